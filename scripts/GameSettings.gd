@@ -11,6 +11,8 @@ const DISPLAY_SETTINGS_KEY_RESOLUTION := "resolution"
 const ONBOARDING_SETTINGS_SECTION := "onboarding"
 const ONBOARDING_SETTINGS_KEY_COMPLETED := "completed"
 const ONBOARDING_SETTINGS_KEY_HINTS_ENABLED := "hints_enabled"
+const TELEMETRY_SETTINGS_SECTION := "telemetry"
+const TELEMETRY_SETTINGS_KEY_INSTALL_ID := "install_id"
 
 const CONTROL_PRESET_MODERN := "modern"
 const CONTROL_PRESET_CLASSIC := "classic"
@@ -155,6 +157,21 @@ static func set_onboarding_hints_enabled(enabled: bool) -> void:
 static func reset_onboarding_progress() -> void:
 	_set_onboarding_settings(false, true)
 
+static func get_install_id() -> String:
+	var config := ConfigFile.new()
+	var load_error := config.load(SETTINGS_PATH)
+	if load_error != OK:
+		var absolute_path := ProjectSettings.globalize_path(SETTINGS_PATH)
+		load_error = config.load(absolute_path)
+	var install_id := ""
+	if load_error == OK:
+		install_id = str(config.get_value(TELEMETRY_SETTINGS_SECTION, TELEMETRY_SETTINGS_KEY_INSTALL_ID, "")).strip_edges()
+	if install_id != "":
+		return install_id
+	install_id = Crypto.new().generate_random_bytes(16).hex_encode()
+	_save_install_id(install_id)
+	return install_id
+
 static func get_video_settings() -> Dictionary:
 	var config := ConfigFile.new()
 	var load_error := config.load(SETTINGS_PATH)
@@ -248,6 +265,18 @@ static func _save_video_settings(window_mode: String, resolution: Vector2i) -> v
 	DirAccess.make_dir_recursive_absolute(dir_path)
 	config.save(absolute_path)
 
+static func _save_install_id(install_id: String) -> void:
+	var config := ConfigFile.new()
+	config.load(SETTINGS_PATH)
+	config.set_value(TELEMETRY_SETTINGS_SECTION, TELEMETRY_SETTINGS_KEY_INSTALL_ID, install_id)
+	var save_error := config.save(SETTINGS_PATH)
+	if save_error == OK:
+		return
+	var absolute_path := ProjectSettings.globalize_path(SETTINGS_PATH)
+	var dir_path := absolute_path.get_base_dir()
+	DirAccess.make_dir_recursive_absolute(dir_path)
+	config.save(absolute_path)
+
 static func _set_onboarding_settings(completed: bool, hints_enabled: bool) -> void:
 	var config := ConfigFile.new()
 	config.load(SETTINGS_PATH)
@@ -219,7 +219,19 @@ const SFX_VOLUME_DB := {
 const DIALOGUE_PACK_PATH := "res://assets/data/dialogue/DialoguePackV1.json"
 const DIALOGUE_LINE_DELAY_SECONDS := 0.45
 const MATCH_METRICS_LOG_PATH := "user://match_metrics.jsonl"
-const MATCH_METRICS_SCHEMA_VERSION := 3
+const MATCH_METRICS_SCHEMA_VERSION := 4
+# Build label for A/B comparisons; CI sets the env var, local runs fall back to the project version.
+const METRICS_BUILD_ID_ENV := "FFC_BUILD_ID"
+const METRICS_BUILD_ID_FALLBACK := "dev"
+# Frame-time histogram: bucket 0 is < BASE_MS, bucket i covers [BASE * 2^((i-1)/N), BASE * 2^(i/N))
+# with N = BUCKETS_PER_OCTAVE, and the last bucket is open-ended. review_match_metrics.py mirrors this layout.
+const FRAME_TIME_HISTOGRAM_VERSION := 1
+const FRAME_TIME_BUCKET_BASE_MS := 1.0
+const FRAME_TIME_BUCKETS_PER_OCTAVE := 8
+const FRAME_TIME_BUCKET_COUNT := 74
+const FRAME_TIME_HITCH_MS := 16.7
+const FRAME_TIME_SEVERE_HITCH_MS := 33.0
+const FRAME_TIME_WORST_HITCH_LIMIT := 5
 const ONBOARDING_SEQUENCE_VERSION := 3
 const ONBOARDING_FEEDBACK_SECONDS := 0.8
 const ONBOARDING_STAGE_CENTER_OFFSET := 88.0
@@ -405,6 +417,13 @@ var telemetry_training_drill_events: Array[Dictionary] = []
 var telemetry_onboarding_lesson_events: Array[Dictionary] = []
 var telemetry_expected_item_evolution_count := 0
 var telemetry_session_log_written := false
+var telemetry_frame_time_counts := PackedInt32Array()
+var telemetry_frame_count := 0
+var telemetry_frame_time_total_ms := 0.0
+var telemetry_frame_time_max_ms := 0.0
+var telemetry_frames_over_hitch := 0
+var telemetry_frames_over_severe_hitch := 0
+var telemetry_worst_hitches: Array[Dictionary] = []
 
 func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
@@ -520,6 +539,7 @@ func _unhandled_input(event: InputEvent) -> void:
 		_toggle_pause()
 
 func _process(delta: float) -> void:
+	_record_frame_time(delta)
 	_update_hitstop_state()
 	_update_screen_fx(delta)
 	if get_tree().paused:
@@ -1041,10 +1061,14 @@ func _append_match_metrics_log(result_key: String, exit_reason: String = "match_
 	var record := {
 		"schema_version": MATCH_METRICS_SCHEMA_VERSION,
 		"timestamp_utc": Time.get_datetime_string_from_system(true),
+		"build_id": _resolve_metrics_build_id(),
+		"install_id": GameSettingsStore.get_install_id(),
 		"match_mode": _resolve_active_match_mode(),
 		"result": normalized_result,
 		"exit_reason": normalized_exit_reason,
 		"match_elapsed_seconds": match_elapsed_seconds,
+		"stage_id": _resolve_metrics_stage_id(),
+		"frame_times": _build_frame_time_summary(),
 		"p1_character_id": str(selected_character_ids.get("p1", "")),
 		"p2_character_id": str(selected_character_ids.get("p2", "")),
 		"p1_loadout": p1_loadout,
@@ -1135,6 +1159,81 @@ func _reset_match_telemetry() -> void:
 	telemetry_onboarding_lesson_events.clear()
 	telemetry_expected_item_evolution_count = _count_expected_item_evolutions()
 	telemetry_session_log_written = false
+	_reset_frame_time_telemetry()
+
+func _reset_frame_time_telemetry() -> void:
+	telemetry_frame_time_counts = PackedInt32Array()
+	telemetry_frame_time_counts.resize(FRAME_TIME_BUCKET_COUNT)
+	telemetry_frame_time_counts.fill(0)
+	telemetry_frame_count = 0
+	telemetry_frame_time_total_ms = 0.0
+	telemetry_frame_time_max_ms = 0.0
+	telemetry_frames_over_hitch = 0
+	telemetry_frames_over_severe_hitch = 0
+	telemetry_worst_hitches.clear()
+
+func _frame_time_bucket_index(frame_ms: float) -> int:
+	if frame_ms < FRAME_TIME_BUCKET_BASE_MS:
+		return 0
+	var octaves := log(frame_ms / FRAME_TIME_BUCKET_BASE_MS) / log(2.0)
+	return clampi(int(floor(octaves * float(FRAME_TIME_BUCKETS_PER_OCTAVE))) + 1, 1, FRAME_TIME_BUCKET_COUNT - 1)
+
+func _record_frame_time(delta: float) -> void:
+	if telemetry_frame_time_counts.size() != FRAME_TIME_BUCKET_COUNT:
+		_reset_frame_time_telemetry()
+	var frame_ms := maxf(0.0, delta) * 1000.0
+	var bucket := _frame_time_bucket_index(frame_ms)
+	telemetry_frame_time_counts[bucket] = telemetry_frame_time_counts[bucket] + 1
+	telemetry_frame_count += 1
+	telemetry_frame_time_total_ms += frame_ms
+	telemetry_frame_time_max_ms = maxf(telemetry_frame_time_max_ms, frame_ms)
+	if frame_ms <= FRAME_TIME_HITCH_MS:
+		return
+	telemetry_frames_over_hitch += 1
+	if frame_ms > FRAME_TIME_SEVERE_HITCH_MS:
+		telemetry_frames_over_severe_hitch += 1
+	var worst_count := telemetry_worst_hitches.size()
+	if worst_count >= FRAME_TIME_WORST_HITCH_LIMIT and frame_ms <= float(telemetry_worst_hitches[worst_count - 1].get("frame_ms", 0.0)):
+		return
+	telemetry_worst_hitches.append({
+		"frame_ms": snappedf(frame_ms, 0.01),
+		"elapsed_seconds": snappedf(match_elapsed_seconds, 0.001),
+		"unix_time": Time.get_unix_time_from_system()
+	})
+	telemetry_worst_hitches.sort_custom(func(a: Dictionary, b: Dictionary) -> bool:
+		return float(a.get("frame_ms", 0.0)) > float(b.get("frame_ms", 0.0))
+	)
+	if telemetry_worst_hitches.size() > FRAME_TIME_WORST_HITCH_LIMIT:
+		telemetry_worst_hitches.resize(FRAME_TIME_WORST_HITCH_LIMIT)
+
+func _build_frame_time_summary() -> Dictionary:
+	var counts: Array[int] = []
+	for count in telemetry_frame_time_counts:
+		counts.append(count)
+	return {
+		"version": FRAME_TIME_HISTOGRAM_VERSION,
+		"bucket_base_ms": FRAME_TIME_BUCKET_BASE_MS,
+		"buckets_per_octave": FRAME_TIME_BUCKETS_PER_OCTAVE,
+		"counts": counts,
+		"frame_count": telemetry_frame_count,
+		"total_ms": snappedf(telemetry_frame_time_total_ms, 0.01),
+		"max_ms": snappedf(telemetry_frame_time_max_ms, 0.01),
+		"over_16_7ms": telemetry_frames_over_hitch,
+		"over_33ms": telemetry_frames_over_severe_hitch,
+		"worst_hitches": telemetry_worst_hitches.duplicate(true)
+	}
+
+func _resolve_metrics_build_id() -> String:
+	var build_id := OS.get_environment(METRICS_BUILD_ID_ENV).strip_edges()
+	if build_id == "":
+		build_id = str(ProjectSettings.get_setting("application/config/version", "")).strip_edges()
+	return build_id if build_id != "" else METRICS_BUILD_ID_FALLBACK
+
+func _resolve_metrics_stage_id() -> String:
+	var scene_name := scene_file_path.get_file().get_basename().to_snake_case()
+	if scene_name == "":
+		scene_name = str(name).to_snake_case()
+	return "%s/%s" % [scene_name, ruleset_profile]
 
 func _count_expected_item_evolutions() -> int:
 	var expected := 0
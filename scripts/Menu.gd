@@ -1091,6 +1091,7 @@ func _append_menu_metrics_log(event_name: String) -> void:
 	var record := {
 		"schema_version": MENU_METRICS_SCHEMA_VERSION,
 		"timestamp_utc": Time.get_datetime_string_from_system(true),
+		"install_id": GameSettingsStore.get_install_id(),
 		"event": event_name,
 		"locale": TranslationServer.get_locale(),
 		"control_preset": current_control_preset,
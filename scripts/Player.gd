@@ -509,23 +509,6 @@ const BLOCK_CHIP_BY_ATTACK := {
 	"signature_c": 0.12,
 	"ultimate": 0.15
 }
-const REQUIRED_ANIMATION_NAMES := [
-	"idle",
-	"walk",
-	"jump",
-	"light",
-	"heavy",
-	"special",
-	"throw",
-	"block",
-	"hit_light",
-	"hit_heavy",
-	"hit",
-	"fall",
-	"getup",
-	"ko"
-]
-const ANIMATION_PROFILES := PlayerDataStore.ANIMATION_PROFILES
 const LOCAL_INPUT_ACTIONS := PlayerDataStore.LOCAL_INPUT_ACTIONS
 const LOCAL_INPUT_PREFIX_BY_PLAYER_ID := PlayerDataStore.LOCAL_INPUT_PREFIX_BY_PLAYER_ID
 const LOCAL_GAMEPAD_DEVICE_BY_PLAYER_ID := PlayerDataStore.LOCAL_GAMEPAD_DEVICE_BY_PLAYER_ID
@@ -5438,12 +5421,13 @@ func _is_headless_sprite_runtime() -> bool:
 	return OS.has_feature("headless") or DisplayServer.get_name() == "headless"
 
 func _merge_missing_animations(target: SpriteFrames, fallback: SpriteFrames) -> void:
-	for animation_name in REQUIRED_ANIMATION_NAMES:
+	var animation_profiles := PlayerDataStore.get_animation_profiles()
+	for animation_name in PlayerDataStore.get_required_animation_names():
 		var has_required := target.has_animation(animation_name) and target.get_frame_count(animation_name) > 0
 		if not has_required:
 			_copy_animation(fallback, target, animation_name)
 			continue
-		var profile: Dictionary = ANIMATION_PROFILES.get(animation_name, {})
+		var profile: Dictionary = animation_profiles.get(animation_name, {})
 		if profile.has("fps"):
 			target.set_animation_speed(animation_name, float(profile["fps"]))
 		if profile.has("loop"):
@@ -5584,11 +5568,11 @@ func _add_placeholder_animation(
 		frames.add_frame(name, texture)
 
 func _profile_fps(animation_name: StringName, fallback: float) -> float:
-	var profile: Dictionary = ANIMATION_PROFILES.get(animation_name, {})
+	var profile: Dictionary = PlayerDataStore.get_animation_profiles().get(animation_name, {})
 	return float(profile.get("fps", fallback))
 
 func _profile_loop(animation_name: StringName, fallback: bool) -> bool:
-	var profile: Dictionary = ANIMATION_PROFILES.get(animation_name, {})
+	var profile: Dictionary = PlayerDataStore.get_animation_profiles().get(animation_name, {})
 	return bool(profile.get("loop", fallback))
 
 func _make_placeholder_texture(pose: String, variant: int = 0) -> Texture2D:
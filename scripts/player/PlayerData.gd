@@ -65,22 +65,7 @@ const CHARACTER_TINT_BY_ID := {
 	"prototype_p2": Color(1.0, 0.88, 0.84, 1.0)
 }
 
-const ANIMATION_PROFILES := {
-	"idle": {"fps": 8.0, "loop": true},
-	"walk": {"fps": 11.0, "loop": true},
-	"jump": {"fps": 9.0, "loop": false},
-	"light": {"fps": 18.0, "loop": false},
-	"heavy": {"fps": 9.0, "loop": false},
-	"special": {"fps": 10.0, "loop": false},
-	"throw": {"fps": 12.0, "loop": false},
-	"block": {"fps": 8.0, "loop": true},
-	"hit_light": {"fps": 11.0, "loop": false},
-	"hit_heavy": {"fps": 8.0, "loop": false},
-	"hit": {"fps": 10.0, "loop": false},
-	"fall": {"fps": 8.0, "loop": false},
-	"getup": {"fps": 9.0, "loop": false},
-	"ko": {"fps": 1.0, "loop": false}
-}
+const ANIMATION_PROFILES_PATH := "res://assets/data/animation/AnimationProfiles.json"
 
 const LOCAL_INPUT_ACTIONS := [
 	"move_left",
@@ -156,6 +141,29 @@ const ATTACK_DATA := {
 	}
 }
 
+static var _animation_profile_table: Dictionary = {}
+
+static func get_animation_profile_table() -> Dictionary:
+	if not _animation_profile_table.is_empty():
+		return _animation_profile_table
+	if not FileAccess.file_exists(ANIMATION_PROFILES_PATH):
+		push_warning("Animation profile table not found: %s" % ANIMATION_PROFILES_PATH)
+		return _animation_profile_table
+	var parsed: Variant = JSON.parse_string(FileAccess.get_file_as_string(ANIMATION_PROFILES_PATH))
+	if typeof(parsed) != TYPE_DICTIONARY:
+		push_warning("Animation profile table JSON parse failed: %s" % ANIMATION_PROFILES_PATH)
+		return _animation_profile_table
+	_animation_profile_table = parsed as Dictionary
+	return _animation_profile_table
+
+static func get_animation_profiles() -> Dictionary:
+	var profiles: Variant = get_animation_profile_table().get("profiles", {})
+	return profiles as Dictionary if typeof(profiles) == TYPE_DICTIONARY else {}
+
+static func get_required_animation_names() -> Array:
+	var names: Variant = get_animation_profile_table().get("required_animations", [])
+	return names as Array if typeof(names) == TYPE_ARRAY else []
+
 static func get_ai_profile(character_id: String) -> Dictionary:
 	var profile := AI_PROFILE_DEFAULT.duplicate(true)
 	var override_value: Variant = AI_PROFILE_BY_CHARACTER.get(character_id, {})
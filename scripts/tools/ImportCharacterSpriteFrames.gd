@@ -1,41 +1,11 @@
 extends SceneTree
 
-const REQUIRED_ANIMATION_NAMES := [
-	"idle",
-	"walk",
-	"jump",
-	"light",
-	"heavy",
-	"special",
-	"throw",
-	"block",
-	"hit_light",
-	"hit_heavy",
-	"hit",
-	"fall",
-	"getup",
-	"ko"
-]
-
-const ANIMATION_PROFILES := {
-	"idle": {"fps": 8.0, "loop": true},
-	"walk": {"fps": 11.0, "loop": true},
-	"jump": {"fps": 9.0, "loop": false},
-	"light": {"fps": 18.0, "loop": false},
-	"heavy": {"fps": 9.0, "loop": false},
-	"special": {"fps": 10.0, "loop": false},
-	"throw": {"fps": 12.0, "loop": false},
-	"block": {"fps": 8.0, "loop": true},
-	"hit_light": {"fps": 11.0, "loop": false},
-	"hit_heavy": {"fps": 8.0, "loop": false},
-	"hit": {"fps": 10.0, "loop": false},
-	"fall": {"fps": 8.0, "loop": false},
-	"getup": {"fps": 9.0, "loop": false},
-	"ko": {"fps": 1.0, "loop": false}
-}
-
+const ANIMATION_PROFILES_PATH := "res://assets/data/animation/AnimationProfiles.json"
 const FRAME_FILE_REGEX := "^(?<animation>[a-z0-9_]+)_(?<index>\\d+)\\.png$"
 
+var required_animation_names: Array = []
+var animation_profiles: Dictionary = {}
+
 func _init() -> void:
 	call_deferred("_main")
 
@@ -55,6 +25,10 @@ func _run() -> int:
 		_print_usage()
 		return ERR_INVALID_PARAMETER
 
+	var profile_error := _load_animation_profiles()
+	if profile_error != OK:
+		return profile_error
+
 	var exports_dir := _normalize_project_path(String(opts["exports"]))
 	var output_path := _normalize_project_path(String(opts["output"]))
 	var require_all := bool(opts.get("require_all", false))
@@ -124,6 +98,19 @@ func _run() -> int:
 	print("Saved SpriteFrames: %s" % output_path)
 	return OK
 
+func _load_animation_profiles() -> int:
+	if not FileAccess.file_exists(ANIMATION_PROFILES_PATH):
+		printerr("ERROR: Animation profile table not found: %s" % ANIMATION_PROFILES_PATH)
+		return ERR_FILE_NOT_FOUND
+	var parsed: Variant = JSON.parse_string(FileAccess.get_file_as_string(ANIMATION_PROFILES_PATH))
+	if typeof(parsed) != TYPE_DICTIONARY:
+		printerr("ERROR: Animation profile table JSON parse failed: %s" % ANIMATION_PROFILES_PATH)
+		return ERR_PARSE_ERROR
+	var table := parsed as Dictionary
+	required_animation_names = table.get("required_animations", []) as Array
+	animation_profiles = table.get("profiles", {}) as Dictionary
+	return OK
+
 func _parse_args(args: PackedStringArray) -> Dictionary:
 	var opts := {}
 	var index := 0
@@ -262,7 +249,7 @@ func _scan_exports(exports_dir: String) -> Dictionary:
 				)
 			result["total_frames"] = int(result["total_frames"]) + anim_frames.size()
 
-	for required_name in REQUIRED_ANIMATION_NAMES:
+	for required_name in required_animation_names:
 		if not frames_by_animation.has(required_name):
 			(result["missing_required"] as Array).append(required_name)
 
@@ -290,7 +277,7 @@ func _build_sprite_frames(exports_dir: String, frames_by_animation: Dictionary)
 		if sprite_frames.has_animation(animation_name):
 			sprite_frames.remove_animation(animation_name)
 		sprite_frames.add_animation(animation_name)
-		var profile: Dictionary = ANIMATION_PROFILES.get(animation_name, {})
+		var profile: Dictionary = animation_profiles.get(animation_name, {})
 		if profile.has("fps"):
 			sprite_frames.set_animation_speed(animation_name, float(profile["fps"]))
 		if profile.has("loop"):
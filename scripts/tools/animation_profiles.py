@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Load and compile the shared animation profile table (fps, loop, frame budgets, timings)."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+import math
+from pathlib import Path
+import sys
+
+
+ANIMATION_PROFILES_PATH = (
+	Path(__file__).resolve().parents[2] / "assets" / "data" / "animation" / "AnimationProfiles.json"
+)
+SOURCE_KEYS = ("fps", "loop", "min_frames", "target_frames")
+
+
+@dataclass(frozen=True)
+class AnimationProfile:
+	name: str
+	fps: float
+	loop: bool
+	min_frames: int
+	target_frames: int
+	ticks_per_frame: float
+	min_duration_ticks: int
+	target_duration_ticks: int
+
+	def duration_ticks(self, frame_count: int) -> int:
+		return int(math.ceil(frame_count * self.ticks_per_frame - 1e-9))
+
+
+@dataclass(frozen=True)
+class AnimationProfileTable:
+	physics_ticks_per_second: int
+	required_animations: list[str]
+	profiles: dict[str, AnimationProfile]
+
+	def as_fps_loop_dict(self) -> dict[str, dict[str, float | bool]]:
+		return {
+			name: {"fps": profile.fps, "loop": profile.loop} for name, profile in self.profiles.items()
+		}
+
+
+def compile_profile_payload(payload: dict) -> dict:
+	"""Return `payload` with the derived per-animation timing fields recomputed."""
+	ticks_per_second = int(payload["physics_ticks_per_second"])
+	compiled_profiles: dict[str, dict] = {}
+	for name, raw in payload["profiles"].items():
+		missing = [key for key in SOURCE_KEYS if key not in raw]
+		if missing:
+			raise ValueError(f"Animation profile '{name}' is missing: {', '.join(missing)}")
+		fps = float(raw["fps"])
+		if fps <= 0.0:
+			raise ValueError(f"Animation profile '{name}' must have fps > 0")
+		min_frames = int(raw["min_frames"])
+		target_frames = int(raw["target_frames"])
+		if min_frames < 1 or target_frames < min_frames:
+			raise ValueError(f"Animation profile '{name}' needs 1 <= min_frames <= target_frames")
+		ticks_per_frame = ticks_per_second / fps
+		compiled_profiles[name] = {
+			"fps": fps,
+			"loop": bool(raw["loop"]),
+			"min_frames": min_frames,
+			"target_frames": target_frames,
+			"ticks_per_frame": round(ticks_per_frame, 4),
+			"min_duration_ticks": int(math.ceil(min_frames * ticks_per_frame - 1e-9)),
+			"target_duration_ticks": int(math.ceil(target_frames * ticks_per_frame - 1e-9)),
+		}
+	for name in payload["required_animations"]:
+		if name not in compiled_profiles:
+			raise ValueError(f"Required animation '{name}' has no profile")
+	return {
+		"schema_version": int(payload.get("schema_version", 1)),
+		"physics_ticks_per_second": ticks_per_second,
+		"required_animations": [str(name) for name in payload["required_animations"]],
+		"profiles": compiled_profiles,
+	}
+
+
+def _table_from_payload(payload: dict) -> AnimationProfileTable:
+	compiled = compile_profile_payload(payload)
+	return AnimationProfileTable(
+		physics_ticks_per_second=compiled["physics_ticks_per_second"],
+		required_animations=list(compiled["required_animations"]),
+		profiles={
+			name: AnimationProfile(name=name, **fields) for name, fields in compiled["profiles"].items()
+		},
+	)
+
+
+def _render_payload(payload: dict) -> str:
+	return json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+
+@lru_cache(maxsize=None)
+def load_animation_profiles(path: Path = ANIMATION_PROFILES_PATH) -> AnimationProfileTable:
+	with Path(path).open("r", encoding="utf-8") as handle:
+		return _table_from_payload(json.load(handle))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Recompute the frame-timing columns of AnimationProfiles.json from fps/loop/frame budgets."
+		)
+	)
+	parser.add_argument(
+		"--input",
+		default=str(ANIMATION_PROFILES_PATH),
+		help="Profile table path (default: assets/data/animation/AnimationProfiles.json)",
+	)
+	mode = parser.add_mutually_exclusive_group()
+	mode.add_argument("--write", action="store_true", help="Rewrite the file with recomputed timings")
+	mode.add_argument("--check", action="store_true", help="Fail if the stored timings are stale")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	path = Path(args.input)
+	current = path.read_text(encoding="utf-8")
+	try:
+		compiled = _render_payload(compile_profile_payload(json.loads(current)))
+	except (KeyError, ValueError) as exc:
+		print(f"Invalid animation profile table {path}: {exc}", file=sys.stderr)
+		return 1
+
+	if args.write:
+		if compiled != current:
+			path.write_text(compiled, encoding="utf-8")
+			print(f"Wrote animation profiles: {path}")
+		else:
+			print(f"Animation profiles unchanged: {path}")
+		return 0
+	if args.check and compiled != current:
+		print(f"Animation profiles are stale; run with --write: {path}", file=sys.stderr)
+		return 1
+
+	table = _table_from_payload(json.loads(compiled))
+	print(f"Animation profiles: {path} ({table.physics_ticks_per_second} ticks/s)")
+	for name, profile in table.profiles.items():
+		required = "required" if name in table.required_animations else "optional"
+		print(
+			f"  - {name}: fps={profile.fps:g} loop={str(profile.loop).lower()} "
+			f"frames={profile.min_frames}-{profile.target_frames} "
+			f"ticks={profile.min_duration_ticks}-{profile.target_duration_ticks} ({required})"
+		)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
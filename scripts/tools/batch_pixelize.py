@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Normalize AI-generated character frames into a fixed pixel-art canvas."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from character_exports_common import _parse_png_dimensions, scan_frame_entries
+
+
+SUPPORTED_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+# One of the 256 palette entries is kept for the transparent canvas padding.
+MAX_COLORS = 255
+
+
+@dataclass(frozen=True)
+class PixelizeOptions:
+	width: int
+	height: int
+	colors: int
+	trim: bool
+	remove_bg: bool
+	quantize: bool
+
+
+@dataclass(frozen=True)
+class PixelizeOutcome:
+	source: Path
+	output: Path
+	width: int
+	height: int
+	error: str = ""
+
+
+def _remove_background(image: Image.Image) -> Image.Image:
+	from rembg import remove  # optional dependency, only needed for --remove-bg
+
+	return remove(image).convert("RGBA")
+
+
+def _trim_transparent(image: Image.Image) -> Image.Image:
+	alpha = np.asarray(image.getchannel("A"))
+	rows = np.flatnonzero(alpha.any(axis=1))
+	cols = np.flatnonzero(alpha.any(axis=0))
+	if rows.size == 0 or cols.size == 0:
+		return image
+	return image.crop((int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1))
+
+
+def _fit_size(size: tuple[int, int], width: int, height: int) -> tuple[int, int]:
+	src_w, src_h = size
+	scale = min(width / float(src_w), height / float(src_h))
+	return max(1, min(width, round(src_w * scale))), max(1, min(height, round(src_h * scale)))
+
+
+def _to_palette(canvas: np.ndarray) -> Image.Image:
+	"""Exact RGBA -> `P` conversion with per-entry alpha in tRNS, for canvases of at most 256 colors."""
+	canvas = canvas.copy()
+	canvas[canvas[..., 3] == 0] = 0
+	colors, indices = np.unique(canvas.reshape(-1, 4), axis=0, return_inverse=True)
+	image = Image.fromarray(indices.reshape(canvas.shape[:2]).astype(np.uint8), "P")
+	image.putpalette(colors[:, :3].tobytes(), rawmode="RGB")
+	image.info["transparency"] = colors[:, 3].tobytes()
+	return image
+
+
+def pixelize_image(image: Image.Image, options: PixelizeOptions) -> Image.Image:
+	"""Trim, nearest-neighbour resize and bottom-centre the frame on the output canvas.
+
+	Quantized frames come back as `P` images (palette + tRNS alpha) so the PNG is written 8-bit indexed,
+	as pngquant did; `--skip-quantize` keeps RGBA.
+	"""
+	image = image.convert("RGBA")
+	if options.remove_bg:
+		image = _remove_background(image)
+	if options.trim:
+		image = _trim_transparent(image)
+
+	resized = image.resize(_fit_size(image.size, options.width, options.height), Image.Resampling.NEAREST)
+	if options.quantize:
+		resized = resized.quantize(
+			colors=options.colors,
+			method=Image.Quantize.FASTOCTREE,
+			dither=Image.Dither.NONE,
+		).convert("RGBA")
+
+	canvas = np.zeros((options.height, options.width, 4), dtype=np.uint8)
+	pixels = np.asarray(resized)
+	top = options.height - pixels.shape[0]
+	left = (options.width - pixels.shape[1]) // 2
+	canvas[top:, left:left + pixels.shape[1]] = pixels
+	if options.quantize:
+		# Transparent padding adds at most one entry, so MAX_COLORS quantized colors still fit.
+		return _to_palette(canvas)
+	return Image.fromarray(canvas, "RGBA")
+
+
+def _process_one(job: tuple[Path, Path, PixelizeOptions]) -> PixelizeOutcome:
+	source, output, options = job
+	try:
+		with Image.open(source) as image:
+			frame = pixelize_image(image, options)
+		frame.save(output, format="PNG")
+	except Exception as exc:  # noqa: BLE001
+		return PixelizeOutcome(source=source, output=output, width=0, height=0, error=str(exc))
+	return PixelizeOutcome(source=source, output=output, width=frame.width, height=frame.height)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description="Normalize AI-generated character frames into a fixed pixel-art canvas for review/integration."
+	)
+	parser.add_argument("--input-dir", required=True, help="Source images directory (png/jpg/jpeg/webp)")
+	parser.add_argument("--output-dir", required=True, help="Output directory for processed PNGs")
+	parser.add_argument("--width", type=int, default=24, help="Output canvas width (default: 24)")
+	parser.add_argument("--height", type=int, default=48, help="Output canvas height (default: 48)")
+	parser.add_argument("--colors", type=int, default=24, help=f"Palette color limit, at most {MAX_COLORS} (default: 24)")
+	parser.add_argument(
+		"--remove-bg",
+		action="store_true",
+		help="Run rembg before processing (requires the `rembg` Python package)",
+	)
+	parser.add_argument("--skip-quantize", action="store_true", help="Skip palette quantization")
+	parser.add_argument("--no-trim", action="store_true", help="Disable transparent-border trim before resize")
+	parser.add_argument("--overwrite", action="store_true", help="Overwrite existing output files")
+	parser.add_argument("--dry-run", action="store_true", help="Print planned actions without writing files")
+	parser.add_argument(
+		"--jobs",
+		type=int,
+		default=0,
+		help="Worker processes (default: CPU count)",
+	)
+	parser.add_argument(
+		"--validate",
+		action="store_true",
+		help="Validate the output directory as a character exports folder after processing",
+	)
+	parser.add_argument(
+		"--require-all",
+		action="store_true",
+		help="With --validate, fail if any required runtime animation is missing",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	input_dir = Path(args.input_dir)
+	output_dir = Path(args.output_dir)
+
+	if not input_dir.is_dir():
+		print(f"Input directory not found: {input_dir}", file=sys.stderr)
+		return 1
+	if args.width <= 0 or args.height <= 0:
+		print("Width and height must be positive integers.", file=sys.stderr)
+		return 1
+	if args.colors <= 0:
+		print("Colors must be a positive integer.", file=sys.stderr)
+		return 1
+	if args.remove_bg:
+		try:
+			import rembg  # noqa: F401
+		except ImportError:
+			print("--remove-bg was set but `rembg` is not installed.", file=sys.stderr)
+			return 1
+
+	options = PixelizeOptions(
+		width=args.width,
+		height=args.height,
+		colors=min(args.colors, MAX_COLORS),
+		trim=not args.no_trim,
+		remove_bg=args.remove_bg,
+		quantize=not args.skip_quantize,
+	)
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+	print(f"Input:  {input_dir}")
+	print(f"Output: {output_dir}")
+	print(f"Canvas: {options.width}x{options.height}")
+	if options.quantize:
+		print(f"Quantize: enabled (colors={options.colors})")
+	else:
+		print("Quantize: disabled")
+	print(f"rembg: {'enabled' if options.remove_bg else 'disabled'}")
+	print(f"Workers: {jobs}")
+	if args.dry_run:
+		print("Mode: dry-run")
+
+	if not args.dry_run:
+		output_dir.mkdir(parents=True, exist_ok=True)
+
+	pending: list[tuple[Path, Path, PixelizeOptions]] = []
+	existing: list[Path] = []
+	for src in sorted(input_dir.iterdir(), key=lambda p: p.name):
+		if not src.is_file() or src.suffix.lower() not in SUPPORTED_SUFFIXES:
+			continue
+		dst = output_dir / f"{src.stem}.png"
+		if dst.exists() and not args.overwrite:
+			print(f"Skip (exists): {dst}")
+			existing.append(dst)
+			continue
+		print(f"Process: {src.name} -> {dst.name}")
+		pending.append((src, dst, options))
+
+	if args.dry_run:
+		print(f"Done. Processed={len(pending)} Skipped={len(existing)}")
+		return 0
+
+	outcomes: list[PixelizeOutcome] = []
+	if jobs == 1 or len(pending) <= 1:
+		outcomes = [_process_one(job) for job in pending]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			outcomes = list(pool.map(_process_one, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+
+	failed = [outcome for outcome in outcomes if outcome.error]
+	for outcome in failed:
+		print(f"Failed: {outcome.source.name}: {outcome.error}", file=sys.stderr)
+	print(f"Done. Processed={len(outcomes) - len(failed)} Skipped={len(existing)} Failed={len(failed)}")
+
+	if not args.validate:
+		return 1 if failed else 0
+
+	entries: list[tuple[Path, int, int]] = [
+		(outcome.output, outcome.width, outcome.height) for outcome in outcomes if not outcome.error
+	]
+	for dst in existing:
+		try:
+			width, height = _parse_png_dimensions(dst)
+		except Exception as exc:  # noqa: BLE001
+			print(f"Failed to read PNG header for {dst.name}: {exc}", file=sys.stderr)
+			return 1
+		entries.append((dst, width, height))
+
+	result = scan_frame_entries(
+		output_dir,
+		entries,
+		expected_size=(options.width, options.height),
+		require_all=args.require_all,
+	)
+	print(f"Detected animations: {result.animation_count} | Detected frames: {result.total_frames}")
+	if result.warnings:
+		print("Warnings:")
+		for warning in result.warnings:
+			print(f"  - {warning}")
+	if result.errors:
+		print("Errors:")
+		for error in result.errors:
+			print(f"  - {error}")
+		print("Validation result: FAIL")
+		return 1
+	print("Validation result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
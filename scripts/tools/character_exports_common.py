@@ -4,31 +4,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
+import hashlib
+import json
 import re
 import struct
-from typing import Iterable
-
-
-DEFAULT_REQUIRED_ANIMATIONS: list[str] = [
-	"idle",
-	"walk",
-	"jump",
-	"light",
-	"heavy",
-	"special",
-	"throw",
-	"block",
-	"hit_light",
-	"hit_heavy",
-	"hit",
-	"fall",
-	"getup",
-	"ko",
-]
+from typing import TYPE_CHECKING, Iterable
+
+from animation_profiles import AnimationProfileTable, load_animation_profiles
+from project_paths import PROJECT_ROOT
+
+if TYPE_CHECKING:
+	from frame_hashes import FrameHashIndex
+
+
+_ANIMATION_PROFILE_TABLE = load_animation_profiles()
+DEFAULT_REQUIRED_ANIMATIONS: list[str] = list(_ANIMATION_PROFILE_TABLE.required_animations)
+DEFAULT_ANIMATION_PROFILES: dict[str, dict[str, float | bool]] = _ANIMATION_PROFILE_TABLE.as_fps_loop_dict()
+# Godot's SpriteFrames defaults for animations without a profile.
+_DEFAULT_SPRITE_FRAMES_SPEED = 5.0
+_DEFAULT_SPRITE_FRAMES_LOOP = True
+_EXT_RESOURCE_ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
 
 FRAME_FILENAME_RE = re.compile(r"^(?P<animation>[a-z0-9_]+)_(?P<index>\d+)\.png$")
 PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+EXPORT_CANVAS_SIZE = (24, 48)
 
 
 @dataclass(frozen=True)
@@ -49,6 +50,7 @@ class ScanResult:
 	frames_by_animation: dict[str, list[FrameRecord]] = field(default_factory=dict)
 	errors: list[str] = field(default_factory=list)
 	warnings: list[str] = field(default_factory=list)
+	frame_hashes: FrameHashIndex | None = None
 
 	@property
 	def total_frames(self) -> int:
@@ -82,77 +84,99 @@ def _parse_png_dimensions(path: Path) -> tuple[int, int]:
 		return width, height
 
 
+def project_relative_path(path: Path) -> str:
+	"""POSIX path relative to the project root (as-is outside it), so written files do not depend on the cwd."""
+	try:
+		return path.resolve().relative_to(PROJECT_ROOT).as_posix()
+	except ValueError:
+		return path.as_posix()
+
+
+def infer_character_id(exports_dir: Path) -> str:
+	if exports_dir.name == "exports" and exports_dir.parent.name:
+		return exports_dir.parent.name
+	return exports_dir.name
+
+
 def _sorted_unique(items: Iterable[str]) -> list[str]:
 	return sorted(set(items))
 
 
-def scan_character_exports(
-	exports_dir: str | Path,
-	*,
-	required_animations: list[str] | None = None,
-	expected_size: tuple[int, int] | None = (24, 48),
-	require_all: bool = False,
+def _new_scan_result(
+	exports_dir: Path,
+	required_animations: list[str] | None,
+	expected_size: tuple[int, int] | None,
 ) -> ScanResult:
-	path = Path(exports_dir)
-	required = list(required_animations or DEFAULT_REQUIRED_ANIMATIONS)
-	result = ScanResult(
-		exports_dir=path,
-		required_animations=required,
+	return ScanResult(
+		exports_dir=exports_dir,
+		required_animations=list(required_animations or DEFAULT_REQUIRED_ANIMATIONS),
 		expected_size=expected_size,
 	)
 
-	if not path.exists():
-		result.errors.append(f"Exports directory does not exist: {path}")
-		return result
-	if not path.is_dir():
-		result.errors.append(f"Exports path is not a directory: {path}")
-		return result
 
-	frame_map: dict[str, list[FrameRecord]] = {}
+def _match_frame_name(result: ScanResult, path: Path) -> re.Match[str] | None:
+	match = FRAME_FILENAME_RE.match(path.name)
+	if not match:
+		result.warnings.append(
+			f"Filename does not match '<animation>_<index>.png': {path.name}"
+		)
+	return match
 
-	for entry in sorted(path.iterdir(), key=lambda p: p.name):
-		if entry.name.startswith("."):
-			continue
-		if entry.is_dir():
-			result.warnings.append(f"Ignoring subdirectory: {entry.name}")
-			continue
-		if entry.name.endswith(".import"):
-			continue
-		if entry.suffix.lower() != ".png":
-			result.warnings.append(f"Ignoring non-PNG file: {entry.name}")
-			continue
 
-		match = FRAME_FILENAME_RE.match(entry.name)
-		if not match:
-			result.warnings.append(
-				f"Filename does not match '<animation>_<index>.png': {entry.name}"
-			)
-			continue
-
-		animation = match.group("animation")
-		index = int(match.group("index"))
-		try:
-			width, height = _parse_png_dimensions(entry)
-		except Exception as exc:  # noqa: BLE001
-			result.errors.append(f"Failed to read PNG header for {entry.name}: {exc}")
-			continue
+def _add_frame(
+	result: ScanResult,
+	frame_map: dict[str, list[FrameRecord]],
+	match: re.Match[str],
+	path: Path,
+	width: int,
+	height: int,
+) -> None:
+	frame = FrameRecord(
+		animation=match.group("animation"),
+		index=int(match.group("index")),
+		filename=path.name,
+		path=path,
+		width=width,
+		height=height,
+	)
+	frame_map.setdefault(frame.animation, []).append(frame)
 
-		frame = FrameRecord(
-			animation=animation,
-			index=index,
-			filename=entry.name,
-			path=entry,
-			width=width,
-			height=height,
+	if result.expected_size is not None and (width, height) != result.expected_size:
+		exp_w, exp_h = result.expected_size
+		result.errors.append(
+			f"Wrong canvas size for {path.name}: {width}x{height} (expected {exp_w}x{exp_h})"
 		)
-		frame_map.setdefault(animation, []).append(frame)
 
-		if expected_size is not None and (width, height) != expected_size:
-			exp_w, exp_h = expected_size
-			result.errors.append(
-				f"Wrong canvas size for {entry.name}: {width}x{height} (expected {exp_w}x{exp_h})"
+
+def _check_frame_budgets(
+	result: ScanResult,
+	frame_map: dict[str, list[FrameRecord]],
+	profile_table: AnimationProfileTable,
+) -> None:
+	for animation in sorted(frame_map.keys()):
+		profile = profile_table.profiles.get(animation)
+		if profile is None:
+			continue
+		frame_count = len(frame_map[animation])
+		duration = profile.duration_ticks(frame_count)
+		if frame_count < profile.min_frames:
+			result.warnings.append(
+				f"Animation '{animation}' has {frame_count} frame(s) ({duration} ticks at {profile.fps:g} fps), "
+				f"below the minimum of {profile.min_frames} ({profile.min_duration_ticks} ticks)"
 			)
+		elif frame_count > profile.target_frames:
+			result.warnings.append(
+				f"Animation '{animation}' has {frame_count} frame(s) ({duration} ticks at {profile.fps:g} fps), "
+				f"over the target of {profile.target_frames} ({profile.target_duration_ticks} ticks)"
+			)
+
 
+def _finalize_scan(
+	result: ScanResult,
+	frame_map: dict[str, list[FrameRecord]],
+	*,
+	require_all: bool,
+) -> ScanResult:
 	for animation, frames in frame_map.items():
 		frames.sort(key=lambda f: (f.index, f.filename))
 
@@ -179,11 +203,13 @@ def scan_character_exports(
 				)
 
 	if frame_map:
-		unknown = [a for a in _sorted_unique(frame_map.keys()) if a not in set(required)]
+		required = set(result.required_animations)
+		unknown = [a for a in _sorted_unique(frame_map.keys()) if a not in required]
 		for animation in unknown:
 			result.warnings.append(
 				f"Animation '{animation}' is not in the required runtime list (kept, but verify usage)"
 			)
+		_check_frame_budgets(result, frame_map, _ANIMATION_PROFILE_TABLE)
 	else:
 		result.errors.append("No valid exported PNG frames found")
 
@@ -196,11 +222,189 @@ def scan_character_exports(
 	return result
 
 
+@dataclass(frozen=True)
+class ExportEntry:
+	"""What one directory entry contributes to a scan, so unchanged files need not be re-read."""
+
+	path: Path
+	warnings: tuple[str, ...] = ()
+	errors: tuple[str, ...] = ()
+	size: tuple[int, int] | None = None
+
+
+def classify_export_entry(entry: Path) -> ExportEntry | None:
+	"""Read one exports-directory entry (PNG header only); None for entries the scan skips silently."""
+	if entry.name.startswith("."):
+		return None
+	if entry.is_dir():
+		return ExportEntry(entry, warnings=(f"Ignoring subdirectory: {entry.name}",))
+	if entry.name.endswith(".import"):
+		return None
+	if entry.suffix.lower() != ".png":
+		return ExportEntry(entry, warnings=(f"Ignoring non-PNG file: {entry.name}",))
+	if not FRAME_FILENAME_RE.match(entry.name):
+		return ExportEntry(entry, warnings=(f"Filename does not match '<animation>_<index>.png': {entry.name}",))
+	try:
+		width, height = _parse_png_dimensions(entry)
+	except Exception as exc:  # noqa: BLE001
+		return ExportEntry(entry, errors=(f"Failed to read PNG header for {entry.name}: {exc}",))
+	return ExportEntry(entry, size=(width, height))
+
+
+def assemble_scan(
+	exports_dir: str | Path,
+	entries: Iterable[ExportEntry],
+	*,
+	required_animations: list[str] | None = None,
+	expected_size: tuple[int, int] | None = EXPORT_CANVAS_SIZE,
+	require_all: bool = False,
+) -> ScanResult:
+	"""Validate already-classified entries (in any order) without touching the disk."""
+	result = _new_scan_result(Path(exports_dir), required_animations, expected_size)
+	frame_map: dict[str, list[FrameRecord]] = {}
+	for entry in sorted(entries, key=lambda item: item.path.name):
+		result.warnings.extend(entry.warnings)
+		result.errors.extend(entry.errors)
+		if entry.size is not None:
+			match = FRAME_FILENAME_RE.match(entry.path.name)
+			_add_frame(result, frame_map, match, entry.path, entry.size[0], entry.size[1])
+	return _finalize_scan(result, frame_map, require_all=require_all)
+
+
+def scan_character_exports(
+	exports_dir: str | Path,
+	*,
+	required_animations: list[str] | None = None,
+	expected_size: tuple[int, int] | None = EXPORT_CANVAS_SIZE,
+	require_all: bool = False,
+	hash_frames: bool = False,
+) -> ScanResult:
+	path = Path(exports_dir)
+	missing_dir_error = exports_dir_error(path)
+	if missing_dir_error:
+		result = _new_scan_result(path, required_animations, expected_size)
+		result.errors.append(missing_dir_error)
+		return result
+
+	entries = [classify_export_entry(entry) for entry in sorted(path.iterdir(), key=lambda p: p.name)]
+	result = assemble_scan(
+		path,
+		[entry for entry in entries if entry is not None],
+		required_animations=required_animations,
+		expected_size=expected_size,
+		require_all=require_all,
+	)
+	if hash_frames:
+		attach_frame_hashes(result)
+	return result
+
+
+def exports_dir_error(path: Path) -> str:
+	if not path.exists():
+		return f"Exports directory does not exist: {path}"
+	if not path.is_dir():
+		return f"Exports path is not a directory: {path}"
+	return ""
+
+
+def attach_frame_hashes(result: ScanResult) -> None:
+	"""Decode and hash a scan's frames into `result.frame_hashes`; decode failures become scan errors."""
+	# Pillow/NumPy are only needed when hashing is requested.
+	from frame_hashes import build_frame_hash_index
+
+	try:
+		result.frame_hashes = build_frame_hash_index(
+			result, character_id=infer_character_id(result.exports_dir)
+		)
+	except Exception as exc:  # noqa: BLE001
+		result.errors.append(f"Failed to decode frames for hashing: {exc}")
+		return
+	for name in result.frame_hashes.skipped:
+		result.warnings.append(f"Skipped hashing frame with non-canvas size: {name}")
+
+
+def scan_frame_entries(
+	exports_dir: str | Path,
+	entries: Iterable[tuple[Path, int, int]],
+	*,
+	required_animations: list[str] | None = None,
+	expected_size: tuple[int, int] | None = EXPORT_CANVAS_SIZE,
+	require_all: bool = False,
+) -> ScanResult:
+	"""Validate frames whose sizes are already known, without touching the disk.
+
+	`entries` yields `(path, width, height)` for every PNG frame in the exports
+	directory, e.g. straight from a tool that just wrote them.
+	"""
+	result = _new_scan_result(Path(exports_dir), required_animations, expected_size)
+	frame_map: dict[str, list[FrameRecord]] = {}
+	for entry_path, width, height in sorted(entries, key=lambda item: Path(item[0]).name):
+		entry = Path(entry_path)
+		match = _match_frame_name(result, entry)
+		if match:
+			_add_frame(result, frame_map, match, entry, width, height)
+	return _finalize_scan(result, frame_map, require_all=require_all)
+
+
+class FileHashCache:
+	"""blake2b content hashes keyed by path, reused while size and mtime are unchanged."""
+
+	def __init__(self, path: Path | None = None) -> None:
+		self.path = path
+		self.entries: dict[str, list] = {}
+		self.hashed_count = 0
+		self._dirty = False
+		if path is not None and path.exists():
+			try:
+				loaded = json.loads(path.read_text(encoding="utf-8"))
+			except (OSError, ValueError):
+				loaded = {}
+			if isinstance(loaded, dict):
+				self.entries = {str(key): value for key, value in loaded.items() if isinstance(value, list)}
+
+	def hash_file(self, file_path: Path) -> str:
+		key = str(file_path.resolve())
+		stat = file_path.stat()
+		cached = self.entries.get(key)
+		if cached and len(cached) == 3 and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+			return str(cached[2])
+		digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+		self.entries[key] = [stat.st_size, stat.st_mtime_ns, digest]
+		self.hashed_count += 1
+		self._dirty = True
+		return digest
+
+	def save(self) -> None:
+		if self.path is None or not self._dirty:
+			return
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self.path.write_text(json.dumps(self.entries, sort_keys=True) + "\n", encoding="utf-8")
+		self._dirty = False
+
+
+def hash_scan_frames(result: ScanResult, cache: FileHashCache | None = None) -> dict[Path, str]:
+	hasher = cache or FileHashCache()
+	return {
+		frame.path: hasher.hash_file(frame.path)
+		for frames in result.frames_by_animation.values()
+		for frame in frames
+	}
+
+
+def merkle_digest(leaves: Iterable[tuple[str, str]]) -> str:
+	"""Digest of `(name, child_digest)` pairs; changes iff any name or child digest changes."""
+	hasher = hashlib.blake2b(digest_size=16)
+	for name, child in leaves:
+		hasher.update(f"{name}:{child}\n".encode("utf-8"))
+	return hasher.hexdigest()
+
+
 def build_manifest_dict(
 	result: ScanResult,
 	*,
 	character_id: str,
 	include_missing_required: bool = True,
+	content_hashes: dict[Path, str] | None = None,
 ) -> dict:
 	all_sizes = sorted(
 		{
@@ -225,11 +429,17 @@ def build_manifest_dict(
 				for frame in frames
 			],
 		}
+		if content_hashes is not None:
+			for frame, entry in zip(frames, animations[animation]["frames"]):
+				entry["content_hash"] = content_hashes[frame.path]
+			animations[animation]["digest"] = merkle_digest(
+				(entry["file"], entry["content_hash"]) for entry in animations[animation]["frames"]
+			)
 
 	manifest: dict = {
 		"schema_version": 1,
 		"character_id": character_id,
-		"exports_dir": str(result.exports_dir),
+		"exports_dir": project_relative_path(result.exports_dir),
 		"expected_canvas": (
 			{"width": result.expected_size[0], "height": result.expected_size[1]}
 			if result.expected_size is not None
@@ -251,4 +461,123 @@ def build_manifest_dict(
 	}
 	if include_missing_required:
 		manifest["summary"]["missing_required_animations"] = list(result.missing_required)
+	if content_hashes is not None:
+		manifest["content_digest"] = merkle_digest(
+			(name, animation["digest"]) for name, animation in animations.items()
+		)
 	return manifest
+
+
+def json_content_changed(path: Path, payload: dict, *, timestamp_key: str = "generated_at_utc") -> bool:
+	"""True unless `path` already holds `payload`, ignoring `timestamp_key`."""
+	if not path.exists():
+		return True
+	try:
+		previous = json.loads(path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return True
+	if not isinstance(previous, dict) or timestamp_key not in previous:
+		return True
+	strip = lambda data: {key: value for key, value in data.items() if key != timestamp_key}  # noqa: E731
+	return strip(previous) != strip(payload)
+
+
+def write_json_if_changed(path: Path, payload: dict, *, timestamp_key: str = "generated_at_utc") -> bool:
+	"""Write `payload` stamped with the current time, unless only the timestamp would change.
+
+	Keeping the old file when the content is unchanged means reruns do not churn it.
+	"""
+	if not json_content_changed(path, payload, timestamp_key=timestamp_key):
+		return False
+	stamped = {key: value for key, value in payload.items() if key != timestamp_key}
+	stamped[timestamp_key] = datetime.now(timezone.utc).isoformat()
+	return write_if_changed(path, json.dumps(stamped, indent=2, ensure_ascii=False) + "\n")
+
+
+def to_res_path(path: Path, project_root: Path) -> str:
+	try:
+		relative = path.resolve().relative_to(project_root.resolve())
+	except ValueError as exc:
+		raise ValueError(f"{path} is outside the Godot project at {project_root}") from exc
+	return "res://" + relative.as_posix()
+
+
+def _stable_ext_resource_id(sequence: int, res_path: str) -> str:
+	# Same "<n>_<5 chars>" shape the editor writes, but derived from the path so
+	# regenerating an unchanged export set yields byte-identical output.
+	value = int.from_bytes(hashlib.blake2b(res_path.encode("utf-8"), digest_size=8).digest(), "big")
+	suffix = ""
+	for _ in range(5):
+		value, digit = divmod(value, len(_EXT_RESOURCE_ID_ALPHABET))
+		suffix += _EXT_RESOURCE_ID_ALPHABET[digit]
+	return f"{sequence}_{suffix}"
+
+
+def _format_godot_float(value: float) -> str:
+	text = repr(float(value))
+	return text if ("." in text or "e" in text) else text + ".0"
+
+
+def build_sprite_frames_tres(
+	result: ScanResult,
+	*,
+	project_root: Path,
+	animation_profiles: dict[str, dict[str, float | bool]] | None = None,
+	texture_aliases: dict[Path, Path] | None = None,
+) -> str:
+	"""Render a Godot 4 `SpriteFrames` text resource for the scanned frames.
+
+	Matches what `ImportCharacterSpriteFrames.gd` saves: animations sorted by
+	name, frames in index order, fps/loop from the animation profiles.
+	`texture_aliases` maps a frame path to the path of an identical frame so
+	both reference one `ext_resource`.
+	"""
+	profiles = DEFAULT_ANIMATION_PROFILES if animation_profiles is None else animation_profiles
+	aliases = texture_aliases or {}
+
+	ext_ids: dict[str, str] = {}
+	ext_lines: list[str] = []
+	animation_blocks: list[str] = []
+	for animation in sorted(result.frames_by_animation.keys()):
+		frames = result.frames_by_animation[animation]
+		if not frames:
+			continue
+		frame_blocks: list[str] = []
+		for frame in frames:
+			res_path = to_res_path(aliases.get(frame.path, frame.path), project_root)
+			if res_path not in ext_ids:
+				ext_ids[res_path] = _stable_ext_resource_id(len(ext_ids) + 1, res_path)
+				ext_lines.append(
+					f'[ext_resource type="Texture2D" path="{res_path}" id="{ext_ids[res_path]}"]'
+				)
+			frame_blocks.append(
+				'{\n"duration": 1.0,\n' + f'"texture": ExtResource("{ext_ids[res_path]}")' + "\n}"
+			)
+		profile = profiles.get(animation, {})
+		loop = bool(profile.get("loop", _DEFAULT_SPRITE_FRAMES_LOOP))
+		speed = float(profile.get("fps", _DEFAULT_SPRITE_FRAMES_SPEED))
+		animation_blocks.append(
+			"{\n"
+			+ '"frames": [' + ", ".join(frame_blocks) + "],\n"
+			+ f'"loop": {"true" if loop else "false"},\n'
+			+ f'"name": &"{animation}",\n'
+			+ f'"speed": {_format_godot_float(speed)}\n'
+			+ "}"
+		)
+
+	lines = ['[gd_resource type="SpriteFrames" format=3]', ""]
+	if ext_lines:
+		lines.extend(ext_lines)
+		lines.append("")
+	lines.append("[resource]")
+	lines.append("animations = [" + ", ".join(animation_blocks) + "]")
+	return "\n".join(lines) + "\n"
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+	"""Write `content` to `path` only when it differs; return whether the file changed."""
+	if path.exists() and path.read_text(encoding="utf-8") == content:
+		return False
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(content, encoding="utf-8")
+	return True
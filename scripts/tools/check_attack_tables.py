@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Validate every character attack table without starting Godot."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from godot_resource import PROJECT_ROOT, GodotParseError, Vector2, load_attack_tables
+
+
+REQUIRED_BASE_ATTACKS = ["light", "heavy", "special", "throw"]
+NUMERIC_KEYS = ["startup", "active", "recovery", "damage", "hitstun", "blockstun"]
+VECTOR_KEYS = [
+	"hitbox_size_ground",
+	"hitbox_size_air",
+	"hitbox_offset_ground",
+	"hitbox_offset_air",
+	"knockback_ground",
+	"knockback_air",
+]
+MIN_ROSTER_TABLES = 16
+
+
+def check_attack_table(file_name: str, attacks: object) -> list[str]:
+	"""Mirror of `_test_character_attack_tables_are_valid` in tests/TestRunner.gd."""
+	if not isinstance(attacks, dict) or not attacks:
+		return [f"{file_name} has no attack entries"]
+	errors: list[str] = []
+	for key in REQUIRED_BASE_ATTACKS:
+		entry = attacks.get(key)
+		if entry is None:
+			errors.append(f"{file_name} is missing {key}")
+			continue
+		if not isinstance(entry, dict):
+			errors.append(f"{file_name}.{key} entry is not a dictionary")
+			continue
+		for number_key in NUMERIC_KEYS:
+			value = entry.get(number_key)
+			if isinstance(value, bool) or not isinstance(value, (int, float)):
+				errors.append(f"{file_name}.{key}.{number_key} is not numeric")
+		for vector_key in VECTOR_KEYS:
+			if not isinstance(entry.get(vector_key), Vector2):
+				errors.append(f"{file_name}.{key}.{vector_key} is not Vector2")
+	return errors
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description="Validate assets/data/characters/*AttackTable.tres the same way the headless test suite does."
+	)
+	parser.add_argument(
+		"--project-root",
+		default=str(PROJECT_ROOT),
+		help="Godot project root (default: repository root)",
+	)
+	parser.add_argument(
+		"--format",
+		choices=["text", "json"],
+		default="text",
+		help="Output format. Default: text.",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	try:
+		tables = load_attack_tables(Path(args.project_root))
+	except GodotParseError as exc:
+		print(str(exc), file=sys.stderr)
+		return 1
+
+	errors: list[str] = []
+	for file_name, resource in tables.items():
+		errors.extend(check_attack_table(file_name, resource.properties.get("attacks")))
+	if len(tables) < MIN_ROSTER_TABLES:
+		errors.append(f"character roster has {len(tables)} attack tables (expected at least {MIN_ROSTER_TABLES})")
+	elapsed = time.perf_counter() - started
+
+	if args.format == "json":
+		payload = {
+			"table_count": len(tables),
+			"errors": errors,
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+	else:
+		print(f"Attack tables: {len(tables)} checked in {elapsed * 1000.0:.1f} ms")
+		for error in errors:
+			print(f"  - {error}")
+		print("Result: FAIL" if errors else "Result: PASS")
+	return 1 if errors else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Report broken res:// references, unreachable assets, missing .import sidecars and per-scene load sets."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+from godot_resource import PROJECT_ROOT
+from resource_graph import DEFAULT_INDEX_PATH, IMPORT_SUFFIX, ResourceGraph, load_graph
+
+
+# Runtime entry points: project.godot (main scene, icon, translations), the headless test runner and
+# the debug scenes launched directly with `just run-scene`.
+DEFAULT_ENTRY_POINTS = ("project.godot", "tests/TestRunner.gd", "scenes/debug")
+# Editor/CLI tooling is run by path, never loaded by the game.
+TOOLING_PREFIXES = ("scripts/tools/",)
+RUNTIME_SUFFIXES = (".gd", ".tscn", ".tres", ".png", ".svg", ".webp", ".jpg", ".wav", ".ogg", ".mp3", ".ttf", ".otf", ".json")
+IMPORTED_SUFFIXES = (".png", ".svg", ".webp", ".jpg", ".wav", ".ogg", ".mp3", ".ttf", ".otf")
+
+
+@dataclass
+class SceneLoadSet:
+	scene: str
+	files: list[str]
+	bytes: int
+
+	def to_dict(self) -> dict:
+		return {"scene": self.scene, "files": len(self.files), "bytes": self.bytes, "load_set": self.files}
+
+
+@dataclass
+class RefsReport:
+	broken: dict[str, list[str]] = field(default_factory=dict)
+	unreachable: list[str] = field(default_factory=list)
+	missing_imports: list[str] = field(default_factory=list)
+	stale_imports: list[str] = field(default_factory=list)
+	scenes: list[SceneLoadSet] = field(default_factory=list)
+
+	@property
+	def broken_count(self) -> int:
+		return sum(len(paths) for paths in self.broken.values())
+
+	def to_dict(self) -> dict:
+		return {
+			"broken_refs": {source: [f"res://{path}" for path in paths] for source, paths in sorted(self.broken.items())},
+			"unreachable": self.unreachable,
+			"missing_imports": self.missing_imports,
+			"stale_imports": self.stale_imports,
+			"scenes": [scene.to_dict() for scene in self.scenes],
+		}
+
+
+def _git_ignored(project_root: Path, paths: list[str]) -> set[str]:
+	"""Generated outputs (i18n/compiled, ...) are ignored by git and should not count as dead assets."""
+	if not paths:
+		return set()
+	try:
+		completed = subprocess.run(
+			["git", "-C", str(project_root), "check-ignore", "--stdin"],
+			input="\n".join(paths),
+			capture_output=True,
+			text=True,
+		)
+	except OSError:
+		return set()
+	return {line.strip() for line in completed.stdout.splitlines() if line.strip()}
+
+
+def entry_roots(graph: ResourceGraph, entry_points: list[str]) -> set[str]:
+	roots: set[str] = set()
+	for entry in entry_points:
+		entry = entry.removeprefix("res://").rstrip("/")
+		if entry in graph.files:
+			roots.add(entry)
+		else:
+			roots.update(rel for rel in graph.files if rel.startswith(entry + "/"))
+	return roots
+
+
+def analyze_refs(project_root: Path, graph: ResourceGraph, entry_points: list[str]) -> RefsReport:
+	report = RefsReport(broken={source: paths for source, paths in graph.broken.items()})
+	reachable = graph.closure(entry_roots(graph, entry_points))
+	candidates = [
+		rel
+		for rel in sorted(graph.files)
+		if rel.endswith(RUNTIME_SUFFIXES) and rel not in reachable and not rel.startswith(TOOLING_PREFIXES)
+	]
+	ignored = _git_ignored(project_root, candidates)
+	report.unreachable = [rel for rel in candidates if rel not in ignored]
+	report.missing_imports = [
+		rel for rel in sorted(graph.files) if rel.endswith(IMPORTED_SUFFIXES) and rel + IMPORT_SUFFIX not in graph.files
+	]
+	report.stale_imports = [
+		rel for rel in sorted(graph.files) if rel.endswith(IMPORT_SUFFIX) and rel[: -len(IMPORT_SUFFIX)] not in graph.files
+	]
+	sizes: dict[str, int] = {}
+	for scene in sorted(rel for rel in graph.files if rel.endswith(".tscn")):
+		load_set = sorted(rel for rel in graph.closure([scene]) if rel in graph.files and rel != scene)
+		for rel in load_set:
+			if rel not in sizes:
+				sizes[rel] = os.stat(project_root / rel).st_size
+		report.scenes.append(SceneLoadSet(scene=scene, files=load_set, bytes=sum(sizes[rel] for rel in load_set)))
+	return report
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Index res:// references across .gd/.tscn/.tres files and report broken references, assets no "
+			"entry point reaches, missing .import sidecars and each scene's transitive load set."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument(
+		"--entry",
+		action="append",
+		help=f"Extra reachability root file or directory (repeatable; always includes {', '.join(DEFAULT_ENTRY_POINTS)})",
+	)
+	parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Cached reference index relative to the project root")
+	parser.add_argument("--jobs", type=int, default=0, help="Parallel tokenizer processes for changed files (0 = CPU count)")
+	parser.add_argument("--strict", action="store_true", help="Also fail on unreachable assets and missing/stale .import files")
+	parser.add_argument("--scenes", action="store_true", help="List every file in each scene's load set (text output)")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root).resolve()
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+	graph, stats = load_graph(project_root, project_root / args.index, jobs=jobs)
+	report = analyze_refs(project_root, graph, [*DEFAULT_ENTRY_POINTS, *(args.entry or [])])
+	elapsed = time.perf_counter() - started
+	failed = report.broken_count > 0 or (
+		args.strict and bool(report.unreachable or report.missing_imports or report.stale_imports)
+	)
+
+	if args.format == "json":
+		payload = {
+			**report.to_dict(),
+			"index": {"files": stats.files, "sources": stats.sources, "scanned": stats.scanned, "reused": stats.reused},
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2))
+		return 1 if failed else 0
+
+	print(
+		f"Resource refs: {stats.sources} source(s) over {stats.files} file(s), "
+		f"{stats.scanned} rescanned, {stats.reused} cached ({elapsed * 1000.0:.1f} ms)"
+	)
+	for source, paths in sorted(report.broken.items()):
+		for path in paths:
+			print(f"  - broken: {source} -> res://{path}")
+	for rel in report.unreachable:
+		print(f"  ~ unreachable: {rel}")
+	for rel in report.missing_imports:
+		print(f"  ~ no .import sidecar: {rel}")
+	for rel in report.stale_imports:
+		print(f"  ~ stale .import (source missing): {rel}")
+	print("Scene load sets:")
+	for scene in sorted(report.scenes, key=lambda item: -item.bytes):
+		print(f"  {scene.scene}: {len(scene.files)} file(s), {scene.bytes / 1024.0:.1f} KiB")
+		if args.scenes:
+			for rel in scene.files:
+				print(f"      {rel}")
+	print(
+		f"Broken refs: {report.broken_count}, unreachable: {len(report.unreachable)}, "
+		f"missing .import: {len(report.missing_imports)}, stale .import: {len(report.stale_imports)}"
+	)
+	print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
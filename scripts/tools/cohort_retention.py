@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Streaming sessionization and cohort retention over match telemetry records.
+
+Records are grouped per install (`install_id`, or one implicit install for a single machine's log) and
+split into play sessions wherever `timestamp_utc` jumps by more than the session gap. Each install keeps a
+fixed-size state and each cohort fixed-size tables, so one pass over any number of records uses memory
+proportional to installs and cohorts, never to records.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any
+
+
+DEFAULT_SESSION_GAP_MINUTES = 30.0
+DEFAULT_RETENTION_DAYS = (1, 3, 7, 14, 30)
+DEFAULT_MAX_SESSION_INDEX = 10
+COHORT_PERIODS = ("day", "week")
+LOCAL_INSTALL_ID = "(local)"
+# matchup_sim.py writes synthetic records with this match_mode; they are not player sessions.
+SIM_MATCH_MODE = "sim"
+_ENTRY_POINT_LIMIT = 16
+_OTHER_ENTRY_POINT = "(other)"
+
+
+def parse_timestamp(value: Any) -> float | None:
+	"""Seconds since the epoch for Godot's `YYYY-MM-DDTHH:MM:SS` UTC strings (a `Z`/offset is also accepted)."""
+	text = str(value or "").strip()
+	if not text:
+		return None
+	if text.endswith("Z"):
+		text = text[:-1] + "+00:00"
+	try:
+		parsed = datetime.fromisoformat(text)
+	except ValueError:
+		return None
+	if parsed.tzinfo is None:
+		parsed = parsed.replace(tzinfo=timezone.utc)
+	return parsed.timestamp()
+
+
+def _day_ordinal(timestamp: float) -> int:
+	return datetime.fromtimestamp(timestamp, tz=timezone.utc).toordinal()
+
+
+class InstallState:
+	"""Per-install progress; constant size regardless of how many records the install produced."""
+
+	__slots__ = (
+		"cohort",
+		"first_day",
+		"last_seen",
+		"session_index",
+		"active_days",
+		"max_day_offset",
+		"onboarding_started",
+		"onboarding_completed",
+		"onboarding_skipped",
+	)
+
+	def __init__(self, cohort: str, first_day: int, timestamp: float) -> None:
+		self.cohort = cohort
+		self.first_day = first_day
+		self.last_seen = timestamp
+		self.session_index = 1
+		self.active_days = 1
+		self.max_day_offset = 0
+		self.onboarding_started = False
+		self.onboarding_completed = False
+		self.onboarding_skipped = False
+
+
+@dataclass
+class CohortStats:
+	"""Fixed-size tables for one cohort (installs whose first record falls in the same day or week)."""
+
+	cohort: str
+	start_day: int
+	period_days: int
+	max_day: int
+	max_session_index: int
+	installs: int = 0
+	sessions: int = 0
+	records: int = 0
+	first_day_counts: list[int] = field(default_factory=list)
+	returned_on_day: list[int] = field(default_factory=list)
+	returned_by_day: list[int] = field(default_factory=list)
+	reached_session: list[int] = field(default_factory=list)
+	onboarding_started: int = 0
+	onboarding_skipped: int = 0
+	onboarding_forced_replays: int = 0
+	completed_by_session: list[int] = field(default_factory=list)
+	completion_seconds_sum: float = 0.0
+	drill_results: list[int] = field(default_factory=list)
+	drill_successes: list[int] = field(default_factory=list)
+	entry_points: dict[str, int] = field(default_factory=dict)
+
+	def __post_init__(self) -> None:
+		# Session tables hold sessions 1..max_session_index plus one trailing bucket for everything later.
+		buckets = self.max_session_index + 1
+		for name, size in (
+			("first_day_counts", self.period_days),
+			("returned_on_day", self.max_day + 1),
+			("returned_by_day", self.max_day + 1),
+			("reached_session", buckets),
+			("completed_by_session", buckets),
+			("drill_results", buckets),
+			("drill_successes", buckets),
+		):
+			if not getattr(self, name):
+				setattr(self, name, [0] * size)
+
+	def session_bucket(self, session_index: int) -> int:
+		return min(session_index, self.max_session_index + 1) - 1
+
+	def count_entry_point(self, entry_point: str) -> None:
+		if entry_point not in self.entry_points and len(self.entry_points) >= _ENTRY_POINT_LIMIT:
+			entry_point = _OTHER_ENTRY_POINT
+		self.entry_points[entry_point] = self.entry_points.get(entry_point, 0) + 1
+
+	def eligible_installs(self, day: int, last_day: int) -> int:
+		"""Installs whose first day is at least `day` days before the last day observed in the log."""
+		return sum(count for offset, count in enumerate(self.first_day_counts) if self.start_day + offset + day <= last_day)
+
+	def to_dict(self, retention_days: tuple[int, ...], last_day: int) -> dict[str, Any]:
+		def rate(numerator: int, denominator: int) -> float | None:
+			return numerator / denominator if denominator else None
+
+		retention = []
+		for day in retention_days:
+			eligible = self.eligible_installs(day, last_day)
+			retention.append(
+				{
+					"day": day,
+					"eligible_installs": eligible,
+					"returned_on_day": self.returned_on_day[day],
+					"returned_by_day": self.returned_by_day[day],
+					"return_rate": rate(self.returned_on_day[day], eligible),
+					"rolling_return_rate": rate(self.returned_by_day[day], eligible),
+				}
+			)
+		completed = 0
+		by_session = []
+		for index in range(self.max_session_index + 1):
+			completed += self.completed_by_session[index]
+			by_session.append(
+				{
+					"session": index + 1 if index < self.max_session_index else f"{self.max_session_index + 1}+",
+					"installs_reached": self.reached_session[index],
+					"onboarding_completed_cumulative": completed,
+					"onboarding_completion_rate": rate(completed, self.installs),
+					"drill_results": self.drill_results[index],
+					"drill_successes": self.drill_successes[index],
+					"drill_success_rate": rate(self.drill_successes[index], self.drill_results[index]),
+				}
+			)
+		return {
+			"cohort": self.cohort,
+			"installs": self.installs,
+			"sessions": self.sessions,
+			"records": self.records,
+			"sessions_per_install": self.sessions / self.installs if self.installs else 0.0,
+			"retention": retention,
+			"onboarding": {
+				"started": self.onboarding_started,
+				"completed": completed,
+				"skipped": self.onboarding_skipped,
+				"forced_replays": self.onboarding_forced_replays,
+				"completion_rate": rate(completed, self.installs),
+				"avg_completed_at_seconds": self.completion_seconds_sum / completed if completed else 0.0,
+				"entry_points": dict(sorted(self.entry_points.items(), key=lambda item: (-item[1], item[0]))),
+			},
+			"by_session": by_session,
+		}
+
+
+class CohortAnalyzer:
+	"""Feed records in log order with `add`; `result` may be called at any point."""
+
+	def __init__(
+		self,
+		*,
+		session_gap_minutes: float = DEFAULT_SESSION_GAP_MINUTES,
+		period: str = "day",
+		retention_days: tuple[int, ...] = DEFAULT_RETENTION_DAYS,
+		max_session_index: int = DEFAULT_MAX_SESSION_INDEX,
+		include_sim: bool = False,
+	) -> None:
+		if period not in COHORT_PERIODS:
+			raise ValueError(f"unknown cohort period {period!r} (use {' or '.join(COHORT_PERIODS)})")
+		if session_gap_minutes <= 0.0 or max_session_index < 1 or not retention_days or min(retention_days) < 1:
+			raise ValueError("session gap, max session index and retention days must all be positive")
+		self.session_gap_seconds = session_gap_minutes * 60.0
+		self.period = period
+		self.retention_days = tuple(sorted(set(retention_days)))
+		self.max_day = self.retention_days[-1]
+		self.max_session_index = max_session_index
+		self.include_sim = include_sim
+		self.installs: dict[str, InstallState] = {}
+		self.cohorts: dict[str, CohortStats] = {}
+		self.records = 0
+		self.skipped_untimed = 0
+		self.skipped_sim = 0
+		self.out_of_order = 0
+		self.last_day = 0
+
+	def _cohort_for(self, first_day: int) -> CohortStats:
+		start_day = first_day if self.period == "day" else first_day - date.fromordinal(first_day).weekday()
+		key = date.fromordinal(start_day).isoformat()
+		cohort = self.cohorts.get(key)
+		if cohort is None:
+			cohort = self.cohorts[key] = CohortStats(
+				cohort=key,
+				start_day=start_day,
+				period_days=1 if self.period == "day" else 7,
+				max_day=self.max_day,
+				max_session_index=self.max_session_index,
+			)
+		return cohort
+
+	def add(self, record: dict[str, Any]) -> bool:
+		"""Fold one record into its install and cohort; returns False for records that were not counted."""
+		if not self.include_sim and str(record.get("match_mode", "")) == SIM_MATCH_MODE:
+			self.skipped_sim += 1
+			return False
+		timestamp = parse_timestamp(record.get("timestamp_utc"))
+		if timestamp is None:
+			self.skipped_untimed += 1
+			return False
+		self.records += 1
+		day = _day_ordinal(timestamp)
+		self.last_day = max(self.last_day, day)
+		install_id = str(record.get("install_id", "")).strip() or LOCAL_INSTALL_ID
+		state = self.installs.get(install_id)
+		if state is None:
+			cohort = self._cohort_for(day)
+			state = self.installs[install_id] = InstallState(cohort.cohort, day, timestamp)
+			cohort.installs += 1
+			cohort.sessions += 1
+			cohort.first_day_counts[day - cohort.start_day] += 1
+			cohort.reached_session[0] += 1
+		else:
+			cohort = self.cohorts[state.cohort]
+			if timestamp < state.last_seen:
+				# Late or merged-out-of-order record: keep it in the current session rather than rewinding.
+				self.out_of_order += 1
+			elif timestamp - state.last_seen > self.session_gap_seconds:
+				state.session_index += 1
+				cohort.sessions += 1
+				if state.session_index <= self.max_session_index + 1:
+					cohort.reached_session[state.session_index - 1] += 1
+			state.last_seen = max(state.last_seen, timestamp)
+			offset = day - state.first_day
+			if 0 < offset <= self.max_day and not state.active_days >> offset & 1:
+				state.active_days |= 1 << offset
+				cohort.returned_on_day[offset] += 1
+			if offset > state.max_day_offset:
+				for threshold in range(state.max_day_offset + 1, min(offset, self.max_day) + 1):
+					cohort.returned_by_day[threshold] += 1
+				state.max_day_offset = offset
+		cohort.records += 1
+		bucket = cohort.session_bucket(state.session_index)
+		self._add_onboarding(record.get("onboarding"), state, cohort, bucket)
+		funnels = record.get("training_drill_funnels", {})
+		if isinstance(funnels, dict):
+			for funnel in funnels.values():
+				if isinstance(funnel, dict):
+					cohort.drill_results[bucket] += int(funnel.get("rep_result_count", 0) or 0)
+					cohort.drill_successes[bucket] += int(funnel.get("success_count", 0) or 0)
+		return True
+
+	def _add_onboarding(self, onboarding: Any, state: InstallState, cohort: CohortStats, bucket: int) -> None:
+		if not isinstance(onboarding, dict):
+			return
+		if bool(onboarding.get("forced_replay", False)):
+			cohort.onboarding_forced_replays += 1
+		if bool(onboarding.get("started", False)) and not state.onboarding_started:
+			state.onboarding_started = True
+			cohort.onboarding_started += 1
+			cohort.count_entry_point(str(onboarding.get("entry_point", "")).strip().lower() or "unknown")
+		if bool(onboarding.get("skipped", False)) and not state.onboarding_skipped:
+			state.onboarding_skipped = True
+			cohort.onboarding_skipped += 1
+		if bool(onboarding.get("completed", False)) and not state.onboarding_completed:
+			state.onboarding_completed = True
+			cohort.completed_by_session[bucket] += 1
+			cohort.completion_seconds_sum += max(0.0, float(onboarding.get("completed_at_seconds", 0.0) or 0.0))
+
+	def result(self) -> dict[str, Any]:
+		return {
+			"period": self.period,
+			"session_gap_minutes": self.session_gap_seconds / 60.0,
+			"retention_days": list(self.retention_days),
+			"max_session_index": self.max_session_index,
+			"last_activity_date": date.fromordinal(self.last_day).isoformat() if self.last_day else "",
+			"record_count": self.records,
+			"install_count": len(self.installs),
+			"session_count": sum(cohort.sessions for cohort in self.cohorts.values()),
+			"skipped_untimed": self.skipped_untimed,
+			"skipped_sim": self.skipped_sim,
+			"out_of_order": self.out_of_order,
+			"cohorts": [
+				self.cohorts[key].to_dict(self.retention_days, self.last_day) for key in sorted(self.cohorts)
+			],
+		}
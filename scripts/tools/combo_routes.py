@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Search each character's hit-cancel graph for combo routes, max-damage routes and loops."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+
+from frame_data import FrameDataTable, analyze_frame_data, load_frame_data
+from godot_resource import PROJECT_ROOT
+
+
+# Mirrors COMBO_* constants and _apply_combo_damage_scaling in Player.gd.
+COMBO_DAMAGE_SCALING_STEP = 0.12
+COMBO_DAMAGE_SCALING_MIN = 0.45
+COMBO_MIN_DAMAGE = 2
+COMBO_SCALING_PROFILE_BY_TIER = {
+	"light": {"step": 0.10, "min": 0.50},
+	"heavy": {"step": 0.14, "min": 0.42},
+	"special": {"step": 0.12, "min": 0.45},
+	"signature": {"step": 0.11, "min": 0.46},
+	"ultimate": {"step": 0.08, "min": 0.56},
+	"throw": {"step": 0.08, "min": 0.60},
+}
+DEFAULT_MAX_HITS = 8
+DEFAULT_MAX_ROUTES = 200
+
+
+def combo_attack_tier(move: str) -> str:
+	if move == "ultimate":
+		return "ultimate"
+	if move.startswith("signature_"):
+		return "signature"
+	if move.startswith("heavy"):
+		return "heavy"
+	if move.startswith("light"):
+		return "light"
+	if move == "throw":
+		return "throw"
+	return "special"
+
+
+def scaled_combo_damage(base_damage: int, combo_count: int, move: str) -> int:
+	if combo_count <= 1:
+		return base_damage
+	profile = COMBO_SCALING_PROFILE_BY_TIER.get(combo_attack_tier(move), {})
+	step = float(profile.get("step", COMBO_DAMAGE_SCALING_STEP))
+	min_scale = float(profile.get("min", COMBO_DAMAGE_SCALING_MIN))
+	scale = max(min_scale, 1.0 - float(combo_count - 1) * step)
+	# GDScript round() is half away from zero; Python's round() is banker's rounding.
+	scaled = int(np.floor(base_damage * scale + 0.5))
+	return max(COMBO_MIN_DAMAGE, scaled)
+
+
+@dataclass(frozen=True)
+class MoveGraph:
+	"""One character's moves and the hit cancels that keep the opponent in hitstun."""
+
+	character_id: str
+	moves: tuple[str, ...]
+	damage: tuple[int, ...]
+	knockdown: tuple[bool, ...]
+	edges: tuple[tuple[int, ...], ...]
+
+
+@dataclass
+class RouteReport:
+	character_id: str
+	best_route: list[str] = field(default_factory=list)
+	best_damage: int = 0
+	route_count: int = 0
+	routes_truncated: bool = False
+	top_routes: list[tuple[int, list[str]]] = field(default_factory=list)
+	loops: list[list[str]] = field(default_factory=list)
+	degenerate_moves: list[str] = field(default_factory=list)
+
+	def to_dict(self) -> dict:
+		return {
+			"best_route": self.best_route,
+			"best_damage": self.best_damage,
+			"route_count": self.route_count,
+			"routes_truncated": self.routes_truncated,
+			"top_routes": [{"damage": damage, "route": route} for damage, route in self.top_routes],
+			"loops": self.loops,
+			"degenerate_moves": self.degenerate_moves,
+		}
+
+
+def build_move_graphs(table: FrameDataTable) -> list[MoveGraph]:
+	"""Split the roster-wide hit-cancel adjacency into one small graph per character."""
+	analysis = analyze_frame_data(table)
+	records = table.records
+	graphs: list[MoveGraph] = []
+	for character_id in table.characters:
+		rows = np.flatnonzero(records["character_id"] == character_id)
+		local = {int(row): position for position, row in enumerate(rows)}
+		edges = []
+		for row in rows:
+			# A knockdown puts the opponent into `fall`, which ends the route.
+			if records["knockdown"][row]:
+				edges.append(())
+				continue
+			targets = np.flatnonzero(analysis.cancel_on_hit[row])
+			edges.append(tuple(local[int(target)] for target in targets if int(target) in local))
+		graphs.append(
+			MoveGraph(
+				character_id=character_id,
+				moves=tuple(str(move) for move in records["move"][rows]),
+				damage=tuple(int(round(float(value))) for value in records["damage"][rows]),
+				knockdown=tuple(bool(value) for value in records["knockdown"][rows]),
+				edges=tuple(edges),
+			)
+		)
+	return graphs
+
+
+def find_loops(graph: MoveGraph) -> list[list[str]]:
+	"""Elementary cycles of the hit-cancel graph, each reported once from its smallest move index."""
+	loops: list[list[str]] = []
+
+	def walk(start: int, node: int, path: list[int], on_path: set[int]) -> None:
+		for target in graph.edges[node]:
+			if target == start:
+				loops.append([graph.moves[index] for index in path] + [graph.moves[start]])
+			elif target > start and target not in on_path:
+				on_path.add(target)
+				path.append(target)
+				walk(start, target, path, on_path)
+				path.pop()
+				on_path.discard(target)
+
+	for start in range(len(graph.moves)):
+		walk(start, start, [start], {start})
+	return loops
+
+
+def best_routes_by_move(graph: MoveGraph, max_hits: int = DEFAULT_MAX_HITS) -> list[tuple[int, tuple[int, ...]]]:
+	"""For each move as the opening hit: the max total damage and the route (move indexes) that reaches it."""
+
+	@lru_cache(maxsize=None)
+	def best_from(move: int, hit_number: int) -> tuple[int, tuple[int, ...]]:
+		"""Max total damage for a route whose `hit_number`-th hit is `move`, and its continuation."""
+		damage = scaled_combo_damage(graph.damage[move], hit_number, graph.moves[move])
+		if hit_number >= max_hits:
+			return damage, (move,)
+		best_tail: tuple[int, tuple[int, ...]] = (0, ())
+		for target in graph.edges[move]:
+			candidate = best_from(target, hit_number + 1)
+			if candidate[0] > best_tail[0]:
+				best_tail = candidate
+		return damage + best_tail[0], (move, *best_tail[1])
+
+	return [best_from(start, 1) for start in range(len(graph.moves))]
+
+
+def search_routes(graph: MoveGraph, max_hits: int = DEFAULT_MAX_HITS, max_routes: int = DEFAULT_MAX_ROUTES) -> RouteReport:
+	report = RouteReport(character_id=graph.character_id)
+	for damage, route in best_routes_by_move(graph, max_hits):
+		if damage > report.best_damage:
+			report.best_damage = damage
+			report.best_route = [graph.moves[index] for index in route]
+
+	# Enumerate every multi-hit route up to `max_hits`, keeping the top `max_routes` by damage.
+	routes: list[tuple[int, list[str]]] = []
+	stack = [(start, [start], scaled_combo_damage(graph.damage[start], 1, graph.moves[start])) for start in range(len(graph.moves))]
+	while stack:
+		move, path, damage = stack.pop()
+		if len(path) > 1:
+			report.route_count += 1
+			routes.append((damage, [graph.moves[index] for index in path]))
+			if len(routes) > max_routes * 4:
+				routes.sort(key=lambda item: (-item[0], item[1]))
+				del routes[max_routes:]
+				report.routes_truncated = True
+		if len(path) >= max_hits:
+			continue
+		for target in graph.edges[move]:
+			hit_damage = scaled_combo_damage(graph.damage[target], len(path) + 1, graph.moves[target])
+			stack.append((target, [*path, target], damage + hit_damage))
+	routes.sort(key=lambda item: (-item[0], item[1]))
+	report.top_routes = routes[:max_routes]
+	report.routes_truncated = report.routes_truncated or len(routes) > max_routes
+
+	report.loops = find_loops(graph)
+	report.degenerate_moves = [graph.moves[index] for index in range(len(graph.moves)) if index in graph.edges[index]]
+	return report
+
+
+def _search_job(job: tuple[MoveGraph, int, int]) -> RouteReport:
+	graph, max_hits, max_routes = job
+	return search_routes(graph, max_hits, max_routes)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Enumerate combo routes through cancel_on_hit/cancel_options for every character, find the "
+			"max-damage route (with Player.gd combo scaling) and flag cancel loops."
+		)
+	)
+	parser.add_argument(
+		"--project-root",
+		default=str(PROJECT_ROOT),
+		help="Godot project root (default: repository root)",
+	)
+	parser.add_argument("--character", action="append", help="Only search this character id (repeatable)")
+	parser.add_argument(
+		"--max-hits",
+		type=int,
+		default=DEFAULT_MAX_HITS,
+		help=f"Longest route to consider (default: {DEFAULT_MAX_HITS})",
+	)
+	parser.add_argument(
+		"--top",
+		type=int,
+		default=5,
+		help="Routes to list per character in text output (default: 5)",
+	)
+	parser.add_argument(
+		"--max-routes",
+		type=int,
+		default=DEFAULT_MAX_ROUTES,
+		help=f"Routes kept per character (default: {DEFAULT_MAX_ROUTES})",
+	)
+	parser.add_argument(
+		"--jobs",
+		type=int,
+		default=0,
+		help="Worker processes (default: CPU count)",
+	)
+	parser.add_argument(
+		"--fail-on-loops",
+		action="store_true",
+		help="Exit non-zero if any character has a hit-cancel loop",
+	)
+	parser.add_argument(
+		"--format",
+		choices=["text", "json"],
+		default="text",
+		help="Output format. Default: text.",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	if args.max_hits < 1:
+		print("--max-hits must be at least 1", file=sys.stderr)
+		return 1
+	started = time.perf_counter()
+	graphs = build_move_graphs(load_frame_data(Path(args.project_root)))
+	if args.character:
+		wanted = set(args.character)
+		graphs = [graph for graph in graphs if graph.character_id in wanted]
+	if not graphs:
+		print("No matching characters.", file=sys.stderr)
+		return 1
+
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+	pending = [(graph, args.max_hits, args.max_routes) for graph in graphs]
+	if jobs == 1 or len(pending) <= 1:
+		reports = [_search_job(job) for job in pending]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			reports = list(pool.map(_search_job, pending))
+	elapsed = time.perf_counter() - started
+	has_loops = any(report.loops for report in reports)
+
+	if args.format == "json":
+		payload = {
+			"max_hits": args.max_hits,
+			"elapsed_seconds": round(elapsed, 4),
+			"characters": {report.character_id: report.to_dict() for report in reports},
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+	else:
+		print(f"Combo routes: {len(reports)} character(s), up to {args.max_hits} hits ({elapsed * 1000.0:.1f} ms)")
+		for report in reports:
+			truncated = "+" if report.routes_truncated else ""
+			print(
+				f"{report.character_id}: {report.route_count}{truncated} route(s), "
+				f"best {report.best_damage} dmg {' > '.join(report.best_route)}"
+			)
+			for damage, route in report.top_routes[: args.top]:
+				print(f"  - {damage:>3} {' > '.join(route)}")
+			for loop in report.loops:
+				label = "self-cancel" if len(loop) == 2 else "loop"
+				print(f"  ! {label}: {' > '.join(loop)}")
+
+	if args.fail_on_loops and has_loops:
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
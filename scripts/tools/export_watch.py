@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Filesystem change sources and incremental re-validation for a character exports directory.
+
+`InotifySource` talks to the Linux inotify API through ctypes (no third-party watcher needed);
+`PollingSource` diffs `os.scandir` stat snapshots everywhere else. `ExportWatcher` keeps one
+classified entry per file, so a change only re-reads the touched PNG headers before the in-memory
+index/continuity checks run again.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import time
+
+from character_exports_common import (
+	ExportEntry,
+	FileHashCache,
+	ScanResult,
+	assemble_scan,
+	classify_export_entry,
+)
+
+
+DEFAULT_DEBOUNCE_SECONDS = 0.15
+DEFAULT_POLL_INTERVAL = 0.5
+
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+# IN_CLOSE_WRITE (not IN_MODIFY) so a frame is re-read once the editor has finished writing it.
+_WATCH_MASK = (
+	_IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+	| _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+# Sentinel change name: re-list the whole directory (queue overflow, polling restart).
+RESCAN = ""
+
+
+class WatchedDirectoryGone(Exception):
+	pass
+
+
+class InotifySource:
+	"""Names changed in one directory, from a non-blocking inotify descriptor."""
+
+	kind = "inotify"
+
+	def __init__(self, directory: Path) -> None:
+		if not sys.platform.startswith("linux"):
+			raise OSError("inotify is only available on Linux")
+		libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+		self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+		if self._fd < 0:
+			raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+		if libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK) < 0:
+			errno = ctypes.get_errno()
+			os.close(self._fd)
+			raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+	def wait(self, timeout: float | None) -> set[str]:
+		ready, _, _ = select.select([self._fd], [], [], timeout)
+		if not ready:
+			return set()
+		try:
+			data = os.read(self._fd, 64 * 1024)
+		except BlockingIOError:
+			return set()
+		changed: set[str] = set()
+		offset = 0
+		while offset + _EVENT_HEADER.size <= len(data):
+			_, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+			offset += _EVENT_HEADER.size
+			name = data[offset : offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+			offset += length
+			if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+				raise WatchedDirectoryGone()
+			changed.add(RESCAN if mask & _IN_Q_OVERFLOW else name)
+		return changed
+
+	def close(self) -> None:
+		os.close(self._fd)
+
+
+class PollingSource:
+	"""Names whose (size, mtime, type) changed between `os.scandir` snapshots."""
+
+	kind = "polling"
+
+	def __init__(self, directory: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+		self.directory = directory
+		self.interval = max(0.05, interval)
+		self._snapshot = self._scan()
+
+	def _scan(self) -> dict[str, tuple[int, int, bool]]:
+		try:
+			with os.scandir(self.directory) as entries:
+				snapshot: dict[str, tuple[int, int, bool]] = {}
+				for entry in entries:
+					try:
+						stat = entry.stat()
+					except FileNotFoundError:
+						continue
+					snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns, entry.is_dir())
+				return snapshot
+		except (FileNotFoundError, NotADirectoryError) as exc:
+			raise WatchedDirectoryGone() from exc
+
+	def wait(self, timeout: float | None) -> set[str]:
+		deadline = None if timeout is None else time.monotonic() + timeout
+		while True:
+			pause = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+			time.sleep(pause)
+			snapshot = self._scan()
+			changed = {
+				name for name in set(snapshot) | set(self._snapshot) if snapshot.get(name) != self._snapshot.get(name)
+			}
+			self._snapshot = snapshot
+			if changed or (deadline is not None and time.monotonic() >= deadline):
+				return changed
+
+	def close(self) -> None:
+		pass
+
+
+def open_change_source(directory: Path, *, poll: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL):
+	"""inotify where available, otherwise (or when `poll` is set) stat polling."""
+	if not poll:
+		try:
+			return InotifySource(directory)
+		except (OSError, AttributeError):
+			pass
+	return PollingSource(directory, poll_interval)
+
+
+def wait_for_changes(source, debounce: float = DEFAULT_DEBOUNCE_SECONDS) -> set[str]:
+	"""Block for the next change, then keep collecting until `debounce` seconds pass without another."""
+	changed = source.wait(None)
+	while True:
+		more = source.wait(debounce)
+		if not more:
+			return changed
+		changed |= more
+
+
+@dataclass
+class ExportWatcher:
+	"""Classified entries for one exports directory, updated per changed file."""
+
+	exports_dir: Path
+	expected_size: tuple[int, int] | None
+	require_all: bool = False
+	entries: dict[str, ExportEntry] = field(default_factory=dict)
+	hashes: FileHashCache = field(default_factory=FileHashCache)
+	reads: int = 0
+
+	def rescan(self) -> None:
+		self.entries.clear()
+		for path in sorted(self.exports_dir.iterdir(), key=lambda item: item.name):
+			self._classify(path)
+
+	def apply(self, names: set[str]) -> None:
+		if RESCAN in names:
+			self.rescan()
+			return
+		for name in names:
+			self.entries.pop(name, None)
+			path = self.exports_dir / name
+			if path.exists() or path.is_symlink():
+				self._classify(path)
+
+	def _classify(self, path: Path) -> None:
+		entry = classify_export_entry(path)
+		if entry is None:
+			return
+		self.entries[path.name] = entry
+		if entry.size is not None or entry.errors:
+			self.reads += 1
+
+	def result(self) -> ScanResult:
+		return assemble_scan(
+			self.exports_dir,
+			self.entries.values(),
+			expected_size=self.expected_size,
+			require_all=self.require_all,
+		)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Report exact and near-duplicate frames within and across character exports."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from character_exports_common import scan_character_exports
+from frame_hashes import FrameHashIndex, default_max_distance
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Hash every frame of one or more character exports directories (aHash/dHash over decoded RGBA) "
+			"and report exact and near-duplicate frames."
+		)
+	)
+	parser.add_argument("exports_dirs", nargs="+", help="Directories containing exported PNG frames")
+	parser.add_argument(
+		"--width",
+		type=int,
+		default=24,
+		help="Frame canvas width to hash (default: 24)",
+	)
+	parser.add_argument(
+		"--height",
+		type=int,
+		default=48,
+		help="Frame canvas height to hash (default: 48)",
+	)
+	parser.add_argument(
+		"--max-distance",
+		type=int,
+		help=(
+			"Max differing hash bits for a near-duplicate "
+			f"(default: 1%% of the hash bits, {default_max_distance((24, 48))} at 24x48)"
+		),
+	)
+	parser.add_argument(
+		"--format",
+		choices=["text", "json"],
+		default="text",
+		help="Output format. Default: text.",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	canvas = (args.width, args.height)
+	started = time.perf_counter()
+
+	index = FrameHashIndex(canvas=canvas)
+	max_distance = default_max_distance(canvas) if args.max_distance is None else args.max_distance
+	errors: list[str] = []
+	for exports_dir in args.exports_dirs:
+		result = scan_character_exports(exports_dir, expected_size=canvas, hash_frames=True)
+		errors.extend(f"{Path(exports_dir)}: {error}" for error in result.errors)
+		if result.frame_hashes is not None:
+			index.extend(result.frame_hashes)
+	elapsed = time.perf_counter() - started
+
+	if args.format == "json":
+		payload = index.to_dict(max_distance)
+		payload["errors"] = errors
+		payload["elapsed_seconds"] = round(elapsed, 4)
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+		return 0
+
+	print(f"Hashed frames: {len(index.frames)} in {elapsed * 1000.0:.1f} ms")
+	exact_groups = index.exact_groups()
+	print(f"Exact duplicate groups: {len(exact_groups)}")
+	for group in exact_groups:
+		print("  - " + ", ".join(hashed.key for hashed in group))
+	near = index.near_duplicates(max_distance)
+	print(f"Near duplicates (<= {max_distance} of {index.hash_bits} bits): {len(near)}")
+	for pair in near:
+		print(
+			f"  - {pair.first.key} ~ {pair.second.key} "
+			f"(ahash={pair.ahash_distance}, dhash={pair.dhash_distance})"
+		)
+	if index.skipped:
+		print("Skipped (non-canvas size): " + ", ".join(index.skipped))
+	if errors:
+		print("Errors:")
+		for error in errors:
+			print(f"  - {error}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""Roster-wide frame data: advantage, punishability and cancel reachability from the attack tables."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+from dataclasses import dataclass
+import io
+import json
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+
+from animation_profiles import load_animation_profiles
+from godot_resource import PROJECT_ROOT, load_attack_tables
+
+
+# Fallbacks mirror the `data.get(...)` defaults in Player.gd.
+TIMING_DEFAULTS = {
+	"startup": 0.06,
+	"active": 0.10,
+	"recovery": 0.20,
+	"hitstun": 0.18,
+	"blockstun": 0.14,
+}
+KNOCKDOWN_HITSTUN_THRESHOLD = 0.22
+KNOCKDOWN_VERTICAL_THRESHOLD = 145.0
+FRAME_FIELDS = ("startup", "active", "recovery", "block_recovery", "hitstun", "blockstun")
+FRAME_DATA_DTYPE = np.dtype(
+	[
+		("character_id", "U32"),
+		("move", "U32"),
+		("damage", "f4"),
+		("cancel_on_hit", "?"),
+		("cancel_on_block", "?"),
+		("knockdown", "?"),
+	]
+	+ [(f"{name}_seconds", "f4") for name in FRAME_FIELDS]
+	+ [(name, "i4") for name in FRAME_FIELDS]
+)
+BASE_MOVES = ["light", "heavy", "special", "throw"]
+# Player._can_block_hit never blocks a throw, so throws have no on-block advantage and do not punish a block.
+UNBLOCKABLE_MOVES = ("throw",)
+MATRIX_METRICS = (
+	"on_hit",
+	"on_hit_late",
+	"on_block",
+	"punisher_count",
+	"fastest_punish",
+	"startup",
+	"damage",
+)
+BLOCK_METRICS = ("on_block", "punisher_count", "fastest_punish")
+# Frame advantage reads as +N/-N; counts, durations and damage are plain numbers.
+SIGNED_METRICS = ("on_hit", "on_hit_late", "on_block")
+MOVE_COLUMNS = (
+	"character_id",
+	"move",
+	"startup",
+	"active",
+	"recovery",
+	"on_hit",
+	"on_hit_late",
+	"on_block",
+	"punisher_count",
+	"fastest_punish",
+	"damage",
+	"knockdown",
+)
+
+
+@dataclass(frozen=True)
+class FrameDataTable:
+	"""One row per (character, move); `cancel_options[i]` belongs to `records[i]`."""
+
+	records: np.ndarray
+	cancel_options: list[tuple[str, ...]]
+	ticks_per_second: int
+
+	@property
+	def characters(self) -> list[str]:
+		return list(dict.fromkeys(self.records["character_id"].tolist()))
+
+	@property
+	def moves(self) -> list[str]:
+		seen = dict.fromkeys(BASE_MOVES)
+		seen.update(dict.fromkeys(sorted(set(self.records["move"].tolist()))))
+		return [move for move in seen if move in set(self.records["move"].tolist())]
+
+	def row_index(self) -> dict[tuple[str, str], int]:
+		return {
+			(str(character_id), str(move)): index
+			for index, (character_id, move) in enumerate(zip(self.records["character_id"], self.records["move"]))
+		}
+
+
+@dataclass(frozen=True)
+class FrameDataAnalysis:
+	on_hit: np.ndarray
+	on_hit_late: np.ndarray
+	on_block: np.ndarray
+	blockable: np.ndarray
+	punish_matrix: np.ndarray
+	punisher_count: np.ndarray
+	fastest_punish: np.ndarray
+	cancel_on_hit: np.ndarray
+	cancel_on_block: np.ndarray
+	combo_reach: np.ndarray
+	pressure_reach: np.ndarray
+
+	@property
+	def punishable(self) -> np.ndarray:
+		return self.punisher_count > 0
+
+
+def seconds_to_frames(seconds: np.ndarray, ticks_per_second: int) -> np.ndarray:
+	# A phase ends on the first physics tick where `attack_time >= duration`.
+	return np.ceil(np.asarray(seconds, dtype=np.float64) * ticks_per_second - 1e-6).astype(np.int32)
+
+
+def _causes_knockdown(move: str, entry: dict, hitstun_seconds: float) -> bool:
+	"""Player._should_knockdown for a grounded hit with the table's base knockback."""
+	if move == "throw":
+		return True
+	if hitstun_seconds >= KNOCKDOWN_HITSTUN_THRESHOLD:
+		return True
+	knockback = entry.get("knockback_ground")
+	return knockback is not None and -float(knockback[1]) >= KNOCKDOWN_VERTICAL_THRESHOLD
+
+
+def load_frame_data(project_root: Path = PROJECT_ROOT, ticks_per_second: int | None = None) -> FrameDataTable:
+	if ticks_per_second is None:
+		ticks_per_second = load_animation_profiles().physics_ticks_per_second
+	rows: list[tuple] = []
+	cancel_options: list[tuple[str, ...]] = []
+	for file_name, resource in load_attack_tables(project_root).items():
+		properties = resource.properties
+		character_id = str(properties.get("character_id") or file_name.removesuffix("AttackTable.tres"))
+		attacks = properties.get("attacks", {})
+		if not isinstance(attacks, dict):
+			continue
+		for move, entry in attacks.items():
+			if not isinstance(entry, dict):
+				continue
+			recovery = float(entry.get("recovery", TIMING_DEFAULTS["recovery"]))
+			seconds = [
+				float(entry.get("startup", TIMING_DEFAULTS["startup"])),
+				float(entry.get("active", TIMING_DEFAULTS["active"])),
+				recovery,
+				float(entry.get("block_recovery", recovery)),
+				float(entry.get("hitstun", TIMING_DEFAULTS["hitstun"])),
+				float(entry.get("blockstun", TIMING_DEFAULTS["blockstun"])),
+			]
+			rows.append(
+				(
+					character_id,
+					str(move),
+					float(entry.get("damage", 0)),
+					bool(entry.get("cancel_on_hit", False)),
+					bool(entry.get("cancel_on_block", False)),
+					_causes_knockdown(str(move), entry, seconds[4]),
+					*seconds,
+					*([0] * len(FRAME_FIELDS)),
+				)
+			)
+			cancel_options.append(tuple(str(option) for option in entry.get("cancel_options", [])))
+	records = np.array(rows, dtype=FRAME_DATA_DTYPE)
+	for name in FRAME_FIELDS:
+		records[name] = seconds_to_frames(records[f"{name}_seconds"], ticks_per_second)
+	return FrameDataTable(records=records, cancel_options=cancel_options, ticks_per_second=ticks_per_second)
+
+
+def _cancel_adjacency(table: FrameDataTable) -> np.ndarray:
+	"""`adjacency[i, j]` is True when move i lists move j (same character) in `cancel_options`."""
+	records = table.records
+	count = len(records)
+	index = table.row_index()
+	adjacency = np.zeros((count, count), dtype=bool)
+	for source, options in enumerate(table.cancel_options):
+		character_id = str(records["character_id"][source])
+		for option in options:
+			target = index.get((character_id, option))
+			if target is not None:
+				adjacency[source, target] = True
+	return adjacency
+
+
+def transitive_closure(adjacency: np.ndarray) -> np.ndarray:
+	"""Reachability in one or more steps, by repeated boolean squaring."""
+	reach = adjacency.copy()
+	while True:
+		step = reach | ((reach.astype(np.uint8) @ reach.astype(np.uint8)) > 0)
+		if np.array_equal(step, reach):
+			return reach
+		reach = step
+
+
+def analyze_frame_data(table: FrameDataTable) -> FrameDataAnalysis:
+	records = table.records
+	startup = records["startup"]
+	active = records["active"]
+	recovery = records["recovery"]
+	hitstun = records["hitstun"]
+
+	# On hit the attack keeps running; on block Player._on_attack_blocked jumps straight to block_recovery.
+	on_hit = hitstun - active - recovery
+	on_hit_late = hitstun - recovery
+	blockable = ~np.isin(records["move"], UNBLOCKABLE_MOVES)
+	on_block = np.where(blockable, records["blockstun"] - records["block_recovery"], 0).astype(np.int32)
+
+	# punish_matrix[i, j]: defender move j becomes active before attacker move i recovers from a block.
+	punish_matrix = (startup[None, :] <= -on_block[:, None]) & blockable[:, None] & blockable[None, :]
+	characters = np.asarray(table.characters)
+	owner = records["character_id"][None, :] == characters[:, None]
+	punishes_by_character = (punish_matrix[:, None, :] & owner[None, :, :]).any(axis=2)
+	punisher_count = punishes_by_character.sum(axis=1).astype(np.int32)
+	masked_startup = np.where(punish_matrix, startup[None, :], np.iinfo(np.int32).max)
+	fastest = masked_startup.min(axis=1)
+	fastest_punish = np.where(fastest == np.iinfo(np.int32).max, -1, fastest).astype(np.int32)
+
+	adjacency = _cancel_adjacency(table)
+	# A hit cancel only combos if the follow-up is active before hitstun runs out.
+	cancel_on_hit = adjacency & records["cancel_on_hit"][:, None] & (startup[None, :] <= hitstun[:, None])
+	cancel_on_block = adjacency & records["cancel_on_block"][:, None]
+	return FrameDataAnalysis(
+		on_hit=on_hit,
+		on_hit_late=on_hit_late,
+		on_block=on_block,
+		blockable=blockable,
+		punish_matrix=punish_matrix,
+		punisher_count=punisher_count,
+		fastest_punish=fastest_punish,
+		cancel_on_hit=cancel_on_hit,
+		cancel_on_block=cancel_on_block,
+		combo_reach=transitive_closure(cancel_on_hit),
+		pressure_reach=transitive_closure(cancel_on_block),
+	)
+
+
+def metric_values(table: FrameDataTable, analysis: FrameDataAnalysis, metric: str) -> np.ndarray:
+	if metric in ("startup", "damage"):
+		return table.records[metric]
+	values = getattr(analysis, metric)
+	if metric in BLOCK_METRICS:
+		# Unblockable moves get an empty cell rather than a meaningless 0 / -1.
+		return np.where(analysis.blockable, values, np.nan)
+	return values
+
+
+def roster_move_matrix(
+	table: FrameDataTable,
+	values: np.ndarray,
+	moves: list[str] | None = None,
+) -> tuple[list[str], list[str], np.ndarray]:
+	"""Scatter per-row `values` into a characters x moves float matrix (NaN where a move is absent)."""
+	characters = table.characters
+	moves = moves or table.moves
+	character_pos = {character_id: index for index, character_id in enumerate(characters)}
+	move_pos = {move: index for index, move in enumerate(moves)}
+	matrix = np.full((len(characters), len(moves)), np.nan, dtype=np.float64)
+	rows = np.array([character_pos[str(value)] for value in table.records["character_id"]], dtype=np.intp)
+	cols = np.array([move_pos.get(str(value), -1) for value in table.records["move"]], dtype=np.intp)
+	keep = cols >= 0
+	matrix[rows[keep], cols[keep]] = np.asarray(values, dtype=np.float64)[keep]
+	return characters, moves, matrix
+
+
+def _reachable_moves(table: FrameDataTable, reach: np.ndarray, row: int) -> list[str]:
+	return [str(table.records["move"][target]) for target in np.flatnonzero(reach[row])]
+
+
+def build_frame_data_dict(table: FrameDataTable, analysis: FrameDataAnalysis) -> dict:
+	records = table.records
+	characters: dict[str, dict] = {}
+	for row in range(len(records)):
+		character_id = str(records["character_id"][row])
+		move = str(records["move"][row])
+		characters.setdefault(character_id, {})[move] = {
+			"startup": int(records["startup"][row]),
+			"active": int(records["active"][row]),
+			"recovery": int(records["recovery"][row]),
+			"block_recovery": int(records["block_recovery"][row]),
+			"hitstun": int(records["hitstun"][row]),
+			"blockstun": int(records["blockstun"][row]),
+			"damage": float(records["damage"][row]),
+			"knockdown": bool(records["knockdown"][row]),
+			"on_hit": int(analysis.on_hit[row]),
+			"on_hit_late": int(analysis.on_hit_late[row]),
+			"on_block": int(analysis.on_block[row]) if analysis.blockable[row] else None,
+			"punishable": bool(analysis.punishable[row]),
+			"punisher_count": int(analysis.punisher_count[row]),
+			"fastest_punish": int(analysis.fastest_punish[row]),
+			"combo_cancels": _reachable_moves(table, analysis.cancel_on_hit, row),
+			"combo_reachable": _reachable_moves(table, analysis.combo_reach, row),
+			"block_cancels": _reachable_moves(table, analysis.cancel_on_block, row),
+		}
+	return {
+		"ticks_per_second": table.ticks_per_second,
+		"character_count": len(characters),
+		"move_count": int(len(records)),
+		"characters": characters,
+	}
+
+
+def move_table_rows(table: FrameDataTable, analysis: FrameDataAnalysis) -> list[list[str]]:
+	"""One row per move in `MOVE_COLUMNS` order; block columns are empty for unblockable moves."""
+	records = table.records
+	rows = []
+	for row in range(len(records)):
+		blockable = bool(analysis.blockable[row])
+		rows.append(
+			[
+				str(records["character_id"][row]),
+				str(records["move"][row]),
+				str(records["startup"][row]),
+				str(records["active"][row]),
+				str(records["recovery"][row]),
+				str(analysis.on_hit[row]),
+				str(analysis.on_hit_late[row]),
+				str(analysis.on_block[row]) if blockable else "",
+				str(analysis.punisher_count[row]) if blockable else "",
+				str(analysis.fastest_punish[row]) if blockable else "",
+				f"{records['damage'][row]:g}",
+				"true" if records["knockdown"][row] else "false",
+			]
+		)
+	return rows
+
+
+def render_move_table(table: FrameDataTable, analysis: FrameDataAnalysis, output_format: str) -> str:
+	rows = move_table_rows(table, analysis)
+	if output_format == "csv":
+		buffer = io.StringIO()
+		writer = csv.writer(buffer, lineterminator="\n")
+		writer.writerow(MOVE_COLUMNS)
+		writer.writerows(rows)
+		return buffer.getvalue()
+	lines = [
+		"| " + " | ".join(f"`{column}`" for column in MOVE_COLUMNS) + " |",
+		"| " + " | ".join("---" for _ in MOVE_COLUMNS) + " |",
+	]
+	lines.extend("| " + " | ".join(row) + " |" for row in rows)
+	return "\n".join(lines) + "\n"
+
+
+def _format_cell(value: float, signed: bool) -> str:
+	if np.isnan(value):
+		return ""
+	if float(value).is_integer():
+		return f"{int(value):+d}" if signed else str(int(value))
+	return f"{value:g}"
+
+
+def render_matrix(
+	characters: list[str],
+	moves: list[str],
+	matrix: np.ndarray,
+	output_format: str,
+	signed: bool = False,
+) -> str:
+	if output_format == "csv":
+		buffer = io.StringIO()
+		writer = csv.writer(buffer, lineterminator="\n")
+		writer.writerow(["character_id", *moves])
+		for character_id, row in zip(characters, matrix):
+			writer.writerow([character_id, *("" if np.isnan(value) else f"{value:g}" for value in row)])
+		return buffer.getvalue()
+	lines = [
+		"| Character ID | " + " | ".join(f"`{move}`" for move in moves) + " |",
+		"| --- | " + " | ".join("---" for _ in moves) + " |",
+	]
+	for character_id, row in zip(characters, matrix):
+		lines.append(f"| `{character_id}` | " + " | ".join(_format_cell(value, signed) for value in row) + " |")
+	return "\n".join(lines) + "\n"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Compute on-hit/on-block advantage, punishability and cancel reachability for every attack in "
+			"assets/data/characters/*AttackTable.tres, and export roster x move matrices."
+		)
+	)
+	parser.add_argument(
+		"--project-root",
+		default=str(PROJECT_ROOT),
+		help="Godot project root (default: repository root)",
+	)
+	parser.add_argument(
+		"--matrix",
+		choices=MATRIX_METRICS,
+		help="Export one roster x move matrix instead of the per-move report",
+	)
+	parser.add_argument(
+		"--moves",
+		help="Comma-separated move columns for --matrix (default: every move in the roster)",
+	)
+	parser.add_argument(
+		"--format",
+		choices=["text", "json", "csv", "markdown"],
+		default="text",
+		help="Output format. csv/markdown give one row per move, or the --matrix grid. Default: text.",
+	)
+	parser.add_argument("--output", help="Write to this file instead of stdout")
+	return parser
+
+
+def _render_text_report(table: FrameDataTable, analysis: FrameDataAnalysis, elapsed: float) -> str:
+	records = table.records
+	lines = [
+		f"Frame data: {len(table.characters)} character(s), {len(records)} move(s) "
+		f"at {table.ticks_per_second} ticks/s ({elapsed * 1000.0:.1f} ms)"
+	]
+	current = ""
+	for row in range(len(records)):
+		character_id = str(records["character_id"][row])
+		if character_id != current:
+			current = character_id
+			lines.append(f"{character_id}:")
+		if not analysis.blockable[row]:
+			block = "unblockable"
+		elif analysis.punishable[row]:
+			block = (
+				f"block {analysis.on_block[row]:+d} punishable by {analysis.punisher_count[row]} "
+				f"(fastest {analysis.fastest_punish[row]}f)"
+			)
+		else:
+			block = f"block {analysis.on_block[row]:+d} safe"
+		combo = ",".join(_reachable_moves(table, analysis.combo_reach, row)) or "-"
+		lines.append(
+			f"  - {records['move'][row]}: S{records['startup'][row]} A{records['active'][row]} "
+			f"R{records['recovery'][row]} hit {analysis.on_hit[row]:+d}..{analysis.on_hit_late[row]:+d} "
+			f"{block} combo->{combo}"
+		)
+	return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	table = load_frame_data(Path(args.project_root))
+	if len(table.records) == 0:
+		print(f"No attack tables found under {args.project_root}", file=sys.stderr)
+		return 1
+	analysis = analyze_frame_data(table)
+	elapsed = time.perf_counter() - started
+
+	if args.matrix:
+		moves = [move.strip() for move in args.moves.split(",") if move.strip()] if args.moves else None
+		characters, moves, matrix = roster_move_matrix(table, metric_values(table, analysis, args.matrix), moves)
+		if args.format == "json":
+			rendered = json.dumps(
+				{
+					"metric": args.matrix,
+					"moves": moves,
+					"rows": {
+						character_id: [None if np.isnan(value) else float(value) for value in row]
+						for character_id, row in zip(characters, matrix)
+					},
+				},
+				indent=2,
+				ensure_ascii=False,
+			) + "\n"
+		else:
+			rendered = render_matrix(
+				characters,
+				moves,
+				matrix,
+				"csv" if args.format == "csv" else "markdown",
+				signed=args.matrix in SIGNED_METRICS,
+			)
+	elif args.format == "json":
+		payload = build_frame_data_dict(table, analysis)
+		payload["elapsed_seconds"] = round(elapsed, 4)
+		rendered = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+	elif args.format in ("csv", "markdown"):
+		rendered = render_move_table(table, analysis, args.format)
+	else:
+		rendered = _render_text_report(table, analysis, elapsed)
+
+	if args.output:
+		Path(args.output).write_text(rendered, encoding="utf-8")
+		print(f"Wrote frame data: {args.output}")
+	else:
+		sys.stdout.write(rendered)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
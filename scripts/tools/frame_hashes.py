@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Exact and perceptual (aHash/dHash) frame hashing for character exports."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+from PIL import Image
+
+from character_exports_common import FrameRecord, ScanResult
+
+
+# One hash cell per 2x2 pixels (at least 8x8 cells, at most 64 per side): an 8x8 grid over a 24x48 frame
+# averages 3x6-pixel blocks, which maps most standing poses onto the same bits.
+HASH_CELL_PIXELS = 2
+MIN_HASH_GRID = 8
+MAX_HASH_GRID = 64
+# Default near-duplicate threshold as a fraction of the hash bits (2 of 288 bits at 24x48).
+DEFAULT_MAX_DISTANCE_RATIO = 0.01
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class HashedFrame:
+	character_id: str
+	frame: FrameRecord
+	digest: str
+	ahash: int
+	dhash: int
+
+	@property
+	def key(self) -> str:
+		return f"{self.character_id}/{self.frame.filename}"
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+	first: HashedFrame
+	second: HashedFrame
+	ahash_distance: int
+	dhash_distance: int
+
+
+def hash_grid(canvas: tuple[int, int]) -> tuple[int, int]:
+	"""`(rows, cols)` of the aHash grid for a `(width, height)` canvas; dHash uses one extra column."""
+	width, height = canvas
+	return (
+		min(MAX_HASH_GRID, max(MIN_HASH_GRID, height // HASH_CELL_PIXELS)),
+		min(MAX_HASH_GRID, max(MIN_HASH_GRID, width // HASH_CELL_PIXELS)),
+	)
+
+
+def default_max_distance(canvas: tuple[int, int]) -> int:
+	rows, cols = hash_grid(canvas)
+	return max(1, int(rows * cols * DEFAULT_MAX_DISTANCE_RATIO))
+
+
+@dataclass
+class FrameHashIndex:
+	canvas: tuple[int, int]
+	frames: list[HashedFrame] = field(default_factory=list)
+	skipped: list[str] = field(default_factory=list)
+
+	@property
+	def hash_bits(self) -> int:
+		rows, cols = hash_grid(self.canvas)
+		return rows * cols
+
+	def extend(self, other: FrameHashIndex) -> None:
+		if other.canvas != self.canvas:
+			raise ValueError(f"Cannot merge hash indexes for {other.canvas} into {self.canvas}")
+		self.frames.extend(other.frames)
+		self.skipped.extend(other.skipped)
+
+	def exact_groups(self) -> list[list[HashedFrame]]:
+		"""Groups of frames with byte-identical decoded RGBA pixels (2+ members)."""
+		groups: dict[str, list[HashedFrame]] = {}
+		for hashed in self.frames:
+			groups.setdefault(hashed.digest, []).append(hashed)
+		return [group for _, group in sorted(groups.items(), key=lambda item: item[1][0].key) if len(group) > 1]
+
+	def near_duplicates(self, max_distance: int | None = None) -> list[NearDuplicate]:
+		"""Pairs whose aHash and dHash both differ by at most `max_distance` bits, excluding exact copies.
+
+		`max_distance` defaults to `default_max_distance(canvas)`.
+		"""
+		count = len(self.frames)
+		if count < 2:
+			return []
+		if max_distance is None:
+			max_distance = default_max_distance(self.canvas)
+		a_dist = _hamming_matrix([hashed.ahash for hashed in self.frames], self.hash_bits)
+		d_dist = _hamming_matrix([hashed.dhash for hashed in self.frames], self.hash_bits)
+		digests = np.array([hashed.digest for hashed in self.frames])
+		upper = np.triu(np.ones((count, count), dtype=bool), k=1)
+		mask = upper & (a_dist <= max_distance) & (d_dist <= max_distance) & (digests[:, None] != digests[None, :])
+		pairs: list[NearDuplicate] = []
+		for i, j in zip(*np.nonzero(mask)):
+			pairs.append(
+				NearDuplicate(
+					first=self.frames[i],
+					second=self.frames[j],
+					ahash_distance=int(a_dist[i, j]),
+					dhash_distance=int(d_dist[i, j]),
+				)
+			)
+		pairs.sort(key=lambda pair: (pair.ahash_distance + pair.dhash_distance, pair.first.key, pair.second.key))
+		return pairs
+
+	def canonical_paths(self) -> dict[Path, Path]:
+		"""Map every exact duplicate frame path to the first frame path sharing its pixels."""
+		mapping: dict[Path, Path] = {}
+		for group in self.exact_groups():
+			canonical = group[0].frame.path
+			for hashed in group[1:]:
+				mapping[hashed.frame.path] = canonical
+		return mapping
+
+	def to_dict(self, max_distance: int | None = None) -> dict:
+		if max_distance is None:
+			max_distance = default_max_distance(self.canvas)
+		return {
+			"canvas": {"width": self.canvas[0], "height": self.canvas[1]},
+			"hash_bits": self.hash_bits,
+			"max_distance": max_distance,
+			"frame_count": len(self.frames),
+			"skipped": list(self.skipped),
+			"exact_duplicates": [[hashed.key for hashed in group] for group in self.exact_groups()],
+			"near_duplicates": [
+				{
+					"frames": [pair.first.key, pair.second.key],
+					"ahash_distance": pair.ahash_distance,
+					"dhash_distance": pair.dhash_distance,
+				}
+				for pair in self.near_duplicates(max_distance)
+			],
+		}
+
+
+def _hamming_matrix(hashes: list[int], bits: int) -> np.ndarray:
+	width = (bits + 7) // 8
+	packed = np.frombuffer(b"".join(value.to_bytes(width, "big") for value in hashes), dtype=np.uint8)
+	packed = packed.reshape(len(hashes), width)
+	return _POPCOUNT[packed[:, None, :] ^ packed[None, :, :]].sum(axis=-1, dtype=np.uint16)
+
+
+def _block_means(gray: np.ndarray, rows: int, cols: int) -> np.ndarray:
+	height, width = gray.shape[1:]
+	row_edges = np.linspace(0, height, rows + 1).astype(np.intp)
+	col_edges = np.linspace(0, width, cols + 1).astype(np.intp)
+	sums = np.add.reduceat(np.add.reduceat(gray, row_edges[:-1], axis=1), col_edges[:-1], axis=2)
+	counts = np.outer(np.diff(row_edges), np.diff(col_edges))
+	return sums / counts
+
+
+def _pack_bits(bits: np.ndarray) -> list[int]:
+	packed = np.packbits(bits.reshape(bits.shape[0], -1), axis=1)
+	return [int.from_bytes(row.tobytes(), "big") for row in packed]
+
+
+def decode_frames(paths: Iterable[Path], canvas: tuple[int, int]) -> np.ndarray:
+	"""Decode PNG frames into one `(N, height, width, 4)` uint8 RGBA stack."""
+	width, height = canvas
+	decoded = []
+	for path in paths:
+		with Image.open(path) as image:
+			decoded.append(np.asarray(image.convert("RGBA"), dtype=np.uint8))
+	if not decoded:
+		return np.zeros((0, height, width, 4), dtype=np.uint8)
+	return np.stack(decoded)
+
+
+def hash_stack(stack: np.ndarray) -> tuple[list[str], list[int], list[int]]:
+	"""Return blake2b digests plus aHash/dHash values (`hash_grid` bits each) for an RGBA frame stack."""
+	digests = [hashlib.blake2b(frame.tobytes(), digest_size=16).hexdigest() for frame in stack]
+	if stack.shape[0] == 0:
+		return digests, [], []
+	rgba = stack.astype(np.float32)
+	# Transparent pixels collapse to black so background noise under alpha=0 is ignored.
+	gray = (rgba[..., 0] * 0.299 + rgba[..., 1] * 0.587 + rgba[..., 2] * 0.114) * (rgba[..., 3] / 255.0)
+	rows, cols = hash_grid((stack.shape[2], stack.shape[1]))
+	# Canvases smaller than the grid (dHash needs cols + 1 columns) are upsampled nearest-neighbour, so
+	# every hash cell covers at least one pixel instead of an empty, divide-by-zero block.
+	gray = gray.repeat(-(-rows // gray.shape[1]), axis=1).repeat(-(-(cols + 1) // gray.shape[2]), axis=2)
+	small = _block_means(gray, rows, cols)
+	ahash_bits = small > small.mean(axis=(1, 2), keepdims=True)
+	wide = _block_means(gray, rows, cols + 1)
+	dhash_bits = wide[:, :, 1:] > wide[:, :, :-1]
+	return digests, _pack_bits(ahash_bits), _pack_bits(dhash_bits)
+
+
+def build_frame_hash_index(result: ScanResult, *, character_id: str) -> FrameHashIndex:
+	canvas = result.expected_size or (24, 48)
+	index = FrameHashIndex(canvas=canvas)
+	frames: list[FrameRecord] = []
+	for animation_frames in result.frames_by_animation.values():
+		for frame in animation_frames:
+			if (frame.width, frame.height) != canvas:
+				index.skipped.append(f"{character_id}/{frame.filename}")
+				continue
+			frames.append(frame)
+	digests, ahashes, dhashes = hash_stack(decode_frames((frame.path for frame in frames), canvas))
+	for frame, digest, ahash, dhash in zip(frames, digests, ahashes, dhashes):
+		index.frames.append(
+			HashedFrame(character_id=character_id, frame=frame, digest=digest, ahash=ahash, dhash=dhash)
+		)
+	return index
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Bootstrap A/B comparison of training drill and onboarding lesson funnels between two record sets.
+
+Each session contributes one row per funnel (numerator and denominator counts); metrics are ratios of
+sums, so resampling whole sessions keeps the per-session correlation between attempts intact.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import numpy as np
+
+
+DEFAULT_RESAMPLES = 5000
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MIN_SESSIONS = 5
+# Upper bound on resample-by-session cells materialized per chunk (~32 MiB of int64 counts).
+_CHUNK_CELLS = 4_000_000
+
+
+@dataclass(frozen=True)
+class FunnelMetric:
+	name: str
+	numerator: str
+	denominator: str
+	# Metrics stored as per-session averages are turned back into sums with their sample count.
+	numerator_is_average: bool = False
+	higher_is_better: bool = True
+
+
+@dataclass(frozen=True)
+class FunnelKind:
+	name: str
+	record_field: str
+	metrics: tuple[FunnelMetric, ...]
+
+
+FUNNEL_KINDS = (
+	FunnelKind(
+		name="training_drill",
+		record_field="training_drill_funnels",
+		metrics=(
+			FunnelMetric("completion_rate", "rep_result_count", "rep_start_count"),
+			FunnelMetric("success_rate", "success_count", "rep_result_count"),
+			FunnelMetric("avg_result_seconds", "avg_result_seconds", "rep_result_count", True, False),
+		),
+	),
+	FunnelKind(
+		name="onboarding_lesson",
+		record_field="onboarding_lesson_funnels",
+		metrics=(
+			FunnelMetric("completion_rate", "result_count", "start_count"),
+			FunnelMetric("success_rate", "success_count", "result_count"),
+			FunnelMetric("avg_attempt_seconds", "avg_attempt_seconds", "result_count", True, False),
+		),
+	),
+)
+
+
+@dataclass
+class RecordSelector:
+	"""`file=PATH`, `build=ID` and `date=START..END` terms, comma-separated; every term must match.
+
+	Dates compare against `timestamp_utc`; a bare `YYYY-MM-DD` end bound includes that whole day.
+	"""
+
+	spec: str
+	file: str = ""
+	build: str = ""
+	since: str = ""
+	until: str = ""
+
+	@classmethod
+	def parse(cls, spec: str) -> RecordSelector:
+		selector = cls(spec=spec)
+		for term in (part.strip() for part in spec.split(",")):
+			if not term:
+				continue
+			key, separator, value = term.partition("=")
+			key = key.strip().lower()
+			value = value.strip()
+			if not separator or not value:
+				raise ValueError(f"expected KEY=VALUE in {spec!r}, got {term!r}")
+			if key == "file":
+				selector.file = value
+			elif key == "build":
+				selector.build = value
+			elif key == "date":
+				since, dots, until = value.partition("..")
+				selector.since = since.strip()
+				selector.until = until.strip() if dots else since.strip()
+			else:
+				raise ValueError(f"unknown selector key {key!r} in {spec!r} (use file, build or date)")
+		return selector
+
+	def matches(self, record: dict[str, Any]) -> bool:
+		if self.build and str(record.get("build_id", "")) != self.build:
+			return False
+		if self.since or self.until:
+			timestamp = str(record.get("timestamp_utc", ""))
+			if not timestamp:
+				return False
+			if self.since and timestamp[: len(self.since)] < self.since:
+				return False
+			if self.until and timestamp[: len(self.until)] > self.until:
+				return False
+		return True
+
+
+@dataclass
+class FunnelRows:
+	"""Per-session numerator/denominator columns for one funnel, one column pair per metric."""
+
+	numerators: list[list[float]] = field(default_factory=list)
+	denominators: list[list[float]] = field(default_factory=list)
+
+	@property
+	def session_count(self) -> int:
+		return len(self.numerators)
+
+
+def collect_funnel_rows(records: Iterable[dict[str, Any]], kind: FunnelKind) -> dict[str, FunnelRows]:
+	rows: dict[str, FunnelRows] = {}
+	for record in records:
+		funnels = record.get(kind.record_field, {})
+		if not isinstance(funnels, dict):
+			continue
+		for funnel_id, funnel in funnels.items():
+			key = str(funnel_id).strip().lower()
+			if not key or not isinstance(funnel, dict):
+				continue
+			entry = rows.setdefault(key, FunnelRows())
+			numerators: list[float] = []
+			denominators: list[float] = []
+			for metric in kind.metrics:
+				denominator = float(funnel.get(metric.denominator, 0) or 0)
+				numerator = float(funnel.get(metric.numerator, 0) or 0)
+				numerators.append(numerator * denominator if metric.numerator_is_average else numerator)
+				denominators.append(denominator)
+			entry.numerators.append(numerators)
+			entry.denominators.append(denominators)
+	return rows
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+	with np.errstate(invalid="ignore", divide="ignore"):
+		return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1.0), np.nan)
+
+
+def bootstrap_ratios(rows: FunnelRows, resamples: int, rng: np.random.Generator) -> np.ndarray:
+	"""`(resamples, metrics)` ratio-of-sums for session resamples drawn with replacement.
+
+	Resample counts come from one `bincount` per chunk, then a single matrix product sums every metric.
+	"""
+	values = np.hstack([np.asarray(rows.numerators, dtype=np.float64), np.asarray(rows.denominators, dtype=np.float64)])
+	sessions, width = values.shape
+	metric_count = width // 2
+	result = np.empty((resamples, metric_count), dtype=np.float64)
+	chunk = max(1, min(resamples, _CHUNK_CELLS // max(1, sessions)))
+	for start in range(0, resamples, chunk):
+		size = min(chunk, resamples - start)
+		picks = rng.integers(0, sessions, size=(size, sessions))
+		picks += (np.arange(size) * sessions)[:, None]
+		counts = np.bincount(picks.ravel(), minlength=size * sessions).reshape(size, sessions)
+		sums = counts @ values
+		result[start : start + size] = _ratio(sums[:, :metric_count], sums[:, metric_count:])
+	return result
+
+
+@dataclass
+class MetricDelta:
+	kind: str
+	funnel_id: str
+	metric: str
+	higher_is_better: bool
+	baseline_sessions: int
+	candidate_sessions: int
+	baseline: float | None
+	candidate: float | None
+	delta: float | None = None
+	ci_low: float | None = None
+	ci_high: float | None = None
+	p_value: float | None = None
+	significant: bool = False
+
+	@property
+	def regression(self) -> bool:
+		if not self.significant or self.delta is None:
+			return False
+		return self.delta < 0.0 if self.higher_is_better else self.delta > 0.0
+
+	@property
+	def improvement(self) -> bool:
+		return self.significant and not self.regression
+
+	def to_dict(self) -> dict[str, Any]:
+		def rounded(value: float | None) -> float | None:
+			return None if value is None else round(value, 6)
+
+		return {
+			"kind": self.kind,
+			"funnel_id": self.funnel_id,
+			"metric": self.metric,
+			"higher_is_better": self.higher_is_better,
+			"baseline_sessions": self.baseline_sessions,
+			"candidate_sessions": self.candidate_sessions,
+			"baseline": rounded(self.baseline),
+			"candidate": rounded(self.candidate),
+			"delta": rounded(self.delta),
+			"ci_low": rounded(self.ci_low),
+			"ci_high": rounded(self.ci_high),
+			"p_value": rounded(self.p_value),
+			"significant": self.significant,
+			"regression": self.regression,
+		}
+
+
+def _point_ratios(rows: FunnelRows | None, metric_count: int) -> list[float | None]:
+	if rows is None or rows.session_count == 0:
+		return [None] * metric_count
+	sums_num = np.asarray(rows.numerators, dtype=np.float64).sum(axis=0)
+	sums_den = np.asarray(rows.denominators, dtype=np.float64).sum(axis=0)
+	return [None if np.isnan(value) else float(value) for value in _ratio(sums_num, sums_den)]
+
+
+def _holm_significant(p_values: list[float], alpha: float) -> list[bool]:
+	"""Holm-Bonferroni step-down over every compared metric, so more funnels do not mean more false alarms."""
+	order = sorted(range(len(p_values)), key=lambda index: p_values[index])
+	significant = [False] * len(p_values)
+	for rank, index in enumerate(order):
+		if p_values[index] > alpha / (len(p_values) - rank):
+			break
+		significant[index] = True
+	return significant
+
+
+def compare_funnels(
+	baseline: list[dict[str, Any]],
+	candidate: list[dict[str, Any]],
+	*,
+	resamples: int = DEFAULT_RESAMPLES,
+	confidence: float = DEFAULT_CONFIDENCE,
+	min_sessions: int = DEFAULT_MIN_SESSIONS,
+	seed: int = 0,
+) -> list[MetricDelta]:
+	rng = np.random.default_rng(seed)
+	tail = (1.0 - confidence) / 2.0
+	deltas: list[MetricDelta] = []
+	tested: list[tuple[MetricDelta, float]] = []
+	for kind in FUNNEL_KINDS:
+		baseline_rows = collect_funnel_rows(baseline, kind)
+		candidate_rows = collect_funnel_rows(candidate, kind)
+		for funnel_id in sorted(set(baseline_rows) | set(candidate_rows)):
+			base = baseline_rows.get(funnel_id)
+			cand = candidate_rows.get(funnel_id)
+			base_points = _point_ratios(base, len(kind.metrics))
+			cand_points = _point_ratios(cand, len(kind.metrics))
+			base_sessions = base.session_count if base else 0
+			cand_sessions = cand.session_count if cand else 0
+			testable = base is not None and cand is not None and min(base_sessions, cand_sessions) >= max(1, min_sessions)
+			if testable:
+				boot_delta = bootstrap_ratios(cand, resamples, rng) - bootstrap_ratios(base, resamples, rng)
+			for index, metric in enumerate(kind.metrics):
+				entry = MetricDelta(
+					kind=kind.name,
+					funnel_id=funnel_id,
+					metric=metric.name,
+					higher_is_better=metric.higher_is_better,
+					baseline_sessions=base_sessions,
+					candidate_sessions=cand_sessions,
+					baseline=base_points[index],
+					candidate=cand_points[index],
+				)
+				deltas.append(entry)
+				if entry.baseline is None or entry.candidate is None:
+					continue
+				entry.delta = entry.candidate - entry.baseline
+				if not testable:
+					continue
+				samples = boot_delta[:, index]
+				samples = samples[~np.isnan(samples)]
+				if samples.size == 0:
+					continue
+				entry.ci_low, entry.ci_high = (float(value) for value in np.quantile(samples, [tail, 1.0 - tail]))
+				# Two-sided bootstrap p-value: how often the resampled delta lands on the other side of zero.
+				below = float(np.count_nonzero(samples <= 0.0)) / samples.size
+				above = float(np.count_nonzero(samples >= 0.0)) / samples.size
+				entry.p_value = min(1.0, 2.0 * min(below, above))
+				tested.append((entry, entry.p_value))
+	for (entry, _), significant in zip(tested, _holm_significant([p for _, p in tested], 1.0 - confidence)):
+		entry.significant = significant and entry.delta != 0.0
+	return deltas
@@ -6,16 +6,21 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
-from character_exports_common import build_manifest_dict, scan_character_exports
-
-
-def _infer_character_id(exports_dir: Path) -> str:
-	if exports_dir.name == "exports" and exports_dir.parent.name:
-		return exports_dir.parent.name
-	return exports_dir.name
+from character_exports_common import (
+	FileHashCache,
+	attach_frame_hashes,
+	build_manifest_dict,
+	build_sprite_frames_tres,
+	hash_scan_frames,
+	infer_character_id,
+	scan_character_exports,
+	write_if_changed,
+	write_json_if_changed,
+)
+from instrumentation import Instrumentation, add_instrumentation_arguments, instrumented
+from project_paths import PROJECT_ROOT
 
 
 def _infer_output_path(exports_dir: Path, explicit_output: str | None) -> Path:
@@ -68,35 +73,105 @@ def _build_parser() -> argparse.ArgumentParser:
 		action="store_true",
 		help="Do not write a manifest if validation has errors",
 	)
+	parser.add_argument(
+		"--sprite-frames",
+		help="Also write a Godot SpriteFrames .tres to this path (no headless Godot import needed)",
+	)
+	parser.add_argument(
+		"--dedupe-textures",
+		action="store_true",
+		help="With --sprite-frames, reference one texture for pixel-identical frames",
+	)
+	parser.add_argument(
+		"--project-root",
+		default=str(PROJECT_ROOT),
+		help="Godot project root used to build res:// paths (default: repository root)",
+	)
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	add_instrumentation_arguments(parser)
 	return parser
 
 
-def main() -> int:
-	args = _build_parser().parse_args()
-
+def _run(args: argparse.Namespace, probe: Instrumentation) -> int:
 	exports_dir = Path(args.exports_dir)
 	expected_size = None if args.no_size_check else (args.width, args.height)
-	result = scan_character_exports(
-		exports_dir,
-		expected_size=expected_size,
-		require_all=args.require_all,
-	)
+	text = args.format == "text"
+	with probe.phase("scan"):
+		result = scan_character_exports(
+			exports_dir,
+			expected_size=expected_size,
+			require_all=args.require_all,
+		)
+	if args.sprite_frames is not None and args.dedupe_textures:
+		with probe.phase("decode"):
+			attach_frame_hashes(result)
+	probe.count("frames", result.total_frames)
 
 	if args.strict and result.errors:
+		if not text:
+			probe.stop()
+			print(json.dumps({"aborted": True, "errors": result.errors, "timings": probe.to_dict()}, indent=2))
+			return 1
 		print("Manifest generation aborted: validation errors present (use without --strict to write anyway).")
 		for error in result.errors:
 			print(f"  - {error}")
 		return 1
 
-	character_id = args.character_id or _infer_character_id(exports_dir)
-	manifest = build_manifest_dict(result, character_id=character_id)
-	manifest["generated_at_utc"] = datetime.now(timezone.utc).isoformat()
+	character_id = args.character_id or infer_character_id(exports_dir)
+	hashes = FileHashCache()
+	with probe.phase("hash"):
+		content_hashes = hash_scan_frames(result, hashes)
+	probe.count("files_hashed", hashes.hashed_count)
+	with probe.phase("render"):
+		manifest = build_manifest_dict(
+			result,
+			character_id=character_id,
+			content_hashes=content_hashes,
+		)
 
 	output_path = _infer_output_path(exports_dir, args.output)
-	output_path.parent.mkdir(parents=True, exist_ok=True)
-	output_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+	with probe.phase("write"):
+		manifest_written = write_json_if_changed(output_path, manifest)
+	if text:
+		print(f"Wrote manifest: {output_path}" if manifest_written else f"Manifest unchanged: {output_path}")
+	sprite_frames_written: bool | None = None
+	if args.sprite_frames:
+		sprite_frames_path = Path(args.sprite_frames)
+		try:
+			with probe.phase("render"):
+				content = build_sprite_frames_tres(
+					result,
+					project_root=Path(args.project_root),
+					texture_aliases=(
+						result.frame_hashes.canonical_paths() if result.frame_hashes is not None else None
+					),
+				)
+		except ValueError as exc:
+			print(f"SpriteFrames generation failed: {exc}", file=sys.stdout if text else sys.stderr)
+			return 1
+		with probe.phase("write"):
+			sprite_frames_written = write_if_changed(sprite_frames_path, content)
+		if text:
+			state = "Wrote SpriteFrames" if sprite_frames_written else "SpriteFrames unchanged"
+			print(f"{state}: {sprite_frames_path}")
+
+	if not text:
+		probe.stop()
+		payload = {
+			"character_id": character_id,
+			"manifest": str(output_path),
+			"manifest_written": manifest_written,
+			"sprite_frames": args.sprite_frames,
+			"sprite_frames_written": sprite_frames_written,
+			"animations": result.animation_count,
+			"frames": result.total_frames,
+			"warnings": result.warnings,
+			"errors": result.errors,
+			"timings": probe.to_dict(),
+		}
+		print(json.dumps(payload, indent=2))
+		return 0
 
-	print(f"Wrote manifest: {output_path}")
 	print(
 		f"Character id: {character_id} | Animations: {result.animation_count} | Frames: {result.total_frames}"
 	)
@@ -109,6 +184,12 @@ def main() -> int:
 	return 0
 
 
+def main() -> int:
+	args = _build_parser().parse_args()
+	with instrumented(args) as probe:
+		return _run(args, probe)
+
+
 if __name__ == "__main__":
 	sys.exit(main())
 
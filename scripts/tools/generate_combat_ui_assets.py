@@ -3,12 +3,20 @@
 
 from __future__ import annotations
 
+import argparse
+from functools import partial
+import io
+import json
 import math
 import random
+import sys
 from pathlib import Path
+from typing import Callable
 
 from PIL import Image, ImageDraw
 
+from instrumentation import Instrumentation, add_instrumentation_arguments, instrumented
+
 
 ROOT = Path(__file__).resolve().parents[2]
 UI_DIR = ROOT / "assets" / "sprites" / "ui"
@@ -438,42 +446,77 @@ def build_guard_spark(frame: int) -> Image.Image:
 	return image
 
 
-def save(image: Image.Image, path: Path) -> None:
-	path.parent.mkdir(parents=True, exist_ok=True)
-	image.save(path)
-	print(f"wrote {path.relative_to(ROOT)}")
-
-
-def main() -> None:
-	save(build_menu_background(), UI_DIR / "menu_bg.png")
-	save(build_menu_panel((360, 680), rgba("#69D8FF")), UI_DIR / "menu_center_panel.png")
-	save(build_menu_panel((280, 396), rgba("#69D8FF")), UI_DIR / "menu_summary_panel.png")
-	save(build_menu_panel((430, 220), rgba("#FFD36E")), UI_DIR / "menu_overlay_panel.png")
-	save(build_menu_slot_card(), UI_DIR / "menu_slot_card.png")
-	save(build_timer_chip(), UI_DIR / "hud_timer_chip.png")
-	save(build_result_chip(), UI_DIR / "hud_result_chip.png")
-	save(build_hp_under(), UI_DIR / "hp_under.png")
-	save(build_hp_fill(rgba("#FF7466"), rgba("#C94850")), UI_DIR / "hp_fill_p1.png")
-	save(build_hp_fill(rgba("#52C7FF"), rgba("#2C73E4")), UI_DIR / "hp_fill_p2.png")
-	save(build_pause_panel(), UI_DIR / "hud_pause_panel.png")
-	save(build_hud_panel((336, 196), rgba("#69D8FF")), UI_DIR / "hud_training_panel.png")
-	save(build_hud_panel((392, 110), rgba("#FFD36E")), UI_DIR / "hud_onboarding_panel.png")
-	save(build_hud_panel((556, 298), rgba("#69D8FF")), UI_DIR / "hud_round_tuning_panel.png")
-	save(build_hud_card((248, 170), rgba("#FFD36E")), UI_DIR / "hud_choice_card.png")
-	save(build_guided_icon(), UI_DIR / "icon_guided.png")
-	save(build_story_icon(), UI_DIR / "icon_story.png")
-	save(build_versus_icon(), UI_DIR / "icon_versus.png")
-	save(build_training_icon(), UI_DIR / "icon_training.png")
-	save(build_classic_icon(), UI_DIR / "icon_classic.png")
-	save(build_modern_icon(), UI_DIR / "icon_modern.png")
+def save(image: Image.Image, path: Path, probe: Instrumentation | None = None, *, quiet: bool = False) -> None:
+	probe = probe or Instrumentation()
+	with probe.phase("encode"):
+		buffer = io.BytesIO()
+		image.save(buffer, format="PNG")
+	data = buffer.getvalue()
+	with probe.phase("write"):
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_bytes(data)
+	probe.count("images")
+	probe.count("bytes_written", len(data))
+	if not quiet:
+		print(f"wrote {path.relative_to(ROOT) if path.is_relative_to(ROOT) else path}")
+
+
+def asset_jobs() -> list[tuple[Callable[[], Image.Image], Path]]:
+	jobs: list[tuple[Callable[[], Image.Image], Path]] = [
+		(build_menu_background, UI_DIR / "menu_bg.png"),
+		(partial(build_menu_panel, (360, 680), rgba("#69D8FF")), UI_DIR / "menu_center_panel.png"),
+		(partial(build_menu_panel, (280, 396), rgba("#69D8FF")), UI_DIR / "menu_summary_panel.png"),
+		(partial(build_menu_panel, (430, 220), rgba("#FFD36E")), UI_DIR / "menu_overlay_panel.png"),
+		(build_menu_slot_card, UI_DIR / "menu_slot_card.png"),
+		(build_timer_chip, UI_DIR / "hud_timer_chip.png"),
+		(build_result_chip, UI_DIR / "hud_result_chip.png"),
+		(build_hp_under, UI_DIR / "hp_under.png"),
+		(partial(build_hp_fill, rgba("#FF7466"), rgba("#C94850")), UI_DIR / "hp_fill_p1.png"),
+		(partial(build_hp_fill, rgba("#52C7FF"), rgba("#2C73E4")), UI_DIR / "hp_fill_p2.png"),
+		(build_pause_panel, UI_DIR / "hud_pause_panel.png"),
+		(partial(build_hud_panel, (336, 196), rgba("#69D8FF")), UI_DIR / "hud_training_panel.png"),
+		(partial(build_hud_panel, (392, 110), rgba("#FFD36E")), UI_DIR / "hud_onboarding_panel.png"),
+		(partial(build_hud_panel, (556, 298), rgba("#69D8FF")), UI_DIR / "hud_round_tuning_panel.png"),
+		(partial(build_hud_card, (248, 170), rgba("#FFD36E")), UI_DIR / "hud_choice_card.png"),
+		(build_guided_icon, UI_DIR / "icon_guided.png"),
+		(build_story_icon, UI_DIR / "icon_story.png"),
+		(build_versus_icon, UI_DIR / "icon_versus.png"),
+		(build_training_icon, UI_DIR / "icon_training.png"),
+		(build_classic_icon, UI_DIR / "icon_classic.png"),
+		(build_modern_icon, UI_DIR / "icon_modern.png"),
+	]
 	for slot_key in ["signature_a", "signature_b", "signature_c", "ultimate", "item", "passive"]:
-		save(build_slot_icon(slot_key), UI_DIR / f"icon_{slot_key}.png")
-	save(build_arena_background(), ARENA_DIR / "arena_bg.png")
-	save(build_arena_floor(), ARENA_DIR / "arena_floor.png")
+		jobs.append((partial(build_slot_icon, slot_key), UI_DIR / f"icon_{slot_key}.png"))
+	jobs.append((build_arena_background, ARENA_DIR / "arena_bg.png"))
+	jobs.append((build_arena_floor, ARENA_DIR / "arena_floor.png"))
 	for frame in range(4):
-		save(build_counter_spark(frame), EFFECTS_DIR / f"counter_spark_{frame}.png")
-		save(build_guard_spark(frame), EFFECTS_DIR / f"guard_spark_{frame}.png")
+		jobs.append((partial(build_counter_spark, frame), EFFECTS_DIR / f"counter_spark_{frame}.png"))
+		jobs.append((partial(build_guard_spark, frame), EFFECTS_DIR / f"guard_spark_{frame}.png"))
+	return jobs
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(description="Regenerate the procedural combat UI, arena and impact effect PNGs.")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	add_instrumentation_arguments(parser)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	quiet = args.format == "json"
+	written: list[str] = []
+	with instrumented(args) as probe:
+		for build, path in asset_jobs():
+			with probe.phase("render"):
+				image = build()
+			save(image, path, probe, quiet=quiet)
+			written.append(str(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path))
+		if quiet:
+			probe.stop()
+			print(json.dumps({"written": written, "timings": probe.to_dict()}, indent=2))
+	return 0
 
 
 if __name__ == "__main__":
-	main()
+	sys.exit(main())
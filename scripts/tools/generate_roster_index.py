@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Aggregate every character manifest into a content-hashed roster index and report changes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from character_exports_common import (
+	FileHashCache,
+	build_manifest_dict,
+	hash_scan_frames,
+	infer_character_id,
+	json_content_changed,
+	merkle_digest,
+	project_relative_path,
+	scan_character_exports,
+	write_json_if_changed,
+)
+from project_paths import PROJECT_ROOT
+
+
+CHARACTERS_DIR = PROJECT_ROOT / "assets" / "sprites" / "characters"
+DEFAULT_INDEX_PATH = CHARACTERS_DIR / "roster_index.json"
+HASH_CACHE_NAME = ".roster_hash_cache.json"
+
+
+def _discover_exports_dirs() -> list[Path]:
+	if not CHARACTERS_DIR.is_dir():
+		return []
+	return sorted(path for path in CHARACTERS_DIR.glob("*/exports") if path.is_dir())
+
+
+def _manifest_path(exports_dir: Path) -> Path:
+	if exports_dir.name == "exports":
+		return exports_dir.parent / "character_manifest.json"
+	return exports_dir / "character_manifest.json"
+
+
+def _load_previous_index(path: Path) -> dict:
+	if not path.exists():
+		return {}
+	try:
+		loaded = json.loads(path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return {}
+	return loaded if isinstance(loaded, dict) else {}
+
+
+def _index_entry(exports_dir: Path, manifest: dict) -> dict:
+	animations = manifest["animations"]
+	return {
+		"exports_dir": project_relative_path(exports_dir),
+		"manifest": project_relative_path(_manifest_path(exports_dir)),
+		"content_digest": manifest["content_digest"],
+		"frame_count": manifest["summary"]["frame_count"],
+		"animations": {
+			name: {"digest": animation["digest"], "frame_count": animation["frame_count"]}
+			for name, animation in animations.items()
+		},
+		"validation": {
+			"error_count": len(manifest["validation"]["errors"]),
+			"warning_count": len(manifest["validation"]["warnings"]),
+		},
+	}
+
+
+def diff_indexes(previous: dict, current: dict) -> dict:
+	"""Characters and animations whose digests differ between two roster indexes."""
+	old_characters: dict = previous.get("characters", {}) if isinstance(previous.get("characters"), dict) else {}
+	new_characters: dict = current["characters"]
+	changed: dict[str, dict[str, list[str]]] = {}
+	for character_id in sorted(set(old_characters) & set(new_characters)):
+		old_entry = old_characters[character_id]
+		new_entry = new_characters[character_id]
+		if old_entry.get("content_digest") == new_entry["content_digest"]:
+			continue
+		old_animations = old_entry.get("animations", {})
+		new_animations = new_entry["animations"]
+		changed[character_id] = {
+			"added": sorted(set(new_animations) - set(old_animations)),
+			"removed": sorted(set(old_animations) - set(new_animations)),
+			"changed": sorted(
+				name
+				for name in set(old_animations) & set(new_animations)
+				if old_animations[name].get("digest") != new_animations[name]["digest"]
+			),
+		}
+	return {
+		"added": sorted(set(new_characters) - set(old_characters)),
+		"removed": sorted(set(old_characters) - set(new_characters)),
+		"changed": changed,
+	}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Regenerate character manifests with frame content hashes and aggregate them into a roster index."
+		)
+	)
+	parser.add_argument(
+		"exports_dirs",
+		nargs="*",
+		help="Character exports directories (default: assets/sprites/characters/*/exports)",
+	)
+	parser.add_argument(
+		"--output",
+		default=str(DEFAULT_INDEX_PATH),
+		help="Roster index path (default: assets/sprites/characters/roster_index.json)",
+	)
+	parser.add_argument(
+		"--cache",
+		help=f"Content hash cache path (default: {HASH_CACHE_NAME} next to the index)",
+	)
+	parser.add_argument(
+		"--width",
+		type=int,
+		default=24,
+		help="Expected frame canvas width (default: 24)",
+	)
+	parser.add_argument(
+		"--height",
+		type=int,
+		default=48,
+		help="Expected frame canvas height (default: 48)",
+	)
+	parser.add_argument(
+		"--check",
+		action="store_true",
+		help="Do not write anything; exit non-zero if the index or any manifest is out of date",
+	)
+	parser.add_argument(
+		"--format",
+		choices=["text", "json"],
+		default="text",
+		help="Output format. Default: text.",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	output_path = Path(args.output)
+	cache_path = Path(args.cache) if args.cache else output_path.parent / HASH_CACHE_NAME
+	exports_dirs = [Path(path) for path in args.exports_dirs] or _discover_exports_dirs()
+
+	cache = FileHashCache(cache_path)
+
+	characters: dict[str, dict] = {}
+	manifests: dict[str, tuple[Path, dict]] = {}
+	for exports_dir in exports_dirs:
+		character_id = infer_character_id(exports_dir)
+		if character_id in characters:
+			print(f"Duplicate character id '{character_id}' for {exports_dir}", file=sys.stderr)
+			return 1
+		result = scan_character_exports(exports_dir, expected_size=(args.width, args.height))
+		manifest = build_manifest_dict(
+			result,
+			character_id=character_id,
+			content_hashes=hash_scan_frames(result, cache),
+		)
+		manifests[character_id] = (_manifest_path(exports_dir), manifest)
+		characters[character_id] = _index_entry(exports_dir, manifest)
+	if not args.check:
+		cache.save()
+
+	index = {
+		"schema_version": 1,
+		"roster_digest": merkle_digest(
+			(character_id, entry["content_digest"]) for character_id, entry in sorted(characters.items())
+		),
+		"characters": dict(sorted(characters.items())),
+	}
+	previous = _load_previous_index(output_path)
+	changes = diff_indexes(previous, index)
+	index_stale = json_content_changed(output_path, index)
+	stale_manifests = [
+		character_id
+		for character_id, (manifest_path, manifest) in sorted(manifests.items())
+		if json_content_changed(manifest_path, manifest)
+	]
+
+	index_written = False
+	if not args.check:
+		for character_id in stale_manifests:
+			manifest_path, manifest = manifests[character_id]
+			write_json_if_changed(manifest_path, manifest)
+		index_written = write_json_if_changed(output_path, index)
+
+	if args.format == "json":
+		print(
+			json.dumps(
+				{
+					"index": str(output_path),
+					"roster_digest": index["roster_digest"],
+					"character_count": len(characters),
+					"hashed_files": cache.hashed_count,
+					"index_written": index_written,
+					"stale_manifests": stale_manifests,
+					"changes": changes,
+				},
+				indent=2,
+				ensure_ascii=False,
+			)
+		)
+	else:
+		print(f"Roster index: {output_path} ({len(characters)} character(s), digest {index['roster_digest']})")
+		print(f"Frames re-hashed: {cache.hashed_count}")
+		for character_id in changes["added"]:
+			print(f"  + {character_id}")
+		for character_id in changes["removed"]:
+			print(f"  - {character_id}")
+		for character_id, animation_changes in changes["changed"].items():
+			parts = [
+				f"{label}={','.join(names)}"
+				for label, names in animation_changes.items()
+				if names
+			]
+			print(f"  ~ {character_id}: {' '.join(parts) if parts else 'metadata'}")
+		if stale_manifests:
+			verb = "Out of date" if args.check else "Updated"
+			print(f"{verb} manifests: {', '.join(stale_manifests)}")
+		if not index_stale and not stale_manifests:
+			print("No content changes.")
+		elif args.check:
+			print("Roster index is out of date (run without --check to update).")
+		elif index_written:
+			print("Index updated.")
+
+	if args.check and (index_stale or stale_manifests):
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""Collect the code points the game's text uses and bake them into a subset font and glyph atlas.
+
+Code points come from every `i18n/*.tres` catalog and the dialogue pack (see localization_catalog.py),
+plus printable ASCII for runtime-formatted numbers and names. With `--font`, the tool reports glyphs
+the font lacks, renders a 1-bit pixel atlas PNG with a BMFont `.fnt` (importable by Godot as a
+FontFile) and a JSON metrics table, and optionally writes a fontTools subset of the source font.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+import contextlib
+from dataclasses import dataclass
+import hashlib
+import json
+import math
+from pathlib import Path
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from generate_combat_ui_assets import rgba, save
+from godot_resource import PROJECT_ROOT, GodotParseError
+from localization_catalog import flatten_dialogue, load_translation_messages
+
+
+DEFAULT_OUTPUT_DIR = Path("/tmp/ffc-glyph-atlas")
+DEFAULT_FONT_SIZE = 12
+ATLAS_PADDING = 1
+ATLAS_NAME = "glyph_atlas"
+BASE_CHARSET = frozenset(range(0x20, 0x7F))
+# Bump when the atlas layout or metrics format changes so cached outputs are rebuilt.
+ATLAS_FORMAT_VERSION = 1
+# A private-use code point no UI font maps; its rendering is the font's .notdef box.
+NOTDEF_PROBE = 0x10FFFD
+UNICODE_BLOCKS = (
+	("ascii", 0x0000, 0x007F),
+	("latin", 0x0080, 0x024F),
+	("general_punctuation", 0x2000, 0x206F),
+	("cjk_symbols", 0x3000, 0x303F),
+	("cjk_unified", 0x4E00, 0x9FFF),
+	("fullwidth", 0xFF00, 0xFFEF),
+)
+
+
+@dataclass(frozen=True)
+class GlyphPlacement:
+	code_point: int
+	x: int
+	y: int
+	width: int
+	height: int
+	x_offset: int
+	y_offset: int
+	advance: int
+
+
+def collect_code_points(project_root: Path, dialogue_path: Path) -> dict[str, set[int]]:
+	"""Code points per locale across the translation catalogs and the dialogue pack."""
+	messages_by_locale: dict[str, dict[str, str]] = {}
+	for path in sorted((project_root / "i18n").glob("*.tres")):
+		locale, messages = load_translation_messages(path)
+		messages_by_locale[locale] = messages
+	pack = json.loads(dialogue_path.read_text(encoding="utf-8")) if dialogue_path.exists() else {}
+	dialogue = flatten_dialogue(pack, set(messages_by_locale))
+	code_points: dict[str, set[int]] = {}
+	for locale, messages in messages_by_locale.items():
+		texts = list(messages.values())
+		for lines_by_locale in dialogue.values():
+			texts.extend(lines_by_locale.get(locale, []))
+		code_points[locale] = {ord(char) for text in texts for char in text if char.isprintable()}
+	return code_points
+
+
+def block_name(code_point: int) -> str:
+	for name, start, end in UNICODE_BLOCKS:
+		if start <= code_point <= end:
+			return name
+	return "other"
+
+
+def missing_glyphs(font: ImageFont.FreeTypeFont, code_points: list[int]) -> list[int]:
+	"""Code points the font renders as its .notdef box (whitespace is never reported)."""
+
+	def signature(char: str) -> tuple:
+		mask = font.getmask(char, mode="1")
+		return (mask.size, bytes(mask))
+
+	notdef = signature(chr(NOTDEF_PROBE))
+	return [
+		code_point
+		for code_point in code_points
+		if not chr(code_point).isspace() and signature(chr(code_point)) == notdef
+	]
+
+
+def pack_glyphs(font: ImageFont.FreeTypeFont, code_points: list[int]) -> tuple[list[GlyphPlacement], tuple[int, int]]:
+	"""Shelf-pack glyph bounding boxes into a power-of-two atlas, tallest glyphs first."""
+	ascent, _ = font.getmetrics()
+	boxes = []
+	for code_point in code_points:
+		left, top, right, bottom = font.getbbox(chr(code_point), mode="1", anchor="ls")
+		boxes.append((code_point, left, top, max(0, right - left), max(0, bottom - top), round(font.getlength(chr(code_point)))))
+	area = sum((width + ATLAS_PADDING) * (height + ATLAS_PADDING) for _, _, _, width, height, _ in boxes)
+	widest = max((width for _, _, _, width, _, _ in boxes), default=1) + ATLAS_PADDING
+	atlas_width = max(64, 1 << math.ceil(math.log2(max(widest, math.sqrt(area * 1.15)))))
+
+	placements: list[GlyphPlacement] = []
+	cursor_x = cursor_y = shelf_height = 0
+	for code_point, left, top, width, height, advance in sorted(boxes, key=lambda box: (-box[4], box[0])):
+		if cursor_x + width + ATLAS_PADDING > atlas_width:
+			cursor_x = 0
+			cursor_y += shelf_height + ATLAS_PADDING
+			shelf_height = 0
+		placements.append(
+			GlyphPlacement(
+				code_point=code_point,
+				x=cursor_x,
+				y=cursor_y,
+				width=width,
+				height=height,
+				x_offset=left,
+				y_offset=ascent + top,
+				advance=advance,
+			)
+		)
+		cursor_x += width + ATLAS_PADDING
+		shelf_height = max(shelf_height, height)
+	atlas_height = 1 << math.ceil(math.log2(max(1, cursor_y + shelf_height + ATLAS_PADDING)))
+	placements.sort(key=lambda placement: placement.code_point)
+	return placements, (atlas_width, atlas_height)
+
+
+def render_atlas(font: ImageFont.FreeTypeFont, placements: list[GlyphPlacement], size: tuple[int, int]) -> Image.Image:
+	image = Image.new("RGBA", size, (0, 0, 0, 0))
+	draw = ImageDraw.Draw(image, "RGBA")
+	# 1-bit rasterization keeps glyph edges crisp at the HUD's pixel-art scale.
+	draw.fontmode = "1"
+	ascent, _ = font.getmetrics()
+	for placement in placements:
+		if placement.width == 0 or placement.height == 0:
+			continue
+		origin = (placement.x - placement.x_offset, placement.y - (placement.y_offset - ascent))
+		draw.text(origin, chr(placement.code_point), font=font, fill=rgba("#FFFFFF"), anchor="ls")
+	return image
+
+
+def bmfont_text(font: ImageFont.FreeTypeFont, placements: list[GlyphPlacement], size: tuple[int, int], page_file: str) -> str:
+	ascent, descent = font.getmetrics()
+	family, _ = font.getname()
+	lines = [
+		f'info face="{family}" size={font.size} bold=0 italic=0 charset="" unicode=1 stretchH=100 smooth=0 aa=0 '
+		f"padding=0,0,0,0 spacing={ATLAS_PADDING},{ATLAS_PADDING}",
+		f"common lineHeight={ascent + descent} base={ascent} scaleW={size[0]} scaleH={size[1]} pages=1 packed=0",
+		f'page id=0 file="{page_file}"',
+		f"chars count={len(placements)}",
+	]
+	for placement in placements:
+		lines.append(
+			f"char id={placement.code_point} x={placement.x} y={placement.y} width={placement.width} "
+			f"height={placement.height} xoffset={placement.x_offset} yoffset={placement.y_offset} "
+			f"xadvance={placement.advance} page=0 chnl=15"
+		)
+	return "\n".join(lines) + "\n"
+
+
+def subset_font(font_path: Path, code_points: list[int], output_path: Path) -> None:
+	from fontTools import subset
+
+	options = subset.Options()
+	options.name_IDs = ["*"]
+	options.notdef_outline = True
+	font = subset.load_font(str(font_path), options)
+	subsetter = subset.Subsetter(options)
+	subsetter.populate(unicodes=code_points)
+	subsetter.subset(font)
+	output_path.parent.mkdir(parents=True, exist_ok=True)
+	subset.save_font(font, str(output_path), options)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Collect the code points used by i18n/*.tres and the dialogue pack, report font coverage, and bake a "
+			"pixel glyph atlas (PNG + BMFont .fnt + JSON metrics) and an optional subset font."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument(
+		"--dialogue",
+		default="assets/data/dialogue/DialoguePackV1.json",
+		help="Dialogue pack path relative to the project root",
+	)
+	parser.add_argument("--locale", action="append", help="Only include this locale (repeatable)")
+	parser.add_argument("--extra-chars", default="", help="Additional characters to always include")
+	parser.add_argument("--font", help="TTF/OTF font to check coverage against and rasterize")
+	parser.add_argument("--size", type=int, default=DEFAULT_FONT_SIZE, help=f"Pixel size for the atlas (default: {DEFAULT_FONT_SIZE})")
+	parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help=f"Atlas output directory (default: {DEFAULT_OUTPUT_DIR})")
+	parser.add_argument("--no-atlas", action="store_true", help="Only report coverage; do not render the atlas")
+	parser.add_argument("--subset-output", help="Write a subset of --font with only the collected code points (needs fontTools)")
+	parser.add_argument("--force", action="store_true", help="Rebuild the atlas even if inputs are unchanged")
+	parser.add_argument("--fail-on-missing", action="store_true", help="Exit non-zero when --font lacks any collected glyph")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root)
+	if args.size <= 0:
+		print("--size must be a positive integer.", file=sys.stderr)
+		return 1
+	if args.subset_output:
+		if not args.font:
+			print("--subset-output needs --font.", file=sys.stderr)
+			return 1
+		try:
+			import fontTools  # noqa: F401
+		except ImportError:
+			print("--subset-output was set but `fontTools` is not installed.", file=sys.stderr)
+			return 1
+	try:
+		by_locale = collect_code_points(project_root, project_root / args.dialogue)
+	except (GodotParseError, ValueError) as exc:
+		print(str(exc), file=sys.stderr)
+		return 1
+	if args.locale:
+		by_locale = {locale: points for locale, points in by_locale.items() if locale in args.locale}
+	code_points = sorted(set().union(*by_locale.values(), BASE_CHARSET, (ord(char) for char in args.extra_chars)))
+	blocks = Counter(block_name(code_point) for code_point in code_points)
+
+	missing: list[int] = []
+	atlas_info: dict = {}
+	subset_info: dict = {}
+	if args.font:
+		font_path = Path(args.font)
+		try:
+			font = ImageFont.truetype(str(font_path), args.size)
+		except OSError as exc:
+			print(f"Cannot load font {font_path}: {exc}", file=sys.stderr)
+			return 1
+		missing = missing_glyphs(font, code_points)
+		baked = [code_point for code_point in code_points if code_point not in set(missing)]
+		if not args.no_atlas:
+			output_dir = Path(args.output_dir)
+			metrics_path = output_dir / f"{ATLAS_NAME}.json"
+			source_digest = hashlib.blake2b(
+				json.dumps([ATLAS_FORMAT_VERSION, args.size, baked]).encode("utf-8") + font_path.read_bytes(),
+				digest_size=16,
+			).hexdigest()
+			try:
+				previous = json.loads(metrics_path.read_text(encoding="utf-8"))
+			except (OSError, ValueError):
+				previous = {}
+			atlas_path = output_dir / f"{ATLAS_NAME}.png"
+			if not args.force and previous.get("source_digest") == source_digest and atlas_path.exists():
+				atlas_info = {key: previous[key] for key in ("atlas", "fnt", "atlas_size", "glyph_count") if key in previous}
+				atlas_info["rebuilt"] = False
+			else:
+				placements, size = pack_glyphs(font, baked)
+				# Keep stdout clean for --format json; save() reports each written file.
+				with contextlib.redirect_stdout(sys.stderr if args.format == "json" else sys.stdout):
+					save(render_atlas(font, placements, size), atlas_path)
+				fnt_path = output_dir / f"{ATLAS_NAME}.fnt"
+				fnt_path.write_text(bmfont_text(font, placements, size, atlas_path.name), encoding="utf-8")
+				ascent, descent = font.getmetrics()
+				atlas_info = {
+					"atlas": str(atlas_path),
+					"fnt": str(fnt_path),
+					"atlas_size": list(size),
+					"glyph_count": len(placements),
+				}
+				metrics = {
+					**atlas_info,
+					"source_digest": source_digest,
+					"font": str(font_path),
+					"font_size": args.size,
+					"ascent": ascent,
+					"descent": descent,
+					"glyphs": {
+						str(placement.code_point): [
+							placement.x,
+							placement.y,
+							placement.width,
+							placement.height,
+							placement.x_offset,
+							placement.y_offset,
+							placement.advance,
+						]
+						for placement in placements
+					},
+				}
+				metrics_path.write_text(json.dumps(metrics, ensure_ascii=False) + "\n", encoding="utf-8")
+				atlas_info["rebuilt"] = True
+		if args.subset_output:
+			subset_path = Path(args.subset_output)
+			subset_font(font_path, baked, subset_path)
+			subset_info = {
+				"path": str(subset_path),
+				"source_bytes": font_path.stat().st_size,
+				"subset_bytes": subset_path.stat().st_size,
+			}
+	elapsed = time.perf_counter() - started
+	failed = bool(args.fail_on_missing and missing)
+
+	if args.format == "json":
+		payload = {
+			"code_point_count": len(code_points),
+			"locales": {locale: len(points) for locale, points in sorted(by_locale.items())},
+			"blocks": dict(sorted(blocks.items())),
+			"missing_glyphs": [f"U+{code_point:04X}" for code_point in missing],
+			"atlas": atlas_info,
+			"subset": subset_info,
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+		return 1 if failed else 0
+
+	locales = ", ".join(f"{locale}={len(points)}" for locale, points in sorted(by_locale.items()))
+	block_summary = ", ".join(f"{name}={count}" for name, count in sorted(blocks.items()))
+	print(f"Code points: {len(code_points)} [{locales}] ({elapsed * 1000.0:.1f} ms)")
+	print(f"Blocks: {block_summary}")
+	if args.font:
+		if missing:
+			sample = "".join(chr(code_point) for code_point in missing[:40])
+			print(f"Missing from {Path(args.font).name}: {len(missing)} glyph(s) {sample}{' ...' if len(missing) > 40 else ''}")
+		else:
+			print(f"Font covers every collected glyph: {Path(args.font).name}")
+		if atlas_info:
+			state = "rebuilt" if atlas_info.get("rebuilt") else "up to date"
+			width, height = atlas_info.get("atlas_size", [0, 0])
+			print(f"Atlas ({state}): {atlas_info.get('glyph_count', 0)} glyph(s), {width}x{height} -> {atlas_info.get('atlas', '')}")
+		if subset_info:
+			print(
+				f"Subset: {subset_info['path']} ({subset_info['subset_bytes']} bytes, "
+				f"source {subset_info['source_bytes']} bytes)"
+			)
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Tokenizer and parser for Godot 4 text resources (.tres/.tscn) without booting the engine.
+
+`read_gdscript_const` reuses the value grammar for literal `const NAME := {...}` tables in .gd files.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import re
+from typing import Any, Iterator, NamedTuple
+
+from project_paths import PROJECT_ROOT
+
+
+_TOKEN_RE = re.compile(
+	r"""
+	(?P<ws>[ \t\r\n]+)
+	|(?P<comment>[;#][^\n]*)
+	|(?P<string>[&^]?"(?:[^"\\]|\\.)*")
+	|(?P<number>[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?|-inf\b)
+	|(?P<ident>[A-Za-z_][A-Za-z0-9_/]*)
+	|(?P<punct>[\[\]{}(),:=])
+	""",
+	re.VERBOSE | re.DOTALL,
+)
+
+
+class GodotParseError(ValueError):
+	pass
+
+
+class Token(NamedTuple):
+	kind: str
+	text: str
+	offset: int
+
+
+class Vector2(NamedTuple):
+	x: float
+	y: float
+
+
+class StringName(str):
+	"""A `&"..."` literal."""
+
+
+class NodePath(str):
+	"""A `^"..."` literal or `NodePath("...")` constructor."""
+
+
+@dataclass(frozen=True)
+class ExtResourceRef:
+	id: str
+
+
+@dataclass(frozen=True)
+class SubResourceRef:
+	id: str
+
+
+@dataclass(frozen=True)
+class GodotConstructor:
+	"""Any other `Name(args...)` value, e.g. `Color(1, 0, 0, 1)` or `Rect2(...)`."""
+
+	name: str
+	args: tuple
+
+
+@dataclass
+class ResourceSection:
+	tag: str
+	attributes: dict[str, Any] = field(default_factory=dict)
+	properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class GodotResource:
+	path: Path | None
+	sections: list[ResourceSection]
+
+	@property
+	def header(self) -> ResourceSection:
+		return self.sections[0]
+
+	@property
+	def resource_type(self) -> str:
+		return str(self.header.attributes.get("type", ""))
+
+	@property
+	def ext_resources(self) -> dict[str, ResourceSection]:
+		return {
+			str(section.attributes.get("id")): section
+			for section in self.sections
+			if section.tag == "ext_resource"
+		}
+
+	@property
+	def sub_resources(self) -> dict[str, ResourceSection]:
+		return {
+			str(section.attributes.get("id")): section
+			for section in self.sections
+			if section.tag == "sub_resource"
+		}
+
+	@property
+	def properties(self) -> dict[str, Any]:
+		"""Properties of the main `[resource]` section (empty for scenes)."""
+		for section in self.sections:
+			if section.tag == "resource":
+				return section.properties
+		return {}
+
+	def ext_resource_path(self, ref: ExtResourceRef) -> str:
+		section = self.ext_resources.get(ref.id)
+		if section is None:
+			raise KeyError(f"Unknown ExtResource id {ref.id!r}")
+		return str(section.attributes.get("path", ""))
+
+
+def tokenize(text: str, start: int = 0) -> Iterator[Token]:
+	position = start
+	length = len(text)
+	while position < length:
+		match = _TOKEN_RE.match(text, position)
+		if match is None:
+			raise GodotParseError(f"Unexpected character {text[position]!r} at offset {position}")
+		kind = match.lastgroup or ""
+		if kind not in ("ws", "comment"):
+			yield Token(kind, match.group(), position)
+		position = match.end()
+
+
+def _unquote(literal: str) -> str:
+	# Godot escapes are a superset-compatible subset of JSON's; strict=False keeps raw newlines/tabs.
+	return json.loads(literal, strict=False)
+
+
+_UNREAD = Token("", "", -1)
+
+
+class _Parser:
+	def __init__(self, text: str, start: int = 0) -> None:
+		self._tokens = tokenize(text, start)
+		# Tokens are pulled lazily so a single value can be parsed out of a larger GDScript file.
+		self._current: Token | None = _UNREAD
+
+	def _peek(self) -> Token | None:
+		if self._current is _UNREAD:
+			self._current = next(self._tokens, None)
+		return self._current
+
+	def _advance(self) -> Token:
+		token = self._peek()
+		if token is None:
+			raise GodotParseError("Unexpected end of resource")
+		self._current = _UNREAD
+		return token
+
+	def _expect(self, text: str) -> Token:
+		token = self._advance()
+		if token.text != text:
+			raise GodotParseError(f"Expected {text!r} at offset {token.offset}, found {token.text!r}")
+		return token
+
+	def _at(self, text: str) -> bool:
+		token = self._peek()
+		return token is not None and token.kind == "punct" and token.text == text
+
+	def parse_single_value(self) -> Any:
+		return self._parse_value()
+
+	def parse(self) -> list[ResourceSection]:
+		sections: list[ResourceSection] = []
+		while self._peek() is not None:
+			if not self._at("["):
+				token = self._advance()
+				raise GodotParseError(f"Expected section header at offset {token.offset}, found {token.text!r}")
+			section = self._parse_section_header()
+			while self._peek() is not None and not self._at("["):
+				key = self._parse_key()
+				self._expect("=")
+				section.properties[key] = self._parse_value()
+			sections.append(section)
+		if not sections:
+			raise GodotParseError("Resource has no sections")
+		return sections
+
+	def _parse_key(self) -> str:
+		token = self._advance()
+		if token.kind == "ident":
+			return token.text
+		if token.kind == "string":
+			return _unquote(token.text.lstrip("&^"))
+		raise GodotParseError(f"Expected property name at offset {token.offset}, found {token.text!r}")
+
+	def _parse_section_header(self) -> ResourceSection:
+		self._expect("[")
+		tag = self._advance()
+		if tag.kind != "ident":
+			raise GodotParseError(f"Expected section tag at offset {tag.offset}")
+		section = ResourceSection(tag=tag.text)
+		while not self._at("]"):
+			key = self._parse_key()
+			self._expect("=")
+			section.attributes[key] = self._parse_value()
+		self._expect("]")
+		return section
+
+	def _parse_value(self) -> Any:
+		token = self._advance()
+		if token.kind == "string":
+			if token.text.startswith("&"):
+				return StringName(_unquote(token.text[1:]))
+			if token.text.startswith("^"):
+				return NodePath(_unquote(token.text[1:]))
+			return _unquote(token.text)
+		if token.kind == "number":
+			if token.text == "-inf":
+				return float("-inf")
+			if any(marker in token.text for marker in (".", "e", "E")):
+				return float(token.text)
+			return int(token.text)
+		if token.kind == "punct":
+			if token.text == "[":
+				return self._parse_array()
+			if token.text == "{":
+				return self._parse_dict()
+			raise GodotParseError(f"Unexpected {token.text!r} at offset {token.offset}")
+		return self._parse_ident_value(token)
+
+	def _parse_ident_value(self, token: Token) -> Any:
+		name = token.text
+		if name == "true":
+			return True
+		if name == "false":
+			return False
+		if name == "null":
+			return None
+		if name in ("inf", "inf_neg", "nan"):
+			return {"inf": float("inf"), "inf_neg": float("-inf"), "nan": float("nan")}[name]
+		if self._at("["):
+			# Typed containers: Array[int]([...]) / Dictionary[String, int]({...}).
+			self._advance()
+			while not self._at("]"):
+				self._advance()
+			self._expect("]")
+		self._expect("(")
+		args: list[Any] = []
+		while not self._at(")"):
+			args.append(self._parse_value())
+			if self._at(","):
+				self._advance()
+		self._expect(")")
+		if name == "Vector2" and len(args) == 2:
+			return Vector2(float(args[0]), float(args[1]))
+		if name == "ExtResource" and len(args) == 1:
+			return ExtResourceRef(str(args[0]))
+		if name == "SubResource" and len(args) == 1:
+			return SubResourceRef(str(args[0]))
+		if name == "NodePath" and len(args) == 1:
+			return NodePath(str(args[0]))
+		if name in ("Array", "Dictionary") and len(args) == 1:
+			return args[0]
+		if name.startswith("Packed") and name.endswith("Array"):
+			return list(args)
+		return GodotConstructor(name=name, args=tuple(args))
+
+	def _parse_array(self) -> list[Any]:
+		items: list[Any] = []
+		while not self._at("]"):
+			items.append(self._parse_value())
+			if self._at(","):
+				self._advance()
+		self._expect("]")
+		return items
+
+	def _parse_dict(self) -> dict[Any, Any]:
+		items: dict[Any, Any] = {}
+		while not self._at("}"):
+			key = self._parse_value()
+			self._expect(":")
+			items[key] = self._parse_value()
+			if self._at(","):
+				self._advance()
+		self._expect("}")
+		return items
+
+
+def parse_resource_text(text: str, path: Path | None = None) -> GodotResource:
+	try:
+		return GodotResource(path=path, sections=_Parser(text).parse())
+	except GodotParseError as exc:
+		location = f"{path}: " if path is not None else ""
+		raise GodotParseError(f"{location}{exc}") from None
+
+
+_CACHE: dict[Path, tuple[int, int, GodotResource]] = {}
+
+
+def load_resource(path: str | Path) -> GodotResource:
+	"""Parse a .tres/.tscn file, reusing the previous result while its mtime and size are unchanged."""
+	resolved = Path(path).resolve()
+	stat = resolved.stat()
+	cached = _CACHE.get(resolved)
+	if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+		return cached[2]
+	resource = parse_resource_text(resolved.read_text(encoding="utf-8"), resolved)
+	_CACHE[resolved] = (stat.st_mtime_ns, stat.st_size, resource)
+	return resource
+
+
+def read_gdscript_const(path: str | Path, name: str) -> Any:
+	"""Parse the literal value of `const <name> := ...` in a GDScript file (dicts, arrays, numbers, Vector2)."""
+	text = Path(path).read_text(encoding="utf-8")
+	match = re.search(rf"^const {re.escape(name)}\s*(?::\s*[A-Za-z_][\w\[\], ]*)?:?=\s*", text, re.MULTILINE)
+	if match is None:
+		raise GodotParseError(f"{path}: const {name} not found")
+	try:
+		return _Parser(text, match.end()).parse_single_value()
+	except GodotParseError as exc:
+		raise GodotParseError(f"{path}: const {name}: {exc}") from None
+
+
+def res_to_path(res_path: str, project_root: Path = PROJECT_ROOT) -> Path:
+	if not res_path.startswith("res://"):
+		raise ValueError(f"Not a res:// path: {res_path}")
+	return project_root / res_path[len("res://"):]
+
+
+def load_attack_tables(project_root: Path = PROJECT_ROOT) -> dict[str, GodotResource]:
+	"""Every `assets/data/characters/*AttackTable.tres`, keyed by file name."""
+	characters_dir = project_root / "assets" / "data" / "characters"
+	return {
+		path.name: load_resource(path)
+		for path in sorted(characters_dir.glob("*AttackTable.tres"))
+	}
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""Rasterize every attack hitbox into a shared grid and measure reach and hurtbox coverage.
+
+Coordinates are attacker-local pixels with the attacker's body centre at the origin, facing +x
+(`Player._update_facing` mirrors `hitbox_offset.x` for the other side). The opponent uses the same
+body size as the 24x48 export canvas and the head/torso/legs zones from `Player._build_target_hurtbox_zones`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+from dataclasses import dataclass
+import json
+import math
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from character_exports_common import EXPORT_CANVAS_SIZE
+from generate_combat_ui_assets import lerp_color, rgba, save
+from godot_resource import PROJECT_ROOT, GodotParseError, Vector2, load_attack_tables, read_gdscript_const
+
+
+PLAYER_SCRIPT = PROJECT_ROOT / "scripts" / "Player.gd"
+DEFAULT_HEATMAP_DIR = Path("/tmp/ffc-hitbox-heatmaps")
+STANCES = ("ground", "air")
+# Player._apply_hitbox_profile fallbacks when an entry has no hitbox vectors.
+DEFAULT_OFFSETS = {"ground": Vector2(22.0, 0.0), "air": Vector2(20.0, -6.0)}
+DEFAULT_SIZES = {"ground": Vector2(26.0, 18.0), "air": Vector2(24.0, 16.0)}
+ZONE_NAMES = ("head", "torso", "legs")
+# Player._resolve_allowed_hurt_zones.
+ALLOWED_ZONES_BY_BLOCK_TYPE = {
+	"low": ("legs", "torso"),
+	"overhead": ("head", "torso"),
+	"high": ("head", "torso"),
+}
+DEFAULT_OUTLIER_Z = 2.0
+MIN_OUTLIER_GROUP = 4
+# Ignore z-score hits that are within this fraction of the roster mean (tight groups inflate z).
+MIN_OUTLIER_RELATIVE = 0.10
+
+
+@dataclass(frozen=True)
+class HitboxTable:
+	"""One row per (character, move, stance) hitbox, as parallel arrays."""
+
+	character_id: np.ndarray
+	move: np.ndarray
+	stance: np.ndarray
+	block_type: np.ndarray
+	rects: np.ndarray  # (N, 4) left, top, right, bottom
+
+	def __len__(self) -> int:
+		return len(self.move)
+
+
+@dataclass(frozen=True)
+class OccupancyGrid:
+	origin: tuple[int, int]  # grid cell (0, 0) in attacker-local pixels
+	cell: float
+	counts: np.ndarray  # (H, W) number of hitboxes covering each cell
+
+	def to_cell(self, x: float, y: float) -> tuple[float, float]:
+		return ((x - self.origin[0]) / self.cell, (y - self.origin[1]) / self.cell)
+
+
+def hurtbox_zones(half_size: tuple[float, float]) -> np.ndarray:
+	"""(3, 4) head/torso/legs rects of a grounded target centred at the origin."""
+	half_x, half_y = half_size
+	centers = {"head": -half_y * 0.62, "torso": -half_y * 0.08, "legs": half_y * 0.56}
+	rects = []
+	for name in ZONE_NAMES:
+		scale = read_gdscript_const(PLAYER_SCRIPT, f"HURTBOX_{name.upper()}_SCALE")
+		width = half_x * float(scale[0]) * 2.0
+		height = half_y * float(scale[1]) * 2.0
+		rects.append((-width * 0.5, centers[name] - height * 0.5, width * 0.5, centers[name] + height * 0.5))
+	return np.array(rects, dtype=np.float64)
+
+
+def load_hitboxes(project_root: Path = PROJECT_ROOT) -> HitboxTable:
+	character_ids: list[str] = []
+	moves: list[str] = []
+	stances: list[str] = []
+	block_types: list[str] = []
+	rects: list[tuple[float, float, float, float]] = []
+	for file_name, resource in load_attack_tables(project_root).items():
+		properties = resource.properties
+		character_id = str(properties.get("character_id") or file_name.removesuffix("AttackTable.tres"))
+		attacks = properties.get("attacks", {})
+		if not isinstance(attacks, dict):
+			continue
+		for move, entry in attacks.items():
+			if not isinstance(entry, dict):
+				continue
+			for stance in STANCES:
+				offset = entry.get(f"hitbox_offset_{stance}", DEFAULT_OFFSETS[stance])
+				size = entry.get(f"hitbox_size_{stance}", DEFAULT_SIZES[stance])
+				if not isinstance(offset, Vector2) or not isinstance(size, Vector2):
+					continue
+				half_w, half_h = abs(size.x) * 0.5, abs(size.y) * 0.5
+				character_ids.append(character_id)
+				moves.append(str(move))
+				stances.append(stance)
+				block_types.append(str(entry.get("block_type", "mid")))
+				rects.append((offset.x - half_w, offset.y - half_h, offset.x + half_w, offset.y + half_h))
+	return HitboxTable(
+		character_id=np.array(character_ids, dtype=str),
+		move=np.array(moves, dtype=str),
+		stance=np.array(stances, dtype=str),
+		block_type=np.array(block_types, dtype=str),
+		rects=np.array(rects, dtype=np.float64).reshape(-1, 4),
+	)
+
+
+def _overlap_area(rects: np.ndarray, others: np.ndarray) -> np.ndarray:
+	"""Pairwise intersection area between (N, 4) and (M, 4) rects -> (N, M)."""
+	width = np.minimum(rects[:, None, 2], others[None, :, 2]) - np.maximum(rects[:, None, 0], others[None, :, 0])
+	height = np.minimum(rects[:, None, 3], others[None, :, 3]) - np.maximum(rects[:, None, 1], others[None, :, 1])
+	return np.clip(width, 0.0, None) * np.clip(height, 0.0, None)
+
+
+def analyze_hitboxes(table: HitboxTable, body_size: tuple[int, int] = EXPORT_CANVAS_SIZE) -> dict[str, np.ndarray]:
+	"""Per-hitbox reach, vertical coverage and overlap with an opponent standing at body contact."""
+	half_x, half_y = body_size[0] * 0.5, body_size[1] * 0.5
+	left, top, right, bottom = table.rects.T
+	area = (right - left) * (bottom - top)
+	# Bodies touching: the opponent's centre is one full body width in front of the attacker.
+	contact_x = half_x * 2.0
+	opponent = np.array([[contact_x - half_x, -half_y, contact_x + half_x, half_y]])
+	zones = hurtbox_zones((half_x, half_y)) + np.array([contact_x, 0.0, contact_x, 0.0])
+	body_overlap = _overlap_area(table.rects, opponent)[:, 0]
+	zone_overlap = _overlap_area(table.rects, zones)
+	allowed = np.array(
+		[[zone in ALLOWED_ZONES_BY_BLOCK_TYPE.get(block_type, ZONE_NAMES) for zone in ZONE_NAMES] for block_type in table.block_type],
+		dtype=bool,
+	).reshape(-1, len(ZONE_NAMES))
+	allowed_overlap = np.where(allowed, zone_overlap, 0.0)
+	covered = np.clip(np.minimum(bottom, half_y) - np.maximum(top, -half_y), 0.0, None)
+	return {
+		"reach": right,
+		"reach_past_body": right - half_x,
+		"max_hit_distance": right + half_x,
+		"behind": np.clip(-left - half_x, 0.0, None),
+		"area": area,
+		"vertical_coverage": covered / (half_y * 2.0),
+		"contact_overlap": body_overlap / (half_x * half_y * 4.0),
+		"zone_overlap": zone_overlap,
+		"best_zone": np.where(allowed_overlap.max(axis=1) > 0.0, allowed_overlap.argmax(axis=1), -1),
+		"whiffs_at_contact": allowed_overlap.max(axis=1) <= 0.0,
+	}
+
+
+def find_outliers(table: HitboxTable, metrics: dict[str, np.ndarray], z_limit: float) -> list[dict]:
+	"""Hitboxes whose reach or area is `z_limit` standard deviations from the same move/stance across the roster."""
+	outliers: list[dict] = []
+	groups = np.char.add(np.char.add(table.move, "/"), table.stance)
+	for group in np.unique(groups):
+		rows = np.flatnonzero(groups == group)
+		if len(rows) < MIN_OUTLIER_GROUP:
+			continue
+		for metric in ("reach", "area"):
+			values = metrics[metric][rows]
+			spread = values.std()
+			if spread <= 1e-9:
+				continue
+			scores = (values - values.mean()) / spread
+			relative = np.abs(values - values.mean()) / max(abs(float(values.mean())), 1e-9)
+			flagged = (np.abs(scores) >= z_limit) & (relative >= MIN_OUTLIER_RELATIVE)
+			for row, score in zip(rows[flagged], scores[flagged]):
+				outliers.append(
+					{
+						"character_id": str(table.character_id[row]),
+						"move": str(table.move[row]),
+						"stance": str(table.stance[row]),
+						"metric": metric,
+						"value": round(float(metrics[metric][row]), 2),
+						"group_mean": round(float(values.mean()), 2),
+						"z": round(float(score), 2),
+					}
+				)
+	outliers.sort(key=lambda item: -abs(item["z"]))
+	return outliers
+
+
+def rasterize(table: HitboxTable, rows: np.ndarray, bounds: tuple[int, int, int, int], cell: float = 1.0) -> OccupancyGrid:
+	"""Count how many of the selected hitboxes cover each grid cell.
+
+	Rects are axis-aligned, so coverage is separable: (cells in row span) x (cells in column span),
+	summed over hitboxes as a single (H, N) @ (N, W) product.
+	"""
+	x0, y0, x1, y1 = bounds
+	xs = x0 + (np.arange(int(math.ceil((x1 - x0) / cell))) + 0.5) * cell
+	ys = y0 + (np.arange(int(math.ceil((y1 - y0) / cell))) + 0.5) * cell
+	rects = table.rects[rows]
+	in_x = ((xs[None, :] >= rects[:, 0:1]) & (xs[None, :] < rects[:, 2:3])).astype(np.int32)
+	in_y = ((ys[None, :] >= rects[:, 1:2]) & (ys[None, :] < rects[:, 3:4])).astype(np.int32)
+	return OccupancyGrid(origin=(x0, y0), cell=cell, counts=in_y.T @ in_x)
+
+
+def grid_bounds(table: HitboxTable, body_size: tuple[int, int] = EXPORT_CANVAS_SIZE, margin: int = 4) -> tuple[int, int, int, int]:
+	half_x, half_y = body_size[0] * 0.5, body_size[1] * 0.5
+	left = min(float(table.rects[:, 0].min(initial=0.0)), -half_x)
+	top = min(float(table.rects[:, 1].min(initial=0.0)), -half_y)
+	right = max(float(table.rects[:, 2].max(initial=0.0)), half_x * 3.0)
+	bottom = max(float(table.rects[:, 3].max(initial=0.0)), half_y)
+	return (
+		int(math.floor(left)) - margin,
+		int(math.floor(top)) - margin,
+		int(math.ceil(right)) + margin,
+		int(math.ceil(bottom)) + margin,
+	)
+
+
+def _heat_palette() -> np.ndarray:
+	cold, mid, hot = rgba("#17284A"), rgba("#69D8FF"), rgba("#FFD36E")
+	palette = [rgba("#0B1222")]
+	for step in range(1, 256):
+		t = step / 255.0
+		palette.append(lerp_color(cold, mid, t * 2.0) if t < 0.5 else lerp_color(mid, hot, (t - 0.5) * 2.0))
+	return np.array(palette, dtype=np.uint8)
+
+
+def render_heatmap(grid: OccupancyGrid, body_size: tuple[int, int] = EXPORT_CANVAS_SIZE, scale: int = 4) -> Image.Image:
+	"""Occupancy heatmap with the attacker body and the opponent's hurtbox zones at contact distance."""
+	peak = max(1, int(grid.counts.max()))
+	levels = np.where(grid.counts > 0, 1 + (grid.counts * 254) // peak, 0).astype(np.uint8)
+	image = Image.fromarray(_heat_palette()[levels], "RGBA")
+	image = image.resize((image.width * scale, image.height * scale), Image.NEAREST)
+	draw = ImageDraw.Draw(image, "RGBA")
+	half_x, half_y = body_size[0] * 0.5, body_size[1] * 0.5
+
+	def box(rect: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+		left, top = grid.to_cell(rect[0], rect[1])
+		right, bottom = grid.to_cell(rect[2], rect[3])
+		return (left * scale, top * scale, right * scale - 1, bottom * scale - 1)
+
+	draw.rectangle(box((-half_x, -half_y, half_x, half_y)), outline=rgba("#F5FFFF", 200), width=1)
+	zone_colors = (rgba("#FF7466", 220), rgba("#FFD36E", 220), rgba("#52C7FF", 220))
+	zones = hurtbox_zones((half_x, half_y)) + np.array([half_x * 2.0, 0.0, half_x * 2.0, 0.0])
+	for rect, color in zip(zones, zone_colors):
+		draw.rectangle(box(tuple(rect)), outline=color, width=1)
+	return image
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Rasterize attack-table hitboxes into an occupancy grid, report reach, vertical coverage and "
+			"hurtbox overlap per move, flag outliers, and write heatmap PNGs."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--character", action="append", help="Only analyze this character id (repeatable)")
+	parser.add_argument("--stance", choices=["ground", "air", "both"], default="both", help="Hitbox stance (default: both)")
+	parser.add_argument(
+		"--outlier-z",
+		type=float,
+		default=DEFAULT_OUTLIER_Z,
+		help=f"Flag reach/area this many standard deviations from the roster (default: {DEFAULT_OUTLIER_Z})",
+	)
+	parser.add_argument(
+		"--heatmaps",
+		nargs="?",
+		const=str(DEFAULT_HEATMAP_DIR),
+		help=f"Write per-character and roster heatmap PNGs (default dir: {DEFAULT_HEATMAP_DIR})",
+	)
+	parser.add_argument("--scale", type=int, default=4, help="Heatmap pixels per grid cell (default: 4)")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	try:
+		table = load_hitboxes(Path(args.project_root))
+	except GodotParseError as exc:
+		print(str(exc), file=sys.stderr)
+		return 1
+	keep = np.ones(len(table), dtype=bool)
+	if args.character:
+		keep &= np.isin(table.character_id, args.character)
+	if args.stance != "both":
+		keep &= table.stance == args.stance
+	table = HitboxTable(
+		character_id=table.character_id[keep],
+		move=table.move[keep],
+		stance=table.stance[keep],
+		block_type=table.block_type[keep],
+		rects=table.rects[keep],
+	)
+	if len(table) == 0:
+		print("No matching hitboxes.", file=sys.stderr)
+		return 1
+
+	metrics = analyze_hitboxes(table)
+	outliers = find_outliers(table, metrics, args.outlier_z)
+	bounds = grid_bounds(table)
+	characters = sorted(set(table.character_id.tolist()))
+	written: list[str] = []
+	if args.heatmaps:
+		out_dir = Path(args.heatmaps)
+		scale = max(1, args.scale)
+		selections = [("roster", np.arange(len(table)))]
+		selections.extend((character_id, np.flatnonzero(table.character_id == character_id)) for character_id in characters)
+		# Keep stdout clean for --format json; save() reports each written file.
+		with contextlib.redirect_stdout(sys.stderr if args.format == "json" else sys.stdout):
+			for name, rows in selections:
+				path = out_dir / f"{name}.png"
+				save(render_heatmap(rasterize(table, rows, bounds), scale=scale), path)
+				written.append(str(path))
+	elapsed = time.perf_counter() - started
+
+	hitboxes = [
+		{
+			"character_id": str(table.character_id[row]),
+			"move": str(table.move[row]),
+			"stance": str(table.stance[row]),
+			"block_type": str(table.block_type[row]),
+			"rect": [round(float(value), 2) for value in table.rects[row]],
+			"reach": round(float(metrics["reach"][row]), 2),
+			"max_hit_distance": round(float(metrics["max_hit_distance"][row]), 2),
+			"behind": round(float(metrics["behind"][row]), 2),
+			"vertical_coverage": round(float(metrics["vertical_coverage"][row]), 3),
+			"contact_overlap": round(float(metrics["contact_overlap"][row]), 3),
+			"best_zone": ZONE_NAMES[metrics["best_zone"][row]] if metrics["best_zone"][row] >= 0 else "",
+			"whiffs_at_contact": bool(metrics["whiffs_at_contact"][row]),
+		}
+		for row in range(len(table))
+	]
+	if args.format == "json":
+		payload = {
+			"body_size": list(EXPORT_CANVAS_SIZE),
+			"grid_bounds": list(bounds),
+			"elapsed_seconds": round(elapsed, 4),
+			"hitboxes": hitboxes,
+			"outliers": outliers,
+			"heatmaps": written,
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+		return 0
+
+	print(f"Hitboxes: {len(table)} across {len(characters)} character(s) ({elapsed * 1000.0:.1f} ms)")
+	for character_id in characters:
+		rows = np.flatnonzero(table.character_id == character_id)
+		longest = rows[np.argmax(metrics["reach"][rows])]
+		whiffs = [f"{table.move[row]}/{table.stance[row]}" for row in rows if metrics["whiffs_at_contact"][row]]
+		print(
+			f"{character_id}: max reach {metrics['reach'][longest]:.0f}px ({table.move[longest]}/{table.stance[longest]}), "
+			f"avg vertical coverage {metrics['vertical_coverage'][rows].mean() * 100.0:.0f}%, "
+			f"whiffs at contact: {', '.join(whiffs) if whiffs else '-'}"
+		)
+	if outliers:
+		print("Outliers:")
+		for outlier in outliers:
+			print(
+				f"  ! {outlier['character_id']} {outlier['move']}/{outlier['stance']} {outlier['metric']}="
+				f"{outlier['value']:g} (roster mean {outlier['group_mean']:g}, z={outlier['z']:+.1f})"
+			)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
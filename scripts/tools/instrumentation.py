@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Phase timers, counters and optional cProfile/tracemalloc capture shared by the scripts/tools CLIs.
+
+Typical use inside a tool's `main()`:
+
+	with instrumented(args) as probe:
+		with probe.phase("read"):
+			data = path.read_bytes()
+			probe.count("bytes_read", len(data))
+		...
+		probe.stop()
+		payload["timings"] = probe.to_dict()
+
+`add_instrumentation_arguments()` adds `--profile PATH` and `--trace-memory` to the tool's parser.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+import io
+from pathlib import Path
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+
+PROFILE_TOP = 25
+MEMORY_TOP = 10
+_MEMORY_IGNORED = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+@dataclass
+class PhaseTiming:
+	seconds: float = 0.0
+	calls: int = 0
+
+
+class Instrumentation:
+	"""Nestable wall-clock phases and named counters for one tool run.
+
+	Phases are keyed by their slash-joined path (`read/decode`); re-entering a phase under the same
+	parent accumulates into one entry, so per-file work inside a loop reports a total and a call count.
+	"""
+
+	def __init__(self, *, profile_path: Path | None = None, trace_memory: bool = False) -> None:
+		self.phases: dict[str, PhaseTiming] = {}
+		self.counters: dict[str, int] = {}
+		self.memory: dict | None = None
+		self.profile_path = profile_path
+		self.trace_memory = trace_memory
+		self._stack: list[str] = []
+		self._profiler: cProfile.Profile | None = None
+		self._started = time.perf_counter()
+		self._stopped: float | None = None
+
+	def start(self) -> None:
+		if self.trace_memory and not tracemalloc.is_tracing():
+			tracemalloc.start()
+		if self.profile_path is not None:
+			self._profiler = cProfile.Profile()
+			self._profiler.enable()
+
+	def stop(self) -> None:
+		"""Stop the clock and any profiler/tracer; later calls are no-ops."""
+		if self._stopped is not None:
+			return
+		self._stopped = time.perf_counter()
+		if self._profiler is not None:
+			self._profiler.disable()
+			self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+			self._profiler.dump_stats(str(self.profile_path))
+		if self.trace_memory and tracemalloc.is_tracing():
+			self.memory = _memory_summary(tracemalloc.take_snapshot(), *tracemalloc.get_traced_memory())
+			tracemalloc.stop()
+
+	@contextmanager
+	def phase(self, name: str) -> Iterator[None]:
+		self._stack.append(name)
+		timing = self.phases.setdefault("/".join(self._stack), PhaseTiming())
+		started = time.perf_counter()
+		try:
+			yield
+		finally:
+			timing.seconds += time.perf_counter() - started
+			timing.calls += 1
+			self._stack.pop()
+
+	def count(self, name: str, amount: int = 1) -> None:
+		self.counters[name] = self.counters.get(name, 0) + int(amount)
+
+	@property
+	def elapsed(self) -> float:
+		end = self._stopped if self._stopped is not None else time.perf_counter()
+		return end - self._started
+
+	def to_dict(self) -> dict:
+		payload: dict = {
+			"elapsed_seconds": round(self.elapsed, 6),
+			"phases": {
+				key: {"seconds": round(timing.seconds, 6), "calls": timing.calls} for key, timing in self.phases.items()
+			},
+			"counters": dict(sorted(self.counters.items())),
+		}
+		if self.memory is not None:
+			payload["memory"] = self.memory
+		if self.profile_path is not None:
+			payload["profile"] = str(self.profile_path)
+		return payload
+
+	def format_lines(self) -> list[str]:
+		lines = [f"Timings: {self.elapsed * 1000.0:.1f} ms"]
+		for key, timing in self.phases.items():
+			calls = f" x{timing.calls}" if timing.calls > 1 else ""
+			indent = "  " * (key.count("/") + 1)
+			lines.append(f"{indent}{key.rsplit('/', 1)[-1]}: {timing.seconds * 1000.0:.1f} ms{calls}")
+		if self.counters:
+			lines.append("Counters: " + ", ".join(f"{name}={value}" for name, value in sorted(self.counters.items())))
+		if self.memory is not None:
+			lines.append(
+				f"Memory: peak {self.memory['peak_bytes'] / 1024.0:.1f} KiB, "
+				f"current {self.memory['current_bytes'] / 1024.0:.1f} KiB"
+			)
+			for site in self.memory["top"]:
+				lines.append(f"  {site['site']}: {site['bytes'] / 1024.0:.1f} KiB in {site['count']} block(s)")
+		if self.profile_path is not None:
+			lines.append(f"Profile: {self.profile_path}")
+			buffer = io.StringIO()
+			pstats.Stats(str(self.profile_path), stream=buffer).sort_stats("cumulative").print_stats(PROFILE_TOP)
+			lines.extend(f"  {line}" for line in buffer.getvalue().strip().splitlines() if line.strip())
+		return lines
+
+
+def _memory_summary(snapshot: tracemalloc.Snapshot, current: int, peak: int) -> dict:
+	snapshot = snapshot.filter_traces(
+		[tracemalloc.Filter(False, path) for path in (__file__, tracemalloc.__file__, cProfile.__file__, pstats.__file__)]
+		+ [tracemalloc.Filter(False, pattern) for pattern in _MEMORY_IGNORED]
+	)
+	return {
+		"current_bytes": current,
+		"peak_bytes": peak,
+		"top": [
+			{"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "bytes": stat.size, "count": stat.count}
+			for stat in snapshot.statistics("lineno")[:MEMORY_TOP]
+		],
+	}
+
+
+def add_instrumentation_arguments(parser: argparse.ArgumentParser) -> None:
+	parser.add_argument(
+		"--profile",
+		metavar="PATH",
+		help="Write cProfile stats (pstats format) to PATH and print the hottest calls to stderr",
+	)
+	parser.add_argument(
+		"--trace-memory",
+		action="store_true",
+		help="Trace allocations with tracemalloc and report the peak and largest allocation sites",
+	)
+
+
+@contextmanager
+def instrumented(args: argparse.Namespace) -> Iterator[Instrumentation]:
+	"""Instrumentation for one run; stops on exit and prints a stderr summary when profiling or tracing."""
+	profile = getattr(args, "profile", None)
+	probe = Instrumentation(
+		profile_path=Path(profile) if profile else None,
+		trace_memory=bool(getattr(args, "trace_memory", False)),
+	)
+	probe.start()
+	try:
+		yield probe
+	finally:
+		probe.stop()
+		if probe.profile_path is not None or probe.trace_memory:
+			print("\n".join(probe.format_lines()), file=sys.stderr)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""Check and compile the translation catalogs (i18n/*.tres) and the dialogue pack.
+
+Checks: keys missing from or extra to each locale versus the reference locale, `%d`/`%s`
+placeholder mismatches, and dialogue entries whose per-locale line counts differ.
+
+Compiled catalogs are one binary file per locale (little-endian):
+
+	header   "FFCL" u16 version, u16 locale byte length, u32 entry count, u32 key blob size, u32 value blob size
+	locale   UTF-8 bytes
+	offsets  u32[count + 1] key offsets, then u32[count + 1] value offsets
+	blobs    keys (sorted by UTF-8 bytes), then values
+
+so a lookup is a binary search over the key offsets of a single read.
+"""
+
+from __future__ import annotations
+
+import argparse
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import re
+import struct
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+from character_exports_common import FileHashCache, merkle_digest
+from godot_resource import PROJECT_ROOT, GodotParseError, load_resource
+
+
+CATALOG_MAGIC = b"FFCL"
+CATALOG_VERSION = 1
+# Part of the cached state's inputs digest; bump when check_catalogs rules change so cached reports are redone.
+CHECK_VERSION = 2
+CATALOG_HEADER = struct.Struct("<4sHHIII")
+CATALOG_SUFFIX = ".catalog"
+STATE_NAME = "catalog_state.json"
+HASH_CACHE_NAME = ".localization_hash_cache.json"
+DEFAULT_REFERENCE_LOCALE = "en"
+DIALOGUE_KEY_PREFIX = "dialogue"
+# Godot's String % operator: flags, width, precision and a conversion; `%%` is a literal percent.
+PLACEHOLDER_RE = re.compile(r"%(?:%|[-+ 0#]*(?:\d+|\*)?(?:\.(?:\d+|\*))?[sdioxXfcv])")
+
+
+@dataclass
+class CatalogReport:
+	reference_locale: str
+	locales: list[str] = field(default_factory=list)
+	key_counts: dict[str, int] = field(default_factory=dict)
+	missing_keys: dict[str, list[str]] = field(default_factory=dict)
+	extra_keys: dict[str, list[str]] = field(default_factory=dict)
+	placeholder_mismatches: list[dict[str, Any]] = field(default_factory=list)
+	dialogue_mismatches: list[dict[str, Any]] = field(default_factory=list)
+
+	@property
+	def errors(self) -> int:
+		missing = sum(len(keys) for keys in self.missing_keys.values())
+		return missing + len(self.placeholder_mismatches) + len(self.dialogue_mismatches)
+
+	def to_dict(self) -> dict[str, Any]:
+		return {
+			"reference_locale": self.reference_locale,
+			"locales": self.locales,
+			"key_counts": self.key_counts,
+			"missing_keys": self.missing_keys,
+			"extra_keys": self.extra_keys,
+			"placeholder_mismatches": self.placeholder_mismatches,
+			"dialogue_mismatches": self.dialogue_mismatches,
+		}
+
+	@classmethod
+	def from_dict(cls, payload: dict[str, Any]) -> CatalogReport:
+		return cls(**{key: payload[key] for key in cls.__dataclass_fields__ if key in payload})
+
+
+def placeholders(text: str) -> list[str]:
+	"""Format placeholders in order; Godot's `%` formatting is positional, so order matters as much as the set."""
+	return [token for token in PLACEHOLDER_RE.findall(text) if token != "%%"]
+
+
+def load_translation_messages(path: Path) -> tuple[str, dict[str, str]]:
+	properties = load_resource(path).properties
+	locale = str(properties.get("locale") or path.stem)
+	messages = properties.get("messages", {})
+	if not isinstance(messages, dict):
+		raise GodotParseError(f"{path}: messages is not a dictionary")
+	return locale, {str(key): str(value) for key, value in messages.items()}
+
+
+def flatten_dialogue(pack: dict[str, Any], locales: set[str]) -> dict[str, dict[str, list[str]]]:
+	"""`{key: {locale: lines}}` for every `{"en": [...], "zh": [...]}` leaf in the dialogue pack."""
+	entries: dict[str, dict[str, list[str]]] = {}
+
+	def walk(node: Any, path: list[str]) -> None:
+		if isinstance(node, dict):
+			if node and set(node) <= locales and all(isinstance(value, list) for value in node.values()):
+				entries["/".join(path)] = {locale: [str(line) for line in lines] for locale, lines in node.items()}
+				return
+			for key, value in node.items():
+				walk(value, [*path, str(key)])
+		elif isinstance(node, list):
+			for index, value in enumerate(node):
+				# Rivalries are a list of dicts with ids; key them by id so reordering keeps keys stable.
+				label = str(value.get("id", index)) if isinstance(value, dict) else str(index)
+				walk(value, [*path, label])
+
+	walk(pack, [DIALOGUE_KEY_PREFIX])
+	return entries
+
+
+def check_catalogs(
+	messages_by_locale: dict[str, dict[str, str]],
+	dialogue: dict[str, dict[str, list[str]]],
+	reference_locale: str,
+) -> CatalogReport:
+	report = CatalogReport(reference_locale=reference_locale, locales=sorted(messages_by_locale))
+	reference = messages_by_locale.get(reference_locale, {})
+	for locale, messages in sorted(messages_by_locale.items()):
+		report.key_counts[locale] = len(messages)
+		if locale == reference_locale:
+			continue
+		missing = sorted(set(reference) - set(messages))
+		extra = sorted(set(messages) - set(reference))
+		if missing:
+			report.missing_keys[locale] = missing
+		if extra:
+			report.extra_keys[locale] = extra
+		for key in sorted(set(reference) & set(messages)):
+			expected = placeholders(reference[key])
+			found = placeholders(messages[key])
+			if expected != found:
+				report.placeholder_mismatches.append({"locale": locale, "key": key, "expected": expected, "found": found})
+
+	for key, lines_by_locale in sorted(dialogue.items()):
+		reference_lines = lines_by_locale.get(reference_locale)
+		for locale in report.locales:
+			lines = lines_by_locale.get(locale)
+			if lines is None:
+				report.missing_keys.setdefault(locale, []).append(key)
+				continue
+			if locale == reference_locale or reference_lines is None:
+				continue
+			if len(lines) != len(reference_lines):
+				report.dialogue_mismatches.append(
+					{"locale": locale, "key": key, "expected_lines": len(reference_lines), "found_lines": len(lines)}
+				)
+				continue
+			for index, (expected_line, line) in enumerate(zip(reference_lines, lines)):
+				if placeholders(expected_line) != placeholders(line):
+					report.placeholder_mismatches.append(
+						{
+							"locale": locale,
+							"key": f"{key}/{index}",
+							"expected": placeholders(expected_line),
+							"found": placeholders(line),
+						}
+					)
+	return report
+
+
+def catalog_entries(messages: dict[str, str], dialogue: dict[str, dict[str, list[str]]], locale: str) -> dict[str, str]:
+	entries = dict(messages)
+	for key, lines_by_locale in dialogue.items():
+		for index, line in enumerate(lines_by_locale.get(locale, [])):
+			entries[f"{key}/{index}"] = line
+	return entries
+
+
+def _pack_strings(values: list[bytes]) -> tuple[np.ndarray, bytes]:
+	offsets = np.zeros(len(values) + 1, dtype="<u4")
+	np.cumsum([len(value) for value in values], out=offsets[1:])
+	return offsets, b"".join(values)
+
+
+def encode_catalog(locale: str, entries: dict[str, str]) -> bytes:
+	items = sorted((key.encode("utf-8"), value.encode("utf-8")) for key, value in entries.items())
+	key_offsets, key_blob = _pack_strings([key for key, _ in items])
+	value_offsets, value_blob = _pack_strings([value for _, value in items])
+	locale_bytes = locale.encode("utf-8")
+	header = CATALOG_HEADER.pack(
+		CATALOG_MAGIC, CATALOG_VERSION, len(locale_bytes), len(items), len(key_blob), len(value_blob)
+	)
+	return b"".join([header, locale_bytes, key_offsets.tobytes(), value_offsets.tobytes(), key_blob, value_blob])
+
+
+class CompiledCatalog:
+	"""Read-only view over an encoded catalog; keys are decoded lazily during lookup."""
+
+	def __init__(self, data: bytes) -> None:
+		magic, version, locale_size, count, key_size, value_size = CATALOG_HEADER.unpack_from(data, 0)
+		if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+			raise ValueError("Not a compiled localization catalog (bad magic or version)")
+		view = memoryview(data)
+		position = CATALOG_HEADER.size
+		self.locale = bytes(view[position:position + locale_size]).decode("utf-8")
+		position += locale_size
+		self._key_offsets = np.frombuffer(data, dtype="<u4", count=count + 1, offset=position)
+		position += (count + 1) * 4
+		self._value_offsets = np.frombuffer(data, dtype="<u4", count=count + 1, offset=position)
+		position += (count + 1) * 4
+		self._keys = view[position:position + key_size]
+		self._values = view[position + key_size:position + key_size + value_size]
+		self._count = count
+
+	@classmethod
+	def read(cls, path: Path) -> CompiledCatalog:
+		return cls(path.read_bytes())
+
+	def __len__(self) -> int:
+		return self._count
+
+	def _key(self, index: int) -> bytes:
+		return bytes(self._keys[self._key_offsets[index]:self._key_offsets[index + 1]])
+
+	def get(self, key: str, default: str | None = None) -> str | None:
+		encoded = key.encode("utf-8")
+		index = bisect_left(range(self._count), encoded, key=self._key)
+		if index < self._count and self._key(index) == encoded:
+			return bytes(self._values[self._value_offsets[index]:self._value_offsets[index + 1]]).decode("utf-8")
+		return default
+
+
+def _output_current(output_dir: Path, locale: str, entry: Any, cache: FileHashCache) -> bool:
+	"""True when `locale`'s compiled catalog still exists with the content hash recorded in the state file."""
+	target = output_dir / f"{locale}{CATALOG_SUFFIX}"
+	return isinstance(entry, dict) and target.exists() and cache.hash_file(target) == entry.get("content_hash")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Check i18n/*.tres and the dialogue pack for missing/extra keys and placeholder mismatches, "
+			"and compile each locale into a binary lookup table."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument(
+		"--reference-locale",
+		default=DEFAULT_REFERENCE_LOCALE,
+		help=f"Locale other catalogs are checked against (default: {DEFAULT_REFERENCE_LOCALE})",
+	)
+	parser.add_argument(
+		"--dialogue",
+		default="assets/data/dialogue/DialoguePackV1.json",
+		help="Dialogue pack path relative to the project root",
+	)
+	parser.add_argument("--output-dir", default="i18n/compiled", help="Compiled catalog directory relative to the project root")
+	parser.add_argument("--check-only", action="store_true", help="Run checks without writing compiled catalogs")
+	parser.add_argument("--force", action="store_true", help="Ignore cached state and recompile every locale")
+	parser.add_argument("--lookup", action="append", help="Print KEY from every compiled catalog (repeatable)")
+	parser.add_argument("--strict", action="store_true", help="Also fail on extra keys")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root)
+	translation_paths = sorted((project_root / "i18n").glob("*.tres"))
+	dialogue_path = project_root / args.dialogue
+	output_dir = project_root / args.output_dir
+	if not translation_paths:
+		print(f"No translation resources in {project_root / 'i18n'}", file=sys.stderr)
+		return 1
+
+	cache = FileHashCache(output_dir / HASH_CACHE_NAME)
+	input_hashes = {path.name: cache.hash_file(path) for path in translation_paths}
+	dialogue_hash = cache.hash_file(dialogue_path) if dialogue_path.exists() else ""
+	state_path = output_dir / STATE_NAME
+	try:
+		state = json.loads(state_path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		state = {}
+	inputs_digest = merkle_digest(
+		[(f"v{CATALOG_VERSION}.{CHECK_VERSION}", args.reference_locale), *sorted(input_hashes.items()), (dialogue_path.name, dialogue_hash)]
+	)
+
+	compiled: list[str] = []
+	outputs_current = all(
+		_output_current(output_dir, locale, entry, cache) for locale, entry in state.get("outputs", {}).items()
+	)
+	if (
+		not args.force
+		and state.get("inputs_digest") == inputs_digest
+		and isinstance(state.get("report"), dict)
+		and (args.check_only or outputs_current)
+	):
+		report = CatalogReport.from_dict(state["report"])
+		outputs = state.get("outputs", {})
+	else:
+		try:
+			messages_by_locale: dict[str, dict[str, str]] = {}
+			locale_by_file: dict[str, str] = {}
+			for path in translation_paths:
+				locale, messages = load_translation_messages(path)
+				messages_by_locale[locale] = messages
+				locale_by_file[path.name] = locale
+			pack = json.loads(dialogue_path.read_text(encoding="utf-8")) if dialogue_path.exists() else {}
+		except (GodotParseError, ValueError) as exc:
+			print(str(exc), file=sys.stderr)
+			return 1
+		dialogue = flatten_dialogue(pack, set(messages_by_locale))
+		report = check_catalogs(messages_by_locale, dialogue, args.reference_locale)
+		# Only locales that still have a translation resource are carried over.
+		previous = state.get("outputs", {}) if not args.force else {}
+		outputs = {locale: previous[locale] for locale in locale_by_file.values() if locale in previous}
+		if not args.check_only:
+			output_dir.mkdir(parents=True, exist_ok=True)
+			for file_name, locale in sorted(locale_by_file.items()):
+				# A locale's catalog only depends on its own messages and the dialogue pack.
+				locale_digest = merkle_digest([(file_name, input_hashes[file_name]), (dialogue_path.name, dialogue_hash)])
+				entry = outputs.get(locale)
+				if isinstance(entry, dict) and entry.get("inputs_digest") == locale_digest and _output_current(output_dir, locale, entry, cache):
+					continue
+				target = output_dir / f"{locale}{CATALOG_SUFFIX}"
+				target.write_bytes(encode_catalog(locale, catalog_entries(messages_by_locale[locale], dialogue, locale)))
+				outputs[locale] = {"inputs_digest": locale_digest, "content_hash": cache.hash_file(target)}
+				compiled.append(locale)
+			state_path.write_text(
+				json.dumps({"inputs_digest": inputs_digest, "report": report.to_dict(), "outputs": outputs}, indent=2, ensure_ascii=False) + "\n",
+				encoding="utf-8",
+			)
+	cache.save()
+	elapsed = time.perf_counter() - started
+
+	lookups: dict[str, dict[str, str | None]] = {}
+	for key in args.lookup or []:
+		lookups[key] = {
+			path.stem: CompiledCatalog.read(path).get(key)
+			for path in sorted(output_dir.glob(f"*{CATALOG_SUFFIX}"))
+		}
+	failed = report.errors > 0 or (args.strict and any(report.extra_keys.values()))
+
+	if args.format == "json":
+		payload = {
+			**report.to_dict(),
+			"compiled_locales": compiled,
+			"output_dir": str(output_dir),
+			"lookups": lookups,
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+		return 1 if failed else 0
+
+	counts = ", ".join(f"{locale}={count}" for locale, count in sorted(report.key_counts.items()))
+	print(f"Localization: {len(report.locales)} locale(s) [{counts}] ({elapsed * 1000.0:.1f} ms)")
+	for locale, keys in sorted(report.missing_keys.items()):
+		print(f"  - {locale}: {len(keys)} missing key(s): {', '.join(keys[:10])}{' ...' if len(keys) > 10 else ''}")
+	for locale, keys in sorted(report.extra_keys.items()):
+		print(f"  ~ {locale}: {len(keys)} extra key(s): {', '.join(keys[:10])}{' ...' if len(keys) > 10 else ''}")
+	for mismatch in report.placeholder_mismatches:
+		print(
+			f"  - {mismatch['locale']}: {mismatch['key']} placeholders {' '.join(mismatch['found']) or '(none)'} "
+			f"(expected {' '.join(mismatch['expected']) or '(none)'})"
+		)
+	for mismatch in report.dialogue_mismatches:
+		print(
+			f"  - {mismatch['locale']}: {mismatch['key']} has {mismatch['found_lines']} line(s) "
+			f"(expected {mismatch['expected_lines']})"
+		)
+	if not args.check_only:
+		print(f"Compiled: {', '.join(compiled) if compiled else 'up to date'} -> {output_dir}")
+	for key, values in lookups.items():
+		for locale, value in values.items():
+			print(f"  {locale} {key} = {value!r}")
+	print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
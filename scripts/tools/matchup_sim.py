@@ -0,0 +1,927 @@
+#!/usr/bin/env python3
+"""Headless Monte Carlo matchup simulator over attack tables, loadouts and round tuning.
+
+The model is exchange-based rather than frame-accurate: each step both fighters commit to a move,
+the faster effective startup (plus a spacing jitter) wins, the loser blocks or gets hit, and a hit
+may be confirmed into the character's best hit-cancel route from combo_routes.py. Loadout presets,
+items (with evolution) and round-tuning patches mirror LoadoutCatalog.gd, Player.gd and
+RoundTuningEngine.gd. Thousands of matches per character pair advance together as NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import copy
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+import itertools
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+from combo_routes import MoveGraph, best_routes_by_move, build_move_graphs
+from frame_data import FrameDataTable, load_frame_data
+from godot_resource import PROJECT_ROOT, read_gdscript_const
+
+
+PLAYER_SCRIPT = PROJECT_ROOT / "scripts" / "Player.gd"
+MATCH_SCRIPT = PROJECT_ROOT / "scripts" / "Match.gd"
+LOADOUT_CATALOG_SCRIPT = PROJECT_ROOT / "scripts" / "config" / "LoadoutCatalog.gd"
+CHARACTER_CATALOG_SCRIPT = PROJECT_ROOT / "scripts" / "config" / "CharacterCatalog.gd"
+SKILL_PROFILES_SCRIPT = PROJECT_ROOT / "scripts" / "player" / "GeneratedSkillProfiles.gd"
+
+SIM_MATCH_MODE = "sim"
+DEFAULT_MATCHES = 500
+DEFAULT_COMBO_HITS = 4
+DEFAULT_STOCKS = 3
+MAX_STEPS = 4000
+PLAYER_KEYS = ("p1", "p2")
+
+# How often each move is thrown out in neutral; ultimate is used whenever hype allows at --ultimate-rate.
+NEUTRAL_WEIGHTS = {
+	"light": 0.30,
+	"heavy": 0.20,
+	"special": 0.15,
+	"throw": 0.10,
+	"signature_a": 0.08,
+	"signature_b": 0.08,
+	"signature_c": 0.09,
+}
+
+# (damage multiplier, cooldown multiplier) per slot variant, as in LoadoutCatalog._build_skill_defs.
+SKILL_VARIANTS = {
+	("signature_a", "core"): (1.00, 1.00),
+	("signature_a", "burst"): (1.12, 1.08),
+	("signature_b", "mobility"): (1.00, 0.96),
+	("signature_b", "control"): (0.92, 1.00),
+	("ultimate", "core"): (1.00, 1.00),
+	("ultimate", "overclock"): (1.10, 1.10),
+}
+# LoadoutCatalog._build_loadout_presets: slot -> variant / item / passive suffix.
+PRESETS = {
+	"balanced": {"signature_a": "core", "signature_b": "mobility", "ultimate": "core", "item": "brand_core", "passive": "stable_release"},
+	"burst": {"signature_a": "burst", "signature_b": "mobility", "ultimate": "overclock", "item": "brand_core", "passive": "stable_release"},
+	"control": {"signature_a": "core", "signature_b": "control", "ultimate": "core", "item": "hype_loop", "passive": "stable_release"},
+	"chip_pressure": {"signature_a": "burst", "signature_b": "control", "ultimate": "core", "item": "brand_core", "passive": "pressure_stack"},
+}
+
+
+@dataclass(frozen=True)
+class GameConstants:
+	max_hp: int
+	hype_max: float
+	hype_gain_on_hit: float
+	hype_gain_on_block: float
+	hype_gain_on_taking_hit: float
+	block_chip_by_attack: dict[str, float]
+	round_time_seconds: float
+	schema_version: int
+	ticks_per_second: int
+
+
+@dataclass(frozen=True)
+class SimOptions:
+	matches: int = DEFAULT_MATCHES
+	stocks: int = DEFAULT_STOCKS
+	time_limit: float = 0.0
+	combo_hits: int = DEFAULT_COMBO_HITS
+	block_rate: float = 0.40
+	confirm_rate: float = 0.60
+	punish_rate: float = 0.70
+	ultimate_rate: float = 0.50
+	spacing_frames: float = 10.0
+	neutral_gap_frames: tuple[float, float] = (18.0, 54.0)
+	round_tuning: bool = True
+	round_tuning_policy: str = "first"
+	round_tuning_max_picks: int = 2
+	round_tuning_leader_lock_gap: int = 2
+
+
+@dataclass(frozen=True)
+class FighterModel:
+	character_id: str
+	loadout: dict[str, str]
+	moves: tuple[str, ...]
+	startup: np.ndarray
+	total_frames: np.ndarray
+	block_frames: np.ndarray
+	damage: np.ndarray
+	chip_scale: np.ndarray
+	on_block: np.ndarray
+	weight: np.ndarray
+	cooldown: np.ndarray
+	combo_damage: np.ndarray
+	combo_hits: np.ndarray
+	combo_frames: np.ndarray
+	ultimate_index: int
+	startup_multiplier: float
+	damage_multiplier: float
+	chip_bonus: float
+	item: dict[str, Any]
+	evolved_item: dict[str, Any]
+
+	@property
+	def loadout_signature(self) -> str:
+		slots = ("signature_a", "signature_b", "ultimate", "item", "passive")
+		return "|".join([self.character_id, *(self.loadout.get(slot, "") for slot in slots)])
+
+
+def load_game_constants(ticks_per_second: int) -> GameConstants:
+	def player_const(name: str) -> Any:
+		return read_gdscript_const(PLAYER_SCRIPT, name)
+
+	return GameConstants(
+		max_hp=int(player_const("MAX_HP")),
+		hype_max=float(player_const("HYPE_MAX")),
+		hype_gain_on_hit=float(player_const("HYPE_GAIN_ON_HIT")),
+		hype_gain_on_block=float(player_const("HYPE_GAIN_ON_BLOCK")),
+		hype_gain_on_taking_hit=float(player_const("HYPE_GAIN_ON_TAKING_HIT")),
+		block_chip_by_attack={str(key): float(value) for key, value in player_const("BLOCK_CHIP_BY_ATTACK").items()},
+		round_time_seconds=float(read_gdscript_const(MATCH_SCRIPT, "ROUND_TIME_SECONDS")),
+		schema_version=int(read_gdscript_const(MATCH_SCRIPT, "MATCH_METRICS_SCHEMA_VERSION")),
+		ticks_per_second=ticks_per_second,
+	)
+
+
+def selectable_roster() -> list[str]:
+	return [str(entry["id"]) for entry in read_gdscript_const(CHARACTER_CATALOG_SCRIPT, "CHARACTER_OPTIONS")]
+
+
+def resolve_character_tuning(character_id: str) -> dict[str, float]:
+	"""LoadoutCatalog._resolve_character_tuning."""
+	merged = dict(read_gdscript_const(LOADOUT_CATALOG_SCRIPT, "DEFAULT_CHARACTER_TUNING"))
+	merged.update(read_gdscript_const(LOADOUT_CATALOG_SCRIPT, "WAVE1_CHARACTER_TUNING").get(character_id, {}))
+	return {key: float(value) for key, value in merged.items()}
+
+
+def build_item_defs(character_id: str, tuning: dict[str, float]) -> dict[str, dict[str, Any]]:
+	"""LoadoutCatalog._build_item_defs (gameplay fields only)."""
+	core_id = f"{character_id}_item_brand_core"
+	hype_id = f"{character_id}_item_hype_loop"
+	items = [
+		{
+			"id": core_id,
+			"trigger_type": "hit_count",
+			"trigger_value": max(1.0, 3.0 + tuning["item_core_trigger_delta"]),
+			"effect_type": "buff",
+			"effect_payload": {
+				"duration": max(0.8, 2.6 + tuning["item_core_duration_delta"]),
+				"damage_multiplier": 1.10,
+				"speed_multiplier": 1.05,
+				"startup_multiplier": 0.94,
+			},
+			"max_charges": 2,
+			"cooldown_seconds": max(0.0, 6.0 + tuning["item_core_cooldown_delta"]),
+			"evolution_id": f"{core_id}_plus",
+			"evolution_after_activations": 2,
+			"round_tuning_options": [
+				{"id": "quick_cycle", "patch": {"cooldown_seconds_delta": -0.8}},
+				{"id": "deep_cache", "patch": {"effect_payload_patch": {"duration": 0.8, "damage_multiplier": 0.04}}},
+			],
+		},
+		{
+			"id": hype_id,
+			"trigger_type": "block_count",
+			"trigger_value": max(1.0, 2.0 + tuning["item_hype_trigger_delta"]),
+			"effect_type": "hype",
+			"effect_payload": {"amount": max(8.0, 24.0 + tuning["item_hype_amount_delta"])},
+			"max_charges": 3,
+			"cooldown_seconds": max(0.0, 5.0 + tuning["item_hype_cooldown_delta"]),
+			"evolution_id": f"{hype_id}_plus",
+			"evolution_after_activations": 2,
+			"round_tuning_options": [
+				{"id": "viral_spike", "patch": {"effect_payload_patch": {"amount": 8.0}}},
+				{"id": "guard_cache", "patch": {"trigger_value_delta": -1.0}},
+			],
+		},
+		{
+			"id": f"{core_id}_plus",
+			"trigger_type": "hit_count",
+			"trigger_value": 2.0,
+			"effect_type": "buff",
+			"effect_payload": {
+				"duration": 3.6,
+				"damage_multiplier": 1.14,
+				"speed_multiplier": 1.08,
+				"startup_multiplier": 0.90,
+				"chip_bonus": 0.04,
+			},
+			"max_charges": 3,
+			"cooldown_seconds": 5.0,
+			"evolution_id": "",
+			"round_tuning_options": [],
+		},
+		{
+			"id": f"{hype_id}_plus",
+			"trigger_type": "block_count",
+			"trigger_value": 1.0,
+			"effect_type": "hype",
+			"effect_payload": {"amount": 34.0},
+			"max_charges": 4,
+			"cooldown_seconds": 4.0,
+			"evolution_id": "",
+			"round_tuning_options": [],
+		},
+	]
+	return {item["id"]: item for item in items}
+
+
+def build_item_runtime(item_def: dict[str, Any]) -> dict[str, Any]:
+	runtime = copy.deepcopy(item_def)
+	runtime.update(
+		{
+			"charges_remaining": int(item_def["max_charges"]),
+			"cooldown_remaining": 0.0,
+			"trigger_progress": 0.0,
+			"activation_count": 0,
+		}
+	)
+	return runtime
+
+
+def get_round_tuning_options(item_runtime: dict[str, Any]) -> list[dict[str, Any]]:
+	"""RoundTuningEngine.get_round_tuning_options."""
+	options = [
+		copy.deepcopy(option)
+		for option in item_runtime.get("round_tuning_options", [])
+		if isinstance(option, dict) and str(option.get("id", "")).strip()
+	]
+	return options[:2]
+
+
+def apply_round_tuning_option(item_runtime: dict[str, Any], option_id: str) -> dict[str, Any]:
+	"""RoundTuningEngine.apply_round_tuning_option."""
+	updated = copy.deepcopy(item_runtime)
+	if not updated:
+		return updated
+	for option in get_round_tuning_options(updated):
+		if str(option.get("id", "")) != option_id:
+			continue
+		patch = option.get("patch", {})
+		if isinstance(patch, dict):
+			_apply_patch(updated, patch)
+		return updated
+	return updated
+
+
+def _apply_patch(item_runtime: dict[str, Any], patch: dict[str, Any]) -> None:
+	if "cooldown_seconds_delta" in patch:
+		item_runtime["cooldown_seconds"] = max(
+			0.0, float(item_runtime.get("cooldown_seconds", 0.0)) + float(patch["cooldown_seconds_delta"])
+		)
+	if "trigger_value_delta" in patch:
+		item_runtime["trigger_value"] = max(
+			1.0, float(item_runtime.get("trigger_value", 1.0)) + float(patch["trigger_value_delta"])
+		)
+	if "max_charges_delta" in patch:
+		previous_max = max(1, int(item_runtime.get("max_charges", 1)))
+		previous_remaining = min(max(int(item_runtime.get("charges_remaining", previous_max)), 0), previous_max)
+		delta = int(patch["max_charges_delta"])
+		updated_max = max(1, previous_max + delta)
+		item_runtime["max_charges"] = updated_max
+		if delta > 0:
+			item_runtime["charges_remaining"] = min(updated_max, previous_remaining + delta)
+		else:
+			item_runtime["charges_remaining"] = min(previous_remaining, updated_max)
+	if "effect_payload_patch" in patch:
+		payload = dict(item_runtime.get("effect_payload", {}))
+		payload_patch = patch["effect_payload_patch"]
+		if isinstance(payload_patch, dict):
+			for key, delta_value in payload_patch.items():
+				current = payload.get(key, 0.0)
+				if isinstance(current, (int, float)) and not isinstance(current, bool):
+					payload[key] = float(current) + float(delta_value)
+				else:
+					payload[key] = delta_value
+		item_runtime["effect_payload"] = payload
+
+
+def build_fighter(
+	table: FrameDataTable,
+	graph: MoveGraph,
+	preset_id: str,
+	constants: GameConstants,
+	combo_hits: int,
+) -> FighterModel:
+	"""`graph` is the character's entry from `build_move_graphs(table)`, built once by the caller."""
+	character_id = graph.character_id
+	preset = PRESETS[preset_id]
+	tuning = resolve_character_tuning(character_id)
+	profiles = read_gdscript_const(SKILL_PROFILES_SCRIPT, "PROFILE_BY_CHARACTER")
+	profile = profiles.get(character_id) or profiles.get("prototype", {})
+
+	rows = np.flatnonzero(table.records["character_id"] == character_id)
+	records = table.records[rows]
+	moves = graph.moves
+
+	damage = np.array(graph.damage, dtype=np.float64)
+	cooldown = np.zeros(len(moves), dtype=np.float64)
+	chip_scale = np.array([constants.block_chip_by_attack.get(move, 0.0) for move in moves], dtype=np.float64)
+	for index, move in enumerate(moves):
+		slot_variant = preset.get(move)
+		if (move, slot_variant) not in SKILL_VARIANTS:
+			continue
+		entry = profile.get(move, {})
+		slot_prefix = "ultimate" if move == "ultimate" else "signature"
+		variant_damage, variant_cooldown = SKILL_VARIANTS[(move, slot_variant)]
+		damage_scale = float(entry.get("damage_scale", 0.62)) * variant_damage * tuning[f"{slot_prefix}_damage_multiplier"]
+		damage_scale = min(max(damage_scale, 0.35), 1.80)
+		damage[index] = max(1.0, float(np.floor(damage[index] * damage_scale + 0.5)))
+		cooldown[index] = max(
+			0.35, float(entry.get("cooldown", 1.6)) * variant_cooldown * tuning[f"{slot_prefix}_cooldown_multiplier"]
+		)
+		if move == "signature_a" and slot_variant == "burst":
+			chip_scale[index] += 0.06
+
+	if preset["passive"] == "stable_release":
+		startup_multiplier = min(max(0.96 + tuning["passive_startup_delta"], 0.70), 1.0)
+		damage_multiplier, chip_bonus = 1.0, 0.0
+	else:
+		startup_multiplier = 1.0
+		damage_multiplier = max(1.0, 1.06 + tuning["passive_damage_delta"])
+		chip_bonus = max(0.0, 0.04 + tuning["passive_chip_delta"])
+
+	scaled_graph = replace(graph, damage=tuple(int(value) for value in damage))
+	best_routes = best_routes_by_move(scaled_graph, combo_hits)
+	startup = records["startup"].astype(np.float64)
+	total_frames = (records["startup"] + records["active"] + records["recovery"]).astype(np.float64)
+	combo_frames = np.array(
+		[
+			sum(startup[index] for index in route) + total_frames[route[-1]] - startup[route[-1]]
+			for _, route in best_routes
+		],
+		dtype=np.float64,
+	)
+	items = build_item_defs(character_id, tuning)
+	item = items[f"{character_id}_item_{preset['item']}"]
+	loadout = {
+		"character_id": character_id,
+		"signature_a": f"{character_id}_signature_a_{preset['signature_a']}",
+		"signature_b": f"{character_id}_signature_b_{preset['signature_b']}",
+		"ultimate": f"{character_id}_ultimate_{preset['ultimate']}",
+		"item": item["id"],
+		"passive": f"{character_id}_passive_{preset['passive']}",
+	}
+	return FighterModel(
+		character_id=character_id,
+		loadout=loadout,
+		moves=moves,
+		startup=startup,
+		total_frames=total_frames,
+		block_frames=(records["startup"] + records["active"] + records["block_recovery"]).astype(np.float64),
+		damage=damage,
+		chip_scale=chip_scale,
+		on_block=(records["blockstun"] - records["block_recovery"]).astype(np.float64),
+		weight=np.array([NEUTRAL_WEIGHTS.get(move, 0.0) for move in moves], dtype=np.float64),
+		cooldown=cooldown,
+		combo_damage=np.array([value for value, _ in best_routes], dtype=np.float64),
+		combo_hits=np.array([len(route) for _, route in best_routes], dtype=np.float64),
+		combo_frames=combo_frames,
+		ultimate_index=moves.index("ultimate") if "ultimate" in moves else -1,
+		startup_multiplier=startup_multiplier,
+		damage_multiplier=damage_multiplier,
+		chip_bonus=chip_bonus,
+		item=item,
+		evolved_item=items.get(item["evolution_id"], {}),
+	)
+
+
+def _pad(values: list[np.ndarray], width: int, fill: float = 0.0) -> np.ndarray:
+	return np.stack([np.pad(value, (0, width - len(value)), constant_values=fill) for value in values])
+
+
+def _punish_table(attacker: FighterModel, defender: FighterModel) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Best punish (damage, hits, frames) the defender has against each attacker move after a block."""
+	window = -attacker.on_block[:, None]
+	usable = (defender.weight[None, :] > 0) & (defender.startup[None, :] * defender.startup_multiplier <= window)
+	candidate = np.where(usable, defender.combo_damage[None, :], 0.0)
+	best = candidate.argmax(axis=1)
+	has_punish = usable.any(axis=1)
+	return (
+		np.where(has_punish, defender.combo_damage[best], 0.0),
+		np.where(has_punish, defender.combo_hits[best], 0.0),
+		np.where(has_punish, defender.combo_frames[best], 0.0),
+	)
+
+
+class _ItemState:
+	"""Per-match item runtime for one side, as arrays; rare transitions go through the dict mirror."""
+
+	FIELDS = ("trigger_value", "trigger_progress", "cooldown_seconds", "cooldown_remaining", "max_charges", "charges_remaining", "activation_count")
+	PAYLOAD_FIELDS = ("duration", "damage_multiplier", "startup_multiplier", "chip_bonus", "amount")
+
+	def __init__(self, runtime: dict[str, Any], count: int) -> None:
+		self.trigger_type = str(runtime["trigger_type"])
+		self.effect_type = str(runtime["effect_type"])
+		self.evolution_after = int(runtime.get("evolution_after_activations", 0)) if runtime.get("evolution_id") else 0
+		self.ids = np.array([runtime["id"]] * count, dtype=object)
+		self.evolvable = np.full(count, bool(runtime.get("evolution_id")), dtype=bool)
+		self.values = {name: np.full(count, float(runtime.get(name, 0.0))) for name in self.FIELDS}
+		payload = runtime.get("effect_payload", {})
+		self.payload = {
+			name: np.full(count, float(payload.get(name, 1.0 if name.endswith("multiplier") else 0.0)))
+			for name in self.PAYLOAD_FIELDS
+		}
+		self.round_tuning_options = [runtime.get("round_tuning_options", [])] * count
+		self.evolution_ids = [str(runtime.get("evolution_id", ""))] * count
+
+	def to_runtime(self, index: int) -> dict[str, Any]:
+		runtime: dict[str, Any] = {name: float(values[index]) for name, values in self.values.items()}
+		runtime["max_charges"] = int(runtime["max_charges"])
+		runtime["charges_remaining"] = int(runtime["charges_remaining"])
+		runtime["activation_count"] = int(runtime["activation_count"])
+		runtime["id"] = self.ids[index]
+		runtime["effect_payload"] = {name: float(values[index]) for name, values in self.payload.items()}
+		runtime["round_tuning_options"] = self.round_tuning_options[index]
+		runtime["evolution_id"] = self.evolution_ids[index]
+		return runtime
+
+	def load_runtime(self, index: int, runtime: dict[str, Any]) -> None:
+		for name in self.FIELDS:
+			self.values[name][index] = float(runtime.get(name, 0.0))
+		payload = runtime.get("effect_payload", {})
+		for name in self.PAYLOAD_FIELDS:
+			self.payload[name][index] = float(payload.get(name, 1.0 if name.endswith("multiplier") else 0.0))
+		self.ids[index] = runtime["id"]
+		self.round_tuning_options[index] = runtime.get("round_tuning_options", [])
+		self.evolution_ids[index] = str(runtime.get("evolution_id", ""))
+		self.evolvable[index] = bool(runtime.get("evolution_id"))
+
+
+def _categorical(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+	totals = weights.sum(axis=1, keepdims=True)
+	cumulative = np.cumsum(weights / np.where(totals > 0, totals, 1.0), axis=1)
+	draws = rng.random((weights.shape[0], 1))
+	return np.minimum((cumulative < draws).sum(axis=1), weights.shape[1] - 1)
+
+
+def simulate_pair(
+	fighters: tuple[FighterModel, FighterModel],
+	constants: GameConstants,
+	options: SimOptions,
+	seed: int,
+) -> list[dict[str, Any]]:
+	"""Simulate `options.matches` matches of fighters[0] (p1) vs fighters[1] (p2); one metrics record per match."""
+	rng = np.random.default_rng(seed)
+	count = options.matches
+	width = max(len(fighter.moves) for fighter in fighters)
+	startup = _pad([fighter.startup for fighter in fighters], width)
+	total_frames = _pad([fighter.total_frames for fighter in fighters], width)
+	block_frames = _pad([fighter.block_frames for fighter in fighters], width)
+	damage = _pad([fighter.damage for fighter in fighters], width)
+	chip_scale = _pad([fighter.chip_scale for fighter in fighters], width)
+	weight = _pad([fighter.weight for fighter in fighters], width)
+	cooldown = _pad([fighter.cooldown for fighter in fighters], width)
+	combo_damage = _pad([fighter.combo_damage for fighter in fighters], width)
+	combo_hits = _pad([fighter.combo_hits for fighter in fighters], width, 1.0)
+	combo_frames = _pad([fighter.combo_frames for fighter in fighters], width)
+	is_throw = np.array([[move == "throw" for move in fighter.moves] + [False] * (width - len(fighter.moves)) for fighter in fighters])
+	punish = [_punish_table(fighters[0], fighters[1]), _punish_table(fighters[1], fighters[0])]
+	punish_damage = _pad([punish[0][0], punish[1][0]], width)
+	punish_hits = _pad([punish[0][1], punish[1][1]], width)
+	punish_frames = _pad([punish[0][2], punish[1][2]], width)
+	base_startup_multiplier = np.array([fighter.startup_multiplier for fighter in fighters])
+	base_damage_multiplier = np.array([fighter.damage_multiplier for fighter in fighters])
+	base_chip_bonus = np.array([fighter.chip_bonus for fighter in fighters])
+	evolved_items = [fighter.evolved_item for fighter in fighters]
+
+	matches = np.arange(count)
+	hp = np.full((count, 2), float(constants.max_hp))
+	stocks = np.full((count, 2), options.stocks, dtype=np.int64)
+	hype = np.zeros((count, 2))
+	move_cooldowns = np.zeros((count, 2, width))
+	buff_time = np.zeros((count, 2))
+	buff_damage = np.ones((count, 2))
+	buff_startup = np.ones((count, 2))
+	buff_chip = np.zeros((count, 2))
+	damage_dealt = np.zeros((count, 2))
+	elapsed = np.zeros(count)
+	done = np.zeros(count, dtype=bool)
+	tuning_picks = np.zeros((count, 2), dtype=np.int64)
+	items = [_ItemState(build_item_runtime(fighter.item), count) for fighter in fighters]
+	events: dict[str, list[list[dict[str, Any]]]] = {
+		"round_tuning_picks": [[] for _ in range(count)],
+		"item_activation_events": [[] for _ in range(count)],
+		"item_evolution_events": [[] for _ in range(count)],
+	}
+	time_limit = options.time_limit
+	ticks = float(constants.ticks_per_second)
+
+	def activate_items(side: int, progressed: np.ndarray) -> None:
+		state = items[side]
+		values = state.values
+		ready = (
+			progressed
+			& (values["cooldown_remaining"] <= 0.0)
+			& (values["charges_remaining"] > 0)
+			& (values["trigger_progress"] >= np.maximum(1.0, values["trigger_value"]))
+		)
+		if not ready.any():
+			return
+		if state.effect_type == "buff":
+			buff_time[ready, side] = np.maximum(buff_time[ready, side], state.payload["duration"][ready])
+			buff_damage[ready, side] = np.maximum(buff_damage[ready, side], state.payload["damage_multiplier"][ready])
+			buff_startup[ready, side] = np.minimum(buff_startup[ready, side], state.payload["startup_multiplier"][ready])
+			buff_chip[ready, side] = np.maximum(buff_chip[ready, side], state.payload["chip_bonus"][ready])
+		elif state.effect_type == "hype":
+			hype[ready, side] = np.clip(hype[ready, side] + state.payload["amount"][ready], 0.0, constants.hype_max)
+		values["trigger_progress"][ready] = 0.0
+		values["charges_remaining"][ready] = np.maximum(0, values["charges_remaining"][ready] - 1)
+		values["cooldown_remaining"][ready] = np.maximum(0.0, values["cooldown_seconds"][ready])
+		values["activation_count"][ready] += 1
+		for index in np.flatnonzero(ready):
+			events["item_activation_events"][index].append(
+				{
+					"player_key": PLAYER_KEYS[side],
+					"item_id": state.ids[index],
+					"activation_count": int(values["activation_count"][index]),
+					"elapsed_seconds": round(float(elapsed[index]), 3),
+				}
+			)
+			if not state.evolvable[index] or values["activation_count"][index] < max(1, state.evolution_after):
+				continue
+			evolved = evolved_items[side]
+			if not evolved:
+				continue
+			before = state.to_runtime(index)
+			runtime = build_item_runtime(evolved)
+			runtime["cooldown_remaining"] = min(float(runtime["cooldown_seconds"]), float(before["cooldown_remaining"]))
+			state.load_runtime(index, runtime)
+			events["item_evolution_events"][index].append(
+				{
+					"player_key": PLAYER_KEYS[side],
+					"from_item_id": before["id"],
+					"to_item_id": runtime["id"],
+					"activation_count": int(before["activation_count"]),
+					"elapsed_seconds": round(float(elapsed[index]), 3),
+				}
+			)
+
+	def handle_knockouts(side: int, knocked: np.ndarray) -> None:
+		other = 1 - side
+		if not knocked.any():
+			return
+		respawn = knocked & (stocks[:, side] > 0)
+		hp[respawn, side] = float(constants.max_hp)
+		hype[respawn, side] = 0.0
+		if not options.round_tuning:
+			return
+		eligible = respawn & (tuning_picks[:, side] < options.round_tuning_max_picks)
+		if options.round_tuning_leader_lock_gap > 0:
+			eligible &= (stocks[:, side] - stocks[:, other]) < options.round_tuning_leader_lock_gap
+		state = items[side]
+		for index in np.flatnonzero(eligible):
+			runtime = state.to_runtime(index)
+			choices = get_round_tuning_options(runtime)
+			if not choices:
+				continue
+			# Headless Match.gd auto-picks the first option; "random" samples the whole menu.
+			choice = choices[0] if options.round_tuning_policy == "first" else choices[int(rng.integers(len(choices)))]
+			option_id = str(choice["id"])
+			state.load_runtime(index, apply_round_tuning_option(runtime, option_id))
+			tuning_picks[index, side] += 1
+			events["round_tuning_picks"][index].append(
+				{"player_key": PLAYER_KEYS[side], "option_id": option_id, "elapsed_seconds": round(float(elapsed[index]), 3)}
+			)
+
+	for _ in range(MAX_STEPS):
+		active = np.flatnonzero(~done)
+		if active.size == 0:
+			break
+		size = active.size
+
+		chosen = np.empty((size, 2), dtype=np.int64)
+		effective_startup = np.empty((size, 2))
+		for side in (0, 1):
+			available = weight[side][None, :] * (move_cooldowns[active, side, :] <= 0.0)
+			ultimate_index = fighters[side].ultimate_index
+			if ultimate_index >= 0:
+				# Weight the ultimate so it is picked at --ultimate-rate whenever hype is full.
+				ready = hype[active, side] >= constants.hype_max
+				others = available.sum(axis=1) - available[:, ultimate_index]
+				share = options.ultimate_rate / max(1e-9, 1.0 - options.ultimate_rate)
+				available[:, ultimate_index] = np.where(ready, share * np.maximum(others, 1e-9), 0.0)
+			chosen[:, side] = _categorical(rng, available)
+			buffed = buff_time[active, side] > 0.0
+			multiplier = base_startup_multiplier[side] * np.where(buffed, buff_startup[active, side], 1.0)
+			effective_startup[:, side] = (
+				startup[side][chosen[:, side]] * multiplier + rng.random(size) * options.spacing_frames
+			)
+			move_cooldowns[active, side, chosen[:, side]] = cooldown[side][chosen[:, side]]
+			if ultimate_index >= 0:
+				used_ultimate = chosen[:, side] == ultimate_index
+				hype[active[used_ultimate], side] = np.maximum(0.0, hype[active[used_ultimate], side] - constants.hype_max)
+
+		tie = effective_startup[:, 0] == effective_startup[:, 1]
+		attacker = np.where(tie, rng.integers(0, 2, size), (effective_startup[:, 1] < effective_startup[:, 0]).astype(np.int64))
+		defender = 1 - attacker
+		move = chosen[np.arange(size), attacker]
+		blocked = (rng.random(size) < options.block_rate) & ~is_throw[attacker, move]
+		confirmed = rng.random(size) < options.confirm_rate
+
+		buffed_attacker = buff_time[active, attacker] > 0.0
+		attacker_damage_multiplier = base_damage_multiplier[attacker] * np.where(buffed_attacker, buff_damage[active, attacker], 1.0)
+		hit_damage = np.where(confirmed, combo_damage[attacker, move], damage[attacker, move])
+		hits = np.where(confirmed, combo_hits[attacker, move], 1.0)
+		hit_damage = np.floor(hit_damage * attacker_damage_multiplier + 0.5)
+		chip_bonus = base_chip_bonus[attacker] + np.where(buffed_attacker, buff_chip[active, attacker], 0.0)
+		chip_damage = np.floor(damage[attacker, move] * (chip_scale[attacker, move] + chip_bonus) + 0.5)
+		frames = np.where(confirmed, combo_frames[attacker, move], total_frames[attacker, move])
+
+		landed = ~blocked
+		dealt = np.where(landed, hit_damage, chip_damage)
+		hp[active, defender] -= dealt
+		damage_dealt[active, attacker] += dealt
+		hype[active, attacker] = np.clip(
+			hype[active, attacker] + np.where(landed, constants.hype_gain_on_hit * hits, constants.hype_gain_on_block),
+			0.0,
+			constants.hype_max,
+		)
+		hype[active, defender] = np.clip(
+			hype[active, defender] + np.where(landed, constants.hype_gain_on_taking_hit * hits, 0.0), 0.0, constants.hype_max
+		)
+
+		punished = blocked & (punish_damage[attacker, move] > 0) & (rng.random(size) < options.punish_rate)
+		buffed_defender = buff_time[active, defender] > 0.0
+		defender_damage_multiplier = base_damage_multiplier[defender] * np.where(buffed_defender, buff_damage[active, defender], 1.0)
+		punish_dealt = np.where(punished, np.floor(punish_damage[attacker, move] * defender_damage_multiplier + 0.5), 0.0)
+		hp[active, attacker] -= punish_dealt
+		damage_dealt[active, defender] += punish_dealt
+		frames = np.where(blocked, block_frames[attacker, move] + np.where(punished, punish_frames[attacker, move], 0.0), frames)
+
+		low, high = options.neutral_gap_frames
+		step_seconds = (frames + low + rng.random(size) * (high - low)) / ticks
+		elapsed[active] += step_seconds
+		move_cooldowns[active] = np.maximum(0.0, move_cooldowns[active] - step_seconds[:, None, None])
+		buff_time[active] = np.maximum(0.0, buff_time[active] - step_seconds[:, None])
+		expired = buff_time <= 0.0
+		buff_damage[expired] = 1.0
+		buff_startup[expired] = 1.0
+		buff_chip[expired] = 0.0
+		for state in items:
+			state.values["cooldown_remaining"][active] = np.maximum(0.0, state.values["cooldown_remaining"][active] - step_seconds)
+
+		for side in (0, 1):
+			state = items[side]
+			as_attacker = attacker == side
+			progress = np.zeros(size)
+			if state.trigger_type == "hit_count":
+				progress = np.where(as_attacker & landed, hits, 0.0) + np.where(~as_attacker & punished, punish_hits[attacker, move], 0.0)
+			elif state.trigger_type == "block_count":
+				progress = np.where(as_attacker & blocked, 1.0, 0.0)
+			progressed = np.zeros(count, dtype=bool)
+			progressed[active] = progress > 0
+			state.values["trigger_progress"][active] += progress
+			activate_items(side, progressed)
+
+		# Both sides lose their stock before either respawns, so the leader lock sees the same score.
+		knocked = ~done[:, None] & (hp <= 0.0)
+		stocks[knocked] -= 1
+		for side in (0, 1):
+			handle_knockouts(side, knocked[:, side])
+		out = (stocks[:, 0] <= 0) | (stocks[:, 1] <= 0)
+		if time_limit > 0.0:
+			out |= elapsed >= time_limit
+		done |= out
+
+	results = np.full(count, "draw", dtype=object)
+	p1_ahead = (stocks[:, 0] > stocks[:, 1]) | ((stocks[:, 0] == stocks[:, 1]) & (hp[:, 0] > hp[:, 1]))
+	p2_ahead = (stocks[:, 1] > stocks[:, 0]) | ((stocks[:, 0] == stocks[:, 1]) & (hp[:, 1] > hp[:, 0]))
+	results[p1_ahead] = "p1_win"
+	results[p2_ahead] = "p2_win"
+	exit_reasons = np.where(done, "match_end", "step_limit")
+
+	timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+	loadouts = [fighter.loadout for fighter in fighters]
+	records: list[dict[str, Any]] = []
+	for index in matches:
+		records.append(
+			{
+				"schema_version": constants.schema_version,
+				"timestamp_utc": timestamp,
+				"match_mode": SIM_MATCH_MODE,
+				"result": str(results[index]),
+				"exit_reason": str(exit_reasons[index]),
+				"match_elapsed_seconds": round(float(elapsed[index]), 3),
+				"p1_character_id": fighters[0].character_id,
+				"p2_character_id": fighters[1].character_id,
+				"p1_loadout": dict(loadouts[0]),
+				"p2_loadout": dict(loadouts[1]),
+				"p1_loadout_signature": fighters[0].loadout_signature,
+				"p2_loadout_signature": fighters[1].loadout_signature,
+				"loadout_picks": {key: dict(loadout) for key, loadout in zip(PLAYER_KEYS, loadouts)},
+				"round_tuning_picks": events["round_tuning_picks"][index],
+				"item_activation_events": events["item_activation_events"][index],
+				"item_evolution_events": events["item_evolution_events"][index],
+				"training_drill_events": [],
+				"training_drill_funnels": {},
+				"onboarding_lesson_events": [],
+				"onboarding_lesson_funnels": {},
+				"item_evolution_expected_count": sum(1 for fighter in fighters if fighter.item.get("evolution_id")),
+				"item_evolution_success_count": len(events["item_evolution_events"][index]),
+				"item_evolution_success_rate": (
+					len(events["item_evolution_events"][index])
+					/ max(1, sum(1 for fighter in fighters if fighter.item.get("evolution_id")))
+				),
+				"item_evolution_avg_trigger_time_seconds": (
+					float(np.mean([event["elapsed_seconds"] for event in events["item_evolution_events"][index]]))
+					if events["item_evolution_events"][index]
+					else -1.0
+				),
+				"p1_damage_dealt": int(damage_dealt[index, 0]),
+				"p2_damage_dealt": int(damage_dealt[index, 1]),
+				"p1_stocks_remaining": int(max(0, stocks[index, 0])),
+				"p2_stocks_remaining": int(max(0, stocks[index, 1])),
+			}
+		)
+	return records
+
+
+def summarize_pair(records: list[dict[str, Any]]) -> dict[str, Any]:
+	results = np.array([record["result"] for record in records])
+	dealt = np.array([[record["p1_damage_dealt"], record["p2_damage_dealt"]] for record in records], dtype=np.float64)
+	seconds = np.array([record["match_elapsed_seconds"] for record in records], dtype=np.float64)
+	count = max(1, len(records))
+	percentiles = [10, 50, 90]
+	return {
+		"p1_character_id": records[0]["p1_character_id"],
+		"p2_character_id": records[0]["p2_character_id"],
+		"matches": len(records),
+		"p1_win_rate": float((results == "p1_win").sum() / count),
+		"p2_win_rate": float((results == "p2_win").sum() / count),
+		"draw_rate": float((results == "draw").sum() / count),
+		"p1_damage_percentiles": dict(zip((f"p{value}" for value in percentiles), np.percentile(dealt[:, 0], percentiles).round(1).tolist())),
+		"p2_damage_percentiles": dict(zip((f"p{value}" for value in percentiles), np.percentile(dealt[:, 1], percentiles).round(1).tolist())),
+		"avg_match_seconds": float(seconds.mean()) if len(seconds) else 0.0,
+		"round_tuning_picks": sum(len(record["round_tuning_picks"]) for record in records),
+		"item_evolutions": sum(record["item_evolution_success_count"] for record in records),
+	}
+
+
+def _simulate_job(job: tuple) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+	fighters, constants, options, seed, keep_records = job
+	records = simulate_pair(fighters, constants, options, seed)
+	return summarize_pair(records), records if keep_records else []
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Simulate matches between characters from their attack tables, loadout presets and round-tuning "
+			"patches, and report win rates and damage distributions per pair."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--characters", help="Comma-separated character ids (default: selectable roster)")
+	parser.add_argument("--pair", action="append", help="Explicit p1:p2 pair (repeatable; overrides --characters)")
+	parser.add_argument("--mirror", action="store_true", help="Include mirror matches")
+	parser.add_argument("--preset", default="balanced", choices=sorted(PRESETS), help="p1 loadout preset (default: balanced)")
+	parser.add_argument("--p2-preset", choices=sorted(PRESETS), help="p2 loadout preset (default: same as --preset)")
+	parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES, help=f"Matches per pair (default: {DEFAULT_MATCHES})")
+	parser.add_argument("--stocks", type=int, default=DEFAULT_STOCKS, help=f"Stocks per player (default: {DEFAULT_STOCKS})")
+	parser.add_argument(
+		"--time-limit",
+		type=float,
+		default=-1.0,
+		help="Match time limit in seconds; 0 disables (default: ROUND_TIME_SECONDS from Match.gd)",
+	)
+	parser.add_argument("--combo-hits", type=int, default=DEFAULT_COMBO_HITS, help="Longest confirmed combo (default: 4)")
+	parser.add_argument("--block-rate", type=float, default=SimOptions.block_rate, help="Chance the loser of an exchange blocks")
+	parser.add_argument("--confirm-rate", type=float, default=SimOptions.confirm_rate, help="Chance a hit is confirmed into a combo")
+	parser.add_argument("--punish-rate", type=float, default=SimOptions.punish_rate, help="Chance a punishable block is punished")
+	parser.add_argument("--ultimate-rate", type=float, default=SimOptions.ultimate_rate, help="Chance to spend full hype on ultimate")
+	parser.add_argument("--no-round-tuning", action="store_true", help="Disable round-tuning picks after a lost stock")
+	parser.add_argument(
+		"--round-tuning-policy",
+		choices=["first", "random"],
+		default="first",
+		help="Option picked after a lost stock (default: first, like headless Match.gd)",
+	)
+	parser.add_argument("--seed", type=int, default=0, help="Base random seed (default: 0)")
+	parser.add_argument("--jobs", type=int, default=0, help="Worker processes (default: CPU count)")
+	parser.add_argument("--output", help="Write one match_metrics.jsonl record per simulated match to this path")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def _resolve_pairs(args: argparse.Namespace, roster: list[str]) -> list[tuple[str, str]]:
+	if args.pair:
+		pairs = []
+		for value in args.pair:
+			first, _, second = value.partition(":")
+			if not first or not second:
+				raise ValueError(f"Invalid --pair '{value}' (expected p1:p2)")
+			pairs.append((first.strip(), second.strip()))
+		return pairs
+	characters = [value.strip() for value in args.characters.split(",") if value.strip()] if args.characters else roster
+	pairs = list(itertools.combinations(characters, 2))
+	if args.mirror:
+		pairs.extend((character_id, character_id) for character_id in characters)
+	return pairs
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	table = load_frame_data(Path(args.project_root))
+	constants = load_game_constants(table.ticks_per_second)
+	try:
+		pairs = _resolve_pairs(args, selectable_roster())
+	except ValueError as exc:
+		print(str(exc), file=sys.stderr)
+		return 1
+	if not pairs:
+		print("No character pairs to simulate.", file=sys.stderr)
+		return 1
+	options = SimOptions(
+		matches=max(1, args.matches),
+		stocks=max(1, args.stocks),
+		time_limit=constants.round_time_seconds if args.time_limit < 0 else args.time_limit,
+		combo_hits=max(1, args.combo_hits),
+		block_rate=args.block_rate,
+		confirm_rate=args.confirm_rate,
+		punish_rate=args.punish_rate,
+		ultimate_rate=min(max(args.ultimate_rate, 0.0), 0.99),
+		round_tuning=not args.no_round_tuning,
+		round_tuning_policy=args.round_tuning_policy,
+	)
+
+	graphs = {graph.character_id: graph for graph in build_move_graphs(table)}
+	fighter_cache: dict[tuple[str, str], FighterModel] = {}
+
+	def fighter(character_id: str, preset_id: str) -> FighterModel:
+		key = (character_id, preset_id)
+		if key not in fighter_cache:
+			if character_id not in graphs:
+				raise ValueError(f"No attack table for character '{character_id}'")
+			fighter_cache[key] = build_fighter(table, graphs[character_id], preset_id, constants, options.combo_hits)
+		return fighter_cache[key]
+
+	p2_preset = args.p2_preset or args.preset
+	try:
+		seeds = np.random.SeedSequence(args.seed).spawn(len(pairs))
+		jobs_payload = [
+			(
+				(fighter(first, args.preset), fighter(second, p2_preset)),
+				constants,
+				options,
+				int(seed.generate_state(1)[0]),
+				bool(args.output),
+			)
+			for (first, second), seed in zip(pairs, seeds)
+		]
+	except ValueError as exc:
+		print(str(exc), file=sys.stderr)
+		return 1
+
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+	if jobs == 1 or len(jobs_payload) <= 1:
+		outcomes = [_simulate_job(job) for job in jobs_payload]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			outcomes = list(pool.map(_simulate_job, jobs_payload))
+	elapsed = time.perf_counter() - started
+
+	if args.output:
+		output_path = Path(args.output)
+		output_path.parent.mkdir(parents=True, exist_ok=True)
+		with output_path.open("w", encoding="utf-8") as handle:
+			for _, records in outcomes:
+				for record in records:
+					handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+	summaries = [summary for summary, _ in outcomes]
+	total_matches = sum(summary["matches"] for summary in summaries)
+	if args.format == "json":
+		payload = {
+			"pair_count": len(summaries),
+			"match_count": total_matches,
+			"elapsed_seconds": round(elapsed, 4),
+			"output": args.output or "",
+			"pairs": summaries,
+		}
+		print(json.dumps(payload, indent=2, ensure_ascii=False))
+		return 0
+
+	print(f"Simulated {total_matches} match(es) across {len(summaries)} pair(s) in {elapsed:.2f}s")
+	for summary in sorted(summaries, key=lambda item: -abs(item["p1_win_rate"] - item["p2_win_rate"])):
+		print(
+			f"- {summary['p1_character_id']} vs {summary['p2_character_id']}: "
+			f"p1={summary['p1_win_rate'] * 100.0:.1f}% p2={summary['p2_win_rate'] * 100.0:.1f}% "
+			f"draw={summary['draw_rate'] * 100.0:.1f}% "
+			f"dmg_p50={summary['p1_damage_percentiles']['p50']:g}/{summary['p2_damage_percentiles']['p50']:g} "
+			f"avg={summary['avg_match_seconds']:.1f}s"
+		)
+	if args.output:
+		print(f"Wrote records: {args.output}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,8 @@
+"""Repository paths shared by the tools, with no other dependencies."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
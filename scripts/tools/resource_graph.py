@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""res:// reference graph over .gd/.tscn/.tres sources, cached per file content hash.
+
+Edges come from `res://` string literals (`preload`, `load`, `ext_resource path=`, plain constants),
+`%s`-style path templates and directory literals (matched against every project file), and
+`class_name` globals used by identifier in other scripts.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import re
+from typing import Iterable
+
+from character_exports_common import FileHashCache
+
+
+INDEX_VERSION = 1
+SOURCE_SUFFIXES = (".gd", ".tscn", ".tres", ".godot")
+IMPORT_SUFFIX = ".import"
+DEFAULT_INDEX_PATH = ".godot-user/resource_graph.json"
+_HASH_CACHE_NAME = ".resource_graph_hashes.json"
+
+_RES_STRING_RE = re.compile(r"""["']\*?res://([^"'\n]*)["']""")
+_CLASS_NAME_RE = re.compile(r"^\s*class_name\s+([A-Za-z_]\w*)", re.MULTILINE)
+_IDENTIFIER_RE = re.compile(r"\b([A-Z][A-Za-z0-9_]*)\b")
+_FORMAT_RE = re.compile(r"%[-+ 0-9.]*[sdif]|\{\w*\}")
+
+
+@dataclass(frozen=True)
+class FileRefs:
+	"""What one source file references, before resolution against the project tree."""
+
+	paths: tuple[str, ...] = ()
+	templates: tuple[str, ...] = ()
+	class_name: str = ""
+	identifiers: tuple[str, ...] = ()
+
+	def to_dict(self) -> dict:
+		return {
+			"paths": list(self.paths),
+			"templates": list(self.templates),
+			"class_name": self.class_name,
+			"identifiers": list(self.identifiers),
+		}
+
+	@classmethod
+	def from_dict(cls, payload: dict) -> FileRefs:
+		return cls(
+			paths=tuple(payload.get("paths", ())),
+			templates=tuple(payload.get("templates", ())),
+			class_name=str(payload.get("class_name", "")),
+			identifiers=tuple(payload.get("identifiers", ())),
+		)
+
+
+def scan_text(text: str, *, script: bool = True) -> FileRefs:
+	"""Extract references from GDScript (or, with `script=False`, .tscn/.tres/project.godot) text."""
+	paths: list[str] = []
+	templates: list[str] = []
+	for match in _RES_STRING_RE.finditer(text):
+		value = match.group(1)
+		if not value:
+			continue
+		if _FORMAT_RE.search(value):
+			templates.append(value)
+		else:
+			paths.append(value)
+	class_match = _CLASS_NAME_RE.search(text) if script else None
+	identifiers = sorted(set(_IDENTIFIER_RE.findall(text))) if script else []
+	return FileRefs(
+		paths=tuple(dict.fromkeys(paths)),
+		templates=tuple(dict.fromkeys(templates)),
+		class_name=class_match.group(1) if class_match else "",
+		identifiers=tuple(identifiers),
+	)
+
+
+def scan_file(path: Path) -> FileRefs:
+	return scan_text(path.read_text(encoding="utf-8", errors="replace"), script=path.suffix == ".gd")
+
+
+def list_project_files(project_root: Path) -> list[str]:
+	"""Project-relative posix paths of every file Godot would see (hidden dirs and `.gdignore` dirs skipped)."""
+	files: list[str] = []
+	for directory, dir_names, file_names in os.walk(project_root):
+		dir_names[:] = sorted(
+			name
+			for name in dir_names
+			if not name.startswith(".") and name != "__pycache__" and not (Path(directory) / name / ".gdignore").exists()
+		)
+		base = Path(directory).relative_to(project_root)
+		for name in sorted(file_names):
+			if not name.startswith("."):
+				files.append((base / name).as_posix())
+	return files
+
+
+def template_regex(template: str) -> re.Pattern[str]:
+	parts = _FORMAT_RE.split(template)
+	return re.compile("[^/]*".join(re.escape(part) for part in parts) + "$")
+
+
+@dataclass
+class ResourceGraph:
+	files: set[str]
+	refs: dict[str, FileRefs]
+	deps: dict[str, set[str]] = field(default_factory=dict)
+	rdeps: dict[str, set[str]] = field(default_factory=dict)
+	broken: dict[str, list[str]] = field(default_factory=dict)
+	class_index: dict[str, str] = field(default_factory=dict)
+	_sorted_files: list[str] = field(default_factory=list, repr=False)
+
+	@classmethod
+	def build(cls, files: Iterable[str], refs: dict[str, FileRefs]) -> ResourceGraph:
+		graph = cls(files=set(files), refs=refs)
+		graph._sorted_files = sorted(graph.files)
+		graph.class_index = {file_refs.class_name: rel for rel, file_refs in refs.items() if file_refs.class_name}
+		for rel, file_refs in refs.items():
+			targets, missing = graph.resolve(file_refs)
+			targets.discard(rel)
+			if missing:
+				graph.broken[rel] = missing
+			# Missing targets stay in the graph so deleting a file still selects whatever referenced it.
+			targets.update(missing)
+			graph.deps[rel] = targets
+			for target in targets:
+				graph.rdeps.setdefault(target, set()).add(rel)
+		return graph
+
+	def resolve(self, file_refs: FileRefs) -> tuple[set[str], list[str]]:
+		"""Project files `file_refs` points at, plus the literal paths that match nothing."""
+		targets: set[str] = set()
+		missing: list[str] = []
+		for value in file_refs.paths:
+			target = value.rstrip("/")
+			if target in self.files:
+				targets.add(target)
+				continue
+			prefix = target + "/"
+			under = [candidate for candidate in self._sorted_files if candidate.startswith(prefix)]
+			if under:
+				targets.update(under)
+			else:
+				missing.append(target)
+		for template in file_refs.templates:
+			pattern = template_regex(template)
+			targets.update(candidate for candidate in self._sorted_files if pattern.match(candidate))
+		for identifier in file_refs.identifiers:
+			owner = self.class_index.get(identifier)
+			if owner is not None:
+				targets.add(owner)
+		return targets, missing
+
+	def closure(self, roots: Iterable[str]) -> set[str]:
+		"""Every file reachable from `roots` (inclusive)."""
+		return _walk(roots, self.deps)
+
+	def dependents(self, changed: Iterable[str]) -> set[str]:
+		"""Every file that transitively references one of `changed` (inclusive)."""
+		return _walk(changed, self.rdeps)
+
+
+def _walk(roots: Iterable[str], edges: dict[str, set[str]]) -> set[str]:
+	seen = set(roots)
+	queue = deque(seen)
+	while queue:
+		for neighbor in edges.get(queue.popleft(), ()):
+			if neighbor not in seen:
+				seen.add(neighbor)
+				queue.append(neighbor)
+	return seen
+
+
+@dataclass
+class IndexStats:
+	files: int = 0
+	sources: int = 0
+	scanned: int = 0
+	reused: int = 0
+	hashed: int = 0
+
+
+def load_graph(project_root: Path, index_path: Path | None = None, jobs: int = 1) -> tuple[ResourceGraph, IndexStats]:
+	"""Build the graph, rescanning only sources whose content hash differs from the cached index.
+
+	Rescans are tokenized in one pass over a process pool when `jobs` > 1.
+	"""
+	index_path = index_path or project_root / DEFAULT_INDEX_PATH
+	try:
+		cached = json.loads(index_path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		cached = {}
+	entries: dict = cached.get("sources", {}) if cached.get("version") == INDEX_VERSION else {}
+
+	hashes = FileHashCache(index_path.parent / _HASH_CACHE_NAME)
+	files = list_project_files(project_root)
+	sources = [rel for rel in files if rel.endswith(SOURCE_SUFFIXES)]
+	stats = IndexStats(files=len(files), sources=len(sources))
+	refs: dict[str, FileRefs] = {}
+	digests: dict[str, str] = {}
+	pending: list[str] = []
+	for rel in sources:
+		digests[rel] = hashes.hash_file(project_root / rel)
+		entry = entries.get(rel)
+		if isinstance(entry, dict) and entry.get("digest") == digests[rel]:
+			refs[rel] = FileRefs.from_dict(entry.get("refs", {}))
+		else:
+			pending.append(rel)
+	paths = [project_root / rel for rel in pending]
+	if jobs == 1 or len(pending) <= 1:
+		scanned = [scan_file(path) for path in paths]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			scanned = list(pool.map(scan_file, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+	refs.update(zip(pending, scanned))
+	refs = {rel: refs[rel] for rel in sources}
+	fresh = {rel: {"digest": digests[rel], "refs": refs[rel].to_dict()} for rel in sources}
+	stats.scanned = len(pending)
+	stats.reused = len(sources) - len(pending)
+	stats.hashed = hashes.hashed_count
+
+	if stats.scanned or set(fresh) != set(entries):
+		index_path.parent.mkdir(parents=True, exist_ok=True)
+		index_path.write_text(json.dumps({"version": INDEX_VERSION, "sources": fresh}, sort_keys=True) + "\n", encoding="utf-8")
+	hashes.save()
+	return ResourceGraph.build(files, refs), stats
+
+
+def normalize_changed_path(rel: str) -> str:
+	"""Map import sidecars onto the asset they describe (`x.png.import` -> `x.png`)."""
+	if rel.endswith(IMPORT_SUFFIX):
+		return rel[: -len(IMPORT_SUFFIX)]
+	return rel
@@ -4,13 +4,30 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import math
 import os
 import re
 import sys
+import urllib.error
+import urllib.parse
+import urllib.request
 from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from instrumentation import Instrumentation, add_instrumentation_arguments, instrumented
+
+
+# Mirrors the FRAME_TIME_* constants in scripts/Match.gd.
+FRAME_TIME_HISTOGRAM_VERSION = 1
+FRAME_TIME_BUCKET_BASE_MS = 1.0
+FRAME_TIME_BUCKETS_PER_OCTAVE = 8
+FRAME_TIME_BUCKET_COUNT = 74
+FRAME_TIME_GROUP_LIMIT = 10
+WORST_HITCH_LIMIT = 5
+DEFAULT_REASON_CAPACITY = 64
 
 
 def _repo_root() -> Path:
@@ -62,7 +79,12 @@ def _resolve_input_path(repo_root: Path, input_path: str) -> Path:
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Summarize training drill and onboarding lesson funnels from match_metrics.jsonl."
+        description=(
+            "Summarize training drill and onboarding lesson funnels, matchup results and frame-time "
+            "histograms from match_metrics.jsonl (or a telemetry_ingest.py server), or bootstrap-compare funnels between two record sets "
+            "(--baseline/--candidate), exiting 1 on significant regressions, or report install cohorts "
+            "(--cohorts)."
+        )
     )
     parser.add_argument(
         "--input",
@@ -75,21 +97,110 @@ def _build_parser() -> argparse.ArgumentParser:
         default=20,
         help="Analyze only the most recent N records. Use 0 to analyze all records. Default: 20.",
     )
+    parser.add_argument(
+        "--match-mode",
+        default="",
+        help="Only analyze records with this match_mode (e.g. sim for matchup_sim.py output); applied before --limit.",
+    )
+    parser.add_argument(
+        "--server",
+        default="",
+        help=(
+            "Read aggregates from a telemetry_ingest.py server (e.g. http://127.0.0.1:8765) instead of a log file; "
+            "--match-mode is applied server-side and --limit is ignored."
+        ),
+    )
     parser.add_argument(
         "--format",
         choices=["text", "json"],
         default="text",
         help="Output format. Default: text.",
     )
+    parser.add_argument(
+        "--reason-capacity",
+        type=int,
+        default=DEFAULT_REASON_CAPACITY,
+        help=(
+            "Distinct reasons tracked per funnel counter (space-saving top-K; counts are shown with error bounds "
+            f"once a counter overflows). Use 0 to count exactly. Default: {DEFAULT_REASON_CAPACITY}."
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        default="",
+        help=(
+            "Compare mode: baseline record set as comma-separated file=PATH, build=ID and date=START..END terms "
+            "(file defaults to --input; --limit is ignored)."
+        ),
+    )
+    parser.add_argument("--candidate", default="", help="Compare mode: candidate record set, same syntax as --baseline.")
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=5000,
+        help="Compare mode: bootstrap resamples per record set. Default: 5000.",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Compare mode: confidence level for intervals and the regression gate. Default: 0.95.",
+    )
+    parser.add_argument(
+        "--min-sessions",
+        type=int,
+        default=5,
+        help="Compare mode: sessions each side needs before a funnel is tested. Default: 5.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Compare mode: bootstrap random seed. Default: 0.")
+    parser.add_argument(
+        "--cohorts",
+        action="store_true",
+        help=(
+            "Cohort mode: stream the whole log (--limit is ignored), split it into per-install play sessions and "
+            "report day-N return, onboarding completion by session and drill success by session per cohort."
+        ),
+    )
+    parser.add_argument(
+        "--session-gap-minutes",
+        type=float,
+        default=30.0,
+        help="Cohort mode: a gap longer than this between records starts a new play session. Default: 30.",
+    )
+    parser.add_argument(
+        "--cohort-period",
+        choices=["day", "week"],
+        default="day",
+        help="Cohort mode: group installs by the UTC day or ISO week of their first record. Default: day.",
+    )
+    parser.add_argument(
+        "--retention-days",
+        default="1,3,7,14,30",
+        help="Cohort mode: comma-separated day offsets to report return rates for. Default: 1,3,7,14,30.",
+    )
+    parser.add_argument(
+        "--max-session-index",
+        type=int,
+        default=10,
+        help="Cohort mode: sessions tracked individually per install; later sessions share one bucket. Default: 10.",
+    )
+    add_instrumentation_arguments(parser)
     return parser
 
 
-def _read_records(path: Path, limit: int) -> list[dict[str, Any]]:
+def _read_records(
+    path: Path, limit: int, probe: Instrumentation | None = None, match_mode: str = ""
+) -> list[dict[str, Any]]:
+    """Records in log order; `match_mode` filters before `limit` keeps the last N matching records."""
     if not path.exists():
         raise FileNotFoundError(f"Metrics log not found: {path}")
+    probe = probe or Instrumentation()
+    with probe.phase("read"):
+        data = path.read_bytes()
+    probe.count("bytes_read", len(data))
     records: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line_number, line in enumerate(handle, start=1):
+    with probe.phase("decode"):
+        for line_number, line in enumerate(data.decode("utf-8").split("\n"), start=1):
             stripped = line.strip()
             if not stripped:
                 continue
@@ -97,14 +208,35 @@ def _read_records(path: Path, limit: int) -> list[dict[str, Any]]:
                 payload = json.loads(stripped)
             except json.JSONDecodeError as exc:
                 raise ValueError(f"Invalid JSON on line {line_number}: {exc}") from exc
-            if isinstance(payload, dict):
+            if isinstance(payload, dict) and (not match_mode or str(payload.get("match_mode", "")) == match_mode):
                 records.append(payload)
+    probe.count("records", len(records))
     if limit > 0:
         return records[-limit:]
     return records
 
 
-def _make_training_aggregate(drill_id: str) -> dict[str, Any]:
+def _iter_records(path: Path, probe: Instrumentation | None = None) -> Iterator[dict[str, Any]]:
+    """Yield records one line at a time, so cohort mode never holds the whole log in memory."""
+    if not path.exists():
+        raise FileNotFoundError(f"Metrics log not found: {path}")
+    probe = probe or Instrumentation()
+    with path.open("rb") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            probe.count("bytes_read", len(line))
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                payload = json.loads(stripped)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON on line {line_number}: {exc}") from exc
+            if isinstance(payload, dict):
+                probe.count("records")
+                yield payload
+
+
+def _make_training_aggregate(drill_id: str, reason_capacity: int) -> dict[str, Any]:
     return {
         "drill_id": drill_id,
         "session_count": 0,
@@ -122,7 +254,7 @@ def _make_training_aggregate(drill_id: str) -> dict[str, Any]:
         "closest_blast_margin_sample_count": 0,
         "last_result": "",
         "last_reason": "",
-        "reason_counts": {},
+        "reason_counts": SpaceSavingCounter(reason_capacity),
         "_result_seconds_sum": 0.0,
         "_success_seconds_sum": 0.0,
         "_fail_seconds_sum": 0.0,
@@ -130,7 +262,7 @@ def _make_training_aggregate(drill_id: str) -> dict[str, Any]:
     }
 
 
-def _make_onboarding_aggregate(lesson_id: str) -> dict[str, Any]:
+def _make_onboarding_aggregate(lesson_id: str, reason_capacity: int) -> dict[str, Any]:
     return {
         "lesson_id": lesson_id,
         "session_count": 0,
@@ -147,8 +279,8 @@ def _make_onboarding_aggregate(lesson_id: str) -> dict[str, Any]:
         "avg_attempt_index_on_success": 0.0,
         "last_result": "",
         "last_reason": "",
-        "fail_reason_counts": {},
-        "success_reason_counts": {},
+        "fail_reason_counts": SpaceSavingCounter(reason_capacity),
+        "success_reason_counts": SpaceSavingCounter(reason_capacity),
         "_attempt_seconds_sum": 0.0,
         "_success_seconds_sum": 0.0,
         "_fail_seconds_sum": 0.0,
@@ -156,11 +288,86 @@ def _make_onboarding_aggregate(lesson_id: str) -> dict[str, Any]:
     }
 
 
-def _merge_counter(target: dict[str, int], source: dict[str, Any]) -> dict[str, int]:
-    counter = Counter(target)
-    for key, value in source.items():
-        counter[str(key)] += int(value)
-    return dict(counter)
+class SpaceSavingCounter:
+    """Weighted space-saving top-K over free-form reason strings, holding at most `capacity` keys.
+
+    Each tracked count overestimates the true count by at most its recorded error, and an untracked key
+    occurred at most `untracked_bound` times; both are bounded by total / capacity. Summaries of separate
+    chunks or files merge without losing those guarantees. Capacity 0 counts exactly.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_REASON_CAPACITY) -> None:
+        self.capacity = max(0, int(capacity))
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.total = 0
+
+    @property
+    def full(self) -> bool:
+        return self.capacity > 0 and len(self.counts) >= self.capacity
+
+    @property
+    def untracked_bound(self) -> int:
+        return min(self.counts.values()) if self.full else 0
+
+    def add(self, key: str, weight: int = 1) -> None:
+        if weight <= 0:
+            return
+        self.total += weight
+        if key in self.counts:
+            self.counts[key] += weight
+            return
+        if not self.full:
+            self.counts[key] = weight
+            self.errors[key] = 0
+            return
+        # The evicted key's count becomes the newcomer's error: it may have occurred that often unseen.
+        victim = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[key] = floor + weight
+        self.errors[key] = floor
+
+    def update(self, mapping: Any) -> None:
+        if not isinstance(mapping, dict):
+            return
+        for key, value in mapping.items():
+            self.add(str(key), int(value))
+
+    def merge(self, other: "SpaceSavingCounter") -> None:
+        # A key one side does not track occurred there at most that side's untracked bound.
+        own_floor = self.untracked_bound
+        other_floor = other.untracked_bound
+        counts: dict[str, int] = {}
+        errors: dict[str, int] = {}
+        for key in set(self.counts) | set(other.counts):
+            counts[key] = self.counts.get(key, own_floor) + other.counts.get(key, other_floor)
+            errors[key] = self.errors.get(key, own_floor) + other.errors.get(key, other_floor)
+        if self.capacity and len(counts) > self.capacity:
+            kept = heapq.nlargest(self.capacity, counts, key=lambda key: (counts[key], key))
+            counts = {key: counts[key] for key in kept}
+            errors = {key: errors[key] for key in kept}
+        self.counts = counts
+        self.errors = errors
+        self.total += other.total
+
+    def most_common(self, limit: int | None = None) -> list[tuple[str, int]]:
+        ordered = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return ordered if limit is None else ordered[:limit]
+
+    def bounds(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "untracked_max": self.untracked_bound,
+            "errors": {key: error for key, error in sorted(self.errors.items()) if error > 0},
+        }
+
+
+def _finalize_reason_counter(aggregate: dict[str, Any], field: str) -> None:
+    counter = aggregate[field]
+    aggregate[field] = dict(counter.most_common())
+    aggregate[f"{field}_bounds"] = counter.bounds()
 
 
 def _resolve_blast_margin_sample_count(funnel: dict[str, Any]) -> int:
@@ -171,8 +378,11 @@ def _resolve_blast_margin_sample_count(funnel: dict[str, Any]) -> int:
     return 1 if legacy_avg_margin >= 0.0 else 0
 
 
-def _aggregate_training_funnels(records: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    aggregates: dict[str, dict[str, Any]] = {}
+def _accumulate_training_funnels(
+    aggregates: dict[str, dict[str, Any]],
+    records: Iterable[dict[str, Any]],
+    reason_capacity: int = DEFAULT_REASON_CAPACITY,
+) -> None:
     for record in records:
         funnels = record.get("training_drill_funnels", {})
         if not isinstance(funnels, dict):
@@ -183,7 +393,9 @@ def _aggregate_training_funnels(records: list[dict[str, Any]]) -> dict[str, dict
             key = str(drill_id).strip().lower()
             if not key:
                 continue
-            aggregate = aggregates.setdefault(key, _make_training_aggregate(key))
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = _make_training_aggregate(key, reason_capacity)
             aggregate["session_count"] += 1
             aggregate["rep_start_count"] += int(funnel.get("rep_start_count", 0))
             aggregate["rep_result_count"] += int(funnel.get("rep_result_count", 0))
@@ -203,12 +415,16 @@ def _aggregate_training_funnels(records: list[dict[str, Any]]) -> dict[str, dict
             if margin_samples > 0:
                 aggregate["closest_blast_margin_sample_count"] += margin_samples
                 aggregate["_closest_margin_sum"] += float(funnel.get("avg_closest_blast_margin_px", -1.0)) * margin_samples
-            aggregate["reason_counts"] = _merge_counter(
-                aggregate["reason_counts"], funnel.get("reason_counts", {})
-            )
+            aggregate["reason_counts"].update(funnel.get("reason_counts", {}))
             aggregate["last_result"] = str(funnel.get("last_result", "")).strip().lower()
             aggregate["last_reason"] = str(funnel.get("last_reason", "")).strip().lower()
-    for aggregate in aggregates.values():
+
+
+def _finalize_training_funnels(aggregates: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Report-ready copies; the accumulated aggregates stay usable for more records."""
+    finalized: dict[str, dict[str, Any]] = {}
+    for key, accumulated in aggregates.items():
+        aggregate = finalized[key] = dict(accumulated)
         rep_start_count = int(aggregate["rep_start_count"])
         rep_result_count = int(aggregate["rep_result_count"])
         success_count = int(aggregate["success_count"])
@@ -226,11 +442,23 @@ def _aggregate_training_funnels(records: list[dict[str, Any]]) -> dict[str, dict
         del aggregate["_success_seconds_sum"]
         del aggregate["_fail_seconds_sum"]
         del aggregate["_closest_margin_sum"]
-    return aggregates
+        _finalize_reason_counter(aggregate, "reason_counts")
+    return finalized
 
 
-def _aggregate_onboarding_funnels(records: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def _aggregate_training_funnels(
+    records: Iterable[dict[str, Any]], reason_capacity: int = DEFAULT_REASON_CAPACITY
+) -> dict[str, dict[str, Any]]:
     aggregates: dict[str, dict[str, Any]] = {}
+    _accumulate_training_funnels(aggregates, records, reason_capacity)
+    return _finalize_training_funnels(aggregates)
+
+
+def _accumulate_onboarding_funnels(
+    aggregates: dict[str, dict[str, Any]],
+    records: Iterable[dict[str, Any]],
+    reason_capacity: int = DEFAULT_REASON_CAPACITY,
+) -> None:
     for record in records:
         funnels = record.get("onboarding_lesson_funnels", {})
         if not isinstance(funnels, dict):
@@ -241,7 +469,9 @@ def _aggregate_onboarding_funnels(records: list[dict[str, Any]]) -> dict[str, di
             key = str(lesson_id).strip().lower()
             if not key:
                 continue
-            aggregate = aggregates.setdefault(key, _make_onboarding_aggregate(key))
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = _make_onboarding_aggregate(key, reason_capacity)
             aggregate["session_count"] += 1
             aggregate["start_count"] += int(funnel.get("start_count", 0))
             aggregate["retry_start_count"] += int(funnel.get("retry_start_count", 0))
@@ -260,15 +490,16 @@ def _aggregate_onboarding_funnels(records: list[dict[str, Any]]) -> dict[str, di
             aggregate["_success_attempt_index_sum"] += float(
                 funnel.get("avg_attempt_index_on_success", 0.0)
             ) * int(funnel.get("success_count", 0))
-            aggregate["fail_reason_counts"] = _merge_counter(
-                aggregate["fail_reason_counts"], funnel.get("fail_reason_counts", {})
-            )
-            aggregate["success_reason_counts"] = _merge_counter(
-                aggregate["success_reason_counts"], funnel.get("success_reason_counts", {})
-            )
+            aggregate["fail_reason_counts"].update(funnel.get("fail_reason_counts", {}))
+            aggregate["success_reason_counts"].update(funnel.get("success_reason_counts", {}))
             aggregate["last_result"] = str(funnel.get("last_result", "")).strip().lower()
             aggregate["last_reason"] = str(funnel.get("last_reason", "")).strip().lower()
-    for aggregate in aggregates.values():
+
+
+def _finalize_onboarding_funnels(aggregates: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    finalized: dict[str, dict[str, Any]] = {}
+    for key, accumulated in aggregates.items():
+        aggregate = finalized[key] = dict(accumulated)
         start_count = int(aggregate["start_count"])
         result_count = int(aggregate["result_count"])
         success_count = int(aggregate["success_count"])
@@ -285,14 +516,323 @@ def _aggregate_onboarding_funnels(records: list[dict[str, Any]]) -> dict[str, di
         del aggregate["_success_seconds_sum"]
         del aggregate["_fail_seconds_sum"]
         del aggregate["_success_attempt_index_sum"]
-    return aggregates
+        _finalize_reason_counter(aggregate, "fail_reason_counts")
+        _finalize_reason_counter(aggregate, "success_reason_counts")
+    return finalized
+
+
+def _aggregate_onboarding_funnels(
+    records: Iterable[dict[str, Any]], reason_capacity: int = DEFAULT_REASON_CAPACITY
+) -> dict[str, dict[str, Any]]:
+    aggregates: dict[str, dict[str, Any]] = {}
+    _accumulate_onboarding_funnels(aggregates, records, reason_capacity)
+    return _finalize_onboarding_funnels(aggregates)
+
 
+def _make_matchup_aggregate(p1_character_id: str, p2_character_id: str) -> dict[str, Any]:
+    return {
+        "p1_character_id": p1_character_id,
+        "p2_character_id": p2_character_id,
+        "match_count": 0,
+        "p1_win_count": 0,
+        "p2_win_count": 0,
+        "draw_count": 0,
+        "p1_win_rate": 0.0,
+        "avg_match_seconds": 0.0,
+        "_seconds_sum": 0.0,
+    }
+
+
+def _accumulate_matchups(aggregates: dict[str, dict[str, Any]], records: Iterable[dict[str, Any]]) -> None:
+    for record in records:
+        p1_character_id = str(record.get("p1_character_id", "")).strip()
+        p2_character_id = str(record.get("p2_character_id", "")).strip()
+        result = str(record.get("result", "")).strip()
+        if not p1_character_id or not p2_character_id or result not in ("p1_win", "p2_win", "draw"):
+            continue
+        key = f"{p1_character_id}_vs_{p2_character_id}"
+        aggregate = aggregates.get(key)
+        if aggregate is None:
+            aggregate = aggregates[key] = _make_matchup_aggregate(p1_character_id, p2_character_id)
+        aggregate["match_count"] += 1
+        if result == "draw":
+            aggregate["draw_count"] += 1
+        else:
+            aggregate[f"{result.split('_')[0]}_win_count"] += 1
+        aggregate["_seconds_sum"] += float(record.get("match_elapsed_seconds", 0.0))
+
+
+def _finalize_matchups(aggregates: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    finalized: dict[str, dict[str, Any]] = {}
+    for key, accumulated in aggregates.items():
+        aggregate = finalized[key] = dict(accumulated)
+        match_count = int(aggregate["match_count"])
+        aggregate["p1_win_rate"] = float(aggregate["p1_win_count"]) / float(match_count)
+        aggregate["avg_match_seconds"] = float(aggregate["_seconds_sum"]) / float(match_count)
+        del aggregate["_seconds_sum"]
+    return finalized
+
+
+def _aggregate_matchups(records: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    aggregates: dict[str, dict[str, Any]] = {}
+    _accumulate_matchups(aggregates, records)
+    return _finalize_matchups(aggregates)
+
+
+class FrameTimeHistogram:
+    """Fixed log-spaced frame-time buckets; merging is element-wise addition, so aggregation is O(buckets)."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * FRAME_TIME_BUCKET_COUNT
+        self.session_count = 0
+        self.frame_count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.over_16_7ms = 0
+        self.over_33ms = 0
+        # Non-zero (bucket, count) pairs of a single record's histogram; most buckets are empty, so merging
+        # these is several times cheaper than walking every bucket.
+        self._sparse: list[tuple[int, int]] | None = None
+
+    @classmethod
+    def from_record(cls, payload: Any) -> "FrameTimeHistogram | None":
+        if not isinstance(payload, dict):
+            return None
+        counts = payload.get("counts")
+        if (
+            int(payload.get("version", 0)) != FRAME_TIME_HISTOGRAM_VERSION
+            or float(payload.get("bucket_base_ms", 0.0)) != FRAME_TIME_BUCKET_BASE_MS
+            or int(payload.get("buckets_per_octave", 0)) != FRAME_TIME_BUCKETS_PER_OCTAVE
+            or not isinstance(counts, list)
+            or len(counts) != FRAME_TIME_BUCKET_COUNT
+        ):
+            return None
+        histogram = cls()
+        histogram.counts = [int(count) for count in counts]
+        histogram._sparse = [(index, count) for index, count in enumerate(histogram.counts) if count]
+        histogram.session_count = 1
+        histogram.frame_count = int(payload.get("frame_count", sum(histogram.counts)))
+        histogram.total_ms = float(payload.get("total_ms", 0.0))
+        histogram.max_ms = float(payload.get("max_ms", 0.0))
+        histogram.over_16_7ms = int(payload.get("over_16_7ms", 0))
+        histogram.over_33ms = int(payload.get("over_33ms", 0))
+        return histogram
+
+    def merge(self, other: "FrameTimeHistogram") -> None:
+        counts = self.counts
+        for index, count in other._sparse if other._sparse is not None else enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self._sparse = None
+        self.session_count += other.session_count
+        self.frame_count += other.frame_count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.over_16_7ms += other.over_16_7ms
+        self.over_33ms += other.over_33ms
+
+    @staticmethod
+    def bucket_bounds(index: int) -> tuple[float, float]:
+        if index <= 0:
+            return 0.0, FRAME_TIME_BUCKET_BASE_MS
+        low = FRAME_TIME_BUCKET_BASE_MS * 2.0 ** ((index - 1) / FRAME_TIME_BUCKETS_PER_OCTAVE)
+        high = FRAME_TIME_BUCKET_BASE_MS * 2.0 ** (index / FRAME_TIME_BUCKETS_PER_OCTAVE)
+        return low, high if index < FRAME_TIME_BUCKET_COUNT - 1 else math.inf
+
+    def quantile(self, q: float) -> float:
+        """Frame time at quantile `q`, interpolated geometrically inside the bucket that holds it."""
+        total = sum(self.counts)
+        if total <= 0:
+            return 0.0
+        target = q * total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count <= 0 or cumulative + count < target:
+                cumulative += count
+                continue
+            low, high = self.bucket_bounds(index)
+            high = min(high, max(self.max_ms, low))
+            fraction = (target - cumulative) / float(count)
+            if low <= 0.0:
+                value = high * fraction
+            else:
+                value = low * (high / low) ** fraction
+            return min(value, self.max_ms) if self.max_ms > 0.0 else value
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any]:
+        frame_count = max(1, self.frame_count)
+        return {
+            "session_count": self.session_count,
+            "frame_count": self.frame_count,
+            "avg_ms": self.total_ms / float(frame_count),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": self.max_ms,
+            "over_16_7ms": self.over_16_7ms,
+            "over_33ms": self.over_33ms,
+            "over_16_7ms_rate": self.over_16_7ms / float(frame_count),
+            "counts": list(self.counts),
+        }
+
+
+def _make_frame_time_state() -> dict[str, Any]:
+    return {
+        "overall": FrameTimeHistogram(),
+        "groups": {"match_mode": {}, "stage_id": {}, "character_pair": {}},
+        "hitches": [],
+    }
+
+
+def _prune_hitches(state: dict[str, Any]) -> None:
+    # Keep a few spare candidates per prune so the list stays bounded without re-sorting on every record.
+    if len(state["hitches"]) > WORST_HITCH_LIMIT * 8:
+        state["hitches"] = heapq.nlargest(WORST_HITCH_LIMIT, state["hitches"], key=lambda hitch: hitch["frame_ms"])
+
+
+def _accumulate_frame_times(state: dict[str, Any], records: Iterable[dict[str, Any]]) -> None:
+    overall: FrameTimeHistogram = state["overall"]
+    groups: dict[str, dict[str, FrameTimeHistogram]] = state["groups"]
+    hitches: list[dict[str, Any]] = state["hitches"]
+    for record in records:
+        payload = record.get("frame_times")
+        histogram = FrameTimeHistogram.from_record(payload)
+        if histogram is None:
+            continue
+        overall.merge(histogram)
+        pair = sorted(
+            [str(record.get("p1_character_id", "")).strip() or "?", str(record.get("p2_character_id", "")).strip() or "?"]
+        )
+        keys = {
+            "match_mode": str(record.get("match_mode", "")).strip() or "unknown",
+            "stage_id": str(record.get("stage_id", "")).strip() or "unknown",
+            "character_pair": f"{pair[0]}_vs_{pair[1]}",
+        }
+        for dimension, key in keys.items():
+            groups[dimension].setdefault(key, FrameTimeHistogram()).merge(histogram)
+        for hitch in payload.get("worst_hitches", []):
+            if isinstance(hitch, dict):
+                hitches.append(
+                    {
+                        "frame_ms": float(hitch.get("frame_ms", 0.0)),
+                        "elapsed_seconds": float(hitch.get("elapsed_seconds", 0.0)),
+                        "unix_time": float(hitch.get("unix_time", 0.0)),
+                        "session_timestamp_utc": str(record.get("timestamp_utc", "")),
+                        **keys,
+                    }
+                )
+        _prune_hitches(state)
+        hitches = state["hitches"]
 
-def _top_reasons(mapping: dict[str, Any], limit: int = 3) -> str:
+
+def _finalize_frame_times(state: dict[str, Any]) -> dict[str, Any]:
+    overall: FrameTimeHistogram = state["overall"]
+    groups: dict[str, dict[str, FrameTimeHistogram]] = state["groups"]
+    if overall.session_count == 0:
+        return {}
+    return {
+        "overall": overall.summary(),
+        "by_match_mode": {key: histogram.summary() for key, histogram in sorted(groups["match_mode"].items())},
+        "by_stage": {key: histogram.summary() for key, histogram in sorted(groups["stage_id"].items())},
+        "by_character_pair": {key: histogram.summary() for key, histogram in sorted(groups["character_pair"].items())},
+        "worst_hitches": heapq.nlargest(WORST_HITCH_LIMIT, state["hitches"], key=lambda hitch: hitch["frame_ms"]),
+    }
+
+
+def _aggregate_frame_times(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    state = _make_frame_time_state()
+    _accumulate_frame_times(state, records)
+    return _finalize_frame_times(state)
+
+
+def _merge_accumulated(target: dict[str, Any], other: dict[str, Any]) -> None:
+    """Add one unfinalized funnel/matchup aggregate into another; rates and averages are derived at finalize."""
+    for field, value in other.items():
+        if isinstance(value, SpaceSavingCounter):
+            target[field].merge(value)
+        elif field in ("last_result", "last_reason"):
+            if value:
+                target[field] = value
+        elif isinstance(value, (int, float)) and not field.endswith("_rate") and not field.startswith("avg_"):
+            target[field] += value
+
+
+class RecordAggregates:
+    """Unfinalized funnel, matchup and frame-time state for a growing set of records.
+
+    Every part is mergeable (counts and sums, space-saving counters, fixed-bucket histograms), so a
+    collector can keep one instance per partition, `merge` the ones a query covers and `finalize` the
+    result into the same dicts the file-based report renders.
+    """
+
+    def __init__(self, reason_capacity: int = DEFAULT_REASON_CAPACITY) -> None:
+        self.reason_capacity = reason_capacity
+        self.session_count = 0
+        self.training_funnels: dict[str, dict[str, Any]] = {}
+        self.onboarding_funnels: dict[str, dict[str, Any]] = {}
+        self.matchups: dict[str, dict[str, Any]] = {}
+        self.frame_times = _make_frame_time_state()
+
+    def add(self, records: list[dict[str, Any]]) -> None:
+        self.session_count += len(records)
+        _accumulate_training_funnels(self.training_funnels, records, self.reason_capacity)
+        _accumulate_onboarding_funnels(self.onboarding_funnels, records, self.reason_capacity)
+        _accumulate_matchups(self.matchups, records)
+        _accumulate_frame_times(self.frame_times, records)
+
+    def merge(self, other: "RecordAggregates") -> None:
+        self.session_count += other.session_count
+        for key, aggregate in other.training_funnels.items():
+            if key not in self.training_funnels:
+                self.training_funnels[key] = _make_training_aggregate(key, self.reason_capacity)
+            _merge_accumulated(self.training_funnels[key], aggregate)
+        for key, aggregate in other.onboarding_funnels.items():
+            if key not in self.onboarding_funnels:
+                self.onboarding_funnels[key] = _make_onboarding_aggregate(key, self.reason_capacity)
+            _merge_accumulated(self.onboarding_funnels[key], aggregate)
+        for key, aggregate in other.matchups.items():
+            if key not in self.matchups:
+                self.matchups[key] = _make_matchup_aggregate(aggregate["p1_character_id"], aggregate["p2_character_id"])
+            _merge_accumulated(self.matchups[key], aggregate)
+        self.frame_times["overall"].merge(other.frame_times["overall"])
+        for dimension, histograms in other.frame_times["groups"].items():
+            for key, histogram in histograms.items():
+                self.frame_times["groups"][dimension].setdefault(key, FrameTimeHistogram()).merge(histogram)
+        self.frame_times["hitches"].extend(other.frame_times["hitches"])
+        _prune_hitches(self.frame_times)
+
+    def finalize(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]], dict[str, dict[str, Any]], dict[str, Any]]:
+        return (
+            _finalize_training_funnels(self.training_funnels),
+            _finalize_onboarding_funnels(self.onboarding_funnels),
+            _finalize_matchups(self.matchups),
+            _finalize_frame_times(self.frame_times),
+        )
+
+
+def _format_frame_summary(summary: dict[str, Any]) -> str:
+    return (
+        f"sessions={summary['session_count']} frames={summary['frame_count']} avg={summary['avg_ms']:.2f}ms "
+        f"p50={summary['p50_ms']:.2f}ms p95={summary['p95_ms']:.2f}ms p99={summary['p99_ms']:.2f}ms "
+        f"max={summary['max_ms']:.2f}ms over_16.7ms={summary['over_16_7ms']} ({_format_rate(float(summary['over_16_7ms_rate']))}) "
+        f"over_33ms={summary['over_33ms']}"
+    )
+
+
+def _top_reasons(mapping: dict[str, Any], limit: int = 3, bounds: dict[str, Any] | None = None) -> str:
+    """Top reasons as `reason xN`, or `reason xLOW..N` when a bounded counter may have overcounted it."""
     counter = Counter({str(key): int(value) for key, value in mapping.items()})
     if not counter:
         return "-"
-    parts = [f"{reason} x{count}" for reason, count in counter.most_common(limit)]
+    errors = (bounds or {}).get("errors", {})
+    parts = []
+    for reason, count in counter.most_common(limit):
+        error = int(errors.get(reason, 0))
+        parts.append(f"{reason} x{count - error}..{count}" if error else f"{reason} x{count}")
+    untracked = int((bounds or {}).get("untracked_max", 0))
+    if untracked:
+        parts.append(f"others <={untracked} each")
     return ", ".join(parts)
 
 
@@ -313,14 +853,16 @@ def _format_margin(value: float) -> str:
 
 
 def _text_report(
-    path: Path,
-    records: list[dict[str, Any]],
+    source: Path | str,
+    session_count: int,
     training_funnels: dict[str, dict[str, Any]],
     onboarding_funnels: dict[str, dict[str, Any]],
+    matchups: dict[str, dict[str, Any]],
+    frame_times: dict[str, Any],
 ) -> str:
     lines = [
-        f"Source: {path}",
-        f"Sessions analyzed: {len(records)}",
+        f"Source: {source}",
+        f"Sessions analyzed: {session_count}",
         "",
         "Training Drills",
     ]
@@ -337,7 +879,7 @@ def _text_report(
                     f"reset={funnel['reset_count']} completion={_format_rate(float(funnel['completion_rate']))} "
                     f"success_rate={_format_rate(float(funnel['success_rate']))} avg_result={_format_seconds(float(funnel['avg_result_seconds']))} "
                     f"avg_fail={_format_seconds(float(funnel['avg_fail_seconds']))} blast_margin={_format_margin(float(funnel['avg_closest_blast_margin_px']))} "
-                    f"reasons={_top_reasons(funnel['reason_counts'])}"
+                    f"reasons={_top_reasons(funnel['reason_counts'], bounds=funnel['reason_counts_bounds'])}"
                 )
             )
     else:
@@ -358,45 +900,377 @@ def _text_report(
                     f"avg_attempt={_format_seconds(float(funnel['avg_attempt_seconds']))} "
                     f"avg_success={_format_seconds(float(funnel['avg_success_seconds']))} "
                     f"avg_success_attempt={float(funnel['avg_attempt_index_on_success']):.2f} "
-                    f"fail_reasons={_top_reasons(funnel['fail_reason_counts'])} "
-                    f"success_reasons={_top_reasons(funnel['success_reason_counts'])}"
+                    f"fail_reasons={_top_reasons(funnel['fail_reason_counts'], bounds=funnel['fail_reason_counts_bounds'])} "
+                    f"success_reasons={_top_reasons(funnel['success_reason_counts'], bounds=funnel['success_reason_counts_bounds'])}"
                 )
             )
     else:
         lines.append("- No onboarding funnels found.")
+    lines.extend(["", "Matchups"])
+    if matchups:
+        ordered_matchups = sorted(
+            matchups.values(),
+            key=lambda item: (-abs(float(item["p1_win_rate"]) - 0.5), -int(item["match_count"])),
+        )
+        for matchup in ordered_matchups:
+            lines.append(
+                (
+                    f"- {matchup['p1_character_id']} vs {matchup['p2_character_id']}: matches={matchup['match_count']} "
+                    f"p1_win={matchup['p1_win_count']} p2_win={matchup['p2_win_count']} draw={matchup['draw_count']} "
+                    f"p1_win_rate={_format_rate(float(matchup['p1_win_rate']))} "
+                    f"avg_match={_format_seconds(float(matchup['avg_match_seconds']))}"
+                )
+            )
+    else:
+        lines.append("- No matchup results found.")
+    lines.extend(["", "Frame Times"])
+    if frame_times:
+        lines.append(f"- overall: {_format_frame_summary(frame_times['overall'])}")
+        for title, field in (("match_mode", "by_match_mode"), ("stage", "by_stage"), ("pair", "by_character_pair")):
+            ordered_groups = sorted(frame_times[field].items(), key=lambda item: (-float(item[1]["p99_ms"]), item[0]))
+            for key, summary in ordered_groups[:FRAME_TIME_GROUP_LIMIT]:
+                lines.append(f"- {title} {key}: {_format_frame_summary(summary)}")
+        for hitch in frame_times["worst_hitches"]:
+            lines.append(
+                (
+                    f"- hitch {hitch['frame_ms']:.1f}ms at {hitch['elapsed_seconds']:.2f}s into "
+                    f"{hitch['session_timestamp_utc'] or '?'} ({hitch['match_mode']}, {hitch['stage_id']}, {hitch['character_pair']})"
+                )
+            )
+    else:
+        lines.append("- No frame-time histograms found.")
     return "\n".join(lines)
 
 
-def _json_report(
-    path: Path,
-    records: list[dict[str, Any]],
+def _json_payload(
+    source: Path | str,
+    session_count: int,
     training_funnels: dict[str, dict[str, Any]],
     onboarding_funnels: dict[str, dict[str, Any]],
-) -> str:
-    payload = {
-        "source": str(path),
-        "session_count": len(records),
+    matchups: dict[str, dict[str, Any]],
+    frame_times: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "source": str(source),
+        "session_count": session_count,
         "training_drill_funnels": training_funnels,
         "onboarding_lesson_funnels": onboarding_funnels,
+        "matchups": matchups,
+        "frame_times": frame_times,
     }
-    return json.dumps(payload, indent=2, ensure_ascii=False)
 
 
-def main() -> int:
-    args = _build_parser().parse_args()
-    repo_root = _repo_root()
-    path = _resolve_input_path(repo_root, args.input)
+def _select_compare_records(
+    repo_root: Path,
+    default_path: Path,
+    spec: str,
+    match_mode: str,
+    cache: dict[Path, list[dict[str, Any]]],
+    probe: Instrumentation,
+) -> tuple[Path, list[dict[str, Any]]]:
+    from funnel_compare import RecordSelector
+
+    selector = RecordSelector.parse(spec)
+    path = _resolve_input_path(repo_root, selector.file) if selector.file else default_path
+    if path not in cache:
+        cache[path] = _read_records(path, 0, probe)
+    records = [
+        record
+        for record in cache[path]
+        if selector.matches(record) and (not match_mode or str(record.get("match_mode", "")) == match_mode)
+    ]
+    return path, records
+
+
+def _format_compare_value(metric: str, value: float | None) -> str:
+    if value is None:
+        return "-"
+    if metric.endswith("_seconds"):
+        return f"{value:.2f}s"
+    return _format_rate(value)
+
+
+def _format_compare_delta(metric: str, value: float | None) -> str:
+    if value is None:
+        return "-"
+    if metric.endswith("_seconds"):
+        return f"{value:+.2f}s"
+    return f"{value * 100.0:+.1f}pp"
+
+
+def _compare_text_report(compare: dict[str, Any], deltas: list[Any]) -> str:
+    baseline = compare["baseline"]
+    candidate = compare["candidate"]
+    lines = [
+        f"Baseline: {baseline['selector']} - {baseline['session_count']} session(s) from {baseline['source']}",
+        f"Candidate: {candidate['selector']} - {candidate['session_count']} session(s) from {candidate['source']}",
+        (
+            f"Bootstrap: {compare['resamples']} resamples, {compare['confidence'] * 100.0:g}% CI, "
+            f"Holm-adjusted significance, min {compare['min_sessions']} session(s) per side"
+        ),
+    ]
+    for kind, title in (("training_drill", "Training Drills"), ("onboarding_lesson", "Onboarding Lessons")):
+        lines.extend(["", title])
+        entries = [entry for entry in deltas if entry.kind == kind]
+        if not entries:
+            lines.append("- No funnels found.")
+            continue
+        entries.sort(key=lambda entry: (not entry.regression, not entry.significant, entry.funnel_id, entry.metric))
+        for entry in entries:
+            line = (
+                f"- {entry.funnel_id} {entry.metric}: {_format_compare_value(entry.metric, entry.baseline)} -> "
+                f"{_format_compare_value(entry.metric, entry.candidate)} "
+                f"(n={entry.baseline_sessions}/{entry.candidate_sessions}"
+            )
+            if entry.p_value is None:
+                line += ", not tested)"
+            else:
+                line += (
+                    f", delta {_format_compare_delta(entry.metric, entry.delta)}, "
+                    f"CI {_format_compare_delta(entry.metric, entry.ci_low)}..{_format_compare_delta(entry.metric, entry.ci_high)}, "
+                    f"p={entry.p_value:.3f})"
+                )
+            if entry.regression:
+                line += " REGRESSION"
+            elif entry.improvement:
+                line += " improved"
+            lines.append(line)
+    regressions = sum(1 for entry in deltas if entry.regression)
+    lines.extend(["", f"Result: FAIL ({regressions} regression(s))" if regressions else "Result: PASS"])
+    return "\n".join(lines)
+
+
+def _run_compare(args: argparse.Namespace, repo_root: Path, default_path: Path, probe: Instrumentation) -> int:
+    try:
+        from funnel_compare import compare_funnels
+    except ImportError:
+        print("Compare mode requires NumPy (`pip install numpy`).", file=sys.stderr)
+        return 1
+    if not args.baseline or not args.candidate:
+        print("Compare mode needs both --baseline and --candidate.", file=sys.stderr)
+        return 1
+    if args.resamples < 1 or not 0.0 < args.confidence < 1.0:
+        print("--resamples must be >= 1 and --confidence between 0 and 1.", file=sys.stderr)
+        return 1
+    cache: dict[Path, list[dict[str, Any]]] = {}
+    compare: dict[str, Any] = {}
+    selected: dict[str, list[dict[str, Any]]] = {}
     try:
-        records = _read_records(path, args.limit)
+        for name, spec in (("baseline", args.baseline), ("candidate", args.candidate)):
+            source, selected[name] = _select_compare_records(repo_root, default_path, spec, args.match_mode, cache, probe)
+            compare[name] = {"selector": spec, "source": str(source), "session_count": len(selected[name])}
     except (FileNotFoundError, ValueError) as exc:
         print(str(exc), file=sys.stderr)
         return 1
-    training_funnels = _aggregate_training_funnels(records)
-    onboarding_funnels = _aggregate_onboarding_funnels(records)
+    compare.update(resamples=args.resamples, confidence=args.confidence, min_sessions=args.min_sessions, seed=args.seed)
+    with probe.phase("bootstrap"):
+        deltas = compare_funnels(
+            selected["baseline"],
+            selected["candidate"],
+            resamples=args.resamples,
+            confidence=args.confidence,
+            min_sessions=args.min_sessions,
+            seed=args.seed,
+        )
+    probe.count("resamples", args.resamples)
+    probe.count("metrics_compared", len(deltas))
+    regressions = [entry for entry in deltas if entry.regression]
     if args.format == "json":
-        print(_json_report(path, records, training_funnels, onboarding_funnels))
+        with probe.phase("render"):
+            payload = {
+                "compare": compare,
+                "deltas": [entry.to_dict() for entry in deltas],
+                "regression_count": len(regressions),
+            }
+        probe.stop()
+        payload["timings"] = probe.to_dict()
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
     else:
-        print(_text_report(path, records, training_funnels, onboarding_funnels))
+        with probe.phase("render"):
+            report = _compare_text_report(compare, deltas)
+        with probe.phase("write"):
+            print(report)
+    return 1 if regressions else 0
+
+
+def _format_optional_rate(value: float | None) -> str:
+    return "-" if value is None else _format_rate(value)
+
+
+def _cohort_text_report(path: Path, result: dict[str, Any]) -> str:
+    lines = [
+        f"Source: {path}",
+        (
+            f"Cohorts: {result['install_count']} install(s), {result['session_count']} session(s) from "
+            f"{result['record_count']} record(s); {result['period']} cohorts, "
+            f"{result['session_gap_minutes']:g} min session gap, last activity {result['last_activity_date'] or '-'}"
+        ),
+    ]
+    skipped = [
+        f"{count} {label}"
+        for count, label in (
+            (result["skipped_untimed"], "without timestamp_utc"),
+            (result["skipped_sim"], "sim"),
+            (result["out_of_order"], "out of order (kept in the current session)"),
+        )
+        if count
+    ]
+    if skipped:
+        lines.append(f"Records skipped or adjusted: {', '.join(skipped)}")
+    if not result["cohorts"]:
+        lines.extend(["", "- No timestamped records found."])
+    for cohort in result["cohorts"]:
+        onboarding = cohort["onboarding"]
+        lines.extend(
+            [
+                "",
+                (
+                    f"Cohort {cohort['cohort']}: installs={cohort['installs']} sessions={cohort['sessions']} "
+                    f"records={cohort['records']} sessions_per_install={cohort['sessions_per_install']:.2f}"
+                ),
+                "- return: "
+                + " ".join(
+                    f"d{entry['day']}={_format_optional_rate(entry['return_rate'])}"
+                    f"/{_format_optional_rate(entry['rolling_return_rate'])}+ (n={entry['eligible_installs']})"
+                    for entry in cohort["retention"]
+                ),
+                (
+                    f"- onboarding: started={onboarding['started']} completed={onboarding['completed']} "
+                    f"skipped={onboarding['skipped']} replays={onboarding['forced_replays']} "
+                    f"completion={_format_optional_rate(onboarding['completion_rate'])} "
+                    f"avg_completed_at={_format_seconds(float(onboarding['avg_completed_at_seconds']))} "
+                    f"entry_points={_top_reasons(onboarding['entry_points'])}"
+                ),
+            ]
+        )
+        for entry in cohort["by_session"]:
+            if not entry["installs_reached"] and not entry["drill_results"]:
+                continue
+            lines.append(
+                (
+                    f"- session {entry['session']}: installs={entry['installs_reached']} "
+                    f"onboarded={_format_optional_rate(entry['onboarding_completion_rate'])} "
+                    f"drill_results={entry['drill_results']} "
+                    f"drill_success={_format_optional_rate(entry['drill_success_rate'])}"
+                )
+            )
+    return "\n".join(lines)
+
+
+def _run_cohorts(args: argparse.Namespace, path: Path, probe: Instrumentation) -> int:
+    from cohort_retention import CohortAnalyzer
+
+    try:
+        retention_days = tuple(int(part) for part in args.retention_days.split(",") if part.strip())
+        analyzer = CohortAnalyzer(
+            session_gap_minutes=args.session_gap_minutes,
+            period=args.cohort_period,
+            retention_days=retention_days,
+            max_session_index=args.max_session_index,
+            include_sim=args.match_mode == "sim",
+        )
+    except ValueError as exc:
+        print(f"Invalid cohort options: {exc}", file=sys.stderr)
+        return 1
+    try:
+        with probe.phase("cohorts"):
+            for record in _iter_records(path, probe):
+                if args.match_mode and str(record.get("match_mode", "")) != args.match_mode:
+                    continue
+                analyzer.add(record)
+    except (FileNotFoundError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    probe.count("installs", len(analyzer.installs))
+    with probe.phase("finalize"):
+        result = analyzer.result()
+    if args.format == "json":
+        payload = {"source": str(path), "cohorts": result}
+        probe.stop()
+        payload["timings"] = probe.to_dict()
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        return 0
+    with probe.phase("render"):
+        report = _cohort_text_report(path, result)
+    with probe.phase("write"):
+        print(report)
+    return 0
+
+
+def _fetch_server_payload(server: str, match_mode: str) -> dict[str, Any]:
+    query = f"?{urllib.parse.urlencode({'match_mode': match_mode})}" if match_mode else ""
+    with urllib.request.urlopen(f"{server.rstrip('/')}/aggregates{query}", timeout=10.0) as response:
+        payload = json.loads(response.read())
+    if not isinstance(payload, dict) or "session_count" not in payload:
+        raise ValueError(f"Unexpected /aggregates response from {server}")
+    return payload
+
+
+def _run_server(args: argparse.Namespace, probe: Instrumentation) -> int:
+    try:
+        with probe.phase("fetch"):
+            payload = _fetch_server_payload(args.server, args.match_mode)
+    except (urllib.error.URLError, OSError, ValueError) as exc:
+        print(f"Cannot query {args.server}: {exc}", file=sys.stderr)
+        return 1
+    probe.count("records_analyzed", int(payload["session_count"]))
+    if args.format == "json":
+        probe.stop()
+        payload["timings"] = probe.to_dict()
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        return 0
+    with probe.phase("render"):
+        report = _text_report(
+            payload["source"],
+            int(payload["session_count"]),
+            payload["training_drill_funnels"],
+            payload["onboarding_lesson_funnels"],
+            payload["matchups"],
+            payload["frame_times"],
+        )
+    with probe.phase("write"):
+        print(report)
+    return 0
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    repo_root = _repo_root()
+    path = _resolve_input_path(repo_root, args.input)
+    with instrumented(args) as probe:
+        if args.baseline or args.candidate:
+            return _run_compare(args, repo_root, path, probe)
+        if args.cohorts:
+            return _run_cohorts(args, path, probe)
+        if args.server:
+            return _run_server(args, probe)
+        try:
+            records = _read_records(path, args.limit, probe, args.match_mode)
+        except (FileNotFoundError, ValueError) as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        with probe.phase("aggregate"):
+            with probe.phase("training_funnels"):
+                training_funnels = _aggregate_training_funnels(records, args.reason_capacity)
+            with probe.phase("onboarding_funnels"):
+                onboarding_funnels = _aggregate_onboarding_funnels(records, args.reason_capacity)
+            with probe.phase("matchups"):
+                matchups = _aggregate_matchups(records)
+            with probe.phase("frame_times"):
+                frame_times = _aggregate_frame_times(records)
+        probe.count("records_analyzed", len(records))
+        if args.format == "json":
+            with probe.phase("render"):
+                payload = _json_payload(path, len(records), training_funnels, onboarding_funnels, matchups, frame_times)
+            # Timings cover everything up to the final encode/write of this payload.
+            probe.stop()
+            payload["timings"] = probe.to_dict()
+            print(json.dumps(payload, indent=2, ensure_ascii=False))
+            return 0
+        with probe.phase("render"):
+            report = _text_report(path, len(records), training_funnels, onboarding_funnels, matchups, frame_times)
+        with probe.phase("write"):
+            print(report)
     return 0
 
 
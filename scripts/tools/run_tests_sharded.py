@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Run tests/TestRunner.gd as N parallel headless Godot shards balanced by historical test durations."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import heapq
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from godot_resource import PROJECT_ROOT
+
+
+TEST_RUNNER = "tests/TestRunner.gd"
+TEST_RUNNER_RES = "res://tests/TestRunner.gd"
+SUITE_SMOKE = "smoke"
+SUITE_FULL = "full"
+RESULT_PREFIX = "TEST_RESULT "
+# Same pattern scripts/test.sh greps the Godot log for.
+ERROR_PATTERN = re.compile(r"SCRIPT ERROR:|Parse Error:|ERROR: Failed to load script")
+DEFAULT_TEST_MSEC = 1000.0
+HISTORY_SMOOTHING = 0.5
+HISTORY_VERSION = 1
+
+_FUNC_RE = re.compile(r"^func (\w+)\(", re.MULTILINE)
+_AWAIT_RE = re.compile(r"^\s*await (_\w+)\(\)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class TestCatalog:
+	defined: list[str]
+	suites: dict[str, list[str]]
+
+	def select(self, suite: str, names: list[str] | None = None) -> list[str]:
+		tests = self.suites.get(suite, [])
+		if not names:
+			return list(tests)
+		wanted = set(names)
+		return [name for name in tests if name in wanted]
+
+	@property
+	def unscheduled(self) -> list[str]:
+		scheduled = set(self.suites.get(SUITE_FULL, []))
+		return [name for name in self.defined if name not in scheduled]
+
+
+def function_bodies(source: str) -> dict[str, str]:
+	matches = list(_FUNC_RE.finditer(source))
+	bodies: dict[str, str] = {}
+	for index, match in enumerate(matches):
+		end = matches[index + 1].start() if index + 1 < len(matches) else len(source)
+		bodies[match.group(1)] = source[match.end():end]
+	return bodies
+
+
+def discover_tests(runner_path: Path) -> TestCatalog:
+	"""Find `_test_*` functions and the order `_run_smoke_suite` / `_run_full_suite` await them in."""
+	bodies = function_bodies(runner_path.read_text(encoding="utf-8"))
+	defined = [name for name in bodies if name.startswith("_test_")]
+
+	def expand(function_name: str, seen: set[str]) -> list[str]:
+		ordered: list[str] = []
+		for called in _AWAIT_RE.findall(bodies.get(function_name, "")):
+			if called.startswith("_test_"):
+				ordered.append(called)
+			elif called.startswith("_run_") and called not in seen:
+				ordered.extend(expand(called, seen | {called}))
+		return ordered
+
+	suites = {
+		SUITE_SMOKE: list(dict.fromkeys(expand("_run_smoke_suite", {"_run_smoke_suite"}))),
+		SUITE_FULL: list(dict.fromkeys(expand("_run_full_suite", {"_run_full_suite"}))),
+	}
+	return TestCatalog(defined=defined, suites=suites)
+
+
+class TimingHistory:
+	"""Per-test wall times (ms) smoothed across runs, persisted as JSON."""
+
+	def __init__(self, path: Path) -> None:
+		self.path = path
+		self.tests: dict[str, dict[str, float]] = {}
+		try:
+			payload = json.loads(path.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			payload = {}
+		if payload.get("version") == HISTORY_VERSION and isinstance(payload.get("tests"), dict):
+			self.tests = {str(name): dict(entry) for name, entry in payload["tests"].items() if isinstance(entry, dict)}
+
+	def expected_msec(self, names: list[str]) -> dict[str, float]:
+		known = [float(entry["msec"]) for entry in self.tests.values() if "msec" in entry]
+		fallback = statistics.median(known) if known else DEFAULT_TEST_MSEC
+		return {name: float(self.tests.get(name, {}).get("msec", fallback)) for name in names}
+
+	def record(self, name: str, msec: float) -> None:
+		entry = self.tests.get(name)
+		if entry is None or "msec" not in entry:
+			self.tests[name] = {"msec": round(msec, 2), "runs": 1}
+			return
+		smoothed = HISTORY_SMOOTHING * msec + (1.0 - HISTORY_SMOOTHING) * float(entry["msec"])
+		self.tests[name] = {"msec": round(smoothed, 2), "runs": int(entry.get("runs", 0)) + 1}
+
+	def save(self) -> None:
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		payload = {"version": HISTORY_VERSION, "tests": dict(sorted(self.tests.items()))}
+		self.path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+@dataclass
+class Shard:
+	index: int
+	tests: list[str] = field(default_factory=list)
+	expected_msec: float = 0.0
+
+
+def plan_shards(tests: list[str], expected: dict[str, float], shard_count: int) -> list[Shard]:
+	"""Longest-processing-time-first: each test goes to the currently lightest shard.
+
+	Tests keep their suite order inside a shard so ordering-sensitive tests behave as in a serial run.
+	"""
+	shard_count = max(1, min(shard_count, len(tests)))
+	shards = [Shard(index=index) for index in range(shard_count)]
+	heap = [(0.0, index) for index in range(shard_count)]
+	order = {name: position for position, name in enumerate(tests)}
+	for name in sorted(tests, key=lambda item: (-expected.get(item, DEFAULT_TEST_MSEC), order[item])):
+		load, index = heapq.heappop(heap)
+		shards[index].tests.append(name)
+		shards[index].expected_msec += expected.get(name, DEFAULT_TEST_MSEC)
+		heapq.heappush(heap, (shards[index].expected_msec, index))
+	for shard in shards:
+		shard.tests.sort(key=order.__getitem__)
+	return [shard for shard in shards if shard.tests]
+
+
+@dataclass
+class ShardResult:
+	shard: Shard
+	returncode: int
+	wall_msec: float
+	log_path: Path
+	results: dict[str, dict[str, float]] = field(default_factory=dict)
+	log_errors: list[str] = field(default_factory=list)
+	output_tail: list[str] = field(default_factory=list)
+
+	@property
+	def missing(self) -> list[str]:
+		return [name for name in self.shard.tests if name not in self.results]
+
+	@property
+	def passed(self) -> bool:
+		return (
+			self.returncode == 0
+			and not self.log_errors
+			and not self.missing
+			and all(result["failures"] == 0 for result in self.results.values())
+		)
+
+
+def resolve_godot_bin() -> str | None:
+	"""Same lookup order as scripts/test.sh."""
+	override = os.environ.get("GODOT_BIN", "")
+	if override:
+		return override
+	for candidate in ("godot4", "godot"):
+		found = shutil.which(candidate)
+		if found:
+			return found
+	mac_app = Path("/Applications/Godot.app/Contents/MacOS/Godot")
+	if os.access(mac_app, os.X_OK):
+		return str(mac_app)
+	return None
+
+
+def parse_results(output: str) -> dict[str, dict[str, float]]:
+	results: dict[str, dict[str, float]] = {}
+	for line in output.splitlines():
+		start = line.find(RESULT_PREFIX)
+		if start < 0:
+			continue
+		try:
+			payload = json.loads(line[start + len(RESULT_PREFIX):])
+		except ValueError:
+			continue
+		if isinstance(payload, dict) and "name" in payload:
+			results[str(payload["name"])] = {
+				"msec": float(payload.get("msec", 0.0)),
+				"failures": int(payload.get("failures", 0)),
+			}
+	return results
+
+
+def run_shard(
+	shard: Shard,
+	godot_bin: str,
+	project_root: Path,
+	suite: str,
+	home_root: Path,
+	log_dir: Path,
+	timeout: float,
+) -> ShardResult:
+	home = home_root / f"shard-{shard.index}"
+	home.mkdir(parents=True, exist_ok=True)
+	log_path = log_dir / f"test-shard-{shard.index}.log"
+	log_path.unlink(missing_ok=True)
+	command = [
+		godot_bin,
+		"--headless",
+		"--path", str(project_root),
+		"--log-file", str(log_path),
+		"--script", TEST_RUNNER_RES,
+		"--",
+		"--suite", suite,
+		"--tests", ",".join(shard.tests),
+	]
+	started = time.perf_counter()
+	try:
+		completed = subprocess.run(
+			command,
+			env={**os.environ, "HOME": str(home)},
+			stdout=subprocess.PIPE,
+			stderr=subprocess.STDOUT,
+			text=True,
+			errors="replace",
+			timeout=timeout,
+		)
+		returncode, output = completed.returncode, completed.stdout
+	except subprocess.TimeoutExpired as exc:
+		partial = exc.stdout.decode(errors="replace") if isinstance(exc.stdout, bytes) else exc.stdout or ""
+		returncode, output = 124, partial + f"\nshard {shard.index} timed out after {timeout:.0f}s\n"
+	except OSError as exc:
+		returncode, output = 127, f"could not start {godot_bin}: {exc}\n"
+	wall_msec = (time.perf_counter() - started) * 1000.0
+
+	log_text = output
+	if log_path.exists():
+		log_text += "\n" + log_path.read_text(encoding="utf-8", errors="replace")
+	log_errors = list(dict.fromkeys(line.strip() for line in log_text.splitlines() if ERROR_PATTERN.search(line)))
+	return ShardResult(
+		shard=shard,
+		returncode=returncode,
+		wall_msec=wall_msec,
+		log_path=log_path,
+		results=parse_results(output),
+		log_errors=log_errors,
+		output_tail=[line for line in output.splitlines() if RESULT_PREFIX not in line][-20:],
+	)
+
+
+def _report_payload(
+	suite: str,
+	godot_bin: str,
+	results: list[ShardResult],
+	wall_msec: float,
+	unscheduled: list[str],
+) -> dict:
+	tests = []
+	for result in results:
+		for name in result.shard.tests:
+			measured = result.results.get(name)
+			tests.append(
+				{
+					"name": name,
+					"shard": result.shard.index,
+					"msec": measured["msec"] if measured else None,
+					"failures": measured["failures"] if measured else None,
+					"status": "missing" if measured is None else ("pass" if measured["failures"] == 0 else "fail"),
+				}
+			)
+	serial_msec = sum(test["msec"] or 0.0 for test in tests)
+	return {
+		"suite": suite,
+		"godot_bin": godot_bin,
+		"passed": all(result.passed for result in results),
+		"wall_msec": round(wall_msec, 2),
+		"serial_test_msec": round(serial_msec, 2),
+		"shards": [
+			{
+				"index": result.shard.index,
+				"tests": len(result.shard.tests),
+				"expected_msec": round(result.shard.expected_msec, 2),
+				"wall_msec": round(result.wall_msec, 2),
+				"returncode": result.returncode,
+				"passed": result.passed,
+				"missing": result.missing,
+				"log_errors": result.log_errors,
+				"log": str(result.log_path),
+			}
+			for result in results
+		],
+		"tests": sorted(tests, key=lambda test: -(test["msec"] or 0.0)),
+		"unscheduled_tests": unscheduled,
+	}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Split tests/TestRunner.gd into shards balanced by historical per-test wall time and run them "
+			"as parallel headless Godot processes, each with its own HOME."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--suite", choices=[SUITE_SMOKE, SUITE_FULL], default=SUITE_SMOKE, help="Test suite to shard (default: smoke)")
+	parser.add_argument("--shards", type=int, default=0, help="Parallel Godot processes (0 = CPU count)")
+	parser.add_argument("--tests", help="Comma-separated subset of `_test_*` functions to run")
+	parser.add_argument("--timeout", type=float, default=900.0, help="Per-shard timeout in seconds (default: 900)")
+	parser.add_argument(
+		"--history",
+		default=".godot-user/test_timings.json",
+		help="Per-test timing history relative to the project root",
+	)
+	parser.add_argument("--no-history-update", action="store_true", help="Use the timing history without updating it")
+	parser.add_argument("--report", default=".godot-user/test_report.json", help="JSON run report relative to the project root")
+	parser.add_argument("--dry-run", action="store_true", help="Print the shard plan without launching Godot")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	project_root = Path(args.project_root).resolve()
+	runner_path = project_root / TEST_RUNNER
+	if not runner_path.exists():
+		print(f"Test runner not found: {runner_path}", file=sys.stderr)
+		return 1
+	catalog = discover_tests(runner_path)
+	requested = [name.strip() for name in (args.tests or "").split(",") if name.strip()]
+	unknown = [name for name in requested if name not in catalog.suites.get(args.suite, [])]
+	if unknown:
+		print(f"Not in the {args.suite} suite: {', '.join(unknown)}", file=sys.stderr)
+		return 1
+	tests = catalog.select(args.suite, requested)
+	if not tests:
+		print(f"No tests to run in the {args.suite} suite", file=sys.stderr)
+		return 1
+
+	history = TimingHistory(project_root / args.history)
+	shard_count = args.shards if args.shards > 0 else (os.cpu_count() or 1)
+	shards = plan_shards(tests, history.expected_msec(tests), shard_count)
+
+	if args.dry_run:
+		plan = [{"index": shard.index, "expected_msec": round(shard.expected_msec, 2), "tests": shard.tests} for shard in shards]
+		if args.format == "json":
+			print(json.dumps({"suite": args.suite, "shards": plan, "unscheduled_tests": catalog.unscheduled}, indent=2))
+			return 0
+		print(f"Shard plan: {len(tests)} {args.suite} test(s) across {len(shards)} shard(s)")
+		for shard in shards:
+			print(f"  shard {shard.index}: {len(shard.tests)} test(s), expected {shard.expected_msec:.0f} ms")
+		return 0
+
+	godot_bin = resolve_godot_bin()
+	if godot_bin is None:
+		print("error: Godot executable not found. Set GODOT_BIN=/path/to/godot", file=sys.stderr)
+		return 1
+	home_root = Path(os.environ.get("GODOT_TEST_HOME", project_root / ".godot-test-home"))
+	log_dir = project_root / ".godot-user" / "logs"
+	log_dir.mkdir(parents=True, exist_ok=True)
+
+	started = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+		results = list(
+			executor.map(
+				lambda shard: run_shard(shard, godot_bin, project_root, args.suite, home_root, log_dir, args.timeout),
+				shards,
+			)
+		)
+	wall_msec = (time.perf_counter() - started) * 1000.0
+
+	if not args.no_history_update:
+		for result in results:
+			for name, measured in result.results.items():
+				if name in result.shard.tests:
+					history.record(name, measured["msec"])
+		history.save()
+	payload = _report_payload(args.suite, godot_bin, results, wall_msec, catalog.unscheduled)
+	report_path = project_root / args.report
+	report_path.parent.mkdir(parents=True, exist_ok=True)
+	report_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+	passed = payload["passed"]
+
+	if args.format == "json":
+		print(json.dumps(payload, indent=2))
+		return 0 if passed else 1
+
+	print(f"Sharded {args.suite} suite: {len(tests)} test(s) across {len(results)} shard(s) with {godot_bin}")
+	for result in results:
+		status = "PASS" if result.passed else "FAIL"
+		print(
+			f"  shard {result.shard.index}: {len(result.shard.tests)} test(s), "
+			f"expected {result.shard.expected_msec:.0f} ms, wall {result.wall_msec:.0f} ms, {status}"
+		)
+	serial = payload["serial_test_msec"]
+	speedup = serial / wall_msec if wall_msec > 0 else 0.0
+	print(f"Wall time: {wall_msec:.0f} ms (sum of test times {serial:.0f} ms, {speedup:.2f}x)")
+	for test in payload["tests"][:5]:
+		if test["msec"] is not None:
+			print(f"  slowest: {test['name']} {test['msec']:.0f} ms (shard {test['shard']})")
+	for result in results:
+		if result.passed:
+			continue
+		for test in result.shard.tests:
+			measured = result.results.get(test)
+			if measured is None:
+				print(f"  - shard {result.shard.index}: {test} did not report a result")
+			elif measured["failures"]:
+				print(f"  - shard {result.shard.index}: {test} had {measured['failures']} failed assertion(s)")
+		for line in result.log_errors:
+			print(f"  - shard {result.shard.index}: {line}")
+		if result.returncode != 0:
+			print(f"  - shard {result.shard.index}: exit code {result.returncode}, log {result.log_path}")
+			for line in result.output_tail[-5:]:
+				print(f"      {line}")
+	if catalog.unscheduled:
+		print(f"  ~ not scheduled by any suite: {', '.join(catalog.unscheduled)}")
+	print(f"Report: {report_path}")
+	print("Result: PASS" if passed else "Result: FAIL")
+	return 0 if passed else 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
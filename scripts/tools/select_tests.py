@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Select the TestRunner.gd tests affected by a git diff using the res:// dependency graph."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import re
+import subprocess
+import sys
+import time
+
+from godot_resource import PROJECT_ROOT
+from resource_graph import DEFAULT_INDEX_PATH, ResourceGraph, load_graph, normalize_changed_path, scan_text
+from run_tests_sharded import SUITE_FULL, SUITE_SMOKE, TEST_RUNNER, discover_tests, function_bodies
+
+
+# Changing these affects every test regardless of what it references.
+GLOBAL_INPUTS = ("project.godot",)
+_CALL_RE = re.compile(r"\b(_[a-z]\w*)\(")
+_CONST_RE = re.compile(r"^const\s+(\w+)\s*:?=.*$", re.MULTILINE)
+
+
+@dataclass
+class TestFootprint:
+	"""Resources and TestRunner helpers one `_test_*` function reaches."""
+
+	helpers: set[str] = field(default_factory=set)
+	roots: set[str] = field(default_factory=set)
+	missing: list[str] = field(default_factory=list)
+	resources: set[str] = field(default_factory=set)
+
+
+def runner_header(source: str) -> str:
+	first = re.search(r"^func ", source, re.MULTILINE)
+	return source[: first.start()] if first else source
+
+
+def map_test_footprints(source: str, tests: list[str], graph: ResourceGraph) -> dict[str, TestFootprint]:
+	"""Resolve each test body, the helpers it calls and the header consts it uses into graph closures."""
+	bodies = function_bodies(source)
+	const_lines = {match.group(1): match.group(0) for match in _CONST_RE.finditer(runner_header(source))}
+	footprints: dict[str, TestFootprint] = {}
+	for test in tests:
+		footprint = TestFootprint()
+		pending = [test]
+		texts: list[str] = []
+		while pending:
+			name = pending.pop()
+			if name in footprint.helpers or name not in bodies:
+				continue
+			footprint.helpers.add(name)
+			body = bodies[name]
+			texts.append(body)
+			pending.extend(called for called in _CALL_RE.findall(body) if not called.startswith("_test_"))
+		refs = scan_text("\n".join(texts))
+		texts.extend(const_lines[name] for name in refs.identifiers if name in const_lines)
+		footprint.helpers.discard(test)
+		footprint.roots, footprint.missing = graph.resolve(scan_text("\n".join(texts)))
+		footprint.resources = graph.closure(footprint.roots | set(footprint.missing))
+		footprints[test] = footprint
+	return footprints
+
+
+def changed_files(project_root: Path, base: str) -> list[str]:
+	"""Files differing from `base` in the working tree (staged or not) plus untracked files."""
+	diff = subprocess.run(
+		["git", "-C", str(project_root), "diff", "--name-only", "--relative", base],
+		capture_output=True,
+		text=True,
+		check=True,
+	).stdout.splitlines()
+	untracked = subprocess.run(
+		["git", "-C", str(project_root), "ls-files", "--others", "--exclude-standard"],
+		capture_output=True,
+		text=True,
+		check=True,
+	).stdout.splitlines()
+	return sorted(set(line.strip() for line in [*diff, *untracked] if line.strip()))
+
+
+def base_runner_source(project_root: Path, base: str) -> str | None:
+	completed = subprocess.run(
+		["git", "-C", str(project_root), "show", f"{base}:./{TEST_RUNNER}"],
+		capture_output=True,
+		text=True,
+	)
+	return completed.stdout if completed.returncode == 0 else None
+
+
+def changed_runner_functions(old_source: str | None, new_source: str) -> set[str] | None:
+	"""Functions whose text changed in TestRunner.gd, or None when the shared header changed."""
+	if old_source is None or runner_header(old_source) != runner_header(new_source):
+		return None
+	old_bodies = function_bodies(old_source)
+	new_bodies = function_bodies(new_source)
+	return {name for name in set(old_bodies) | set(new_bodies) if old_bodies.get(name) != new_bodies.get(name)}
+
+
+@dataclass
+class Selection:
+	suite: str
+	changed: list[str]
+	tests: list[str]
+	reasons: dict[str, list[str]]
+	unmapped: list[str]
+	run_all_reason: str = ""
+
+	def to_dict(self) -> dict:
+		return {
+			"suite": self.suite,
+			"changed": self.changed,
+			"tests": self.tests,
+			"reasons": self.reasons,
+			"unmapped_changes": self.unmapped,
+			"run_all_reason": self.run_all_reason,
+		}
+
+
+def select_tests(
+	suite_tests: list[str],
+	footprints: dict[str, TestFootprint],
+	changed: list[str],
+	runner_changes: set[str] | None,
+) -> Selection:
+	normalized = sorted({normalize_changed_path(rel) for rel in changed})
+	selection = Selection(suite="", changed=normalized, tests=[], reasons={}, unmapped=[])
+	global_hits = [rel for rel in normalized if rel in GLOBAL_INPUTS]
+	if global_hits:
+		selection.run_all_reason = f"{', '.join(global_hits)} changed"
+	elif TEST_RUNNER in normalized and runner_changes is None:
+		selection.run_all_reason = f"{TEST_RUNNER} header changed"
+	if selection.run_all_reason:
+		selection.tests = list(suite_tests)
+		selection.reasons = {test: [selection.run_all_reason] for test in suite_tests}
+		return selection
+
+	mapped: set[str] = set()
+	for test in suite_tests:
+		footprint = footprints[test]
+		hits = [rel for rel in normalized if rel in footprint.resources]
+		if TEST_RUNNER in normalized and runner_changes:
+			touched = sorted((footprint.helpers | {test}) & runner_changes)
+			hits.extend(f"{TEST_RUNNER}::{name}" for name in touched)
+		if hits:
+			selection.tests.append(test)
+			selection.reasons[test] = hits
+			mapped.update(hit for hit in hits if "::" not in hit)
+	selection.unmapped = [rel for rel in normalized if rel not in mapped and rel != TEST_RUNNER]
+	return selection
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Map each _test_* in tests/TestRunner.gd to the .gd/.tscn/.tres/asset files it reaches and "
+			"print the tests affected by changes since a git revision."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--base", default="HEAD", help="Git revision to diff the working tree against (default: HEAD)")
+	parser.add_argument(
+		"--changed",
+		action="append",
+		help="Project-relative changed file instead of asking git (repeatable)",
+	)
+	parser.add_argument("--suite", choices=[SUITE_SMOKE, SUITE_FULL], default=SUITE_SMOKE, help="Suite to select from (default: smoke)")
+	parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Cached dependency index relative to the project root")
+	parser.add_argument(
+		"--format",
+		choices=["text", "json", "names"],
+		default="text",
+		help="Output format; `names` prints a comma-separated list for run_tests_sharded.py --tests. Default: text.",
+	)
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root).resolve()
+	runner_path = project_root / TEST_RUNNER
+	if not runner_path.exists():
+		print(f"Test runner not found: {runner_path}", file=sys.stderr)
+		return 1
+	if args.changed:
+		changed = sorted(set(args.changed))
+	else:
+		try:
+			changed = changed_files(project_root, args.base)
+		except (OSError, subprocess.CalledProcessError) as exc:
+			print(f"git diff against {args.base} failed: {exc}", file=sys.stderr)
+			return 1
+
+	graph, stats = load_graph(project_root, project_root / args.index)
+	source = runner_path.read_text(encoding="utf-8")
+	suite_tests = discover_tests(runner_path).select(args.suite)
+	footprints = map_test_footprints(source, suite_tests, graph)
+	runner_changes: set[str] | None = set()
+	if TEST_RUNNER in changed:
+		old_source = None if args.changed else base_runner_source(project_root, args.base)
+		runner_changes = changed_runner_functions(old_source, source)
+	selection = select_tests(suite_tests, footprints, changed, runner_changes)
+	selection.suite = args.suite
+	elapsed = time.perf_counter() - started
+
+	if args.format == "names":
+		print(",".join(selection.tests))
+		return 0
+	if args.format == "json":
+		payload = {
+			**selection.to_dict(),
+			"index": {"files": stats.files, "sources": stats.sources, "scanned": stats.scanned, "reused": stats.reused},
+			"footprints": {
+				test: {"roots": sorted(footprint.roots), "resources": len(footprint.resources)}
+				for test, footprint in footprints.items()
+			},
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2))
+		return 0
+
+	print(
+		f"Dependency index: {stats.sources} source(s) over {stats.files} file(s), "
+		f"{stats.scanned} rescanned, {stats.reused} cached ({elapsed * 1000.0:.1f} ms)"
+	)
+	print(f"Changed: {len(selection.changed)} file(s)")
+	if selection.run_all_reason:
+		print(f"Selected: all {len(selection.tests)} {args.suite} test(s) ({selection.run_all_reason})")
+	else:
+		print(f"Selected: {len(selection.tests)} of {len(suite_tests)} {args.suite} test(s)")
+		for test in selection.tests:
+			reasons = selection.reasons[test]
+			print(f"  {test}: {', '.join(reasons[:3])}{' ...' if len(reasons) > 3 else ''}")
+	if selection.unmapped:
+		print(f"  ~ not reached by any {args.suite} test: {', '.join(selection.unmapped[:10])}{' ...' if len(selection.unmapped) > 10 else ''}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""Analyze and batch-normalize the combat SFX WAVs (sample rate, channel layout, loudness)."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from character_exports_common import FileHashCache
+from godot_resource import PROJECT_ROOT
+
+
+MANIFEST_VERSION = 1
+DEFAULT_SFX_DIR = "assets/audio/sfx"
+DEFAULT_MANIFEST = ".godot-user/sfx_manifest.json"
+DEFAULT_OUTPUT_DIR = "/tmp/ffc-sfx-normalized"
+_HASH_CACHE_NAME = ".sfx_hashes.json"
+# Godot's default mix rate; anything else is resampled at import or playback.
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_CHANNELS = 1
+DEFAULT_PEAK_CEILING_DBFS = -1.0
+DEFAULT_SILENCE_DBFS = -60.0
+CLIP_DBFS = -0.1
+LEADING_SILENCE_WARN_MS = 10.0
+# BS.1770 gating block (400 ms, 75% overlap); shorter clips are measured as a single block.
+_LOUDNESS_BLOCK_SECONDS = 0.4
+_LOUDNESS_HOP_SECONDS = 0.1
+_ABSOLUTE_GATE_LUFS = -70.0
+_RELATIVE_GATE_LU = -10.0
+_FLOOR_DB = -120.0
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavError(ValueError):
+	pass
+
+
+@dataclass(frozen=True)
+class WavInfo:
+	sample_rate: int
+	channels: int
+	bits: int
+	float_samples: bool
+
+
+def read_wav(data: bytes) -> tuple[WavInfo, np.ndarray]:
+	"""Decode RIFF/WAVE bytes into `(frames, channels)` float64 in [-1, 1].
+
+	The data chunk is viewed in place (`memoryview` + `np.frombuffer`); only the float conversion copies.
+	"""
+	view = memoryview(data)
+	if len(view) < 12 or bytes(view[0:4]) != b"RIFF" or bytes(view[8:12]) != b"WAVE":
+		raise WavError("not a RIFF/WAVE file")
+	info: WavInfo | None = None
+	samples: memoryview | None = None
+	offset = 12
+	while offset + 8 <= len(view):
+		chunk_id = bytes(view[offset : offset + 4])
+		(size,) = struct.unpack_from("<I", view, offset + 4)
+		body = view[offset + 8 : offset + 8 + size]
+		if chunk_id == b"fmt ":
+			if len(body) < 16:
+				raise WavError("truncated fmt chunk")
+			format_tag, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", body)
+			if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+				(format_tag,) = struct.unpack_from("<H", body, 24)
+			if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_IEEE_FLOAT):
+				raise WavError(f"unsupported WAV format tag {format_tag}")
+			if channels < 1 or sample_rate < 1:
+				raise WavError("invalid channel count or sample rate")
+			info = WavInfo(sample_rate, channels, bits, format_tag == _WAVE_FORMAT_IEEE_FLOAT)
+		elif chunk_id == b"data":
+			samples = body
+		offset += 8 + size + (size & 1)
+	if info is None or samples is None:
+		raise WavError("missing fmt or data chunk")
+	return info, _decode_samples(info, samples)
+
+
+def _decode_samples(info: WavInfo, samples: memoryview) -> np.ndarray:
+	width = info.bits // 8
+	usable = len(samples) - len(samples) % (width * info.channels)
+	samples = samples[:usable]
+	if info.float_samples:
+		if info.bits not in (32, 64):
+			raise WavError(f"unsupported float sample width {info.bits}")
+		raw = np.frombuffer(samples, dtype="<f4" if info.bits == 32 else "<f8").astype(np.float64)
+	elif info.bits == 8:
+		raw = (np.frombuffer(samples, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+	elif info.bits == 16:
+		raw = np.frombuffer(samples, dtype="<i2") / 32768.0
+	elif info.bits == 24:
+		triples = np.frombuffer(samples, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+		packed = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+		raw = np.where(packed & 0x800000, packed - 0x1000000, packed) / 8388608.0
+	elif info.bits == 32:
+		raw = np.frombuffer(samples, dtype="<i4") / 2147483648.0
+	else:
+		raise WavError(f"unsupported PCM sample width {info.bits}")
+	return raw.reshape(-1, info.channels)
+
+
+def encode_wav_pcm16(samples: np.ndarray, sample_rate: int) -> bytes:
+	pcm = np.clip(np.round(samples * 32767.0), -32768, 32767).astype("<i2")
+	channels = samples.shape[1]
+	payload = pcm.tobytes()
+	header = struct.pack(
+		"<4sI4s4sIHHIIHH4sI",
+		b"RIFF", 36 + len(payload), b"WAVE",
+		b"fmt ", 16, _WAVE_FORMAT_PCM, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+		b"data", len(payload),
+	)
+	return header + payload
+
+
+def _db(value: float) -> float:
+	return 20.0 * math.log10(value) if value > 0.0 else _FLOOR_DB
+
+
+def _biquad_response(b: tuple[float, float, float], a: tuple[float, float, float], z: np.ndarray) -> np.ndarray:
+	return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+
+def k_weighting_power(frequencies: np.ndarray, sample_rate: int) -> np.ndarray:
+	"""|H(f)|^2 of the BS.1770 K-weighting (high-shelf + RLB high-pass) biquads at `sample_rate`."""
+	z = np.exp(-2j * np.pi * frequencies / sample_rate)
+	gain = 10.0 ** (4.0 / 40.0)
+	w0 = 2.0 * math.pi * 1500.0 / sample_rate
+	alpha = math.sin(w0) / (2.0 * (1.0 / math.sqrt(2.0)))
+	cos_w0 = math.cos(w0)
+	root = 2.0 * math.sqrt(gain) * alpha
+	shelf = _biquad_response(
+		(
+			gain * ((gain + 1.0) + (gain - 1.0) * cos_w0 + root),
+			-2.0 * gain * ((gain - 1.0) + (gain + 1.0) * cos_w0),
+			gain * ((gain + 1.0) + (gain - 1.0) * cos_w0 - root),
+		),
+		(
+			(gain + 1.0) - (gain - 1.0) * cos_w0 + root,
+			2.0 * ((gain - 1.0) - (gain + 1.0) * cos_w0),
+			(gain + 1.0) - (gain - 1.0) * cos_w0 - root,
+		),
+		z,
+	)
+	w0 = 2.0 * math.pi * 38.0 / sample_rate
+	alpha = math.sin(w0) / (2.0 * 0.5)
+	cos_w0 = math.cos(w0)
+	high_pass = _biquad_response(
+		((1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0),
+		(1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha),
+		z,
+	)
+	return np.abs(shelf * high_pass) ** 2
+
+
+def integrated_loudness(samples: np.ndarray, sample_rate: int) -> float:
+	"""Gated BS.1770-style loudness in LUFS, K-weighting applied per block in the frequency domain."""
+	frames = samples.shape[0]
+	if frames == 0:
+		return _FLOOR_DB
+	block = min(frames, max(1, int(round(_LOUDNESS_BLOCK_SECONDS * sample_rate))))
+	hop = max(1, int(round(_LOUDNESS_HOP_SECONDS * sample_rate)))
+	starts = np.arange(0, frames - block + 1, hop)
+	windows = np.lib.stride_tricks.sliding_window_view(samples, block, axis=0)[starts]
+	spectrum = np.fft.rfft(windows, axis=-1)
+	weights = k_weighting_power(np.fft.rfftfreq(block, 1.0 / sample_rate), sample_rate)
+	# Parseval: mean square of the filtered block from its weighted one-sided power spectrum.
+	power = np.abs(spectrum) ** 2 * weights
+	power[..., 1:] *= 2.0
+	if block % 2 == 0:
+		power[..., -1] /= 2.0
+	mean_square = power.sum(axis=-1).sum(axis=-1) / float(block * block)
+	with np.errstate(divide="ignore"):
+		block_loudness = -0.691 + 10.0 * np.log10(mean_square)
+	gated = mean_square[block_loudness > _ABSOLUTE_GATE_LUFS]
+	if gated.size == 0:
+		return _FLOOR_DB
+	relative_gate = -0.691 + 10.0 * math.log10(float(gated.mean())) + _RELATIVE_GATE_LU
+	gated = mean_square[(block_loudness > _ABSOLUTE_GATE_LUFS) & (block_loudness > relative_gate)]
+	return -0.691 + 10.0 * math.log10(float(gated.mean()))
+
+
+def analyze_samples(samples: np.ndarray, sample_rate: int, silence_dbfs: float = DEFAULT_SILENCE_DBFS) -> dict:
+	frames = samples.shape[0]
+	envelope = np.abs(samples).max(axis=1) if frames else np.zeros(0)
+	peak = float(envelope.max()) if frames else 0.0
+	rms = float(np.sqrt(np.mean(samples * samples))) if frames else 0.0
+	audible = np.flatnonzero(envelope > 10.0 ** (silence_dbfs / 20.0))
+	leading = int(audible[0]) if audible.size else frames
+	trailing = int(frames - 1 - audible[-1]) if audible.size else frames
+	return {
+		"frames": frames,
+		"duration_seconds": round(frames / float(sample_rate), 6),
+		"peak_dbfs": round(_db(peak), 2),
+		"rms_dbfs": round(_db(rms), 2),
+		"loudness_lufs": round(integrated_loudness(samples, sample_rate), 2),
+		"leading_silence_ms": round(leading * 1000.0 / sample_rate, 2),
+		"trailing_silence_ms": round(trailing * 1000.0 / sample_rate, 2),
+		"dc_offset": round(float(samples.mean()) if frames else 0.0, 6),
+	}
+
+
+def remix(samples: np.ndarray, channels: int) -> np.ndarray:
+	if samples.shape[1] == channels:
+		return samples
+	mono = samples.mean(axis=1, keepdims=True)
+	return mono if channels == 1 else np.repeat(mono, channels, axis=1)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+	"""Band-limited FFT resampling; zero padding keeps the tail from wrapping onto the attack."""
+	if source_rate == target_rate or samples.shape[0] == 0:
+		return samples
+	frames = samples.shape[0]
+	out_frames = int(round(frames * target_rate / float(source_rate)))
+	pad = max(256, frames // 8)
+	padded = frames + pad
+	padded_out = int(round(padded * target_rate / float(source_rate)))
+	spectrum = np.fft.rfft(samples, n=padded, axis=0)
+	bins = padded_out // 2 + 1
+	resized = np.zeros((bins, samples.shape[1]), dtype=spectrum.dtype)
+	keep = min(bins, spectrum.shape[0])
+	resized[:keep] = spectrum[:keep]
+	return np.fft.irfft(resized, n=padded_out, axis=0)[:out_frames] * (padded_out / float(padded))
+
+
+@dataclass(frozen=True)
+class ConvertOptions:
+	sample_rate: int
+	channels: int
+	target_lufs: float | None
+	peak_ceiling_dbfs: float
+	silence_dbfs: float
+
+	def key(self) -> dict:
+		return {
+			"version": MANIFEST_VERSION,
+			"sample_rate": self.sample_rate,
+			"channels": self.channels,
+			"bits": 16,
+			"target_lufs": self.target_lufs,
+			"peak_ceiling_dbfs": self.peak_ceiling_dbfs,
+			"silence_dbfs": self.silence_dbfs,
+		}
+
+
+@dataclass(frozen=True)
+class SfxJob:
+	source: Path
+	output: Path | None
+	options: ConvertOptions
+
+
+def process_sfx(job: SfxJob) -> dict:
+	"""Analyze one WAV and, when `job.output` is set, write its normalized PCM16 copy."""
+	try:
+		info, samples = read_wav(job.source.read_bytes())
+	except (OSError, WavError) as exc:
+		return {"error": str(exc)}
+	entry: dict = {
+		"format": {
+			"sample_rate": info.sample_rate,
+			"channels": info.channels,
+			"bits": info.bits,
+			"float": info.float_samples,
+		},
+		"analysis": analyze_samples(samples, info.sample_rate, job.options.silence_dbfs),
+	}
+	if job.output is None:
+		return entry
+	converted = resample(remix(samples, job.options.channels), info.sample_rate, job.options.sample_rate)
+	gain_db = 0.0
+	if job.options.target_lufs is not None:
+		loudness = integrated_loudness(converted, job.options.sample_rate)
+		if loudness > _FLOOR_DB:
+			gain_db = job.options.target_lufs - loudness
+	peak = float(np.abs(converted).max()) if converted.size else 0.0
+	# Never push the peak past the ceiling, whether the gain came from loudness or resampling overshoot.
+	gain_db = min(gain_db, job.options.peak_ceiling_dbfs - _db(peak)) if peak > 0.0 else gain_db
+	converted = converted * 10.0 ** (gain_db / 20.0)
+	payload = encode_wav_pcm16(converted, job.options.sample_rate)
+	job.output.parent.mkdir(parents=True, exist_ok=True)
+	job.output.write_bytes(payload)
+	_, written = read_wav(payload)
+	entry["output"] = {
+		"path": str(job.output),
+		"content_hash": hashlib.blake2b(payload, digest_size=16).hexdigest(),
+		"format": {"sample_rate": job.options.sample_rate, "channels": written.shape[1], "bits": 16, "float": False},
+		"gain_db": round(gain_db, 2),
+		"analysis": analyze_samples(written, job.options.sample_rate, job.options.silence_dbfs),
+	}
+	return entry
+
+
+def _load_manifest(path: Path, options_key: dict) -> dict:
+	try:
+		loaded = json.loads(path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return {}
+	if not isinstance(loaded, dict) or loaded.get("options") != options_key:
+		return {}
+	files = loaded.get("files", {})
+	return files if isinstance(files, dict) else {}
+
+
+def _entry_warnings(name: str, entry: dict, options: ConvertOptions) -> list[str]:
+	warnings: list[str] = []
+	fmt = entry["format"]
+	analysis = entry["analysis"]
+	if fmt["sample_rate"] != options.sample_rate:
+		warnings.append(f"{name}: {fmt['sample_rate']} Hz, Godot mixes at {options.sample_rate} Hz")
+	if fmt["channels"] != options.channels:
+		warnings.append(f"{name}: {fmt['channels']} channel(s), target layout is {options.channels}")
+	if analysis["peak_dbfs"] >= CLIP_DBFS:
+		warnings.append(f"{name}: peak {analysis['peak_dbfs']:.2f} dBFS is at or near clipping")
+	if analysis["leading_silence_ms"] > LEADING_SILENCE_WARN_MS:
+		warnings.append(f"{name}: {analysis['leading_silence_ms']:.1f} ms of leading silence delays hit feedback")
+	return warnings
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Report peak, RMS, BS.1770-style loudness, leading/trailing silence and duration for every SFX WAV, "
+			"and optionally convert them to one sample rate, channel layout and loudness."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--sfx-dir", default=DEFAULT_SFX_DIR, help=f"WAV directory relative to the project root (default: {DEFAULT_SFX_DIR})")
+	parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help=f"Manifest/cache path relative to the project root (default: {DEFAULT_MANIFEST})")
+	parser.add_argument("--write", action="store_true", help="Write normalized PCM16 copies to --output-dir")
+	parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help=f"Directory for --write output (default: {DEFAULT_OUTPUT_DIR})")
+	parser.add_argument("--in-place", action="store_true", help="With --write, replace the source WAVs (keeps filenames and .import sidecars)")
+	parser.add_argument("--sample-rate", type=int, default=DEFAULT_SAMPLE_RATE, help=f"Target sample rate (default: {DEFAULT_SAMPLE_RATE})")
+	parser.add_argument("--channels", type=int, choices=[1, 2], default=DEFAULT_CHANNELS, help=f"Target channel count (default: {DEFAULT_CHANNELS})")
+	parser.add_argument("--target-lufs", type=float, help="With --write, also gain-match every file to this loudness")
+	parser.add_argument(
+		"--peak-ceiling",
+		type=float,
+		default=DEFAULT_PEAK_CEILING_DBFS,
+		help=f"With --write, maximum output peak in dBFS (default: {DEFAULT_PEAK_CEILING_DBFS:g})",
+	)
+	parser.add_argument(
+		"--silence-threshold",
+		type=float,
+		default=DEFAULT_SILENCE_DBFS,
+		help=f"Level in dBFS below which leading/trailing samples count as silence (default: {DEFAULT_SILENCE_DBFS:g})",
+	)
+	parser.add_argument("--force", action="store_true", help="Reprocess every file even if its content hash is unchanged")
+	parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = CPU count)")
+	parser.add_argument("--strict", action="store_true", help="Fail on warnings (format mismatch, clipping, leading silence)")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root).resolve()
+	sfx_dir = project_root / args.sfx_dir
+	if not sfx_dir.is_dir():
+		print(f"SFX directory not found: {sfx_dir}", file=sys.stderr)
+		return 1
+	options = ConvertOptions(
+		sample_rate=args.sample_rate,
+		channels=args.channels,
+		target_lufs=args.target_lufs if args.write else None,
+		peak_ceiling_dbfs=args.peak_ceiling,
+		silence_dbfs=args.silence_threshold,
+	)
+	output_dir = sfx_dir if args.in_place else Path(args.output_dir)
+	manifest_path = project_root / args.manifest
+	options_key = {**options.key(), "write": args.write, "output_dir": str(output_dir) if args.write else None}
+	previous = {} if args.force else _load_manifest(manifest_path, options_key)
+	hashes = FileHashCache(manifest_path.parent / _HASH_CACHE_NAME)
+
+	sources = sorted(sfx_dir.glob("*.wav"))
+	digests = {source.name: hashes.hash_file(source) for source in sources}
+	entries: dict[str, dict] = {}
+	pending: list[SfxJob] = []
+	for source in sources:
+		cached = previous.get(source.name)
+		output = output_dir / source.name if args.write else None
+		up_to_date = isinstance(cached, dict) and "error" not in cached and digests[source.name] in (
+			cached.get("content_hash"),
+			cached.get("output", {}).get("content_hash"),
+		)
+		if up_to_date and output is not None and not args.in_place:
+			up_to_date = output.exists() and hashes.hash_file(output) == cached.get("output", {}).get("content_hash")
+		if up_to_date:
+			entries[source.name] = cached
+		else:
+			pending.append(SfxJob(source=source, output=output, options=options))
+
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+	if jobs == 1 or len(pending) <= 1:
+		outcomes = [process_sfx(job) for job in pending]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			outcomes = list(pool.map(process_sfx, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+	for job, outcome in zip(pending, outcomes):
+		outcome["content_hash"] = digests[job.source.name]
+		if args.in_place and "output" in outcome:
+			# The source is now the converted file: describe (and hash) that file so later runs that reuse
+			# this entry warn about what is on disk, keeping the pre-conversion data for reference.
+			outcome["converted_from"] = {"format": outcome["format"], "analysis": outcome["analysis"]}
+			outcome["format"] = outcome["output"]["format"]
+			outcome["analysis"] = outcome["output"]["analysis"]
+			outcome["content_hash"] = hashes.hash_file(job.source)
+		entries[job.source.name] = outcome
+	hashes.save()
+	manifest_path.parent.mkdir(parents=True, exist_ok=True)
+	manifest = {"options": options_key, "files": {name: entries[name] for name in sorted(entries)}}
+	manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+	elapsed = time.perf_counter() - started
+
+	errors = [f"{name}: {entry['error']}" for name, entry in sorted(entries.items()) if "error" in entry]
+	warnings = [
+		warning
+		for name, entry in sorted(entries.items())
+		if "error" not in entry
+		for warning in _entry_warnings(name, entry, options)
+	]
+	failed = bool(errors) or (args.strict and bool(warnings))
+
+	if args.format == "json":
+		payload = {
+			"sfx_dir": str(sfx_dir),
+			"manifest": str(manifest_path),
+			"processed": [job.source.name for job in pending],
+			"reused": len(entries) - len(pending),
+			"files": manifest["files"],
+			"warnings": warnings,
+			"errors": errors,
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2))
+		return 1 if failed else 0
+
+	print(
+		f"SFX: {len(entries)} file(s) in {args.sfx_dir}, {len(pending)} processed, "
+		f"{len(entries) - len(pending)} unchanged ({elapsed * 1000.0:.1f} ms)"
+	)
+	for name, entry in sorted(entries.items()):
+		if "error" in entry:
+			continue
+		fmt = entry["format"]
+		analysis = entry["analysis"]
+		line = (
+			f"  {name}: {fmt['sample_rate']} Hz {fmt['channels']}ch {fmt['bits']}-bit "
+			f"{analysis['duration_seconds'] * 1000.0:.0f} ms, peak {analysis['peak_dbfs']:.1f} dBFS, "
+			f"RMS {analysis['rms_dbfs']:.1f} dBFS, {analysis['loudness_lufs']:.1f} LUFS, "
+			f"silence {analysis['leading_silence_ms']:.1f}/{analysis['trailing_silence_ms']:.1f} ms"
+		)
+		if "output" in entry:
+			output = entry["output"]
+			line += f" -> {output['analysis']['loudness_lufs']:.1f} LUFS ({output['gain_db']:+.1f} dB)"
+		print(line)
+	if args.write:
+		print(f"Output: {output_dir}")
+	for error in errors:
+		print(f"  - {error}")
+	for warning in warnings:
+		print(f"  ~ {warning}")
+	print(f"Manifest: {manifest_path}")
+	print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,832 @@
+#!/usr/bin/env python3
+"""Local asyncio HTTP ingest for match and menu telemetry from playtest machines.
+
+	POST /ingest       newline-delimited records exactly as Match.gd/Menu.gd append them (gzip accepted)
+	GET  /aggregates   funnel, matchup and frame-time aggregates in review_match_metrics' JSON shape
+	                   (optional ?match_mode=MODE, ?since=YYYY-MM-DDTHH, ?until=YYYY-MM-DDTHH)
+	GET  /health       ingest counters
+
+Accepted lines are group-committed: requests that arrive while a commit is being written (or within the
+optional --commit-interval-ms linger) share the next single append + flush (and fsync with --fsync) per
+segment file, and a request is answered only once its lines are on disk. Segments are hour partitions of the record's `timestamp_utc`, `<data-dir>/<match|menu>/<YYYY-MM-DDTHH>.jsonl`,
+so any segment (or a concatenation of them) is also a valid `review_match_metrics.py --input`. Match records
+are folded into one mergeable `RecordAggregates` per (hour, match_mode), rebuilt from the segments on start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import statistics
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import zlib
+from collections import Counter, OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from godot_resource import PROJECT_ROOT
+from review_match_metrics import RecordAggregates, _json_payload, _read_records
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_DATA_DIR = ".godot-user/telemetry"
+DEFAULT_COMMIT_INTERVAL_MS = 0.0
+DEFAULT_COMMIT_BYTES = 1 << 20
+DEFAULT_MAX_BODY_BYTES = 16 << 20
+DEFAULT_UPLOAD_BATCH = 500
+MAX_OPEN_SEGMENTS = 32
+MAX_REPORTED_ERRORS = 10
+MATCH_LOG = "match"
+MENU_LOG = "menu"
+UNTIMED_PARTITION = "untimed"
+_HEADER_LIMIT = 64 * 1024
+_PARTITION_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}")
+_REASONS = {
+	200: "OK",
+	400: "Bad Request",
+	404: "Not Found",
+	405: "Method Not Allowed",
+	411: "Length Required",
+	413: "Payload Too Large",
+	431: "Request Header Fields Too Large",
+	500: "Internal Server Error",
+}
+
+
+def classify_record(record: dict[str, Any]) -> str:
+	"""`menu` for Menu.gd navigation events (they carry `event` and no `match_mode`), otherwise `match`."""
+	return MENU_LOG if "event" in record and "match_mode" not in record else MATCH_LOG
+
+
+def partition_for(record: dict[str, Any]) -> str:
+	timestamp = str(record.get("timestamp_utc", ""))
+	return timestamp[:13] if _PARTITION_PATTERN.match(timestamp) else UNTIMED_PARTITION
+
+
+def _partition_in_range(partition: str, since: str, until: str) -> bool:
+	if partition == UNTIMED_PARTITION:
+		return not since and not until
+	if since and partition[: len(since)] < since:
+		return False
+	return not until or partition[: len(until)] <= until
+
+
+class _ScratchAggregates:
+	"""Per-request (or per-segment) match aggregates that reject records the accumulators cannot take.
+
+	A record with wrong field types (`"rep_start_count": null`) can fail part-way through the accumulators.
+	Its key keeps accepting records (validation does not depend on the partial counts) and is rebuilt once,
+	from the accepted records, in `finish`.
+	"""
+
+	def __init__(self, server: "IngestServer") -> None:
+		self._server = server
+		self.aggregates: dict[tuple[str, str], RecordAggregates] = {}
+		self._accepted: dict[tuple[str, str], list[dict[str, Any]]] = {}
+		self._dirty: set[tuple[str, str]] = set()
+
+	def add(self, record: dict[str, Any]) -> str:
+		"""Fold one match record; returns a problem description instead of raising."""
+		key = (partition_for(record), str(record.get("match_mode", "")))
+		aggregates = self.aggregates.get(key)
+		if aggregates is None:
+			aggregates = self.aggregates[key] = self._server._new_aggregates()
+		try:
+			aggregates.add([record])
+		except Exception as exc:
+			self._dirty.add(key)
+			return f"unusable record ({type(exc).__name__}: {exc})"
+		self._accepted.setdefault(key, []).append(record)
+		return ""
+
+	def finish(self) -> dict[tuple[str, str], RecordAggregates]:
+		for key in self._dirty:
+			self.aggregates[key] = self._server._new_aggregates()
+			if self._accepted.get(key):
+				self.aggregates[key].add(self._accepted[key])
+		self._dirty.clear()
+		return self.aggregates
+
+
+@dataclass
+class _PendingBatch:
+	lines: list[tuple[str, bytes]]
+	aggregates: dict[tuple[str, str], RecordAggregates]
+	menu_events: list[str]
+	done: asyncio.Future
+
+
+@dataclass
+class IngestStats:
+	accepted: int = 0
+	rejected: int = 0
+	requests: int = 0
+	commits: int = 0
+	committed_bytes: int = 0
+	replayed: int = 0
+	replay_rejected: int = 0
+	menu_events: Counter = field(default_factory=Counter)
+
+
+class IngestServer:
+	"""Segment writer plus in-memory aggregates behind a minimal HTTP/1.1 keep-alive server."""
+
+	def __init__(
+		self,
+		data_dir: Path,
+		*,
+		commit_interval: float = DEFAULT_COMMIT_INTERVAL_MS / 1000.0,
+		commit_bytes: int = DEFAULT_COMMIT_BYTES,
+		max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+		reason_capacity: int | None = None,
+		fsync: bool = False,
+	) -> None:
+		self.data_dir = data_dir
+		self.commit_interval = max(0.0, commit_interval)
+		self.commit_bytes = max(1, commit_bytes)
+		self.max_body_bytes = max_body_bytes
+		self.reason_capacity = reason_capacity
+		self.fsync = fsync
+		self.stats = IngestStats()
+		self.replay_errors: list[str] = []
+		self.partitions: dict[tuple[str, str], RecordAggregates] = {}
+		self.source = str(data_dir)
+		self._segments: OrderedDict[str, Any] = OrderedDict()
+		self._pending: list[_PendingBatch] = []
+		self._pending_bytes = 0
+		self._wakeup: asyncio.Event | None = None
+		self._full: asyncio.Event | None = None
+		self._committer: asyncio.Task | None = None
+		self._closing = False
+		self._server: asyncio.Server | None = None
+		self._started = time.monotonic()
+
+	def _new_aggregates(self) -> RecordAggregates:
+		return RecordAggregates() if self.reason_capacity is None else RecordAggregates(self.reason_capacity)
+
+	def _fold(self, scratch: dict[tuple[str, str], RecordAggregates]) -> None:
+		for key, other in scratch.items():
+			aggregates = self.partitions.get(key)
+			if aggregates is None:
+				aggregates = self.partitions[key] = self._new_aggregates()
+			aggregates.merge(other)
+
+	def _replay_error(self, segment: Path, line_number: int, problem: str) -> None:
+		self.stats.replay_rejected += 1
+		if len(self.replay_errors) < MAX_REPORTED_ERRORS:
+			self.replay_errors.append(f"{segment}:{line_number}: {problem}")
+
+	def replay(self) -> None:
+		"""Rebuild aggregates and menu counters from segments written by earlier runs.
+
+		Lines that do not decode or do not fold are skipped and counted in `stats.replay_rejected`
+		(the first few are kept in `replay_errors`), so one bad line never keeps the server from starting.
+		"""
+		for log in (MATCH_LOG, MENU_LOG):
+			for segment in sorted((self.data_dir / log).glob("*.jsonl")):
+				scratch = _ScratchAggregates(self)
+				for line_number, line in enumerate(segment.read_bytes().split(b"\n"), start=1):
+					if not line.strip():
+						continue
+					try:
+						record = json.loads(line)
+					except ValueError as exc:
+						self._replay_error(segment, line_number, f"invalid JSON ({exc})")
+						continue
+					if not isinstance(record, dict):
+						self._replay_error(segment, line_number, "record is not an object")
+						continue
+					if log == MENU_LOG:
+						self.stats.menu_events[str(record.get("event", ""))] += 1
+					else:
+						problem = scratch.add(record)
+						if problem:
+							self._replay_error(segment, line_number, problem)
+							continue
+					self.stats.replayed += 1
+				self._fold(scratch.finish())
+
+	async def start(self, host: str, port: int) -> tuple[str, int]:
+		self._wakeup = asyncio.Event()
+		self._full = asyncio.Event()
+		self._committer = asyncio.create_task(self._commit_loop())
+		self._server = await asyncio.start_server(self._handle_connection, host, port, limit=_HEADER_LIMIT)
+		address = self._server.sockets[0].getsockname()
+		self.source = f"http://{address[0]}:{address[1]}"
+		return address[0], address[1]
+
+	async def serve_forever(self) -> None:
+		async with self._server:
+			await self._server.serve_forever()
+
+	async def close(self) -> None:
+		if self._server is not None:
+			self._server.close()
+			await self._server.wait_closed()
+		if self._committer is not None:
+			# Let the committer finish the commit it may be writing and drain what is queued, rather than
+			# cancelling it mid-write and leaving those requests unanswered.
+			self._closing = True
+			self._wakeup.set()
+			await self._committer
+		elif self._pending:
+			await self._commit(self._take_pending())
+		for handle in self._segments.values():
+			handle.close()
+		self._segments.clear()
+
+	# Group commit -----------------------------------------------------------------------------------
+
+	def _enqueue(self, batch: _PendingBatch) -> None:
+		self._pending.append(batch)
+		self._pending_bytes += sum(len(line) for _, line in batch.lines)
+		self._wakeup.set()
+		if self._pending_bytes >= self.commit_bytes:
+			self._full.set()
+
+	def _take_pending(self) -> list[_PendingBatch]:
+		batches, self._pending = self._pending, []
+		self._pending_bytes = 0
+		self._wakeup.clear()
+		self._full.clear()
+		return batches
+
+	async def _commit_loop(self) -> None:
+		while not self._closing or self._pending:
+			await self._wakeup.wait()
+			# Whatever queues up while this commit is on disk forms the next group; the optional linger widens it.
+			if self.commit_interval > 0.0 and not self._full.is_set() and not self._closing:
+				with suppress(asyncio.TimeoutError):
+					await asyncio.wait_for(self._full.wait(), self.commit_interval)
+			await self._commit(self._take_pending())
+
+	async def _commit(self, batches: list[_PendingBatch]) -> None:
+		if not batches:
+			return
+		by_segment: dict[str, list[bytes]] = {}
+		for batch in batches:
+			for segment, line in batch.lines:
+				by_segment.setdefault(segment, []).append(line)
+		try:
+			written = await asyncio.to_thread(self._write_segments, by_segment)
+			self.stats.commits += 1
+			self.stats.committed_bytes += written
+			for batch in batches:
+				self._fold(batch.aggregates)
+				self.stats.menu_events.update(batch.menu_events)
+				if not batch.done.done():
+					batch.done.set_result(None)
+		except (Exception, asyncio.CancelledError) as exc:
+			# Fail this group's requests but keep the commit loop alive for the next one.
+			error = exc if isinstance(exc, Exception) else RuntimeError("commit cancelled")
+			for batch in batches:
+				if not batch.done.done():
+					batch.done.set_exception(error)
+			if isinstance(exc, asyncio.CancelledError):
+				raise
+
+	def _write_segments(self, by_segment: dict[str, list[bytes]]) -> int:
+		"""Append one group to its segments, all or nothing.
+
+		If any segment write fails, the segments this group already appended to are truncated back, so a
+		500 means none of the request's lines were kept and a client retry cannot duplicate them.
+		"""
+		written = 0
+		appended: list[tuple[Any, int]] = []
+		try:
+			for segment, lines in by_segment.items():
+				handle = self._segment_handle(segment)
+				appended.append((handle, handle.tell()))
+				payload = b"".join(lines)
+				handle.write(payload)
+				handle.flush()
+				if self.fsync:
+					os.fsync(handle.fileno())
+				written += len(payload)
+		except OSError:
+			for handle, offset in appended:
+				with suppress(OSError):
+					handle.truncate(offset)
+					handle.flush()
+			raise
+		return written
+
+	def _segment_handle(self, segment: str):
+		handle = self._segments.get(segment)
+		if handle is not None:
+			self._segments.move_to_end(segment)
+			return handle
+		path = self.data_dir / segment
+		path.parent.mkdir(parents=True, exist_ok=True)
+		handle = self._segments[segment] = path.open("ab")
+		while len(self._segments) > MAX_OPEN_SEGMENTS:
+			_, oldest = self._segments.popitem(last=False)
+			oldest.close()
+		return handle
+
+	# HTTP -------------------------------------------------------------------------------------------
+
+	async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		try:
+			while True:
+				try:
+					head = await reader.readuntil(b"\r\n\r\n")
+				except asyncio.IncompleteReadError:
+					break
+				except asyncio.LimitOverrunError:
+					await self._respond(writer, 431, {"error": "request headers too large"}, keep_alive=False)
+					break
+				request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+				try:
+					method, target, version = request_line.split(" ", 2)
+				except ValueError:
+					await self._respond(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+					break
+				headers: dict[str, str] = {}
+				for header_line in header_lines:
+					name, _, value = header_line.partition(":")
+					headers[name.strip().lower()] = value.strip()
+				connection = headers.get("connection", "").lower()
+				keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+				if "transfer-encoding" in headers:
+					await self._respond(writer, 411, {"error": "send a Content-Length body"}, keep_alive=False)
+					break
+				try:
+					length = int(headers.get("content-length", "0"))
+				except ValueError:
+					length = -1
+				if length < 0 or length > self.max_body_bytes:
+					await self._respond(writer, 413, {"error": f"body limit is {self.max_body_bytes} bytes"}, keep_alive=False)
+					break
+				body = await reader.readexactly(length) if length else b""
+				status, payload = await self._route(method, target, headers, body)
+				await self._respond(writer, status, payload, keep_alive=keep_alive)
+				if not keep_alive:
+					break
+		except (ConnectionError, asyncio.IncompleteReadError):
+			pass
+		finally:
+			writer.close()
+			with suppress(ConnectionError):
+				await writer.wait_closed()
+
+	async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: dict[str, Any], *, keep_alive: bool) -> None:
+		body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+		writer.write(
+			(
+				f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+				"Content-Type: application/json\r\n"
+				f"Content-Length: {len(body)}\r\n"
+				f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+			).encode("latin-1")
+			+ body
+		)
+		await writer.drain()
+
+	async def _route(self, method: str, target: str, headers: dict[str, str], body: bytes) -> tuple[int, dict[str, Any]]:
+		url = urlsplit(target)
+		routes = {"/ingest": "POST", "/aggregates": "GET", "/health": "GET"}
+		if url.path not in routes:
+			return 404, {"error": f"unknown path {url.path}"}
+		if method != routes[url.path]:
+			return 405, {"error": f"{url.path} expects {routes[url.path]}"}
+		if url.path == "/ingest":
+			return await self._ingest(headers, body)
+		query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+		if url.path == "/aggregates":
+			return 200, self.aggregates(query.get("match_mode", ""), query.get("since", ""), query.get("until", ""))
+		return 200, self.health()
+
+	async def _ingest(self, headers: dict[str, str], body: bytes) -> tuple[int, dict[str, Any]]:
+		self.stats.requests += 1
+		if headers.get("content-encoding", "").lower() == "gzip":
+			inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+			try:
+				body = inflater.decompress(body, self.max_body_bytes + 1)
+			except zlib.error as exc:
+				return 400, {"error": f"invalid gzip body: {exc}"}
+			if len(body) > self.max_body_bytes or inflater.unconsumed_tail:
+				return 413, {"error": f"inflated body limit is {self.max_body_bytes} bytes"}
+		lines: list[tuple[str, bytes]] = []
+		scratch = _ScratchAggregates(self)
+		menu_events: list[str] = []
+		errors: list[str] = []
+		rejected = 0
+		for line_number, raw in enumerate(body.split(b"\n"), start=1):
+			line = raw.strip()
+			if not line:
+				continue
+			try:
+				record = json.loads(line)
+			except ValueError as exc:
+				record, problem = None, f"invalid JSON ({exc})"
+			else:
+				problem = ""
+			if record is not None and not isinstance(record, dict):
+				problem = "record is not an object"
+			elif record is not None and not isinstance(record.get("schema_version"), (int, float)):
+				problem = "missing schema_version"
+			elif record is not None and classify_record(record) == MATCH_LOG:
+				# Folded before it is queued, so a record the aggregates cannot take is rejected, never written.
+				problem = scratch.add(record)
+			if problem:
+				rejected += 1
+				if len(errors) < MAX_REPORTED_ERRORS:
+					errors.append(f"line {line_number}: {problem}")
+				continue
+			log = classify_record(record)
+			partition = partition_for(record)
+			lines.append((f"{log}/{partition}.jsonl", line + b"\n"))
+			if log == MENU_LOG:
+				menu_events.append(str(record.get("event", "")))
+		self.stats.rejected += rejected
+		if lines:
+			done = asyncio.get_running_loop().create_future()
+			self._enqueue(_PendingBatch(lines, scratch.finish(), menu_events, done))
+			try:
+				await done
+			except Exception as exc:
+				return 500, {"error": f"commit failed: {exc}"}
+			self.stats.accepted += len(lines)
+		status = 400 if rejected and not lines else 200
+		return status, {"accepted": len(lines), "rejected": rejected, "errors": errors}
+
+	# Queries ----------------------------------------------------------------------------------------
+
+	def aggregates(self, match_mode: str = "", since: str = "", until: str = "") -> dict[str, Any]:
+		merged = self._new_aggregates()
+		selected = 0
+		for partition, mode in sorted(self.partitions):
+			if (match_mode and mode != match_mode) or not _partition_in_range(partition, since, until):
+				continue
+			merged.merge(self.partitions[(partition, mode)])
+			selected += 1
+		training_funnels, onboarding_funnels, matchups, frame_times = merged.finalize()
+		payload = _json_payload(self.source, merged.session_count, training_funnels, onboarding_funnels, matchups, frame_times)
+		payload["partitions"] = selected
+		return payload
+
+	def health(self) -> dict[str, Any]:
+		return {
+			"status": "ok",
+			"data_dir": str(self.data_dir),
+			"uptime_seconds": round(time.monotonic() - self._started, 3),
+			"requests": self.stats.requests,
+			"accepted": self.stats.accepted,
+			"rejected": self.stats.rejected,
+			"replayed": self.stats.replayed,
+			"replay_rejected": self.stats.replay_rejected,
+			"commits": self.stats.commits,
+			"committed_bytes": self.stats.committed_bytes,
+			"pending_batches": len(self._pending),
+			"partitions": len(self.partitions),
+			"menu_events": dict(self.stats.menu_events.most_common()),
+		}
+
+
+# Clients ------------------------------------------------------------------------------------------------
+
+
+def upload_lines(url: str, lines: list[bytes], *, gzip_body: bool = True, timeout: float = 30.0) -> dict[str, Any]:
+	"""POST one batch of NDJSON lines to `url`/ingest and return the server's JSON reply."""
+	body = b"".join(line if line.endswith(b"\n") else line + b"\n" for line in lines)
+	headers = {"Content-Type": "application/x-ndjson"}
+	if gzip_body:
+		compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+		body = compressor.compress(body) + compressor.flush()
+		headers["Content-Encoding"] = "gzip"
+	request = urllib.request.Request(f"{url.rstrip('/')}/ingest", data=body, headers=headers, method="POST")
+	try:
+		with urllib.request.urlopen(request, timeout=timeout) as response:
+			return json.loads(response.read())
+	except urllib.error.HTTPError as exc:
+		return json.loads(exc.read() or b"{}") | {"status": exc.code}
+
+
+async def _loopback_client(host: str, port: int, batches: list[bytes], latencies: list[float]) -> int:
+	reader, writer = await asyncio.open_connection(host, port)
+	accepted = 0
+	try:
+		for body in batches:
+			started = time.perf_counter()
+			writer.write(
+				(
+					"POST /ingest HTTP/1.1\r\n"
+					f"Host: {host}\r\n"
+					"Content-Type: application/x-ndjson\r\n"
+					f"Content-Length: {len(body)}\r\n\r\n"
+				).encode("latin-1")
+				+ body
+			)
+			await writer.drain()
+			head = await reader.readuntil(b"\r\n\r\n")
+			length = int(re.search(rb"(?i)content-length:\s*(\d+)", head).group(1))
+			reply = json.loads(await reader.readexactly(length))
+			latencies.append(time.perf_counter() - started)
+			if not head.startswith(b"HTTP/1.1 200"):
+				raise RuntimeError(f"ingest failed: {head.splitlines()[0].decode()} {reply}")
+			accepted += int(reply["accepted"])
+	finally:
+		writer.close()
+		with suppress(ConnectionError):
+			await writer.wait_closed()
+	return accepted
+
+
+def _synthetic_line(index: int) -> bytes:
+	"""A Match.gd-shaped training session record; deterministic so loopback runs are comparable."""
+	drill_id = ("anti_air", "punish", "whiff_punish")[index % 3]
+	starts = 3 + index % 5
+	results = starts - index % 2
+	successes = results - index % 3 if results > index % 3 else 0
+	counts = [0] * 74
+	counts[33 + index % 4] = 600
+	counts[40 + index % 7] = 3 + index % 5
+	record = {
+		"schema_version": 4,
+		"timestamp_utc": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(1_790_000_000 + index * 97)),
+		"build_id": "loopback",
+		"install_id": f"loopback-{index % 40:02d}",
+		"match_mode": ("training", "versus", "story")[index % 3],
+		"result": ("p1_win", "p2_win", "draw", "session_exit")[index % 4],
+		"exit_reason": "match_end",
+		"match_elapsed_seconds": 40.0 + index % 60,
+		"stage_id": "main/default",
+		"p1_character_id": ("ryu", "mai", "zed")[index % 3],
+		"p2_character_id": ("mai", "zed", "ryu", "ryu")[index % 4],
+		"frame_times": {
+			"version": 1,
+			"bucket_base_ms": 1.0,
+			"buckets_per_octave": 8,
+			"counts": counts,
+			"frame_count": sum(counts),
+			"total_ms": sum(counts) * 16.6,
+			"max_ms": 60.0 + index % 30,
+			"over_16_7ms": 3 + index % 5,
+			"over_33ms": 1,
+			"worst_hitches": [{"frame_ms": 60.0 + index % 30, "elapsed_seconds": float(index % 50), "unix_time": 0.0}],
+		},
+		"training_drill_funnels": {
+			drill_id: {
+				"rep_start_count": starts,
+				"rep_result_count": results,
+				"success_count": successes,
+				"fail_count": results - successes,
+				"reset_count": index % 2,
+				"avg_result_seconds": 2.5,
+				"avg_success_seconds": 2.0,
+				"avg_fail_seconds": 3.0,
+				"avg_closest_blast_margin_px": float(index % 12),
+				"closest_blast_margin_sample_count": 1,
+				"reason_counts": {("late", "early", "blocked", f"r{index % 97}")[index % 4]: 1},
+				"last_result": "success",
+				"last_reason": "late",
+			}
+		},
+		"onboarding_lesson_funnels": {},
+		"onboarding": {"version": 1, "started": index % 5 == 0, "completed": index % 10 == 0, "skipped": False},
+	}
+	return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _comparable(payload: dict[str, Any]) -> str:
+	"""Aggregates with float noise and commit-order-dependent `last_*` fields removed."""
+
+	def strip(value: Any) -> Any:
+		if isinstance(value, dict):
+			return {key: strip(item) for key, item in value.items() if key not in ("last_result", "last_reason")}
+		if isinstance(value, list):
+			return [strip(item) for item in value]
+		if isinstance(value, float):
+			return round(value, 6)
+		return value
+
+	keys = ("session_count", "training_drill_funnels", "onboarding_lesson_funnels", "matchups", "frame_times")
+	return json.dumps({key: strip(payload[key]) for key in keys}, sort_keys=True)
+
+
+async def _run_loopback(args: argparse.Namespace) -> int:
+	if args.source:
+		lines = [line + b"\n" for line in Path(args.source).read_bytes().splitlines() if line.strip()]
+	else:
+		lines = [_synthetic_line(index) for index in range(args.loopback_records)]
+	batch_size = max(1, args.batch)
+	bodies = [b"".join(lines[start : start + batch_size]) for start in range(0, len(lines), batch_size)]
+	clients = max(1, min(args.loopback_clients, len(bodies)))
+	latencies: list[float] = []
+	with tempfile.TemporaryDirectory(prefix="ffc-ingest-") as temp_dir:
+		data_dir = Path(temp_dir)
+		# Exact reason counters so the aggregates can be compared field for field with a file re-read.
+		server = IngestServer(
+			data_dir,
+			commit_interval=args.commit_interval_ms / 1000.0,
+			commit_bytes=args.commit_bytes,
+			reason_capacity=0,
+			fsync=args.fsync,
+		)
+		host, port = await server.start(DEFAULT_HOST, 0)
+		started = time.perf_counter()
+		accepted = sum(
+			await asyncio.gather(
+				*(_loopback_client(host, port, bodies[index::clients], latencies) for index in range(clients))
+			)
+		)
+		elapsed = time.perf_counter() - started
+		served = server.aggregates()
+		await server.close()
+		stats = server.stats
+		records = [
+			record
+			for segment in sorted((data_dir / MATCH_LOG).glob("*.jsonl"))
+			for record in _read_records(segment, 0)
+		]
+		reread = RecordAggregates(0)
+		reread.add(records)
+		expected = _json_payload(data_dir, reread.session_count, *reread.finalize())
+		replayed = IngestServer(data_dir, reason_capacity=0)
+		replayed.replay()
+		consistent = _comparable(served) == _comparable(expected) == _comparable(replayed.aggregates())
+		segment_count = sum(1 for _ in data_dir.glob("*/*.jsonl"))
+	result = {
+		"records_sent": len(lines),
+		"records_accepted": accepted,
+		"requests": len(bodies),
+		"clients": clients,
+		"elapsed_seconds": round(elapsed, 4),
+		"records_per_second": round(accepted / elapsed, 1) if elapsed > 0 else 0.0,
+		"commits": stats.commits,
+		"records_per_commit": round(accepted / stats.commits, 1) if stats.commits else 0.0,
+		"segments": segment_count,
+		"latency_p50_ms": round(statistics.median(latencies) * 1000.0, 2) if latencies else 0.0,
+		"latency_max_ms": round(max(latencies) * 1000.0, 2) if latencies else 0.0,
+		"aggregates_consistent": consistent,
+	}
+	failed = not consistent or accepted != len(lines)
+	if args.format == "json":
+		print(json.dumps(result, indent=2))
+	else:
+		print(
+			f"Loopback: {accepted}/{len(lines)} record(s) in {len(bodies)} request(s) from {clients} client(s), "
+			f"{result['records_per_second']:.0f} records/s ({elapsed * 1000.0:.1f} ms)"
+		)
+		print(
+			f"  {stats.commits} commit(s), {result['records_per_commit']:.1f} records/commit, {segment_count} segment(s), "
+			f"request latency p50 {result['latency_p50_ms']:.2f} ms, max {result['latency_max_ms']:.2f} ms"
+		)
+		if not consistent:
+			print("  - served aggregates differ from a re-read of the written segments")
+		print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+def _run_upload(args: argparse.Namespace) -> int:
+	totals = {"accepted": 0, "rejected": 0}
+	for upload in args.upload:
+		path = Path(upload).expanduser()
+		try:
+			lines = [line for line in path.read_bytes().splitlines() if line.strip()]
+		except OSError as exc:
+			print(f"Cannot read {path}: {exc}", file=sys.stderr)
+			return 1
+		for start in range(0, len(lines), max(1, args.batch)):
+			try:
+				reply = upload_lines(args.url, lines[start : start + max(1, args.batch)])
+			except (urllib.error.URLError, OSError, ValueError) as exc:
+				print(f"Upload to {args.url} failed: {exc}", file=sys.stderr)
+				return 1
+			totals["accepted"] += int(reply.get("accepted", 0))
+			totals["rejected"] += int(reply.get("rejected", 0))
+			for error in reply.get("errors", []):
+				print(f"  ~ {path.name} batch {start // max(1, args.batch) + 1} {error}")
+		print(f"Uploaded {path}: {len(lines)} line(s)")
+	print(f"Accepted: {totals['accepted']}, rejected: {totals['rejected']}")
+	return 1 if totals["rejected"] else 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Collect match/menu telemetry from playtest machines over HTTP into hour-partitioned segment files, "
+			"keeping funnel aggregates in memory for review_match_metrics.py --server."
+		)
+	)
+	parser.add_argument("--host", default=DEFAULT_HOST, help=f"Listen address (default: {DEFAULT_HOST}; use 0.0.0.0 for the LAN)")
+	parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Listen port (default: {DEFAULT_PORT})")
+	parser.add_argument(
+		"--data-dir",
+		default=str(PROJECT_ROOT / DEFAULT_DATA_DIR),
+		help=f"Segment directory (default: <repo>/{DEFAULT_DATA_DIR})",
+	)
+	parser.add_argument(
+		"--commit-interval-ms",
+		type=float,
+		default=DEFAULT_COMMIT_INTERVAL_MS,
+		help=(
+			"Extra time to wait for more requests before each group commit; 0 commits at once and lets requests "
+			f"that arrive during a write share the next one (default: {DEFAULT_COMMIT_INTERVAL_MS:g})"
+		),
+	)
+	parser.add_argument(
+		"--commit-bytes",
+		type=int,
+		default=DEFAULT_COMMIT_BYTES,
+		help=f"Commit early once this many bytes are pending (default: {DEFAULT_COMMIT_BYTES})",
+	)
+	parser.add_argument("--fsync", action="store_true", help="fsync segments before acknowledging a commit")
+	parser.add_argument(
+		"--reason-capacity",
+		type=int,
+		help="Distinct reasons tracked per funnel counter (default: review_match_metrics.py's; 0 = exact)",
+	)
+	parser.add_argument(
+		"--upload",
+		action="append",
+		default=[],
+		metavar="JSONL",
+		help="Client mode: send a local match_metrics.jsonl/menu_metrics.jsonl to --url instead of serving (repeatable)",
+	)
+	parser.add_argument("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", help="Client mode: ingest server URL")
+	parser.add_argument(
+		"--batch",
+		type=int,
+		default=DEFAULT_UPLOAD_BATCH,
+		help=f"Client and loopback modes: records per request (default: {DEFAULT_UPLOAD_BATCH})",
+	)
+	parser.add_argument(
+		"--loopback",
+		action="store_true",
+		help=(
+			"Start a server on an ephemeral loopback port with a temporary data dir, post records from concurrent "
+			"clients, report throughput and check the served aggregates against a re-read of the segments"
+		),
+	)
+	parser.add_argument("--loopback-records", type=int, default=20000, help="Loopback mode: synthetic records to send (default: 20000)")
+	parser.add_argument("--loopback-clients", type=int, default=8, help="Loopback mode: concurrent client connections (default: 8)")
+	parser.add_argument("--source", default="", help="Loopback mode: send this JSONL file instead of synthetic records")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+async def _serve(args: argparse.Namespace) -> int:
+	server = IngestServer(
+		Path(args.data_dir),
+		commit_interval=args.commit_interval_ms / 1000.0,
+		commit_bytes=args.commit_bytes,
+		reason_capacity=args.reason_capacity,
+		fsync=args.fsync,
+	)
+	started = time.perf_counter()
+	try:
+		server.replay()
+	except (OSError, ValueError) as exc:
+		print(f"Cannot replay segments in {args.data_dir}: {exc}", file=sys.stderr)
+		return 1
+	if server.stats.replay_rejected:
+		print(f"Skipped {server.stats.replay_rejected} unusable segment line(s):", file=sys.stderr)
+		for error in server.replay_errors:
+			print(f"  {error}", file=sys.stderr)
+	host, port = await server.start(args.host, args.port)
+	# SIGTERM (service managers, `kill`) shuts down like Ctrl-C: pending commits are flushed and segments closed.
+	with suppress(NotImplementedError):
+		asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+	print(
+		f"Ingest: http://{host}:{port} -> {args.data_dir} "
+		f"({server.stats.replayed} record(s) replayed in {(time.perf_counter() - started) * 1000.0:.1f} ms)",
+		flush=True,
+	)
+	try:
+		await server.serve_forever()
+	except asyncio.CancelledError:
+		pass
+	finally:
+		await server.close()
+	return 0
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	if args.upload:
+		return _run_upload(args)
+	try:
+		return asyncio.run(_run_loopback(args) if args.loopback else _serve(args))
+	except KeyboardInterrupt:
+		return 0
+	except OSError as exc:
+		print(f"Ingest server failed: {exc}", file=sys.stderr)
+		return 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
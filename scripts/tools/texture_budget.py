@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Per-scene decoded texture memory from PNG headers and the res:// reference graph."""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import re
+import sys
+import time
+
+from character_exports_common import _parse_png_dimensions
+from godot_resource import PROJECT_ROOT
+from resource_graph import DEFAULT_INDEX_PATH, IMPORT_SUFFIX, ResourceGraph, load_graph
+
+
+DEFAULT_BUDGET_MIB = 16.0
+DEFAULT_TOP = 10
+BYTES_PER_PIXEL = 4
+MIB = 1024 * 1024
+DIMENSION_CACHE_NAME = "texture_dimensions.json"
+_MIPMAPS_RE = re.compile(r"^mipmaps/generate\s*=\s*true\s*$", re.MULTILINE)
+
+
+class DimensionCache:
+	"""PNG (width, height) and mipmap flag keyed by path, reused while size and mtime are unchanged."""
+
+	def __init__(self, path: Path | None = None) -> None:
+		self.path = path
+		self.entries: dict[str, list] = {}
+		self.read_count = 0
+		self._dirty = False
+		if path is not None and path.exists():
+			try:
+				loaded = json.loads(path.read_text(encoding="utf-8"))
+			except (OSError, ValueError):
+				loaded = {}
+			if isinstance(loaded, dict):
+				self.entries = {str(key): value for key, value in loaded.items() if isinstance(value, list)}
+
+	def lookup(self, project_root: Path, rel: str) -> tuple[int, int, bool]:
+		path = project_root / rel
+		import_path = project_root / (rel + IMPORT_SUFFIX)
+		stat = path.stat()
+		import_mtime = import_path.stat().st_mtime_ns if import_path.exists() else 0
+		cached = self.entries.get(rel)
+		if cached and len(cached) == 6 and cached[:3] == [stat.st_size, stat.st_mtime_ns, import_mtime]:
+			return int(cached[3]), int(cached[4]), bool(cached[5])
+		width, height = _parse_png_dimensions(path)
+		mipmaps = bool(import_mtime) and bool(_MIPMAPS_RE.search(import_path.read_text(encoding="utf-8", errors="replace")))
+		self.entries[rel] = [stat.st_size, stat.st_mtime_ns, import_mtime, width, height, mipmaps]
+		self.read_count += 1
+		self._dirty = True
+		return width, height, mipmaps
+
+	def save(self) -> None:
+		if self.path is None or not self._dirty:
+			return
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self.path.write_text(json.dumps(self.entries, sort_keys=True) + "\n", encoding="utf-8")
+		self._dirty = False
+
+
+@dataclass(frozen=True)
+class TextureSize:
+	path: str
+	width: int
+	height: int
+	mipmaps: bool
+
+	@property
+	def bytes(self) -> int:
+		base = self.width * self.height * BYTES_PER_PIXEL
+		# A full mip chain adds a geometric series of quarter-size levels (~1/3).
+		return base + base // 3 if self.mipmaps else base
+
+
+@dataclass
+class SceneTextures:
+	scene: str
+	budget_bytes: int
+	textures: list[TextureSize] = field(default_factory=list)
+
+	@property
+	def bytes(self) -> int:
+		return sum(texture.bytes for texture in self.textures)
+
+	@property
+	def over_budget(self) -> bool:
+		return self.bytes > self.budget_bytes
+
+	def top(self, count: int) -> list[TextureSize]:
+		return sorted(self.textures, key=lambda texture: (-texture.bytes, texture.path))[:count]
+
+
+def scene_load_set(graph: ResourceGraph, scene: str) -> set[str]:
+	"""Files loaded with `scene`: scenes, resources and scripts it references, minus scripts' scene-change targets.
+
+	A `.tscn` path held by a script (e.g. `MENU_SCENE_PATH`) is loaded on transition, not with this scene.
+	"""
+	seen = {scene}
+	queue = deque(seen)
+	while queue:
+		current = queue.popleft()
+		from_script = current.endswith(".gd")
+		for target in graph.deps.get(current, ()):
+			if target in seen or (from_script and target.endswith(".tscn")):
+				continue
+			seen.add(target)
+			queue.append(target)
+	return seen
+
+
+def measure_scenes(
+	project_root: Path,
+	graph: ResourceGraph,
+	scenes: list[str],
+	budgets: dict[str, int],
+	dimensions: DimensionCache,
+) -> tuple[list[SceneTextures], list[str]]:
+	sizes: dict[str, TextureSize] = {}
+	unreadable: list[str] = []
+	results: list[SceneTextures] = []
+	for scene in scenes:
+		result = SceneTextures(scene=scene, budget_bytes=budgets[scene])
+		for rel in sorted(scene_load_set(graph, scene)):
+			if not rel.endswith(".png") or rel not in graph.files:
+				continue
+			if rel not in sizes:
+				try:
+					width, height, mipmaps = dimensions.lookup(project_root, rel)
+				except (OSError, ValueError):
+					if rel not in unreadable:
+						unreadable.append(rel)
+					continue
+				sizes[rel] = TextureSize(path=rel, width=width, height=height, mipmaps=mipmaps)
+			result.textures.append(sizes[rel])
+		results.append(result)
+	return results, unreadable
+
+
+def _parse_scene_budgets(values: list[str] | None) -> dict[str, float]:
+	budgets: dict[str, float] = {}
+	for value in values or []:
+		scene, separator, mib = value.rpartition("=")
+		if not separator or not scene:
+			raise ValueError(f"expected SCENE=MIB, got {value!r}")
+		budgets[scene.removeprefix("res://")] = float(mib)
+	return budgets
+
+
+def _format_mib(value: int) -> str:
+	return f"{value / MIB:.2f} MiB"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Size every PNG each scene loads (through .tscn/.tres/.gd references) from its header and report "
+			"decoded RGBA bytes per scene against a memory budget."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument("--scene", action="append", help="Scene to measure, relative to the project root (default: scenes/**/*.tscn)")
+	parser.add_argument(
+		"--budget-mib",
+		type=float,
+		default=DEFAULT_BUDGET_MIB,
+		help=f"Decoded texture budget per scene in MiB (default: {DEFAULT_BUDGET_MIB:g})",
+	)
+	parser.add_argument(
+		"--scene-budget",
+		action="append",
+		metavar="SCENE=MIB",
+		help="Per-scene budget override, e.g. scenes/Main.tscn=12 (repeatable)",
+	)
+	parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"Largest textures to list (default: {DEFAULT_TOP})")
+	parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Cached reference index relative to the project root")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root).resolve()
+	try:
+		overrides = _parse_scene_budgets(args.scene_budget)
+	except ValueError as exc:
+		print(f"--scene-budget: {exc}", file=sys.stderr)
+		return 1
+	index_path = project_root / args.index
+	graph, _ = load_graph(project_root, index_path)
+	if args.scene:
+		scenes = [scene.removeprefix("res://") for scene in args.scene]
+		missing = [scene for scene in scenes if scene not in graph.files]
+		if missing:
+			print(f"Scene not found: {', '.join(missing)}", file=sys.stderr)
+			return 1
+	else:
+		scenes = sorted(rel for rel in graph.files if rel.startswith("scenes/") and rel.endswith(".tscn"))
+	budgets = {scene: int(overrides.get(scene, args.budget_mib) * MIB) for scene in scenes}
+
+	dimensions = DimensionCache(index_path.parent / DIMENSION_CACHE_NAME)
+	results, unreadable = measure_scenes(project_root, graph, scenes, budgets, dimensions)
+	dimensions.save()
+	elapsed = time.perf_counter() - started
+
+	textures: dict[str, TextureSize] = {}
+	users: dict[str, list[str]] = {}
+	for result in results:
+		for texture in result.textures:
+			textures[texture.path] = texture
+			users.setdefault(texture.path, []).append(result.scene)
+	offenders = sorted(textures.values(), key=lambda texture: (-texture.bytes, texture.path))[: max(0, args.top)]
+	failed = any(result.over_budget for result in results) or bool(unreadable)
+
+	if args.format == "json":
+		payload = {
+			"scenes": [
+				{
+					"scene": result.scene,
+					"textures": len(result.textures),
+					"bytes": result.bytes,
+					"budget_bytes": result.budget_bytes,
+					"over_budget": result.over_budget,
+					"top": [texture.path for texture in result.top(5)],
+				}
+				for result in results
+			],
+			"top_textures": [
+				{
+					"path": texture.path,
+					"width": texture.width,
+					"height": texture.height,
+					"mipmaps": texture.mipmaps,
+					"bytes": texture.bytes,
+					"scenes": users[texture.path],
+				}
+				for texture in offenders
+			],
+			"unreadable": unreadable,
+			"header_reads": dimensions.read_count,
+			"elapsed_seconds": round(elapsed, 4),
+		}
+		print(json.dumps(payload, indent=2))
+		return 1 if failed else 0
+
+	print(
+		f"Texture budget: {len(scenes)} scene(s), {len(textures)} texture(s), "
+		f"{dimensions.read_count} header read(s) ({elapsed * 1000.0:.1f} ms)"
+	)
+	for result in sorted(results, key=lambda item: -item.bytes):
+		status = "OVER" if result.over_budget else "ok"
+		print(
+			f"  {result.scene}: {len(result.textures)} texture(s), {_format_mib(result.bytes)} "
+			f"/ {_format_mib(result.budget_bytes)} {status}"
+		)
+	if offenders:
+		print("Top textures:")
+		for texture in offenders:
+			mip = " +mips" if texture.mipmaps else ""
+			print(
+				f"  {texture.path}: {texture.width}x{texture.height}{mip} {texture.bytes / 1024.0:.1f} KiB "
+				f"({len(users[texture.path])} scene(s))"
+			)
+	for result in results:
+		if result.over_budget:
+			over = result.bytes - result.budget_bytes
+			largest = ", ".join(Path(texture.path).name for texture in result.top(3))
+			print(f"  - {result.scene} exceeds its budget by {_format_mib(over)} (largest: {largest})")
+	for rel in unreadable:
+		print(f"  - unreadable PNG header: {rel}")
+	print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
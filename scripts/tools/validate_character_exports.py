@@ -4,10 +4,31 @@
 from __future__ import annotations
 
 import argparse
+from datetime import datetime
+import json
 import sys
+import time
 from pathlib import Path
 
-from character_exports_common import scan_character_exports
+from character_exports_common import (
+	ScanResult,
+	build_manifest_dict,
+	exports_dir_error,
+	hash_scan_frames,
+	infer_character_id,
+	scan_character_exports,
+	write_json_if_changed,
+)
+from export_watch import (
+	DEFAULT_DEBOUNCE_SECONDS,
+	DEFAULT_POLL_INTERVAL,
+	ExportWatcher,
+	WatchedDirectoryGone,
+	open_change_source,
+	wait_for_changes,
+)
+from generate_character_manifest import _infer_output_path
+from instrumentation import Instrumentation, add_instrumentation_arguments, instrumented
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -44,18 +65,81 @@ def _build_parser() -> argparse.ArgumentParser:
 		action="store_true",
 		help="Treat warnings as failures (non-zero exit)",
 	)
+	parser.add_argument(
+		"--watch",
+		action="store_true",
+		help="Keep running: re-validate changed frames and rewrite the manifest on every save (Ctrl-C to stop)",
+	)
+	parser.add_argument(
+		"--manifest-output",
+		help="With --watch, manifest JSON path (default: <character>/character_manifest.json)",
+	)
+	parser.add_argument(
+		"--character-id",
+		help="With --watch, character id embedded in the manifest (default: inferred from path)",
+	)
+	parser.add_argument(
+		"--poll",
+		action="store_true",
+		help="With --watch, poll file stats instead of using inotify",
+	)
+	parser.add_argument(
+		"--poll-interval",
+		type=float,
+		default=DEFAULT_POLL_INTERVAL,
+		help=f"With --watch --poll, seconds between directory scans (default: {DEFAULT_POLL_INTERVAL:g})",
+	)
+	parser.add_argument(
+		"--debounce-ms",
+		type=float,
+		default=DEFAULT_DEBOUNCE_SECONDS * 1000.0,
+		help=f"With --watch, quiet period that ends a burst of saves (default: {DEFAULT_DEBOUNCE_SECONDS * 1000.0:g})",
+	)
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	add_instrumentation_arguments(parser)
 	return parser
 
 
-def main() -> int:
-	args = _build_parser().parse_args()
+def _json_payload(result: ScanResult, has_failure: bool) -> dict:
+	expected_size = result.expected_size
+	return {
+		"exports_dir": str(result.exports_dir),
+		"expected_size": list(expected_size) if expected_size is not None else None,
+		"animations": {
+			animation: {
+				"frames": len(frames),
+				"indices": [f.index for f in frames],
+				"sizes": [f"{w}x{h}" for (w, h) in sorted({(f.width, f.height) for f in frames})],
+			}
+			for animation, frames in sorted(result.frames_by_animation.items())
+		},
+		"missing_required": result.missing_required,
+		"warnings": result.warnings,
+		"errors": result.errors,
+		"result": "FAIL" if has_failure else "PASS",
+	}
+
+
+def _run(args: argparse.Namespace, probe: Instrumentation) -> int:
 	expected_size = None if args.no_size_check else (args.width, args.height)
 
-	result = scan_character_exports(
-		args.exports_dir,
-		expected_size=expected_size,
-		require_all=args.require_all,
-	)
+	with probe.phase("scan"):
+		result = scan_character_exports(
+			args.exports_dir,
+			expected_size=expected_size,
+			require_all=args.require_all,
+		)
+	probe.count("animations", result.animation_count)
+	probe.count("frames", result.total_frames)
+	has_failure = bool(result.errors) or (args.strict_warnings and bool(result.warnings))
+
+	if args.format == "json":
+		with probe.phase("render"):
+			payload = _json_payload(result, has_failure)
+		probe.stop()
+		payload["timings"] = probe.to_dict()
+		print(json.dumps(payload, indent=2))
+		return 1 if has_failure else 0
 
 	print(f"Exports directory: {Path(args.exports_dir)}")
 	if expected_size is None:
@@ -91,7 +175,6 @@ def main() -> int:
 		for error in result.errors:
 			print(f"  - {error}")
 
-	has_failure = bool(result.errors) or (args.strict_warnings and bool(result.warnings))
 	if has_failure:
 		print("Validation result: FAIL")
 		return 1
@@ -100,6 +183,114 @@ def main() -> int:
 	return 0
 
 
+def _emit_manifest(watcher: ExportWatcher, result: ScanResult, character_id: str, output_path: Path) -> bool:
+	manifest = build_manifest_dict(
+		result,
+		character_id=character_id,
+		content_hashes=hash_scan_frames(result, watcher.hashes),
+	)
+	return write_json_if_changed(output_path, manifest)
+
+
+def _report_watch_cycle(
+	args: argparse.Namespace,
+	changed: list[str],
+	result: ScanResult,
+	reads: int,
+	manifest_path: Path,
+	manifest_written: bool,
+	elapsed: float,
+) -> None:
+	has_failure = bool(result.errors) or (args.strict_warnings and bool(result.warnings))
+	if args.format == "json":
+		payload = {
+			"changed": changed,
+			"header_reads": reads,
+			"animations": result.animation_count,
+			"frames": result.total_frames,
+			"errors": result.errors,
+			"warnings": result.warnings,
+			"manifest": str(manifest_path),
+			"manifest_written": manifest_written,
+			"elapsed_ms": round(elapsed * 1000.0, 3),
+			"result": "FAIL" if has_failure else "PASS",
+		}
+		print(json.dumps(payload), flush=True)
+		return
+	stamp = datetime.now().strftime("%H:%M:%S")
+	named = [name for name in changed if name] or ["(rescan)"]
+	names = ", ".join(named[:5]) + (" ..." if len(named) > 5 else "")
+	what = f"{len(changed)} changed ({names})" if changed else "initial scan"
+	manifest_state = "manifest written" if manifest_written else "manifest unchanged"
+	print(
+		f"[{stamp}] {what}: {reads} header read(s), {result.animation_count} animation(s), "
+		f"{result.total_frames} frame(s), {manifest_state} ({elapsed * 1000.0:.1f} ms)"
+	)
+	for error in result.errors:
+		print(f"  - {error}")
+	for warning in result.warnings:
+		print(f"  ~ {warning}")
+	print("Validation result: FAIL" if has_failure else "Validation result: PASS", flush=True)
+
+
+def _watch(args: argparse.Namespace, probe: Instrumentation) -> int:
+	exports_dir = Path(args.exports_dir)
+	error = exports_dir_error(exports_dir)
+	if error:
+		print(error, file=sys.stderr)
+		return 1
+	watcher = ExportWatcher(
+		exports_dir=exports_dir,
+		expected_size=None if args.no_size_check else (args.width, args.height),
+		require_all=args.require_all,
+	)
+	character_id = args.character_id or infer_character_id(exports_dir)
+	manifest_path = _infer_output_path(exports_dir, args.manifest_output)
+	source = open_change_source(exports_dir, poll=args.poll, poll_interval=args.poll_interval)
+	debounce = max(0.0, args.debounce_ms) / 1000.0
+	print(f"Watching {exports_dir} ({source.kind}); manifest: {manifest_path}", file=sys.stderr, flush=True)
+
+	changed: list[str] = []
+	result: ScanResult | None = None
+	try:
+		while True:
+			started = time.perf_counter()
+			reads_before = watcher.reads
+			with probe.phase("validate"):
+				if result is None:
+					watcher.rescan()
+				else:
+					watcher.apply(set(changed))
+				result = watcher.result()
+			with probe.phase("manifest"):
+				written = _emit_manifest(watcher, result, character_id, manifest_path)
+			probe.count("cycles")
+			_report_watch_cycle(
+				args, changed, result, watcher.reads - reads_before, manifest_path, written,
+				time.perf_counter() - started,
+			)
+			changed = []
+			while not changed:
+				changed = sorted(wait_for_changes(source, debounce))
+	except KeyboardInterrupt:
+		pass
+	except (WatchedDirectoryGone, OSError) as exc:
+		print(f"Stopped watching {exports_dir}: {str(exc) or 'directory removed'}", file=sys.stderr)
+		return 1
+	finally:
+		source.close()
+	has_failure = result is None or bool(result.errors) or (args.strict_warnings and bool(result.warnings))
+	return 1 if has_failure else 0
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	with instrumented(args) as probe:
+		if args.watch:
+			return _watch(args, probe)
+		return _run(args, probe)
+
+
 if __name__ == "__main__":
 	sys.exit(main())
 
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""Compare autoplay screenshot captures against content-addressed baselines.
+
+Captures from `SignatureShowcaseAutoplay.gd` and `StoryGuiAutoplay.gd` are matched by file name;
+each changed pair gets a per-pixel diff, a windowed SSIM score, the bounding box of changed pixels
+and a heatmap PNG.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from godot_resource import PROJECT_ROOT
+
+
+CAPTURE_SETS = {
+	"signature-showcase": Path("/tmp/ffc-signature-showcase"),
+	"gui-story-autoplay": Path("/tmp/ffc-gui-story-autoplay"),
+}
+DEFAULT_BASELINE_DIR = ".godot-user/visual_baselines"
+DEFAULT_OUTPUT_DIR = Path("/tmp/ffc-visual-diff")
+DIFF_CACHE_NAME = "diff_cache.json"
+DIFF_VERSION = 1
+DEFAULT_PIXEL_THRESHOLD = 8
+DEFAULT_MIN_SSIM = 0.98
+DEFAULT_MAX_CHANGED = 0.001
+SSIM_WINDOW = 7
+_SSIM_C1 = (0.01 * 255.0) ** 2
+_SSIM_C2 = (0.03 * 255.0) ** 2
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float64)
+
+
+def file_digest(path: Path) -> str:
+	return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+class BaselineStore:
+	"""`objects/<aa>/<digest>.png` blobs plus one `<set>.json` name -> digest manifest per capture set."""
+
+	def __init__(self, root: Path) -> None:
+		self.root = root
+
+	def object_path(self, digest: str) -> Path:
+		return self.root / "objects" / digest[:2] / f"{digest}.png"
+
+	def manifest(self, capture_set: str) -> dict[str, str]:
+		try:
+			loaded = json.loads((self.root / f"{capture_set}.json").read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return {}
+		return {str(name): str(digest) for name, digest in loaded.get("captures", {}).items()}
+
+	def update(self, capture_set: str, captures: dict[str, Path], digests: dict[str, str]) -> int:
+		"""Store new blobs and replace the manifest; returns how many blobs were written."""
+		written = 0
+		for name, path in captures.items():
+			target = self.object_path(digests[name])
+			if target.exists():
+				continue
+			target.parent.mkdir(parents=True, exist_ok=True)
+			shutil.copyfile(path, target)
+			written += 1
+		self.root.mkdir(parents=True, exist_ok=True)
+		(self.root / f"{capture_set}.json").write_text(
+			json.dumps({"captures": dict(sorted(digests.items()))}, indent=2) + "\n",
+			encoding="utf-8",
+		)
+		return written
+
+
+@dataclass(frozen=True)
+class DiffJob:
+	name: str
+	baseline: Path
+	capture: Path
+	heatmap: Path
+	pixel_threshold: int
+
+
+@dataclass
+class DiffResult:
+	name: str
+	width: int
+	height: int
+	changed_pixels: int
+	changed_ratio: float
+	mean_abs_diff: float
+	max_diff: int
+	ssim: float
+	bbox: list[int] | None
+	heatmap: str
+	error: str = ""
+
+
+def _box_mean(values: np.ndarray, window: int) -> np.ndarray:
+	"""Mean over every `window`x`window` block ("valid" positions) from an integral image."""
+	integral = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+	sums = integral[window:, window:] - integral[:-window, window:] - integral[window:, :-window] + integral[:-window, :-window]
+	return sums / float(window * window)
+
+
+def ssim(first: np.ndarray, second: np.ndarray, window: int = SSIM_WINDOW) -> float:
+	"""Mean structural similarity of two luminance images over sliding square windows."""
+	window = max(1, min(window, first.shape[0], first.shape[1]))
+	mu_x = _box_mean(first, window)
+	mu_y = _box_mean(second, window)
+	var_x = _box_mean(first * first, window) - mu_x * mu_x
+	var_y = _box_mean(second * second, window) - mu_y * mu_y
+	cov = _box_mean(first * second, window) - mu_x * mu_y
+	numerator = (2.0 * mu_x * mu_y + _SSIM_C1) * (2.0 * cov + _SSIM_C2)
+	denominator = (mu_x * mu_x + mu_y * mu_y + _SSIM_C1) * (var_x + var_y + _SSIM_C2)
+	return float(np.mean(numerator / denominator))
+
+
+def changed_bbox(mask: np.ndarray) -> list[int] | None:
+	"""[left, top, right, bottom] (inclusive) of the True pixels in `mask`."""
+	rows = np.flatnonzero(mask.any(axis=1))
+	if rows.size == 0:
+		return None
+	cols = np.flatnonzero(mask.any(axis=0))
+	return [int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])]
+
+
+def render_heatmap(baseline: np.ndarray, diff: np.ndarray, bbox: list[int] | None) -> Image.Image:
+	"""Dimmed grayscale baseline with per-pixel difference in red and the changed region outlined."""
+	gray = (baseline[..., :3].astype(np.float64) @ _LUMA) * 0.35
+	heat = np.clip(diff.astype(np.float64) * 4.0, 0.0, 255.0)
+	rgb = np.stack([np.maximum(gray, heat), gray * (1.0 - heat / 255.0), gray * (1.0 - heat / 255.0)], axis=-1)
+	image = Image.fromarray(rgb.astype(np.uint8), "RGB")
+	if bbox is not None:
+		ImageDraw.Draw(image).rectangle(bbox, outline=(255, 220, 0))
+	return image
+
+
+def diff_pair(job: DiffJob) -> DiffResult:
+	with Image.open(job.baseline) as baseline_image, Image.open(job.capture) as capture_image:
+		baseline = np.asarray(baseline_image.convert("RGBA"), dtype=np.int16)
+		capture = np.asarray(capture_image.convert("RGBA"), dtype=np.int16)
+	height, width = capture.shape[:2]
+	if baseline.shape != capture.shape:
+		return DiffResult(
+			name=job.name,
+			width=width,
+			height=height,
+			changed_pixels=width * height,
+			changed_ratio=1.0,
+			mean_abs_diff=0.0,
+			max_diff=255,
+			ssim=0.0,
+			bbox=[0, 0, width - 1, height - 1],
+			heatmap="",
+			error=f"size changed from {baseline.shape[1]}x{baseline.shape[0]} to {width}x{height}",
+		)
+	diff = np.abs(capture - baseline).max(axis=-1)
+	mask = diff > job.pixel_threshold
+	bbox = changed_bbox(mask)
+	changed = int(mask.sum())
+	score = ssim(baseline[..., :3].astype(np.float64) @ _LUMA, capture[..., :3].astype(np.float64) @ _LUMA)
+	heatmap = ""
+	if changed:
+		job.heatmap.parent.mkdir(parents=True, exist_ok=True)
+		render_heatmap(baseline.astype(np.uint8), diff, bbox).save(job.heatmap)
+		heatmap = str(job.heatmap)
+	return DiffResult(
+		name=job.name,
+		width=width,
+		height=height,
+		changed_pixels=changed,
+		changed_ratio=changed / float(width * height),
+		mean_abs_diff=float(diff.mean()),
+		max_diff=int(diff.max()),
+		ssim=score,
+		bbox=bbox,
+		heatmap=heatmap,
+	)
+
+
+def list_captures(directory: Path) -> dict[str, Path]:
+	if not directory.is_dir():
+		return {}
+	return {path.name: path for path in sorted(directory.glob("*.png"))}
+
+
+@dataclass
+class SetReport:
+	capture_set: str
+	capture_dir: str
+	identical: list[str]
+	results: list[DiffResult]
+	missing: list[str]
+	new: list[str]
+	cached: int = 0
+
+	def failures(self, min_ssim: float, max_changed: float) -> list[DiffResult]:
+		return [
+			result
+			for result in self.results
+			if result.error or result.ssim < min_ssim or result.changed_ratio > max_changed
+		]
+
+
+def compare_set(
+	store: BaselineStore,
+	capture_set: str,
+	capture_dir: Path,
+	output_dir: Path,
+	pixel_threshold: int,
+	jobs: int,
+	diff_cache: dict[str, dict],
+) -> SetReport:
+	captures = list_captures(capture_dir)
+	baseline = store.manifest(capture_set)
+	digests = {name: file_digest(path) for name, path in captures.items()}
+	report = SetReport(
+		capture_set=capture_set,
+		capture_dir=str(capture_dir),
+		identical=[],
+		results=[],
+		missing=sorted(set(baseline) - set(captures)),
+		new=sorted(set(captures) - set(baseline)),
+	)
+	pending: list[tuple[str, DiffJob]] = []
+	for name in sorted(set(captures) & set(baseline)):
+		if digests[name] == baseline[name]:
+			report.identical.append(name)
+			continue
+		key = f"{DIFF_VERSION}:{pixel_threshold}:{baseline[name]}:{digests[name]}"
+		cached = diff_cache.get(key)
+		if cached is not None and (not cached.get("heatmap") or Path(cached["heatmap"]).exists()):
+			report.results.append(DiffResult(**cached))
+			report.cached += 1
+			continue
+		heatmap = output_dir / capture_set / f"{Path(name).stem}_diff.png"
+		pending.append((key, DiffJob(name, store.object_path(baseline[name]), captures[name], heatmap, pixel_threshold)))
+
+	job_list = [job for _, job in pending]
+	if jobs == 1 or len(job_list) <= 1:
+		computed = [diff_pair(job) for job in job_list]
+	else:
+		with ProcessPoolExecutor(max_workers=jobs) as pool:
+			computed = list(pool.map(diff_pair, job_list))
+	for (key, _), result in zip(pending, computed):
+		diff_cache[key] = asdict(result)
+		report.results.append(result)
+	report.results.sort(key=lambda result: result.name)
+	return report
+
+
+def _load_diff_cache(path: Path) -> dict[str, dict]:
+	try:
+		loaded = json.loads(path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return {}
+	return loaded if isinstance(loaded, dict) else {}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Diff autoplay screenshot captures against stored baselines (per-pixel diff, SSIM, changed-region "
+			"bounding box) and write heatmaps plus a summary."
+		)
+	)
+	parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Godot project root (default: repository root)")
+	parser.add_argument(
+		"--set",
+		dest="sets",
+		action="append",
+		choices=sorted(CAPTURE_SETS),
+		help="Capture set to check (repeatable; default: every set with captures on disk)",
+	)
+	parser.add_argument(
+		"--captures",
+		action="append",
+		metavar="NAME=DIR",
+		help="Extra capture set NAME read from DIR (repeatable)",
+	)
+	parser.add_argument("--baseline-dir", default=DEFAULT_BASELINE_DIR, help="Baseline store relative to the project root")
+	parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help=f"Heatmap and summary directory (default: {DEFAULT_OUTPUT_DIR})")
+	parser.add_argument("--update", action="store_true", help="Accept the current captures as the new baseline")
+	parser.add_argument(
+		"--pixel-threshold",
+		type=int,
+		default=DEFAULT_PIXEL_THRESHOLD,
+		help=f"Per-channel difference a pixel must exceed to count as changed (default: {DEFAULT_PIXEL_THRESHOLD})",
+	)
+	parser.add_argument("--min-ssim", type=float, default=DEFAULT_MIN_SSIM, help=f"Fail below this SSIM (default: {DEFAULT_MIN_SSIM})")
+	parser.add_argument(
+		"--max-changed",
+		type=float,
+		default=DEFAULT_MAX_CHANGED,
+		help=f"Fail above this fraction of changed pixels (default: {DEFAULT_MAX_CHANGED})",
+	)
+	parser.add_argument("--jobs", type=int, default=0, help="Worker processes for diffing (0 = CPU count)")
+	parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format. Default: text.")
+	return parser
+
+
+def main() -> int:
+	args = _build_parser().parse_args()
+	started = time.perf_counter()
+	project_root = Path(args.project_root)
+	store = BaselineStore(project_root / args.baseline_dir)
+	output_dir = Path(args.output_dir)
+	jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+	sets = {name: CAPTURE_SETS[name] for name in args.sets or []}
+	for value in args.captures or []:
+		name, separator, directory = value.partition("=")
+		if not separator or not name or not directory:
+			print(f"--captures expects NAME=DIR, got {value!r}", file=sys.stderr)
+			return 1
+		sets[name] = Path(directory)
+	if not sets:
+		sets = {name: directory for name, directory in CAPTURE_SETS.items() if list_captures(directory)}
+	if not sets:
+		print(
+			"No captures found. Run scenes/debug/SignatureShowcaseAutoplay.tscn or StoryGuiAutoplay.tscn first.",
+			file=sys.stderr,
+		)
+		return 1
+
+	if args.update:
+		for name, directory in sorted(sets.items()):
+			captures = list_captures(directory)
+			if not captures:
+				print(f"{name}: no captures in {directory}", file=sys.stderr)
+				return 1
+			written = store.update(name, captures, {capture: file_digest(path) for capture, path in captures.items()})
+			print(f"{name}: baseline set to {len(captures)} capture(s) ({written} new blob(s)) in {store.root}")
+		return 0
+
+	cache_path = store.root / DIFF_CACHE_NAME
+	diff_cache = _load_diff_cache(cache_path)
+	reports = [
+		compare_set(store, name, directory, output_dir, args.pixel_threshold, jobs, diff_cache)
+		for name, directory in sorted(sets.items())
+	]
+	if store.root.exists():
+		cache_path.write_text(json.dumps(diff_cache, sort_keys=True) + "\n", encoding="utf-8")
+	elapsed = time.perf_counter() - started
+
+	no_baseline = [report.capture_set for report in reports if not store.manifest(report.capture_set)]
+	failed = bool(no_baseline) or any(
+		report.missing or report.failures(args.min_ssim, args.max_changed) for report in reports
+	)
+	payload = {
+		"sets": [
+			{
+				"capture_set": report.capture_set,
+				"capture_dir": report.capture_dir,
+				"identical": report.identical,
+				"changed": [asdict(result) for result in report.results],
+				"failed": [result.name for result in report.failures(args.min_ssim, args.max_changed)],
+				"missing": report.missing,
+				"new": report.new,
+				"cached_diffs": report.cached,
+			}
+			for report in reports
+		],
+		"no_baseline": no_baseline,
+		"thresholds": {"pixel": args.pixel_threshold, "min_ssim": args.min_ssim, "max_changed": args.max_changed},
+		"elapsed_seconds": round(elapsed, 4),
+	}
+	output_dir.mkdir(parents=True, exist_ok=True)
+	(output_dir / "summary.json").write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+	if args.format == "json":
+		print(json.dumps(payload, indent=2))
+		return 1 if failed else 0
+
+	print(f"Visual regression: {len(reports)} capture set(s) ({elapsed * 1000.0:.1f} ms)")
+	for report in reports:
+		print(
+			f"  {report.capture_set}: {len(report.identical)} identical, {len(report.results)} changed "
+			f"({report.cached} cached), {len(report.missing)} missing, {len(report.new)} new"
+		)
+		failures = {result.name for result in report.failures(args.min_ssim, args.max_changed)}
+		for result in report.results:
+			marker = "-" if result.name in failures else "~"
+			if result.error:
+				print(f"  {marker} {result.name}: {result.error}")
+				continue
+			if result.bbox is None:
+				print(f"  {marker} {result.name}: ssim {result.ssim:.4f}, max diff {result.max_diff} (within pixel threshold)")
+				continue
+			print(
+				f"  {marker} {result.name}: ssim {result.ssim:.4f}, {result.changed_ratio * 100.0:.3f}% changed "
+				f"in {result.bbox}, max diff {result.max_diff} -> {result.heatmap}"
+			)
+		for name in report.missing:
+			print(f"  - {name}: in baseline but not captured")
+		for name in report.new:
+			print(f"  ~ {name}: no baseline (run with --update to accept)")
+	for name in no_baseline:
+		print(f"  - {name}: no baseline stored; run with --update to create one")
+	print(f"Summary: {output_dir / 'summary.json'}")
+	print("Result: FAIL" if failed else "Result: PASS")
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -19,17 +19,24 @@ const SUITE_FULL := "full"
 var _failures: Array[String] = []
 var _passes := 0
 var _suite := SUITE_SMOKE
+var _selected_tests: PackedStringArray = []
 
 func _initialize() -> void:
 	_suite = _resolve_suite_from_args(OS.get_cmdline_user_args())
+	_selected_tests = _resolve_tests_from_args(OS.get_cmdline_user_args())
 	call_deferred("_run")
 
 func _run() -> void:
 	_assert_true(_resolve_suite_from_args(["--suite", "smoke"]) == SUITE_SMOKE, "suite parser reads --suite smoke")
 	_assert_true(_resolve_suite_from_args(["--suite=full"]) == SUITE_FULL, "suite parser reads --suite=full")
 	_assert_true(_resolve_suite_from_args(["unknown"]) == SUITE_SMOKE, "suite parser falls back to smoke for unknown values")
+	_assert_true(_resolve_tests_from_args(["--tests", "_test_a,_test_b"]) == PackedStringArray(["_test_a", "_test_b"]), "test filter parser reads --tests a,b")
+	_assert_true(_resolve_tests_from_args(["--tests=_test_a, ,"]) == PackedStringArray(["_test_a"]), "test filter parser reads --tests=a and drops blanks")
+	_assert_true(_resolve_tests_from_args(["--suite", "full"]).is_empty(), "test filter parser defaults to the whole suite")
 	print("Running suite: %s" % _suite)
-	if _suite == SUITE_FULL:
+	if not _selected_tests.is_empty():
+		await _run_selected_tests(_selected_tests)
+	elif _suite == SUITE_FULL:
 		await _run_full_suite()
 	else:
 		await _run_smoke_suite()
@@ -37,6 +44,7 @@ func _run() -> void:
 
 func _run_smoke_suite() -> void:
 	await _test_character_attack_tables_are_valid()
+	await _test_animation_profile_table_matches_sprite_frames()
 	await _test_core_scenes_boot()
 	await _test_main_scene_prototype_signature_coverage()
 	await _test_main_scene_runtime_match_flow()
@@ -114,6 +122,41 @@ func _run_full_suite() -> void:
 	await _test_wave1_vertical_slice_skills()
 	await _test_full_roster_signature_coverage()
 
+# Runs an explicit subset of tests (used by scripts/tools/run_tests_sharded.py)
+# and prints one TEST_RESULT line per test so the orchestrator can record wall time.
+func _run_selected_tests(test_names: PackedStringArray) -> void:
+	for test_name in test_names:
+		if not test_name.begins_with("_test_") or not has_method(test_name):
+			_failures.append("unknown test: %s" % test_name)
+			print("TEST_RESULT %s" % JSON.stringify({"name": test_name, "msec": 0, "failures": 1}))
+			continue
+		var failures_before := _failures.size()
+		var started_usec := Time.get_ticks_usec()
+		await call(test_name)
+		var elapsed_msec := float(Time.get_ticks_usec() - started_usec) / 1000.0
+		print("TEST_RESULT %s" % JSON.stringify({
+			"name": test_name,
+			"msec": snappedf(elapsed_msec, 0.01),
+			"failures": _failures.size() - failures_before,
+		}))
+
+func _resolve_tests_from_args(args: PackedStringArray) -> PackedStringArray:
+	var raw := ""
+	for index in range(args.size()):
+		var arg := str(args[index]).strip_edges()
+		if arg == "--tests" and index + 1 < args.size():
+			raw = str(args[index + 1])
+			break
+		if arg.begins_with("--tests="):
+			raw = arg.substr(8)
+			break
+	var names: PackedStringArray = []
+	for part in raw.split(",", false):
+		var entry := part.strip_edges()
+		if entry != "":
+			names.append(entry)
+	return names
+
 func _resolve_suite_from_args(args: PackedStringArray) -> String:
 	var requested := ""
 	for index in range(args.size()):
@@ -206,6 +249,36 @@ func _test_character_attack_tables_are_valid() -> void:
 	dir.list_dir_end()
 	_assert_true(table_count >= 16, "character roster has at least 16 attack tables")
 
+func _test_animation_profile_table_matches_sprite_frames() -> void:
+	var required_names := PlayerDataStore.get_required_animation_names()
+	var profiles := PlayerDataStore.get_animation_profiles()
+	var ticks_per_second := float(PlayerDataStore.get_animation_profile_table().get("physics_ticks_per_second", 60))
+	_assert_true(required_names.size() >= 14, "animation profile table lists required animations")
+	var sprite_frames := load("res://assets/sprites/player/PlayerSpriteFrames.tres") as SpriteFrames
+	_assert_true(sprite_frames != null, "load PlayerSpriteFrames.tres")
+	for name_variant in required_names:
+		var animation_name := String(name_variant)
+		_assert_true(profiles.has(animation_name), "animation profile exists for %s" % animation_name)
+		if not profiles.has(animation_name):
+			continue
+		var profile := profiles[animation_name] as Dictionary
+		var fps := float(profile.get("fps", 0.0))
+		_assert_true(fps > 0.0, "%s profile fps is positive" % animation_name)
+		_assert_true(
+			is_equal_approx(float(profile.get("ticks_per_frame", 0.0)), snappedf(ticks_per_second / fps, 0.0001)),
+			"%s profile timing table is compiled" % animation_name
+		)
+		if sprite_frames == null or not sprite_frames.has_animation(animation_name):
+			continue
+		_assert_true(
+			is_equal_approx(sprite_frames.get_animation_speed(animation_name), fps),
+			"PlayerSpriteFrames %s speed matches profile" % animation_name
+		)
+		_assert_true(
+			sprite_frames.get_animation_loop(animation_name) == bool(profile.get("loop", false)),
+			"PlayerSpriteFrames %s loop matches profile" % animation_name
+		)
+
 func _resolve_attacks_dictionary(resource: Resource) -> Dictionary:
 	if resource == null:
 		return {}
@@ -1971,6 +2044,28 @@ func _test_match_metrics_telemetry_schema() -> void:
 				_assert_true(onboarding.has("started"), "telemetry onboarding summary includes started flag")
 				_assert_true(onboarding.has("completed"), "telemetry onboarding summary includes completed flag")
 				_assert_true(onboarding.has("steps_completed"), "telemetry onboarding summary includes completed step list")
+			_assert_true(str(record.get("stage_id", "")).begins_with("main/"), "telemetry record exposes stage id")
+			_assert_true(str(record.get("build_id", "")).strip_edges() != "", "telemetry record exposes build id")
+			_assert_true(
+				str(record.get("install_id", "")) != "" and str(record.get("install_id", "")) == GameSettingsStore.get_install_id(),
+				"telemetry record carries the persisted install id"
+			)
+			var frame_times_value: Variant = record.get("frame_times", {})
+			_assert_true(typeof(frame_times_value) == TYPE_DICTIONARY, "telemetry record exposes frame-time histogram")
+			if typeof(frame_times_value) == TYPE_DICTIONARY:
+				var frame_times := frame_times_value as Dictionary
+				var counts: Array = frame_times.get("counts", [])
+				_assert_true(counts.size() == 74, "frame-time histogram has fixed bucket count")
+				_assert_true(int(frame_times.get("frame_count", 0)) >= 1, "frame-time histogram counts processed frames")
+				var bucket_total := 0
+				for count in counts:
+					bucket_total += int(count)
+				_assert_true(bucket_total == int(frame_times.get("frame_count", -1)), "frame-time histogram buckets sum to frame count")
+				_assert_true(frame_times.has("over_16_7ms") and frame_times.has("over_33ms"), "frame-time histogram exposes hitch counts")
+				_assert_true(frame_times.get("worst_hitches", null) is Array, "frame-time histogram exposes worst hitches")
+	_assert_true(int(match_node.call("_frame_time_bucket_index", 0.5)) == 0, "frame-time bucket 0 holds sub-millisecond frames")
+	_assert_true(int(match_node.call("_frame_time_bucket_index", 20.0)) == 35, "frame-time buckets are eighth-octave spaced")
+	_assert_true(int(match_node.call("_frame_time_bucket_index", 10000.0)) == 73, "frame-time overflow bucket is open-ended")
 	if is_instance_valid(match_node):
 		match_node.queue_free()
 	await process_frame
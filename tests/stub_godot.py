@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Stand-in GODOT_BIN for exercising scripts/tools/run_tests_sharded.py without Godot.
+
+Mimics the TestRunner.gd `--tests` protocol: prints one TEST_RESULT line per requested test.
+STUB_GODOT_MSEC scales the simulated duration; STUB_GODOT_FAIL lists tests to report as failing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+import time
+import zlib
+
+
+def main() -> int:
+	argv = sys.argv[1:]
+	user_args = argv[argv.index("--") + 1:] if "--" in argv else []
+	tests: list[str] = []
+	if "--tests" in user_args and user_args.index("--tests") + 1 < len(user_args):
+		tests = [name for name in user_args[user_args.index("--tests") + 1].split(",") if name]
+	if "--log-file" in argv:
+		log_path = Path(argv[argv.index("--log-file") + 1])
+		log_path.parent.mkdir(parents=True, exist_ok=True)
+		log_path.write_text(f"stub godot HOME={os.environ.get('HOME', '')}\n", encoding="utf-8")
+	scale = float(os.environ.get("STUB_GODOT_MSEC", "20"))
+	failing = set(os.environ.get("STUB_GODOT_FAIL", "").split(","))
+	failures = 0
+	for name in tests:
+		msec = scale * (1 + zlib.crc32(name.encode("utf-8")) % 10) / 5.0
+		time.sleep(msec / 1000.0)
+		failed = int(name in failing)
+		failures += failed
+		print("TEST_RESULT " + json.dumps({"name": name, "msec": round(msec, 2), "failures": failed}), flush=True)
+	print("Result: FAIL" if failures else "Result: PASS")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
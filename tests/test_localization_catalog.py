@@ -0,0 +1,39 @@
+"""Placeholder checks in scripts/tools/localization_catalog.py (run with `python3 -m pytest tests`)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "tools"))
+
+from localization_catalog import check_catalogs, placeholders  # noqa: E402
+
+
+def test_placeholders_keep_order() -> None:
+	assert placeholders("%s scored %d (100%%)") == ["%s", "%d"]
+
+
+def test_reordered_message_placeholders_are_reported() -> None:
+	report = check_catalogs(
+		{"en": {"SCORE": "%s scored %d"}, "zh": {"SCORE": "%d 分 %s"}},
+		{},
+		"en",
+	)
+	assert report.placeholder_mismatches == [
+		{"locale": "zh", "key": "SCORE", "expected": ["%s", "%d"], "found": ["%d", "%s"]}
+	]
+
+
+def test_reordered_dialogue_placeholders_are_reported() -> None:
+	report = check_catalogs(
+		{"en": {}, "zh": {}},
+		{"dialogue/intro": {"en": ["%s vs %s round %d"], "zh": ["第 %d 回合 %s 对 %s"]}},
+		"en",
+	)
+	assert [mismatch["key"] for mismatch in report.placeholder_mismatches] == ["dialogue/intro/0"]
+
+
+def test_matching_placeholders_pass() -> None:
+	report = check_catalogs({"en": {"SCORE": "%s scored %d"}, "zh": {"SCORE": "%s 得分 %d"}}, {}, "en")
+	assert report.placeholder_mismatches == []